@@ -0,0 +1,503 @@
+#!/usr/bin/env python3
+"""
+Material Image Batch Pipeline
+
+Batch mode for ImageGenerationPipeline: generates images for a list of
+materials (or a whole category) with the pipeline stages overlapped across
+materials, instead of running each material end to end before the next:
+
+- Prompt assembly (CPU, shared MaterialImageGenerator state): one worker,
+  building prompts one round ahead of image generation
+- Image generation and vision validation (network): bounded thread pools;
+  provider rate-limit errors are retried after a backoff. Exhausted quotas
+  are not retried: generation ends the material with an error, validation
+  is skipped (as in ImageGenerationPipeline.generate())
+- Learning-database writes: buffered on the coordinating thread and written
+  in one transaction per learning_batch_size validated attempts
+
+Retry budget: each material gets up to max_attempts attempts. A failed
+validation, or a generation/validation error, sends it back to prompt
+assembly; buffered learning writes are flushed first, so the new prompt sees
+the failed attempt's feedback (learned category feedback). Critical prompt
+validation failures are not retried (fail-fast).
+
+Resumable progress: each material that reaches a final outcome (passed, or
+failed with its budget used) is journaled (BackfillJournal) next to the
+images, once its learning records are written. The journal is keyed by the
+materials, outputs and image settings, so rerunning the same batch with the
+same settings skips journaled materials and retries the ones that ended in
+an error. The journal is deleted when a run completes.
+
+Usage:
+    from domains.materials.image.batch_pipeline import ImageBatchPipeline, build_batch_items
+    from domains.materials.image.pipeline import ImageGenerationPipeline, materials_in_category
+
+    pipeline = ImageGenerationPipeline(gemini_api_key=api_key)
+    items = build_batch_items(pipeline, materials_in_category('metal'), Path('public/images/materials'))
+    results = ImageBatchPipeline(pipeline, generation_workers=3, validation_workers=3).run(items)
+"""
+
+import hashlib
+import itertools
+import json
+import logging
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Tuple
+
+from domains.materials.image.material_config import MaterialImageConfig
+from domains.materials.image.pipeline import (
+    ImageGenerationPipeline,
+    hero_image_path,
+    is_quota_error,
+    is_quota_exhausted,
+)
+from generation.backfill.engine import BackfillJournal, is_rate_limit_error
+
+logger = logging.getLogger(__name__)
+
+# Pipeline stages
+PROMPT_STAGE = 'prompt'
+GENERATION_STAGE = 'generation'
+VALIDATION_STAGE = 'validation'
+
+# Final outcomes
+PASSED = 'passed'
+FAILED = 'failed'    # validation failed on every attempt
+ERROR = 'error'      # prompt failure, or errors on every attempt (not journaled)
+
+
+@dataclass
+class BatchItem:
+    """One material of a batch run."""
+    material: str
+    config: MaterialImageConfig
+    output_path: Path
+    shape_override: Optional[str] = None
+
+
+@dataclass
+class BatchItemResult:
+    """Final outcome for one material."""
+    material: str
+    status: str
+    attempts: int
+    output_path: Optional[str] = None
+    realism_score: Optional[float] = None
+    skipped_validation: bool = False
+    error: Optional[str] = None
+    resumed: bool = False
+
+    @property
+    def passed(self) -> bool:
+        return self.status == PASSED
+
+
+@dataclass
+class _Job:
+    """A material's current attempt as it moves through the stages."""
+    item: BatchItem
+    attempt: int = 1
+    prompt_package: Optional[Dict[str, Any]] = None
+    file_size: int = 0
+
+
+def build_batch_items(
+    pipeline: ImageGenerationPipeline,
+    materials: Iterable[str],
+    output_dir: Path,
+    validate: bool = True,
+    severity: Optional[str] = None,
+    context: str = "outdoor",
+    aging_weight: Optional[float] = None,
+    contamination_weight: Optional[float] = None,
+    uniformity: Optional[int] = None
+) -> List[BatchItem]:
+    """
+    Build batch items with researched defaults, as the single-material CLI does.
+
+    Args:
+        pipeline: Pipeline (resolves each material's category)
+        materials: Material names; duplicates are dropped
+        output_dir: Directory for {material-slug}-laser-cleaning-hero.png images
+
+    Returns:
+        One item per material, in input order
+    """
+    items = []
+    seen = set()
+    for material in materials:
+        if material in seen:
+            continue
+        seen.add(material)
+        config = MaterialImageConfig.from_material(
+            material=material,
+            category=pipeline.get_material_category(material),
+            validate=validate,
+            severity=severity,
+            context=context,
+            aging_weight=aging_weight,
+            contamination_weight=contamination_weight
+        )
+        if uniformity:
+            config.contamination_uniformity = uniformity
+        items.append(BatchItem(material=material, config=config, output_path=hero_image_path(output_dir, material)))
+    return items
+
+
+class ImageBatchPipeline:
+    """
+    Runs ImageGenerationPipeline stages for many materials concurrently.
+
+    Stage workers only call the pipeline's prepare_prompt, generate_image and
+    validate_image; results, retries, learning writes and the journal are
+    handled on the thread that called run().
+    """
+
+    def __init__(
+        self,
+        pipeline: ImageGenerationPipeline,
+        generation_workers: int = 2,
+        validation_workers: int = 2,
+        max_attempts: int = 2,
+        learning_batch_size: int = 10,
+        rate_limit_retries: int = 3,
+        rate_limit_backoff: float = 5.0,
+        journal_dir: Optional[Path] = None
+    ):
+        """
+        Initialize batch pipeline.
+
+        Args:
+            pipeline: Single-material pipeline providing the stages
+            generation_workers: Image generation requests in flight
+            validation_workers: Vision validation requests in flight
+            max_attempts: Attempts per material (retry budget + 1)
+            learning_batch_size: Validated attempts per learning-database transaction
+            rate_limit_retries: Backoff retries for a rate-limited request
+            rate_limit_backoff: First backoff delay in seconds, doubled per retry
+            journal_dir: Directory for the progress journal (default: first item's output directory)
+        """
+        for name, value in (
+            ('generation_workers', generation_workers),
+            ('validation_workers', validation_workers),
+            ('max_attempts', max_attempts),
+            ('learning_batch_size', learning_batch_size),
+        ):
+            if value < 1:
+                raise ValueError(f"{name} must be >= 1, got {value}")
+
+        self.pipeline = pipeline
+        self.generation_workers = generation_workers
+        self.validation_workers = validation_workers
+        self.max_attempts = max_attempts
+        self.learning_batch_size = learning_batch_size
+        self.rate_limit_retries = rate_limit_retries
+        self.rate_limit_backoff = rate_limit_backoff
+        self.journal_dir = journal_dir
+
+    def run(
+        self,
+        items: List[BatchItem],
+        dry_run: bool = False,
+        skip_validation: bool = False
+    ) -> List[BatchItemResult]:
+        """
+        Generate (and validate) images for every item.
+
+        Args:
+            items: Materials to process (see build_batch_items)
+            dry_run: Build prompts only (no images, no journal)
+            skip_validation: Skip Gemini vision validation
+
+        Returns:
+            One result per item, in item order
+        """
+        materials = [item.material for item in items]
+        if len(set(materials)) != len(materials):
+            raise ValueError("Batch items must have distinct materials")
+
+        print(f"\n{'='*80}")
+        print("📦 BATCH IMAGE GENERATION")
+        print(f"{'='*80}")
+        print(f"Materials: {len(items)}")
+        print(f"Workers: generation {self.generation_workers}, validation {self.validation_workers}")
+        print(f"Attempts per material: {self.max_attempts}")
+        print(f"Dry run: {dry_run}")
+        print(f"{'='*80}\n")
+
+        journal = None if dry_run or not items else self.journal_for(items, skip_validation)
+        batch_run = _BatchRun(self, items, dry_run, skip_validation, journal)
+        results = batch_run.execute()
+        if journal is not None:
+            journal.clear()
+
+        print(f"\n{'='*80}")
+        print("📊 BATCH SUMMARY")
+        print(f"{'='*80}")
+        for status, icon in ((PASSED, '✅'), (FAILED, '⚠️ '), (ERROR, '❌')):
+            print(f"{icon} {status.capitalize()}: {sum(1 for r in results if r.status == status)}")
+        resumed = sum(1 for r in results if r.resumed)
+        if resumed:
+            print(f"♻️  Resumed: {resumed}")
+        print(f"{'='*80}\n")
+        return results
+
+    def journal_for(self, items: List[BatchItem], skip_validation: bool = False) -> BackfillJournal:
+        """Progress journal for a batch (same materials, settings and outputs → same journal)."""
+        scope = [
+            [item.material, str(item.output_path), item.shape_override, item.config.to_dict()]
+            for item in items
+        ]
+        key = hashlib.blake2b(
+            json.dumps([scope, skip_validation], sort_keys=True, default=str).encode('utf-8'), digest_size=6
+        ).hexdigest()
+        journal_dir = Path(self.journal_dir or items[0].output_path.parent)
+        return BackfillJournal(journal_dir / f".image-batch-{key}.journal.jsonl")
+
+    def call_with_backoff(self, material: str, call: Callable[[], Any]) -> Any:
+        """Run call, retrying rate-limit errors with exponential backoff (exhausted quotas are raised at once)."""
+        attempt = 0
+        while True:
+            try:
+                return call()
+            except Exception as e:
+                if attempt >= self.rate_limit_retries or not is_rate_limit_error(e) or is_quota_exhausted(e):
+                    raise
+                delay = self.rate_limit_backoff * (2 ** attempt)
+                attempt += 1
+                logger.warning(
+                    f"{material}: rate limited ({e}); retry {attempt}/{self.rate_limit_retries} in {delay:.1f}s"
+                )
+                time.sleep(delay)
+
+
+class _BatchRun:
+    """State of one ImageBatchPipeline.run() call; used on the calling thread only."""
+
+    def __init__(
+        self,
+        batch: ImageBatchPipeline,
+        items: List[BatchItem],
+        dry_run: bool,
+        skip_validation: bool,
+        journal: Optional[BackfillJournal]
+    ):
+        self.batch = batch
+        self.pipeline = batch.pipeline
+        self.items = items
+        self.dry_run = dry_run
+        self.skip_validation = skip_validation
+        self.journal = journal
+        self.results: Dict[str, BatchItemResult] = {}
+        self.pending: Deque[_Job] = deque()    # awaiting prompt assembly
+        self.ready: Deque[_Job] = deque()      # prompt built, awaiting generation
+        self.running: Dict[Future, Tuple[int, str, _Job]] = {}    # future -> (submit order, stage, job)
+        self.sequence = itertools.count()
+        self.in_flight = {PROMPT_STAGE: 0, GENERATION_STAGE: 0, VALIDATION_STAGE: 0}
+        self.learning_buffer: List[Dict[str, Any]] = []
+        self.journal_buffer: List[Tuple[str, Dict[str, Any]]] = []    # finished, awaiting learning flush
+        self.pools: Dict[str, ThreadPoolExecutor] = {}
+
+    def execute(self) -> List[BatchItemResult]:
+        """Run every item to a final outcome; returns results in item order."""
+        by_material = {item.material: item for item in self.items}
+        if self.journal is not None:
+            for material, data in self.journal.entries():
+                if material in by_material:
+                    self.results[material] = BatchItemResult(**{**data, 'resumed': True})
+            if self.results:
+                print(f"♻️  Resuming: {len(self.results)} materials restored from {self.journal.journal_path.name}")
+        self.pending.extend(_Job(item) for item in self.items if item.material not in self.results)
+
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix='image-prompt') as prompt_pool, \
+                ThreadPoolExecutor(max_workers=self.batch.generation_workers,
+                                   thread_name_prefix='image-generation') as generation_pool, \
+                ThreadPoolExecutor(max_workers=self.batch.validation_workers,
+                                   thread_name_prefix='image-validation') as validation_pool:
+            self.pools = {
+                PROMPT_STAGE: prompt_pool,
+                GENERATION_STAGE: generation_pool,
+                VALIDATION_STAGE: validation_pool,
+            }
+            try:
+                while self.pending or self.ready or self.running:
+                    self._schedule()
+                    done, _ = wait(list(self.running), return_when=FIRST_COMPLETED)
+                    # Handle in submit order so results (and the journal) don't depend on thread timing
+                    for future in sorted(done, key=lambda f: self.running[f][0]):
+                        _, stage, job = self.running.pop(future)
+                        self.in_flight[stage] -= 1
+                        self._complete(stage, job, future)
+            except BaseException:
+                # Interrupted: don't start queued stages; the journal keeps
+                # every finished material for the next run.
+                for future in self.running:
+                    future.cancel()
+                raise
+            finally:
+                self._flush_learning()
+
+        return [self.results[item.material] for item in self.items]
+
+    # ------------------------------------------------------------------
+    # Scheduling
+    # ------------------------------------------------------------------
+
+    def _schedule(self) -> None:
+        """Start prompt assembly one round ahead of generation, and generation up to its worker limit."""
+        if self.pending and self.in_flight[PROMPT_STAGE] == 0 and len(self.ready) < self.batch.generation_workers:
+            job = self.pending.popleft()
+            item = job.item
+            self._submit(PROMPT_STAGE, job, self.pipeline.prepare_prompt,
+                         item.material, item.config, item.shape_override)
+
+        while self.ready and self.in_flight[GENERATION_STAGE] < self.batch.generation_workers:
+            job = self.ready.popleft()
+            self._submit(GENERATION_STAGE, job, self.batch.call_with_backoff, job.item.material,
+                         lambda job=job: self.pipeline.generate_image(job.prompt_package, job.item.output_path))
+
+    def _submit(self, stage: str, job: _Job, fn: Callable[..., Any], *args: Any) -> None:
+        future = self.pools[stage].submit(fn, *args)
+        self.running[future] = (next(self.sequence), stage, job)
+        self.in_flight[stage] += 1
+
+    def _validate(self, job: _Job):
+        """Validation stage (worker thread): validation result, or None if quota stayed exhausted."""
+        try:
+            return self.batch.call_with_backoff(
+                job.item.material,
+                lambda: self.pipeline.validate_image(
+                    job.item.material, job.item.config, job.prompt_package, job.item.output_path
+                )
+            )
+        except Exception as e:
+            if is_quota_error(e):
+                logger.warning(f"⚠️  {job.item.material}: validation API quota exceeded - skipping validation")
+                return None
+            raise
+
+    # ------------------------------------------------------------------
+    # Stage results
+    # ------------------------------------------------------------------
+
+    def _complete(self, stage: str, job: _Job, future: Future) -> None:
+        error = future.exception()
+
+        if stage == PROMPT_STAGE:
+            if error is not None:
+                self._finish(job, ERROR, error=f"{stage}: {error}")
+            elif self.dry_run:
+                job.prompt_package = future.result()
+                self._finish(job, PASSED)
+            else:
+                job.prompt_package = future.result()
+                self.ready.append(job)
+            return
+
+        if error is not None:
+            if is_quota_exhausted(error):
+                # Another attempt would fail the same way until the quota resets
+                self._finish(job, ERROR, error=f"{stage}: {error}")
+            else:
+                self._retry_or_finish(job, ERROR, error=f"{stage}: {error}")
+            return
+
+        if stage == GENERATION_STAGE:
+            job.file_size = future.result()
+            if self.skip_validation or not job.item.config.validate:
+                self._finish(job, PASSED, image=True)
+            else:
+                self._submit(VALIDATION_STAGE, job, self._validate, job)
+            return
+
+        validation_result = future.result()
+        if validation_result is None:
+            self._finish(job, PASSED, image=True, skipped_validation=True)
+            return
+
+        self._queue_learning(job, validation_result)
+        score = validation_result.realism_score
+        if validation_result.passed:
+            self._finish(job, PASSED, image=True, realism_score=score)
+        else:
+            self._retry_or_finish(job, FAILED, image=True, realism_score=score)
+
+    def _retry_or_finish(self, job: _Job, status: str, **outcome: Any) -> None:
+        """Send the material back to prompt assembly while its budget lasts."""
+        if job.attempt >= self.batch.max_attempts:
+            self._finish(job, status, **outcome)
+            return
+
+        reason = outcome.get('error') or f"score {outcome.get('realism_score')}"
+        print(f"   🔁 {job.item.material}: attempt {job.attempt}/{self.batch.max_attempts} failed ({reason}), retrying")
+        # The retry prompt should see this attempt's feedback
+        self._flush_learning()
+        self.pending.appendleft(_Job(job.item, attempt=job.attempt + 1))
+
+    def _finish(
+        self,
+        job: _Job,
+        status: str,
+        image: bool = False,
+        realism_score: Optional[float] = None,
+        skipped_validation: bool = False,
+        error: Optional[str] = None
+    ) -> None:
+        material = job.item.material
+        result = BatchItemResult(
+            material=material,
+            status=status,
+            attempts=job.attempt,
+            output_path=str(job.item.output_path) if image else None,
+            realism_score=realism_score,
+            skipped_validation=skipped_validation,
+            error=error,
+        )
+        self.results[material] = result
+        if self.journal is not None and status != ERROR:
+            # Journaled once its learning records are written (a resumed run skips it)
+            self.journal_buffer.append((material, asdict(result)))
+            if not self.learning_buffer:
+                self._flush_learning()
+
+        icon = {PASSED: '✅', FAILED: '⚠️ ', ERROR: '❌'}[status]
+        detail = error or (f"{realism_score:.0f}/100" if realism_score is not None else status)
+        print(f"   {icon} [{len(self.results)}/{len(self.items)}] {material}: {detail} "
+              f"(attempt {job.attempt}/{self.batch.max_attempts})")
+
+    # ------------------------------------------------------------------
+    # Learning database
+    # ------------------------------------------------------------------
+
+    def _queue_learning(self, job: _Job, validation_result) -> None:
+        self.learning_buffer.append({
+            'material': job.item.material,
+            'config': job.item.config,
+            'prompt_package': job.prompt_package,
+            'validation_result': validation_result,
+            'output_path': job.item.output_path,
+            'file_size': job.file_size,
+            'shape_override': job.item.shape_override,
+        })
+        if len(self.learning_buffer) >= self.batch.learning_batch_size:
+            self._flush_learning()
+
+    def _flush_learning(self) -> None:
+        """Write buffered attempts to the learning database in one transaction, then journal finished materials."""
+        if self.learning_buffer:
+            records, self.learning_buffer = self.learning_buffer, []
+            try:
+                with self.pipeline.learning_logger.transaction():
+                    for record in records:
+                        self.pipeline.record_learning(**record)
+            except Exception as e:
+                # Learning is best-effort, as in the single-material pipeline
+                logger.warning(f"Failed to write {len(records)} attempts to learning database: {e}")
+
+        entries, self.journal_buffer = self.journal_buffer, []
+        for material, data in entries:
+            self.journal.append(material, data)
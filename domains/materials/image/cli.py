@@ -8,6 +8,7 @@ Thin wrapper around pipeline.py - handles arguments and output formatting.
 Usage:
     python3 domains/materials/image/cli.py --material "Aluminum"
     python3 domains/materials/image/cli.py --material "Stainless Steel" --show-prompt
+    python3 domains/materials/image/cli.py --category metal --generation-workers 3
 """
 
 import argparse
@@ -20,7 +21,12 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
 
 from domains.materials.image.material_config import MaterialImageConfig
-from domains.materials.image.pipeline import GenerationResult, ImageGenerationPipeline
+from domains.materials.image.pipeline import (
+    GenerationResult,
+    ImageGenerationPipeline,
+    hero_image_path,
+    materials_in_category,
+)
 
 logging.basicConfig(level=logging.INFO, format='%(message)s')
 logger = logging.getLogger(__name__)
@@ -35,12 +41,19 @@ def parse_args():
 Examples:
   python3 domains/materials/image/cli.py --material "Aluminum"
   python3 domains/materials/image/cli.py --material "Brass" --show-prompt --dry-run
+  python3 domains/materials/image/cli.py --materials "Aluminum,Brass,Copper"
+  python3 domains/materials/image/cli.py --category metal --generation-workers 3 --max-attempts 3
         """
     )
     
-    # Required arguments
-    parser.add_argument("--material", required=True, 
+    # Required arguments (one material, or a batch)
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--material",
                        help="Material name (e.g., 'Aluminum', 'Stainless Steel')")
+    target.add_argument("--materials",
+                       help="Batch: comma-separated material names")
+    target.add_argument("--category",
+                       help="Batch: every material of a Materials.yaml category or subcategory (e.g., 'metal')")
     
     # Output options
     parser.add_argument("--output-dir", type=Path,
@@ -96,9 +109,75 @@ Examples:
     parser.add_argument("--skip-validation", action="store_true",
                        help="Skip Gemini vision validation (useful for testing)")
     
+    # Batch options (--materials / --category)
+    parser.add_argument("--generation-workers", type=int, default=2,
+                       help="Batch: image generation requests in flight (default: 2)")
+    parser.add_argument("--validation-workers", type=int, default=2,
+                       help="Batch: vision validation requests in flight (default: 2)")
+    parser.add_argument("--max-attempts", type=int, default=2,
+                       help="Batch: attempts per material before giving up (default: 2)")
+    
     return parser.parse_args()
 
 
+def backup_existing(output_path: Path):
+    """Copy an existing image to *.backup.png before it is overwritten."""
+    import shutil
+    backup_path = output_path.with_suffix('.backup.png')
+    shutil.copy2(output_path, backup_path)
+    logger.info(f"📦 Backed up existing image to: {backup_path}")
+
+
+def run_batch(args, pipeline: ImageGenerationPipeline):
+    """Generate images for every material of --materials / --category."""
+    from domains.materials.image.batch_pipeline import ImageBatchPipeline, build_batch_items
+    
+    if args.filename or args.shape:
+        logger.error("❌ --filename and --shape apply to a single --material only")
+        sys.exit(2)
+    
+    if args.materials:
+        materials = [name.strip() for name in args.materials.split(",") if name.strip()]
+    else:
+        materials = materials_in_category(args.category)
+    
+    output_dir = args.output_dir or Path("public/images/materials")
+    output_dir.mkdir(parents=True, exist_ok=True)
+    
+    items = build_batch_items(
+        pipeline,
+        materials,
+        output_dir,
+        validate=not args.no_validate,
+        severity=args.severity,
+        context=args.context,
+        aging_weight=args.aging_weight,
+        contamination_weight=args.contamination_weight,
+        uniformity=args.uniformity
+    )
+    
+    # Handle existing files
+    if args.no_overwrite:
+        for item in items:
+            if item.output_path.exists():
+                logger.info(f"⚠️  Image already exists: {item.output_path}")
+        items = [item for item in items if not item.output_path.exists()]
+    elif args.backup and not args.dry_run:
+        for item in items:
+            if item.output_path.exists():
+                backup_existing(item.output_path)
+    
+    batch = ImageBatchPipeline(
+        pipeline,
+        generation_workers=args.generation_workers,
+        validation_workers=args.validation_workers,
+        max_attempts=args.max_attempts
+    )
+    results = batch.run(items, dry_run=args.dry_run, skip_validation=args.skip_validation)
+    
+    sys.exit(0 if all(result.passed for result in results) else 1)
+
+
 def main():
     """Main CLI entry point."""
     args = parse_args()
@@ -115,6 +194,9 @@ def main():
         use_flash=args.use_flash
     )
     
+    if not args.material:
+        return run_batch(args, pipeline)
+    
     # Get category for this material
     category = pipeline.get_material_category(args.material)
     
@@ -140,12 +222,7 @@ def main():
     if args.filename:
         output_path = output_dir / args.filename
     else:
-        # Generate safe slug: lowercase, replace spaces/slashes with hyphens, strip parentheses
-        slug = args.material.lower()
-        slug = slug.replace(" ", "-").replace("/", "-")
-        slug = slug.replace("(", "").replace(")", "")  # Strip parentheses
-        slug = "-".join(part for part in slug.split("-") if part)  # Remove empty parts/double hyphens
-        output_path = output_dir / f"{slug}-laser-cleaning-hero.png"
+        output_path = hero_image_path(output_dir, args.material)
     
     # Handle existing file
     if output_path.exists():
@@ -153,10 +230,7 @@ def main():
             logger.info(f"⚠️  Image already exists: {output_path}")
             sys.exit(0)
         if args.backup:
-            import shutil
-            backup_path = output_path.with_suffix('.backup.png')
-            shutil.copy2(output_path, backup_path)
-            logger.info(f"📦 Backed up existing image to: {backup_path}")
+            backup_existing(output_path)
     
     # Log configuration
     logger.info("="*80)
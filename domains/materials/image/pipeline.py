@@ -6,19 +6,23 @@ Core pipeline logic for image generation - separated from CLI concerns.
 Handles: research, prompt generation, image generation, validation, learning.
 
 This module owns the generation flow. CLI (cli.py) handles user interface.
+Batch runs over many materials are scheduled by batch_pipeline.py, which
+calls the stages below (prepare_prompt, generate_image, validate_image,
+record_learning) separately.
 """
 
 import logging
+import os
+import threading
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 import yaml
 
 from domains.materials.image.material_config import MaterialImageConfig
 from domains.materials.image.material_generator import MaterialImageGenerator
-from shared.api.gemini_flash_image_client import GeminiFlashImageClient
-from shared.api.gemini_image_client import GeminiImageClient
+from generation.backfill.engine import is_rate_limit_error
 from shared.image.learning import create_logger
 
 logger = logging.getLogger(__name__)
@@ -75,6 +79,75 @@ PASS_THRESHOLD = _IMAGE_CONFIG['quality']['pass_threshold']
 GUIDANCE_SCALE_DEFAULT = _IMAGE_CONFIG['quality']['guidance_scale_default']
 
 
+# Parsed Materials.yaml, keyed by (mtime_ns, size) of the file
+_materials_yaml: Dict[str, Any] = {'key': None, 'data': None}
+_materials_yaml_lock = threading.Lock()
+
+
+def _load_materials_yaml() -> Dict[str, Any]:
+    """
+    Parsed Materials.yaml, re-read only when the file changes.
+    
+    Batch runs look up every material; parsing the file once per material
+    dominated prompt assembly.
+    """
+    stat = os.stat(MATERIALS_YAML_PATH)
+    key = (stat.st_mtime_ns, stat.st_size)
+    with _materials_yaml_lock:
+        if _materials_yaml['key'] != key:
+            with open(MATERIALS_YAML_PATH, 'r') as f:
+                _materials_yaml['data'] = yaml.safe_load(f)
+            _materials_yaml['key'] = key
+        return _materials_yaml['data']
+
+
+def materials_in_category(category: str) -> List[str]:
+    """
+    Names of all materials whose category or subcategory is category.
+    
+    Args:
+        category: Materials.yaml category (e.g., "metal") or subcategory (e.g., "ferrous")
+        
+    Returns:
+        Material names (as accepted by --material), sorted
+        
+    Raises:
+        FileNotFoundError: If Materials.yaml is missing
+        ValueError: If no material has that category
+    """
+    if not MATERIALS_YAML_PATH.exists():
+        raise FileNotFoundError(f"FAIL-FAST: Materials.yaml not found at {MATERIALS_YAML_PATH}")
+    
+    materials = _load_materials_yaml().get('materials', {})
+    names = sorted(
+        data.get('name', key) for key, data in materials.items()
+        if category in (data.get('category'), data.get('subcategory'))
+    )
+    if not names:
+        raise ValueError(f"No materials with category or subcategory '{category}' in {MATERIALS_YAML_PATH}")
+    return names
+
+
+def hero_image_path(output_dir: Path, material: str) -> Path:
+    """Default hero image path: {material-slug}-laser-cleaning-hero.png in output_dir."""
+    # Generate safe slug: lowercase, replace spaces/slashes with hyphens, strip parentheses
+    slug = material.lower()
+    slug = slug.replace(" ", "-").replace("/", "-")
+    slug = slug.replace("(", "").replace(")", "")  # Strip parentheses
+    slug = "-".join(part for part in slug.split("-") if part)  # Remove empty parts/double hyphens
+    return output_dir / f"{slug}-laser-cleaning-hero.png"
+
+
+def is_quota_error(error: BaseException) -> bool:
+    """Return True if error is an API quota or rate-limit response."""
+    return is_rate_limit_error(error) or is_quota_exhausted(error)
+
+
+def is_quota_exhausted(error: BaseException) -> bool:
+    """Return True if error reports an exhausted API quota (not transient; retrying won't help)."""
+    return "quota" in str(error).lower()
+
+
 def load_material_properties(material_name: str) -> Optional[Dict[str, Any]]:
     """
     Load material properties from Materials.yaml.
@@ -87,8 +160,7 @@ def load_material_properties(material_name: str) -> Optional[Dict[str, Any]]:
         return None
     
     try:
-        with open(MATERIALS_YAML_PATH, 'r') as f:
-            data = yaml.safe_load(f)
+        data = _load_materials_yaml()
         
         materials = data.get('materials', {})
         material_data = materials.get(material_name)
@@ -200,10 +272,13 @@ class ImageGenerationPipeline:
         self.use_flash = use_flash
         self.generator = MaterialImageGenerator(gemini_api_key=gemini_api_key)
         
-        # Select image generation client
+        # Select image generation client (imported on use: only the selected
+        # client's dependencies are loaded)
         if use_flash:
+            from shared.api.gemini_flash_image_client import GeminiFlashImageClient
             self.image_client = GeminiFlashImageClient()
         else:
+            from shared.api.gemini_image_client import GeminiImageClient
             self.image_client = GeminiImageClient(api_key=gemini_api_key)
         
         self.learning_logger = create_logger()
@@ -240,6 +315,45 @@ class ImageGenerationPipeline:
         Returns:
             GenerationResult with outcome details
         """
+        prompt_package = self.prepare_prompt(material, config, shape_override)
+        
+        # Show prompt if requested
+        if show_prompt:
+            self._display_prompt(prompt_package)
+        
+        # Exit early if dry run
+        if dry_run:
+            logger.info("✅ Dry run complete - no image generated")
+            return GenerationResult(
+                passed=True,
+                output_path=None,
+                validation_result=None,
+                prompt_package=prompt_package
+            )
+        
+        # Generate and validate image
+        return self._generate_and_validate(
+            material=material,
+            config=config,
+            prompt_package=prompt_package,
+            output_path=output_path,
+            shape_override=shape_override,
+            skip_validation=skip_validation
+        )
+    
+    def prepare_prompt(
+        self,
+        material: str,
+        config: MaterialImageConfig,
+        shape_override: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Build and validate the prompt package for a material (no API calls
+        except optional shape research).
+        
+        Raises:
+            ValueError: If early or prompt validation fails critically
+        """
         # Run early validation if available
         self._run_early_validation(material, config)
         
@@ -257,29 +371,86 @@ class ImageGenerationPipeline:
         
         # Run prompt validation
         self._run_prompt_validation(material, prompt_package)
+        return prompt_package
+    
+    def generate_image(self, prompt_package: Dict[str, Any], output_path: Path) -> int:
+        """
+        Generate the image for a prompt package and save it.
         
-        # Show prompt if requested
-        if show_prompt:
-            self._display_prompt(prompt_package)
+        Returns:
+            Saved file size in bytes
+        """
+        logger.info(f"\n{'='*80}")
+        logger.info(f"🎨 GENERATING IMAGE")
+        logger.info(f"{'='*80}")
+        logger.info(f"   • Aspect ratio: {prompt_package['aspect_ratio']}")
+        logger.info(f"   • Guidance scale: {prompt_package['guidance_scale']}")
         
-        # Exit early if dry run
-        if dry_run:
-            logger.info("✅ Dry run complete - no image generated")
-            return GenerationResult(
-                passed=True,
-                output_path=None,
-                validation_result=None,
-                prompt_package=prompt_package
-            )
+        # Generate image
+        image = self.image_client.generate_image(
+            prompt=prompt_package["prompt"],
+            negative_prompt=prompt_package["negative_prompt"],
+            aspect_ratio=prompt_package["aspect_ratio"],
+            guidance_scale=prompt_package["guidance_scale"]
+        )
         
-        # Generate and validate image
-        return self._generate_and_validate(
+        # Save image
+        image.save(output_path)
+        file_size = output_path.stat().st_size
+        
+        logger.info(f"✅ Image saved to: {output_path}")
+        logger.info(f"   • Size: {file_size / 1024:.1f} KB")
+        return file_size
+    
+    def validate_image(
+        self,
+        material: str,
+        config: MaterialImageConfig,
+        prompt_package: Dict[str, Any],
+        output_path: Path
+    ):
+        """
+        Validate a generated image with Gemini Vision.
+        
+        Returns:
+            Validation result (API errors, including quota errors, are raised)
+        """
+        logger.info("\n🔍 Validating image with Gemini Vision...")
+        
+        from domains.materials.image.validator import MaterialImageValidator
+        validator = MaterialImageValidator(self.gemini_api_key)
+        
+        return validator.validate_material_image(
+            image_path=output_path,
+            material_name=material,
+            research_data=prompt_package["research_data"],
+            config=config.to_dict(),
+            original_prompt=prompt_package["prompt"],
+            validation_result=prompt_package.get("validation_result")
+        )
+    
+    def record_learning(
+        self,
+        material: str,
+        config: MaterialImageConfig,
+        prompt_package: Dict[str, Any],
+        validation_result,
+        output_path: Path,
+        file_size: int,
+        shape_override: Optional[str] = None
+    ):
+        """Log a validated attempt (with its feedback) to the learning database."""
+        feedback_text, feedback_category = build_feedback_text(validation_result)
+        self._log_to_learning(
             material=material,
             config=config,
             prompt_package=prompt_package,
+            validation_result=validation_result,
             output_path=output_path,
-            shape_override=shape_override,
-            skip_validation=skip_validation
+            file_size=file_size,
+            feedback_text=feedback_text,
+            feedback_category=feedback_category,
+            shape_override=shape_override
         )
     
     def _run_early_validation(self, material: str, config: MaterialImageConfig):
@@ -367,27 +538,7 @@ class ImageGenerationPipeline:
         skip_validation: bool = False
     ) -> GenerationResult:
         """Generate image and run validation."""
-        
-        logger.info(f"\n{'='*80}")
-        logger.info(f"🎨 GENERATING IMAGE")
-        logger.info(f"{'='*80}")
-        logger.info(f"   • Aspect ratio: {prompt_package['aspect_ratio']}")
-        logger.info(f"   • Guidance scale: {prompt_package['guidance_scale']}")
-        
-        # Generate image
-        image = self.image_client.generate_image(
-            prompt=prompt_package["prompt"],
-            negative_prompt=prompt_package["negative_prompt"],
-            aspect_ratio=prompt_package["aspect_ratio"],
-            guidance_scale=prompt_package["guidance_scale"]
-        )
-        
-        # Save image
-        image.save(output_path)
-        file_size = output_path.stat().st_size
-        
-        logger.info(f"✅ Image saved to: {output_path}")
-        logger.info(f"   • Size: {file_size / 1024:.1f} KB")
+        file_size = self.generate_image(prompt_package, output_path)
         
         # Skip validation if disabled or explicitly skipped
         if not config.validate or skip_validation:
@@ -402,23 +553,10 @@ class ImageGenerationPipeline:
             )
         
         # Validate image
-        logger.info("\n🔍 Validating image with Gemini Vision...")
-        
-        from domains.materials.image.validator import MaterialImageValidator
-        validator = MaterialImageValidator(self.gemini_api_key)
-        
         try:
-            validation_result = validator.validate_material_image(
-                image_path=output_path,
-                material_name=material,
-                research_data=prompt_package["research_data"],
-                config=config.to_dict(),
-                original_prompt=prompt_package["prompt"],
-                validation_result=prompt_package.get("validation_result")
-            )
+            validation_result = self.validate_image(material, config, prompt_package, output_path)
         except Exception as val_error:
-            error_str = str(val_error)
-            if "429" in error_str or "quota" in error_str.lower():
+            if is_quota_error(val_error):
                 logger.warning("\n⚠️  Validation API quota exceeded - skipping validation")
                 return GenerationResult(
                     passed=True,
@@ -434,16 +572,13 @@ class ImageGenerationPipeline:
         self._display_validation_results(validation_result)
         
         # Log to learning database
-        feedback_text, feedback_category = build_feedback_text(validation_result)
-        self._log_to_learning(
+        self.record_learning(
             material=material,
             config=config,
             prompt_package=prompt_package,
             validation_result=validation_result,
             output_path=output_path,
             file_size=file_size,
-            feedback_text=feedback_text,
-            feedback_category=feedback_category,
             shape_override=shape_override
         )
         
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Contamination Compatibility Matrix
+
+Precomputed material × contamination-pattern validity for
+ContaminationPatternSelector: the results of the fuzzy valid_materials
+matching (string variants, token sets, substring checks) and the physics
+rules (rust only on ferrous metals, ...), so select_patterns() looks a
+material up instead of evaluating every pattern.
+
+The matrix holds, per normalized material id (lowercased name; all validity
+rules are case-insensitive):
+- compatible: pattern IDs allowed by the physics rules
+- valid: compatible pattern IDs whose valid_materials match the material,
+  in Contaminants.yaml order (selection tie-breaks depend on it)
+
+plus the Materials.yaml contamination rules (valid/prohibited pattern IDs)
+keyed by material key. Rows are built for every Materials.yaml key and name;
+other names get a row on first use.
+
+The matrix is pickled to .cache/contamination_compatibility/ together with a
+content hash of both source files and of the rule code (the selector module
+and shared/utils/metal_classifier.py), and is rebuilt when any of them
+changes.
+
+Usage:
+    from domains.materials.image.research.compatibility_matrix import CompatibilityMatrix
+
+    content_hash = CompatibilityMatrix.compute_content_hash(contaminants_file, materials_file, *rule_sources)
+    matrix = CompatibilityMatrix.load(cache_path, content_hash)
+    row = matrix.row('Aluminum') if matrix else None
+"""
+
+import hashlib
+import logging
+import pickle
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent.parent.parent
+DEFAULT_CACHE_DIR = PROJECT_ROOT / '.cache' / 'contamination_compatibility'
+
+# Bump when the pickle layout changes (rule code is part of the content hash).
+MATRIX_FORMAT_VERSION = 1
+
+
+def material_id(material_name: str) -> str:
+    """Normalized material id used as matrix key."""
+    return material_name.lower()
+
+
+@dataclass(frozen=True)
+class MaterialCompatibility:
+    """Pattern validity for one material."""
+    compatible: FrozenSet[str]
+    valid: Tuple[str, ...]
+    valid_ids: FrozenSet[str]
+
+    @classmethod
+    def build(cls, compatible: List[str], valid: List[str]) -> 'MaterialCompatibility':
+        return cls(frozenset(compatible), tuple(valid), frozenset(valid))
+
+
+class CompatibilityMatrix:
+    """Material × pattern validity rows plus Materials.yaml contamination rules."""
+
+    def __init__(
+        self,
+        content_hash: str,
+        rows: Optional[Dict[str, MaterialCompatibility]] = None,
+        rules: Optional[Dict[str, Dict[str, List[str]]]] = None,
+    ) -> None:
+        self.content_hash = content_hash
+        self._rows: Dict[str, MaterialCompatibility] = dict(rows or {})
+        self.rules: Dict[str, Dict[str, List[str]]] = dict(rules or {})
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def row(self, material_name: str) -> Optional[MaterialCompatibility]:
+        return self._rows.get(material_id(material_name))
+
+    def add(self, material_name: str, row: MaterialCompatibility) -> None:
+        self._rows[material_id(material_name)] = row
+
+    def is_valid(self, material_name: str, pattern_id: str) -> bool:
+        """True if pattern_id is a valid pattern for a material with a row."""
+        row = self.row(material_name)
+        if row is None:
+            raise KeyError(f"No compatibility row for material '{material_name}'")
+        return pattern_id in row.valid_ids
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def compute_content_hash(*paths: Path) -> str:
+        """blake2b over the bytes of paths (missing files hash as absent)."""
+        digest = hashlib.blake2b(digest_size=16)
+        for path in paths:
+            path = Path(path)
+            digest.update(str(path.name).encode('utf-8'))
+            if path.exists():
+                digest.update(b'\x01')
+                digest.update(path.read_bytes())
+            else:
+                digest.update(b'\x00')
+        return digest.hexdigest()
+
+    @staticmethod
+    def cache_path(contaminants_file: Path, materials_file: Path, cache_dir: Optional[Path] = None) -> Path:
+        """Cache file for one pair of source files."""
+        key = hashlib.blake2b(
+            f"{Path(contaminants_file).resolve()}|{Path(materials_file).resolve()}".encode('utf-8'),
+            digest_size=8,
+        ).hexdigest()
+        return Path(cache_dir or DEFAULT_CACHE_DIR) / f"matrix_{key}.pkl"
+
+    @classmethod
+    def load(cls, path: Path, content_hash: str) -> Optional['CompatibilityMatrix']:
+        """Load a persisted matrix; None if missing, unreadable or built from other file contents."""
+        path = Path(path)
+        if not path.exists():
+            return None
+        try:
+            with open(path, 'rb') as handle:
+                header = pickle.load(handle)
+                if header != cls._header(content_hash):
+                    logger.debug(f"Compatibility matrix outdated, rebuilding: {path.name}")
+                    return None
+                rows, rules = pickle.load(handle)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable compatibility matrix {path}: {e}")
+            return None
+        return cls(content_hash, rows, rules)
+
+    def save(self, path: Path) -> None:
+        """Write the matrix atomically (temp file + rename)."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(mode='wb', dir=path.parent, delete=False, suffix='.tmp') as handle:
+            pickle.dump(self._header(self.content_hash), handle, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump((self._rows, self.rules), handle, protocol=pickle.HIGHEST_PROTOCOL)
+            temp_path = handle.name
+        Path(temp_path).replace(path)
+
+    @staticmethod
+    def _header(content_hash: str) -> Dict[str, object]:
+        return {'version': MATRIX_FORMAT_VERSION, 'content_hash': content_hash}
@@ -22,7 +22,12 @@ import re
 
 import yaml
 
+from domains.materials.image.research.compatibility_matrix import (
+    CompatibilityMatrix,
+    MaterialCompatibility,
+)
 # Use central metal classifier for ferrous/non-ferrous logic
+from shared.utils import metal_classifier
 from shared.utils.metal_classifier import get_classifier
 
 logger = logging.getLogger(__name__)
@@ -30,6 +35,11 @@ logger = logging.getLogger(__name__)
 # Project root
 PROJECT_ROOT = Path(__file__).parent.parent.parent.parent.parent
 
+# Code behind the matrix validity rules (_is_pattern_valid_for_material,
+# _material_matches_valid_list, MetalClassifier); hashed with the data files
+# so editing a rule rebuilds the cached matrix.
+MATRIX_RULE_SOURCES = (Path(__file__), Path(metal_classifier.__file__))
+
 
 class ContaminationPatternSelector:
     """
@@ -159,18 +169,26 @@ class ContaminationPatternSelector:
         'carbon fiber': 'composite', 'fiberglass': 'composite', 'pcb': 'composite',
     }
     
-    def __init__(self, contaminants_file: Optional[Path] = None, materials_file: Optional[Path] = None):
+    def __init__(
+        self,
+        contaminants_file: Optional[Path] = None,
+        materials_file: Optional[Path] = None,
+        cache_dir: Optional[Path] = None,
+    ):
         """
         Initialize selector with paths to Contaminants.yaml and Materials.yaml.
         
         Args:
             contaminants_file: Optional path to Contaminants.yaml
             materials_file: Optional path to Materials.yaml for contamination rules
+            cache_dir: Optional directory for the persisted compatibility matrix
         """
         self.contaminants_file = contaminants_file or PROJECT_ROOT / 'data' / 'contaminants' / 'Contaminants.yaml'
         self.materials_file = materials_file or PROJECT_ROOT / 'data' / 'materials' / 'Materials.yaml'
+        self.cache_dir = cache_dir
         self._data: Optional[Dict] = None
         self._materials_data: Optional[Dict] = None
+        self._matrix: Optional[CompatibilityMatrix] = None
         
         if not self.contaminants_file.exists():
             raise FileNotFoundError(f"Contaminants.yaml not found at: {self.contaminants_file}")
@@ -210,20 +228,9 @@ class ContaminationPatternSelector:
             Dict with 'valid' and 'prohibited' lists of pattern IDs
             Empty lists if material not found or no rules defined
         """
-        materials_data = self._load_materials_data()
-        if not materials_data:
-            return {'valid': [], 'prohibited': []}
-        
-        materials = materials_data.get('materials', {})
-        material_info = materials.get(material_name, {})
-        contamination = material_info.get('contamination', {})
-        
-        valid = contamination.get('valid', [])
-        prohibited = contamination.get('prohibited', [])
-        
-        # Normalize pattern IDs: convert underscores to hyphens (yaml uses underscores, patterns use hyphens)
-        valid = [p.replace('_', '-') for p in valid]
-        prohibited = [p.replace('_', '-') for p in prohibited]
+        rules = self.get_compatibility_matrix().rules.get(material_name, {})
+        valid = list(rules.get('valid', []))
+        prohibited = list(rules.get('prohibited', []))
         
         if valid or prohibited:
             logger.info(f"📋 Material rules for {material_name}: valid={len(valid)}, prohibited={len(prohibited)}")
@@ -232,6 +239,72 @@ class ContaminationPatternSelector:
         
         return {'valid': valid, 'prohibited': prohibited}
 
+    def get_compatibility_matrix(self) -> CompatibilityMatrix:
+        """
+        Get the material × pattern compatibility matrix.
+
+        Loaded from the cache when both source files and the rule code
+        (MATRIX_RULE_SOURCES) are unchanged since it was built; otherwise
+        rebuilt and persisted.
+        """
+        if self._matrix is None:
+            content_hash = CompatibilityMatrix.compute_content_hash(
+                self.contaminants_file, self.materials_file, *MATRIX_RULE_SOURCES
+            )
+            cache_path = CompatibilityMatrix.cache_path(self.contaminants_file, self.materials_file, self.cache_dir)
+            matrix = CompatibilityMatrix.load(cache_path, content_hash)
+            if matrix is None:
+                matrix = self._build_compatibility_matrix(content_hash)
+                try:
+                    matrix.save(cache_path)
+                except OSError as e:
+                    logger.warning(f"⚠️ Could not persist compatibility matrix to {cache_path}: {e}")
+                logger.info(f"🧮 Built contamination compatibility matrix ({len(matrix)} materials)")
+            self._matrix = matrix
+        return self._matrix
+
+    def _build_compatibility_matrix(self, content_hash: str) -> CompatibilityMatrix:
+        """Compute rows for every Materials.yaml material (by key and name) and collect its rules."""
+        matrix = CompatibilityMatrix(content_hash)
+        materials_data = self._load_materials_data() or {}
+        for material_key, material_info in materials_data.get('materials', {}).items():
+            if not isinstance(material_info, dict):
+                continue
+
+            contamination = material_info.get('contamination') or {}
+            # Normalize pattern IDs: convert underscores to hyphens (yaml uses underscores, patterns use hyphens)
+            valid = [p.replace('_', '-') for p in contamination.get('valid') or []]
+            prohibited = [p.replace('_', '-') for p in contamination.get('prohibited') or []]
+            if valid or prohibited:
+                matrix.rules[material_key] = {'valid': valid, 'prohibited': prohibited}
+
+            for name in (material_key, material_info.get('name')):
+                if isinstance(name, str) and matrix.row(name) is None:
+                    matrix.add(name, self._compute_compatibility(name))
+        return matrix
+
+    def _compute_compatibility(self, material_name: str) -> MaterialCompatibility:
+        """Run the physics rules and valid_materials matching for every pattern."""
+        patterns = self._load_data().get('contamination_patterns', {})
+        compatible = [
+            pattern_id for pattern_id, pattern in patterns.items()
+            if self._is_pattern_valid_for_material(pattern_id, pattern, material_name)
+        ]
+        valid = [
+            pattern_id for pattern_id in compatible
+            if self._material_matches_valid_list(material_name, patterns[pattern_id].get('valid_materials', []))
+        ]
+        return MaterialCompatibility.build(compatible, valid)
+
+    def _get_compatibility(self, material_name: str) -> MaterialCompatibility:
+        """Matrix row for a material (computed and added on first use for unknown names)."""
+        matrix = self.get_compatibility_matrix()
+        row = matrix.row(material_name)
+        if row is None:
+            row = self._compute_compatibility(material_name)
+            matrix.add(material_name, row)
+        return row
+
     def get_material_category(self, material_name: str) -> str:
         """Get the category for a material (for pattern prioritization)."""
         # Check cache first
@@ -468,6 +541,7 @@ class ContaminationPatternSelector:
         
         Uses the valid_materials field AND chemical compatibility rules.
         Uses intelligent matching to handle alloy variants and base materials.
+        Answered from the precomputed compatibility matrix.
         
         Args:
             material_name: Material name (e.g., "Aluminum", "Titanium Alloy (Ti-6Al-4V)")
@@ -475,21 +549,7 @@ class ContaminationPatternSelector:
         Returns:
             List of pattern IDs valid for this material
         """
-        data = self._load_data()
-        patterns = data.get('contamination_patterns', {})
-        
-        valid_pattern_ids = []
-        for pattern_id, pattern in patterns.items():
-            # First check chemical compatibility (rust only on ferrous, etc.)
-            if not self._is_pattern_valid_for_material(pattern_id, pattern, material_name):
-                continue
-                
-            valid_materials = pattern.get('valid_materials', [])
-            # Check if material matches valid_materials (intelligent matching)
-            if self._material_matches_valid_list(material_name, valid_materials):
-                valid_pattern_ids.append(pattern_id)
-        
-        return valid_pattern_ids
+        return list(self._get_compatibility(material_name).valid)
     
     def _get_category_fallback_patterns(self, category: str, patterns: Dict) -> List[str]:
         """
@@ -617,12 +677,13 @@ class ContaminationPatternSelector:
         }
         
         # Score patterns for selection - MOST COMMON for material, NOT context-based
+        compatible_ids = self._get_compatibility(material_name).compatible
         scored_patterns = []
         for pattern_id in valid_ids:
             pattern = patterns.get(pattern_id, {})
             
             # CRITICAL: Filter out chemically incompatible patterns (rust on non-ferrous, etc.)
-            if not self._is_pattern_valid_for_material(pattern_id, pattern, material_name):
+            if pattern_id not in compatible_ids:
                 logger.info(f"🚫 Filtered out {pattern_id} - incompatible with {material_name}")
                 continue
             
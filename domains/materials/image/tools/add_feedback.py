@@ -114,24 +114,12 @@ def list_recent_feedback(logger, limit: int = 10):
 
 
 def search_feedback(logger, search_term: str):
-    """Search feedback entries by text."""
-    import sqlite3
-    
-    conn = sqlite3.connect(logger.db_path)
-    cursor = conn.cursor()
-    
-    cursor.execute("""
-        SELECT timestamp, material, feedback_category, feedback_text, realism_score, passed
-        FROM generation_attempts
-        WHERE feedback_text LIKE ?
-        ORDER BY timestamp DESC
-        LIMIT 20
-    """, (f"%{search_term}%",))
-    
-    rows = cursor.fetchall()
-    conn.close()
-    
-    return rows
+    """Search feedback entries by text (ranked full-text search)."""
+    return [
+        (r['timestamp'], r['material'], r['feedback_category'], r['feedback_text'],
+         r['realism_score'], r['passed'])
+        for r in logger.search_feedback(search_term, limit=20)
+    ]
 
 
 def get_feedback_stats(logger):
@@ -123,18 +123,20 @@ class MaterialsDataLoader(BaseDataLoader):
         # Optionally merge settings for dataset generation
         if include_machine_settings:
             settings_data = read_yaml_file(self.settings_file)
-            data = self._merge_machine_settings(data, settings_data)
+            data = self.merge_machine_settings(data, settings_data)
 
         # Cache and return (1 hour TTL)
         cache_manager.set(self._get_cache_domain(), cache_key, data, ttl=3600)
 
         return data
     
-    def _merge_machine_settings(self, materials_data: Dict[str, Any], settings_data: Dict[str, Any]) -> Dict[str, Any]:
+    @staticmethod
+    def merge_machine_settings(materials_data: Dict[str, Any], settings_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Merge machine_settings from Settings.yaml into Materials.yaml.
         
         Matches by base slug: 'aluminum-laser-cleaning' material gets 'aluminum-settings' settings.
+        The inputs are not mutated: merged materials are shallow copies.
         
         Args:
             materials_data: Materials.yaml data
@@ -144,10 +146,10 @@ class MaterialsDataLoader(BaseDataLoader):
             Materials data with machine_settings merged
         """
         settings = settings_data.get('settings', {})
-        materials = materials_data.get('materials', {})
+        materials = {}
         
         merged_count = 0
-        for material_slug, material_data in materials.items():
+        for material_slug, material_data in materials_data.get('materials', {}).items():
             # Get base slug (remove -laser-cleaning suffix)
             base_slug = material_slug.replace('-laser-cleaning', '')
             settings_slug = f"{base_slug}-settings"
@@ -156,11 +158,13 @@ class MaterialsDataLoader(BaseDataLoader):
             if settings_slug in settings:
                 setting_data = settings[settings_slug]
                 # Merge machineSettings into material as machine_settings (snake_case for dataset validator)
+                material_data = dict(material_data)
                 material_data['machine_settings'] = setting_data.get('machineSettings', {})
                 merged_count += 1
+            materials[material_slug] = material_data
         
         logger.info(f"Merged machineSettings into {merged_count}/{len(materials)} materials")
-        return materials_data
+        return {**materials_data, 'materials': materials}
     
     def load_properties(self) -> Dict[str, Dict[str, Any]]:
         """
@@ -23,18 +23,48 @@ Usage:
     config = load_domain_config('materials')
     exporter = FrontmatterExporter(config)
     exporter.export_all()
+
+    # Intra-domain parallel export (forked workers share loaded data copy-on-write)
+    exporter.export_all(workers=4)
+
+    # Incremental export (skip items whose inputs are unchanged since last export)
+    exporter.export_all(incremental=True)
+    print(exporter.last_export_report['exported'])
 """
 
 import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from export.utils import load_domain_data, write_frontmatter
 from export.utils.url_formatter import format_filename
 
 logger = logging.getLogger(__name__)
 
+# Exporter inherited by forked item workers (set only while a pool is running).
+_WORKER_EXPORTER: Optional['FrontmatterExporter'] = None
+
+
+def _export_item_chunk(item_ids: List[str], force: bool) -> List[Tuple[str, bool, Optional[str]]]:
+    """
+    Export a chunk of items in a forked worker.
+
+    Runs against the parent's exporter and domain data, inherited copy-on-write
+    through fork, so nothing is re-loaded or pickled per task.
+
+    Returns:
+        List of (item_id, success, error message or None)
+    """
+    exporter = _WORKER_EXPORTER
+    if exporter is None:
+        raise RuntimeError("Item worker started without an inherited exporter")
+    items = exporter._load_domain_data()[exporter.items_key]
+    return [exporter._export_item_safely(item_id, items[item_id], force) for item_id in item_ids]
+
 
 class FrontmatterExporter:
     """
@@ -88,6 +118,12 @@ class FrontmatterExporter:
         self._library_processor: Optional[Any] = None
         self._domain_data: Optional[Dict] = None
         self._field_validator = None
+
+        # Per-item failures from the last export_all() run (item_id → error)
+        self.export_errors: Dict[str, str] = {}
+
+        # What the last export_all() run did, by item (see export_all)
+        self.last_export_report: Dict[str, List[str]] = {}
         
         logger.info(f"Initialized FrontmatterExporter for domain: {self.domain}")
 
@@ -102,6 +138,14 @@ class FrontmatterExporter:
             for item_id in items.keys()
         }
 
+    def _output_file(self, item_id: str) -> Path:
+        """Return the output path for an item."""
+        return self.output_path / format_filename(
+            item_id=item_id,
+            suffix=self.filename_suffix,
+            slugify_id=self.slugify_filenames,
+        )
+
     def _prune_stale_output_files(self, items: Dict[str, Any], dry_run: bool = False) -> int:
         """Remove stale YAML output files that are no longer backed by source data."""
         if not self.output_path.exists():
@@ -161,6 +205,10 @@ class FrontmatterExporter:
     def generators(self) -> List:
         """Lazy-load generators from config."""
         if self._generators is None:
+            if not self.generator_configs:
+                # Nothing to build; avoid importing the generator stack.
+                self._generators = []
+                return self._generators
             from export.generation.registry import create_generators
             self._generators = create_generators(self.generator_configs)
         return self._generators
@@ -232,12 +280,7 @@ class FrontmatterExporter:
             Exception: If export fails (enrichment, generation, or write error)
         """
         # Determine output filename from item_id (with optional slugification)
-        filename = format_filename(
-            item_id=item_id,
-            suffix=self.filename_suffix,
-            slugify_id=self.slugify_filenames
-        )
-        output_file = self.output_path / filename
+        output_file = self._output_file(item_id)
         
         # Skip if exists and not forced
         if not force and output_file.exists():
@@ -287,7 +330,99 @@ class FrontmatterExporter:
             logger.error(f"Failed to export {item_id}: {e}")
             raise
     
-    def export_all(self, force: bool = True, show_progress: bool = True, dry_run: bool = False) -> Dict[str, bool]:
+    def _export_item_safely(
+        self,
+        item_id: str,
+        item_data: Dict[str, Any],
+        force: bool
+    ) -> Tuple[str, bool, Optional[str]]:
+        """Export one item, capturing failure as an error message instead of raising."""
+        try:
+            return item_id, self.export_single(item_id, item_data, force), None
+        except Exception as e:
+            return item_id, False, str(e)
+
+    def _resolve_workers(self, workers: Optional[int]) -> int:
+        """
+        Resolve the item worker count for export_all().
+
+        Falls back to the config key `export_workers`, then to 1 (serial).
+        Parallel export requires the 'fork' start method so workers share the
+        loaded domain data and warmed generators copy-on-write.
+        """
+        if workers is None:
+            workers = self.config.get('export_workers', 1)
+        if workers == 0:
+            workers = os.cpu_count() or 1
+        if workers < 0:
+            raise ValueError(f"workers must be >= 0, got {workers}")
+        if workers > 1 and 'fork' not in multiprocessing.get_all_start_methods():
+            logger.warning("Parallel item export requires fork(); exporting serially")
+            return 1
+        return workers
+
+    def _export_items_parallel(
+        self,
+        items: Dict[str, Any],
+        force: bool,
+        workers: int,
+    ) -> Dict[str, Tuple[bool, Optional[str]]]:
+        """
+        Export items with a pool of forked worker processes.
+
+        The first item is exported in this process before forking so lazily
+        built generator state (associations, author registry, caches) is warm
+        and inherited by every worker instead of being rebuilt per process.
+        Items are dispatched in contiguous chunks; outcomes are keyed by item_id
+        so the caller can report them in source order.
+        """
+        global _WORKER_EXPORTER
+
+        item_ids = list(items)
+        outcomes: Dict[str, Tuple[bool, Optional[str]]] = {}
+        if not item_ids:
+            return outcomes
+
+        first_id = item_ids[0]
+        _, success, error = self._export_item_safely(first_id, items[first_id], force)
+        outcomes[first_id] = (success, error)
+
+        remaining = item_ids[1:]
+        if not remaining:
+            return outcomes
+
+        # Several chunks per worker keeps the pool busy when item costs vary.
+        chunk_size = max(1, len(remaining) // (workers * 4))
+        chunks = [remaining[i:i + chunk_size] for i in range(0, len(remaining), chunk_size)]
+
+        _WORKER_EXPORTER = self
+        try:
+            with ProcessPoolExecutor(
+                max_workers=min(workers, len(chunks)),
+                mp_context=multiprocessing.get_context('fork'),
+            ) as executor:
+                futures = [executor.submit(_export_item_chunk, chunk, force) for chunk in chunks]
+                for chunk, future in zip(chunks, futures, strict=True):
+                    try:
+                        for item_id, success, error in future.result():
+                            outcomes[item_id] = (success, error)
+                    except Exception as e:
+                        # Worker crashed (e.g. killed); every item in its chunk failed.
+                        for item_id in chunk:
+                            outcomes[item_id] = (False, f"worker failed: {e}")
+        finally:
+            _WORKER_EXPORTER = None
+
+        return outcomes
+
+    def export_all(
+        self,
+        force: bool = True,
+        show_progress: bool = True,
+        dry_run: bool = False,
+        workers: Optional[int] = None,
+        incremental: bool = False,
+    ) -> Dict[str, bool]:
         """
         Export all items in domain to frontmatter files.
         
@@ -295,6 +430,18 @@ class FrontmatterExporter:
             force: If True, overwrite existing files
             show_progress: If True, print progress to stdout
             dry_run: If True, simulate export without writing files
+            workers: Item worker processes (default: config `export_workers`
+                or 1 for serial; 0 = one per CPU). Results are identical and
+                in source order either way; per-item errors are collected in
+                self.export_errors.
+            incremental: If True, skip items whose source subtree, export config,
+                generator chain and shared data are unchanged since the last
+                export (see export.performance.export_manifest). The outcome is
+                summarized in self.last_export_report:
+                    unchanged:       skipped, inputs identical
+                    exported:        regenerated
+                    changed_outputs: regenerated and file content differs
+                    failed:          export raised
         
         Returns:
             Dict mapping item_id → success (True if exported, False if skipped)
@@ -317,6 +464,7 @@ class FrontmatterExporter:
                 print(f"\n📦 Exporting {self.domain}...")
         
         results = {}
+        self.export_errors = {}
         data = self._load_domain_data()
         items = data[self.items_key]
 
@@ -334,21 +482,47 @@ class FrontmatterExporter:
         
         exported_count = 0
         skipped_count = 0
+
+        manifest = None
+        item_hashes: Dict[str, str] = {}
+        unchanged: set = set()
+        if incremental:
+            from export.performance.export_manifest import ExportManifest, hash_data
+
+            manifest = ExportManifest.for_exporter(self)
+            for item_id, item_data in items.items():
+                item_hashes[item_id] = hash_data(item_data)
+                if manifest.is_current(item_id, item_hashes[item_id], self._output_file(item_id)):
+                    unchanged.add(item_id)
+            if show_progress:
+                print(f"  Unchanged since last export: {len(unchanged)}")
+        pending = {item_id: item_data for item_id, item_data in items.items() if item_id not in unchanged}
+
+        workers = 1 if dry_run else self._resolve_workers(workers)
+        parallel_outcomes: Optional[Dict[str, Tuple[bool, Optional[str]]]] = None
+        if workers > 1 and len(pending) > 1:
+            if show_progress:
+                print(f"  Workers: {workers}")
+            parallel_outcomes = self._export_items_parallel(pending, force, workers)
         
         for idx, (item_id, item_data) in enumerate(items.items(), 1):
-            if show_progress and idx % 10 == 0:
+            if show_progress and idx % 10 == 0 and parallel_outcomes is None:
                 print(f"  Progress: {idx}/{total} ({(idx/total)*100:.0f}%)")
+
+            if item_id in unchanged:
+                results[item_id] = False
+                skipped_count += 1
+                logger.debug(f"[{idx}/{total}] ⏭️  {item_id} (unchanged)")
+                continue
             
             try:
-                if dry_run:
+                if parallel_outcomes is not None:
+                    success, error = parallel_outcomes[item_id]
+                    if error is not None:
+                        raise RuntimeError(error)
+                elif dry_run:
                     # In dry-run, just check if would export
-                    filename = format_filename(
-                        item_id=item_id,
-                        suffix=self.filename_suffix,
-                        slugify_id=self.slugify_filenames
-                    )
-                    output_file = self.output_path / filename
-                    would_export = force or not output_file.exists()
+                    would_export = force or not self._output_file(item_id).exists()
                     success = would_export
                 else:
                     # Normal export
@@ -368,6 +542,23 @@ class FrontmatterExporter:
                 if show_progress:
                     print(f"  ❌ Failed: {item_id} - {e}")
                 results[item_id] = False
+                self.export_errors[item_id] = str(e)
+
+        exported_ids = [item_id for item_id, success in results.items() if success]
+        self.last_export_report = {
+            'unchanged': [item_id for item_id in items if item_id in unchanged],
+            'exported': exported_ids,
+            'changed_outputs': [],
+            'failed': list(self.export_errors),
+        }
+        if manifest is not None and not dry_run:
+            for item_id in exported_ids:
+                previous_output = manifest.output_hash(item_id)
+                manifest.record(item_id, item_hashes[item_id], self._output_file(item_id))
+                if manifest.output_hash(item_id) != previous_output:
+                    self.last_export_report['changed_outputs'].append(item_id)
+            manifest.prune(items)
+            manifest.save()
         
         # Summary
         action = "would export" if dry_run else "exported"
@@ -381,6 +572,15 @@ class FrontmatterExporter:
             print(f"  ✅ {verb}: {exported_count}")
             if skipped_count > 0:
                 print(f"  ⏭️  Skipped: {skipped_count}")
+            if self.export_errors:
+                print(f"  ❌ Failed: {len(self.export_errors)}")
+            if manifest is not None and not dry_run:
+                changed = self.last_export_report['changed_outputs']
+                print(f"  📝 Changed outputs: {len(changed)}")
+                for item_id in changed[:20]:
+                    print(f"     • {item_id}")
+                if len(changed) > 20:
+                    print(f"     … and {len(changed) - 20} more")
             print(f"  📊 Total: {total}\n")
         
         # Export datasets if not dry-run and domain is materials
@@ -395,8 +595,10 @@ class FrontmatterExporter:
         """
         Export datasets in JSON/CSV/TXT formats.
         
-        Called after successful frontmatter export to generate datasets
-        using the consolidated dataset generator script.
+        Called after successful frontmatter export. Runs the consolidated
+        DatasetGenerator (scripts/export/generate_datasets.py) in-process on
+        the already-loaded domain data, so the dataset step does not pay for a
+        second interpreter start and Materials.yaml re-parse.
         
         Args:
             data: Full domain data dict
@@ -406,42 +608,26 @@ class FrontmatterExporter:
         if show_progress:
             print("📦 Generating datasets...")
         
-        # Use consolidated dataset generator script (v3.0 format)
-        # This generates comprehensive datasets with metadata + structured data
-        import subprocess
-        
         generator_root = Path(__file__).parent.parent.parent
-        script_path = generator_root / "scripts" / "export" / "generate_datasets.py"
-        
-        if not script_path.exists():
-            logger.warning(f"Dataset generator script not found at {script_path}")
-            return
         
         try:
-            # Run consolidated dataset generator for this domain
-            domain = self.config.get('domain') if isinstance(self.config, dict) else self.config.domain
-            result = subprocess.run(
-                ['python3', str(script_path), '--domain', domain],
-                capture_output=True,
-                text=True,
-                cwd=str(generator_root)
+            from scripts.export.generate_datasets import DatasetGenerator
+
+            # Same default location as the script's --z-beam-path (../z-beam)
+            generator = DatasetGenerator(
+                z_beam_path=str(generator_root.parent / 'z-beam'),
+                materials_data=data,
+                workers=self.config.get('dataset_workers'),
+                quiet=True
             )
+            generator.generate_all(domain=self.domain, show_summary=show_progress)
             
-            if show_progress and result.stdout:
-                # Show summary section only (not verbose output)
-                lines = result.stdout.split('\n')
-                in_summary = False
-                for line in lines:
-                    if '📊 GENERATION SUMMARY' in line or in_summary:
-                        print(line)
-                        in_summary = True
-            
-            if result.returncode != 0:
-                logger.warning(f"Dataset generation had issues: {result.stderr}")
+            if generator.stats[self.domain]['errors']:
+                logger.warning(
+                    f"Dataset generation had issues: "
+                    f"{generator.stats[self.domain]['errors']} {self.domain} errors"
+                )
         
-        except Exception as e:
-            logger.warning(f"Failed to run dataset generator: {e}")
-            
         except Exception as e:
             logger.error(f"Dataset export failed: {e}")
             if show_progress:
@@ -486,13 +672,18 @@ class FrontmatterExporter:
         self,
         output_file: Path,
         frontmatter: Dict[str, Any]
-    ) -> None:
+    ) -> bool:
         """
         Write frontmatter dict to YAML file.
+
+        Files whose serialized content is unchanged are not rewritten.
         
         Args:
             output_file: Output path
             frontmatter: Frontmatter dict (field-ordered)
+
+        Returns:
+            True if the file was written, False if already identical
         
         Raises:
             IOError: If write fails
@@ -501,9 +692,10 @@ class FrontmatterExporter:
         # Do NOT convert to regular dict - ordering will be lost
         
         # Use centralized YAML writer with SafeDumper
-        write_frontmatter(output_file, frontmatter, create_dirs=True)
+        written = write_frontmatter(output_file, frontmatter, create_dirs=True)
         
-        logger.debug(f"Wrote {output_file} ({len(frontmatter)} fields)")
+        logger.debug(f"{'Wrote' if written else 'Unchanged'} {output_file} ({len(frontmatter)} fields)")
+        return written
     
     def get_stats(self) -> Dict[str, Any]:
         """
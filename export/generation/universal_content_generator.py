@@ -14,6 +14,9 @@ Architecture:
 - Task-based processing: Each task is a mini-generator
 - Task types: linkage, metadata, relationships, seo, library, etc.
 - Configuration-driven: All behavior defined in config YAML
+- Task plan: the task list is compiled once per generator (handlers resolved,
+  required keys checked, config files loaded); adjacent tree-rewriting tasks
+  (text leaf normalization → camelCase keys) share one traversal per item
 
 Usage:
     from export.generation.universal_content_generator import ContentGenerator
@@ -32,9 +35,10 @@ Usage:
 """
 
 import logging
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 import yaml
 
 from export.generation.base import BaseGenerator
@@ -42,6 +46,54 @@ from shared.text.utils.text_leaf_normalization import coerce_text_leaf_value, no
 
 logger = logging.getLogger(__name__)
 
+SECTION_DISPLAY_SCHEMA = Path(__file__).parent.parent.parent / 'data' / 'schemas' / 'section_display_schema.yaml'
+
+# Section/page text leaves coerced to plain strings by text_field_normalization
+TEXT_LEAF_KEYS = frozenset({'sectionDescription', 'sectionTitle', 'pageDescription', 'pageTitle', 'page_title'})
+
+# Software metadata fields renamed by camelcase_normalization (at any depth)
+CAMELCASE_SOFTWARE_FIELDS = {
+    'content_type': 'contentType',
+    'schema_version': 'schemaVersion',
+    'full_path': 'fullPath',
+    'page_title': 'pageTitle',
+    'page_description': 'pageDescription',
+    'date_published': 'datePublished',
+    'date_modified': 'dateModified',
+    'display_name': 'displayName',
+    'image_url': 'imageUrl',
+    'image_alt': 'imageAlt',
+    'image_width': 'imageWidth',
+    'image_height': 'imageHeight',
+    'country_display': 'countryDisplay',
+    'persona_file': 'personaFile',
+    'formatting_file': 'formattingFile',
+}
+
+# Task config keys without which a task fails on every item
+REQUIRED_TASK_KEYS = {
+    'relationships': ['domain'],
+    'seo_description': ['source_field', 'output_field', 'max_length'],
+    'seo_excerpt': ['source_field', 'output_field', 'max_length'],
+    'library_enrichment': ['library_config'],
+    'normalize_expert_answers': ['target_field'],
+}
+
+# Tree-rewriting tasks that may share one traversal when adjacent, in this order
+FUSIBLE_TREE_TASKS = ('text_field_normalization', 'camelcase_normalization')
+
+
+@dataclass(frozen=True)
+class TaskStep:
+    """One compiled step of a ContentGenerator task plan."""
+    task_type: str
+    config: Dict[str, Any]
+    handler: Callable[[Dict[str, Any], Dict[str, Any]], Dict[str, Any]]
+
+    @property
+    def required(self) -> bool:
+        return bool(self.config.get('required', False))
+
 
 class ContentGenerator(BaseGenerator):
     """
@@ -69,8 +121,11 @@ class ContentGenerator(BaseGenerator):
         super().__init__(config)
         self.tasks = config.get('tasks', [])
         self._task_handlers = self._register_task_handlers()
+        self._yaml_cache: Dict[str, Any] = {}
+        self._field_order_validator = None
+        self.plan = self._compile_plan(self.tasks)
         
-        logger.info(f"Initialized ContentGenerator with {len(self.tasks)} tasks")
+        logger.info(f"Initialized ContentGenerator with {len(self.tasks)} tasks ({len(self.plan)} plan steps)")
     
     def _register_task_handlers(self) -> Dict[str, callable]:
         """Register all task type handlers."""
@@ -100,33 +155,97 @@ class ContentGenerator(BaseGenerator):
             'enrich_material_relationships': self._task_enrich_material_relationships,
         }
     
-    def generate(self, frontmatter: Dict[str, Any]) -> Dict[str, Any]:
+    def _compile_plan(self, tasks: List[Dict[str, Any]]) -> List[TaskStep]:
         """
-        Execute all configured tasks in order.
-        
-        Args:
-            frontmatter: Input frontmatter dict
+        Compile the task list into plan steps once per generator.
         
-        Returns:
-            Enhanced frontmatter dict
+        - Unknown task types and tasks missing required config keys are
+          reported here instead of failing on every item (required tasks raise).
+        - Config files read by section_metadata / field_ordering are loaded now.
+        - Adjacent text_field_normalization → camelcase_normalization tasks are
+          fused into a single tree traversal.
         """
-        for task_config in self.tasks:
+        steps: List[TaskStep] = []
+        for task_config in tasks:
             task_type = task_config.get('type')
             
             if task_type not in self._task_handlers:
                 logger.warning(f"Unknown task type: {task_type}")
                 continue
             
-            handler = self._task_handlers[task_type]
+            missing_keys = [key for key in REQUIRED_TASK_KEYS.get(task_type, []) if key not in task_config]
+            if missing_keys:
+                message = f"{task_type} task missing required config keys: {', '.join(missing_keys)}"
+                if task_config.get('required', False):
+                    raise ValueError(message)
+                logger.error(f"Task '{task_type}' skipped: {message}")
+                continue
             
+            self._preload_task_config(task_type, task_config)
+            
+            previous = steps[-1] if steps else None
+            if (
+                task_type == FUSIBLE_TREE_TASKS[1]
+                and previous is not None
+                and previous.task_type == FUSIBLE_TREE_TASKS[0]
+            ):
+                fused_config = {
+                    'type': '+'.join(FUSIBLE_TREE_TASKS),
+                    'required': previous.required or bool(task_config.get('required', False)),
+                    'tasks': [previous.config, task_config],
+                }
+                steps[-1] = TaskStep(fused_config['type'], fused_config, self._task_text_and_camelcase_normalization)
+                continue
+            
+            steps.append(TaskStep(task_type, task_config, self._task_handlers[task_type]))
+        
+        return steps
+    
+    def _preload_task_config(self, task_type: str, task_config: Dict[str, Any]) -> None:
+        """Load the config files a task reads, so items are exported without disk reads."""
+        try:
+            if task_type == 'section_metadata' and task_config.get('config_file'):
+                if Path(task_config['config_file']).exists():
+                    self._load_yaml_config(task_config['config_file'])
+            elif task_type == 'field_ordering':
+                self._get_field_order_validator()
+                if task_config.get('domain') == 'settings':
+                    self._load_machine_settings_section_metadata()
+        except Exception as e:
+            # Surfaces per item (as before) if the task actually needs the file
+            logger.warning(f"Could not preload config for task '{task_type}': {e}")
+    
+    def _load_yaml_config(self, path: Any) -> Any:
+        """Parse a YAML config file once per generator."""
+        key = str(path)
+        if key not in self._yaml_cache:
+            with open(path, 'r') as f:
+                self._yaml_cache[key] = yaml.safe_load(f)
+        return self._yaml_cache[key]
+    
+    def _get_field_order_validator(self):
+        if self._field_order_validator is None:
+            from shared.validation.field_order import FrontmatterFieldOrderValidator
+            self._field_order_validator = FrontmatterFieldOrderValidator()
+        return self._field_order_validator
+    
+    def generate(self, frontmatter: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Execute the compiled task plan in order.
+        
+        Args:
+            frontmatter: Input frontmatter dict
+        
+        Returns:
+            Enhanced frontmatter dict
+        """
+        for step in self.plan:
             try:
-                frontmatter = handler(frontmatter, task_config)
-                if task_type == 'normalize_applications':
-                    print(f"🔧 normalize_applications task completed")
-                logger.debug(f"✅ Completed task: {task_type}")
+                frontmatter = step.handler(frontmatter, step.config)
+                logger.debug(f"✅ Completed task: {step.task_type}")
             except Exception as e:
-                logger.error(f"Task '{task_type}' failed: {e}")
-                if task_config.get('required', False):
+                logger.error(f"Task '{step.task_type}' failed: {e}")
+                if step.required:
                     raise
         
         return frontmatter
@@ -174,36 +293,60 @@ class ContentGenerator(BaseGenerator):
         - template labels (Title:, Description:)
         - JSON string payload wrappers with sectionDescription fields
         """
-        fields = config.get('fields', [])
-        if fields:
-            for field in fields:
-                if field in frontmatter and isinstance(frontmatter[field], str):
-                    original = frontmatter[field]
-                    normalized = self._normalize_text_output(original)
-                    if normalized != original:
-                        frontmatter[field] = normalized
-                        logger.debug(f"Normalized text field: {field}")
-
+        self._normalize_text_fields(frontmatter, config.get('fields', []))
         frontmatter = self._normalize_section_text_leaves(frontmatter)
 
         return frontmatter
 
+    def _task_text_and_camelcase_normalization(self, frontmatter: Dict[str, Any], config: Dict) -> Dict[str, Any]:
+        """
+        Fused text_field_normalization → camelcase_normalization (one traversal).
+        
+        Same result as running the two tasks in sequence: text leaves are
+        matched on their original (pre-rename) keys, then keys are renamed.
+        """
+        text_config, _camelcase_config = config['tasks']
+        self._normalize_text_fields(frontmatter, text_config.get('fields', []))
+        return self._rewrite_tree(frontmatter, normalize_text_leaves=True, camelcase=True)
+
+    def _normalize_text_fields(self, frontmatter: Dict[str, Any], fields: List[str]) -> None:
+        for field in fields:
+            if field in frontmatter and isinstance(frontmatter[field], str):
+                original = frontmatter[field]
+                normalized = self._normalize_text_output(original)
+                if normalized != original:
+                    frontmatter[field] = normalized
+                    logger.debug(f"Normalized text field: {field}")
+
     def _normalize_section_text_leaves(self, payload: Any) -> Any:
         """Recursively normalize section/page text leaves and coerce object payloads to strings."""
+        return self._rewrite_tree(payload, normalize_text_leaves=True, camelcase=False)
+
+    def _rewrite_tree(self, payload: Any, normalize_text_leaves: bool, camelcase: bool) -> Any:
+        """
+        Rebuild payload, optionally coercing text leaves and renaming software fields.
+        
+        Text leaves (TEXT_LEAF_KEYS) become strings and are not descended into;
+        every other dict/list is rebuilt recursively.
+        """
         if isinstance(payload, list):
-            return [self._normalize_section_text_leaves(item) for item in payload]
+            return [self._rewrite_tree(item, normalize_text_leaves, camelcase) for item in payload]
 
         if not isinstance(payload, dict):
             return payload
 
-        normalized: Dict[str, Any] = {}
+        rewritten: Dict[str, Any] = {}
         for key, value in payload.items():
-            if key in {'sectionDescription', 'sectionTitle', 'pageDescription', 'pageTitle', 'page_title'}:
-                normalized[key] = self._coerce_text_leaf_value(value, key)
-                continue
-            normalized[key] = self._normalize_section_text_leaves(value)
+            if normalize_text_leaves and key in TEXT_LEAF_KEYS:
+                value = self._coerce_text_leaf_value(value, key)
+            else:
+                value = self._rewrite_tree(value, normalize_text_leaves, camelcase)
+            if camelcase and key in CAMELCASE_SOFTWARE_FIELDS:
+                logger.debug(f"   {key} → {CAMELCASE_SOFTWARE_FIELDS[key]}")
+                key = CAMELCASE_SOFTWARE_FIELDS[key]
+            rewritten[key] = value
 
-        return normalized
+        return rewritten
 
     def _coerce_text_leaf_value(self, value: Any, leaf_key: str) -> str:
         """Coerce a known text leaf value to string and normalize wrappers."""
@@ -417,8 +560,7 @@ class ContentGenerator(BaseGenerator):
             print(f"⚠️  section_metadata: No config file")
             return frontmatter
         
-        with open(config_file, 'r') as f:
-            domain_config = yaml.safe_load(f)
+        domain_config = self._load_yaml_config(config_file)
         
         # Get section metadata definitions from config
         configured_metadata = domain_config.get('sections', {})
@@ -889,71 +1031,10 @@ class ContentGenerator(BaseGenerator):
         """
         logger.info("🔄 Running camelCase normalization (software metadata only)...")
         
-        # Software metadata fields that should be camelCase
-        SOFTWARE_FIELDS = {
-            'content_type': 'contentType',
-            'schema_version': 'schemaVersion',
-            'full_path': 'fullPath',
-            'page_title': 'pageTitle',
-            'page_description': 'pageDescription',
-            'date_published': 'datePublished',
-            'date_modified': 'dateModified',
-            'display_name': 'displayName',
-            'image_url': 'imageUrl',
-            'image_alt': 'imageAlt',
-            'image_width': 'imageWidth',
-            'image_height': 'imageHeight',
-            'country_display': 'countryDisplay',
-            'persona_file': 'personaFile',
-            'formatting_file': 'formattingFile',
-        }
-        
-        # Domain data structures (now in camelCase after source normalization)
-        # These fields are no longer converted - they pass through as-is from source
-        # Empty set means all fields follow normal camelCase conversion rules
-        DOMAIN_DATA_FIELDS = set()
-        
-        def normalize_dict(d, is_domain_data=False):
-            if not isinstance(d, dict):
-                return d
-            
-            normalized = {}
-            for key, value in d.items():
-                # Skip fields starting with underscore
-                if key.startswith('_'):
-                    normalized[key] = normalize_value(value, is_domain_data)
-                    continue
-                
-                # If we're inside domain data structure, preserve snake_case
-                if is_domain_data:
-                    normalized[key] = normalize_value(value, is_domain_data=True)
-                    continue
-                
-                # Check if this is a domain data field that should remain snake_case
-                if key in DOMAIN_DATA_FIELDS:
-                    normalized[key] = normalize_value(value, is_domain_data=True)
-                    continue
-                
-                # Convert software metadata fields to camelCase
-                if key in SOFTWARE_FIELDS:
-                    new_key = SOFTWARE_FIELDS[key]
-                    logger.debug(f"   {key} → {new_key}")
-                    normalized[new_key] = normalize_value(value, is_domain_data)
-                else:
-                    # Keep field as-is if not in software fields list
-                    normalized[key] = normalize_value(value, is_domain_data)
-            
-            return normalized
-        
-        def normalize_value(value, is_domain_data=False):
-            if isinstance(value, dict):
-                return normalize_dict(value, is_domain_data)
-            elif isinstance(value, list):
-                return [normalize_value(item, is_domain_data) for item in value]
-            else:
-                return value
-        
-        result = normalize_dict(frontmatter)
+        # Domain data structures are camelCase at source and pass through as-is;
+        # only CAMELCASE_SOFTWARE_FIELDS keys are renamed (fields starting with
+        # underscore are never renamed)
+        result = self._rewrite_tree(frontmatter, normalize_text_leaves=False, camelcase=True)
         logger.info("✅ camelCase normalization complete (software metadata converted, domain data preserved)")
         return result
     
@@ -1018,27 +1099,6 @@ class ContentGenerator(BaseGenerator):
         """
         domain = config.get('domain')
 
-        def _load_machine_settings_section_metadata() -> Dict[str, Any]:
-            schema_path = Path(__file__).parent.parent.parent / 'data' / 'schemas' / 'section_display_schema.yaml'
-            if not schema_path.exists():
-                raise FileNotFoundError(f"Missing required section schema file: {schema_path}")
-
-            with open(schema_path, 'r') as schema_file:
-                schema_data = yaml.safe_load(schema_file)
-
-            if not isinstance(schema_data, dict):
-                raise TypeError("section_display_schema.yaml must contain a dictionary")
-
-            sections = schema_data.get('sections')
-            if not isinstance(sections, dict):
-                raise TypeError("section_display_schema.yaml missing required dictionary key: sections")
-
-            machine_metadata = sections.get('machineSettings')
-            if not isinstance(machine_metadata, dict):
-                raise KeyError("section_display_schema.yaml missing required sections.machineSettings metadata")
-
-            return machine_metadata
-
         def _enforce_settings_machine_settings_contract(payload: Dict[str, Any]) -> None:
             if domain != 'settings':
                 return
@@ -1058,7 +1118,7 @@ class ContentGenerator(BaseGenerator):
                 section_meta = {}
                 machine_settings['_section'] = section_meta
 
-            metadata = _load_machine_settings_section_metadata()
+            metadata = self._load_machine_settings_section_metadata()
 
             if 'sectionTitle' not in section_meta or not str(section_meta.get('sectionTitle', '')).strip():
                 section_meta['sectionTitle'] = metadata.get('sectionTitle') or metadata.get('title') or 'Machine Settings'
@@ -1125,13 +1185,28 @@ class ContentGenerator(BaseGenerator):
         _enforce_settings_machine_settings_contract(frontmatter)
         _enforce_section_contract(frontmatter)
         
-        # Import field validator
-        from shared.validation.field_order import FrontmatterFieldOrderValidator
-        
-        validator = FrontmatterFieldOrderValidator()
-        frontmatter = validator.reorder_fields(frontmatter, domain)
+        frontmatter = self._get_field_order_validator().reorder_fields(frontmatter, domain)
         
         return frontmatter
+
+    def _load_machine_settings_section_metadata(self) -> Dict[str, Any]:
+        if not SECTION_DISPLAY_SCHEMA.exists():
+            raise FileNotFoundError(f"Missing required section schema file: {SECTION_DISPLAY_SCHEMA}")
+
+        schema_data = self._load_yaml_config(SECTION_DISPLAY_SCHEMA)
+
+        if not isinstance(schema_data, dict):
+            raise TypeError("section_display_schema.yaml must contain a dictionary")
+
+        sections = schema_data.get('sections')
+        if not isinstance(sections, dict):
+            raise TypeError("section_display_schema.yaml missing required dictionary key: sections")
+
+        machine_metadata = sections.get('machineSettings')
+        if not isinstance(machine_metadata, dict):
+            raise KeyError("section_display_schema.yaml missing required sections.machineSettings metadata")
+
+        return machine_metadata
     
     def _task_library_enrichment(self, frontmatter: Dict[str, Any], config: Dict) -> Dict[str, Any]:
         """
@@ -5,14 +5,17 @@ Provides high-performance utilities for export operations:
 
 - ParallelExporter: Multi-process domain exports (3-4x faster)
 - YAMLCache: In-memory caching (500x faster repeated loads)
+- ExportManifest: Content-hash record for incremental exports
 
 Combined Performance Improvement: 5-10x faster overall
 """
 
+from export.performance.export_manifest import ExportManifest
 from export.performance.parallel_exporter import ParallelExporter
 from export.performance.yaml_cache import YAMLCache, get_yaml_cache, load_yaml_cached
 
 __all__ = [
+    'ExportManifest',
     'ParallelExporter',
     'YAMLCache',
     'get_yaml_cache',
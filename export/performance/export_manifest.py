@@ -0,0 +1,281 @@
+"""
+Export Manifest - Content-hash record of the last export of each item.
+
+Lets FrontmatterExporter skip items whose inputs have not changed since the
+last export. An item is re-exported when any of these differ from the
+manifest:
+
+- item hash:    hash of the item's source subtree
+- domain hash:  hash of the domain export config, the generator-chain
+                fingerprint (see generator_chain_fingerprint), the non-item
+                sections of the source file and every other data/ YAML file
+                (generators read cross-domain data, including
+                data/schemas/section_display_schema.yaml, so any change there
+                conservatively invalidates the whole domain)
+- output file:  missing, or its bytes no longer match the recorded hash
+
+Manifests live in .cache/export_manifests/, one JSON file per
+(domain, output path) pair, so the output directory (the website repo) only
+ever contains frontmatter files.
+
+Usage:
+    from export.performance.export_manifest import ExportManifest
+
+    manifest = ExportManifest.for_exporter(exporter)
+    if manifest.is_current(item_id, item_hash, output_file):
+        ...  # skip
+    manifest.record(item_id, item_hash, output_file)
+    manifest.save()
+"""
+
+import ast
+import functools
+import hashlib
+import json
+import logging
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+DEFAULT_MANIFEST_DIR = PROJECT_ROOT / '.cache' / 'export_manifests'
+
+# Bump when generator behaviour changes in a way the fingerprint cannot see:
+# inputs read at export time from outside export/ and data/ (environment,
+# files outside the repo) or modules loaded dynamically by name.
+GENERATOR_CHAIN_VERSION = 1
+
+# Bump when the manifest file layout changes.
+MANIFEST_FORMAT_VERSION = 1
+
+
+def hash_bytes(data: bytes) -> str:
+    """Return the hex digest used for all manifest hashes."""
+    return hashlib.blake2b(data, digest_size=20).hexdigest()
+
+
+def hash_data(data: Any) -> str:
+    """Hash a JSON-compatible structure (dates and other scalars via str)."""
+    return hash_bytes(json.dumps(data, sort_keys=True, default=str, ensure_ascii=False).encode('utf-8'))
+
+
+def _module_files(root: Path, module_name: str) -> List[Path]:
+    """Project files executed by importing module_name (package __init__s included)."""
+    files = []
+    parts = module_name.split('.')
+    for depth in range(1, len(parts) + 1):
+        base = root.joinpath(*parts[:depth])
+        for candidate in (base / '__init__.py', base.with_suffix('.py')):
+            if candidate.is_file():
+                files.append(candidate)
+                break
+    return files
+
+
+def _imported_modules(root: Path, path: Path) -> Set[str]:
+    """Absolute names of every module path imports, at any scope."""
+    try:
+        tree = ast.parse(path.read_bytes(), filename=str(path))
+    except (SyntaxError, ValueError):
+        return set()
+    package = '.'.join(path.relative_to(root).with_suffix('').parts)
+    if path.name != '__init__.py':
+        package = package.rpartition('.')[0]
+    names: Set[str] = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            if node.level:
+                anchor = package.split('.') if package else []
+                anchor = anchor[:len(anchor) - (node.level - 1)] if node.level > 1 else anchor
+                module = '.'.join(anchor + ([node.module] if node.module else []))
+            else:
+                module = node.module or ''
+            if not module:
+                continue
+            names.add(module)
+            # "from pkg import submodule"
+            names.update(f"{module}.{alias.name}" for alias in node.names if alias.name != '*')
+    return names
+
+
+def generator_chain_files() -> Tuple[Path, ...]:
+    """
+    Files whose content decides what the export chain emits.
+
+    Everything under export/ (code, config/*.yaml, schema.json) plus every
+    project module reachable from export/ code through imports, including
+    function-level ones (shared/, generation/, domains/, ...). The import
+    graph is scanned once per process; file contents are hashed per call.
+    """
+    return _chain_files(PROJECT_ROOT)
+
+
+@functools.lru_cache(maxsize=None)
+def _chain_files(root: Path) -> Tuple[Path, ...]:
+    export_root = root / 'export'
+    files = {
+        path for path in export_root.rglob('*')
+        if path.is_file() and '__pycache__' not in path.parts and path.suffix != '.pyc'
+    }
+    pending = [path for path in files if path.suffix == '.py']
+    seen = set(pending)
+    while pending:
+        for module_name in _imported_modules(root, pending.pop()):
+            for module_file in _module_files(root, module_name):
+                if module_file not in seen:
+                    seen.add(module_file)
+                    pending.append(module_file)
+    files.update(seen)
+    return tuple(sorted(files))
+
+
+def generator_chain_fingerprint() -> str:
+    """Hash of generator_chain_files() plus GENERATOR_CHAIN_VERSION."""
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(f"v{GENERATOR_CHAIN_VERSION}".encode('utf-8'))
+    for path in generator_chain_files():
+        digest.update(str(path.relative_to(PROJECT_ROOT)).encode('utf-8'))
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def data_files_fingerprint(exclude: Iterable[Path] = ()) -> str:
+    """Hash of every data/ YAML file except those in exclude."""
+    excluded = {Path(p).resolve() for p in exclude}
+    digest = hashlib.blake2b(digest_size=20)
+    data_root = PROJECT_ROOT / 'data'
+    for path in sorted(data_root.rglob('*.yaml')):
+        if path.resolve() in excluded:
+            continue
+        digest.update(str(path.relative_to(data_root)).encode('utf-8'))
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+class ExportManifest:
+    """
+    Per-item export record for one domain and output directory.
+
+    A manifest whose domain hash does not match the current inputs is treated
+    as empty: every item is exported again and the manifest is rewritten.
+    """
+
+    def __init__(self, manifest_path: Path, domain_hash: str) -> None:
+        """
+        Initialize manifest.
+
+        Args:
+            manifest_path: JSON manifest file
+            domain_hash: Hash of all domain-wide export inputs (see module docs)
+        """
+        self.manifest_path = Path(manifest_path)
+        self.domain_hash = domain_hash
+        self.items: Dict[str, Dict[str, Any]] = {}
+        self.domain_changed = True
+        self._load()
+
+    @classmethod
+    def for_exporter(cls, exporter: Any, manifest_dir: Optional[Path] = None) -> 'ExportManifest':
+        """
+        Build the manifest for a FrontmatterExporter's domain and output path.
+
+        Args:
+            exporter: FrontmatterExporter instance (domain data is loaded)
+            manifest_dir: Override manifest directory (default: .cache/export_manifests)
+        """
+        data = exporter._load_domain_data()
+        source_sections = {key: value for key, value in data.items() if key != exporter.items_key}
+        domain_hash = hash_data({
+            'config': exporter.config,
+            'generator_chain': generator_chain_fingerprint(),
+            'source_sections': hash_data(source_sections),
+            'data_files': data_files_fingerprint(exclude=[exporter.source_file]),
+        })
+        output_key = hashlib.sha1(str(exporter.output_path.resolve()).encode('utf-8')).hexdigest()[:12]
+        manifest_dir = Path(manifest_dir or DEFAULT_MANIFEST_DIR)
+        return cls(manifest_dir / f"{exporter.domain}.{output_key}.json", domain_hash)
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def is_current(self, item_id: str, item_hash: str, output_file: Path) -> bool:
+        """Return True if item_id was exported from the same inputs and its output is intact."""
+        entry = self.items.get(item_id)
+        if entry is None or entry.get('item_hash') != item_hash:
+            return False
+        if entry.get('output_file') != output_file.name:
+            return False
+        try:
+            return hash_bytes(output_file.read_bytes()) == entry.get('output_hash')
+        except FileNotFoundError:
+            return False
+
+    def record(self, item_id: str, item_hash: str, output_file: Path) -> None:
+        """Record a successful export of item_id (output file must exist)."""
+        self.items[item_id] = {
+            'item_hash': item_hash,
+            'output_file': output_file.name,
+            'output_hash': hash_bytes(output_file.read_bytes()),
+        }
+
+    def output_hash(self, item_id: str) -> Optional[str]:
+        """Return the recorded output hash for item_id, if any."""
+        entry = self.items.get(item_id)
+        return entry.get('output_hash') if entry else None
+
+    def prune(self, item_ids: Iterable[str]) -> List[str]:
+        """Drop entries for items not in item_ids; return the removed IDs."""
+        keep = set(item_ids)
+        removed = [item_id for item_id in self.items if item_id not in keep]
+        for item_id in removed:
+            del self.items[item_id]
+        return removed
+
+    def save(self) -> None:
+        """Atomically write the manifest."""
+        payload = {
+            'version': MANIFEST_FORMAT_VERSION,
+            'domain_hash': self.domain_hash,
+            'items': self.items,
+        }
+        try:
+            self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                mode='w',
+                encoding='utf-8',
+                dir=self.manifest_path.parent,
+                delete=False,
+                suffix='.tmp'
+            ) as tmp_file:
+                json.dump(payload, tmp_file, indent=1, sort_keys=True)
+                tmp_path = Path(tmp_file.name)
+            tmp_path.replace(self.manifest_path)
+        except OSError as e:
+            # Without a manifest the next run simply exports everything again.
+            logger.warning(f"Could not write export manifest {self.manifest_path.name}: {e}")
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _load(self) -> None:
+        if not self.manifest_path.exists():
+            return
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                payload = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable export manifest {self.manifest_path.name}: {e}")
+            return
+        if payload.get('version') != MANIFEST_FORMAT_VERSION:
+            return
+        if payload.get('domain_hash') != self.domain_hash:
+            logger.info(f"Export inputs changed for {self.manifest_path.stem}; exporting all items")
+            return
+        self.items = payload.get('items', {})
+        self.domain_changed = False
@@ -18,6 +18,9 @@ Usage:
     
     # Export specific domains in parallel
     results = exporter.export_domains(['materials', 'contaminants'])
+
+    # Also parallelize items within each domain (forked item workers)
+    exporter = ParallelExporter(item_workers=2)
 """
 
 import logging
@@ -30,7 +33,12 @@ from shared.type_aliases import DomainType, GenerationResult
 logger = logging.getLogger(__name__)
 
 
-def _export_single_domain(domain: DomainType, skip_existing: bool = False) -> GenerationResult:
+def _export_single_domain(
+    domain: DomainType,
+    skip_existing: bool = False,
+    item_workers: Optional[int] = None,
+    incremental: bool = False
+) -> GenerationResult:
     """
     Export a single domain (runs in separate process).
     
@@ -39,6 +47,8 @@ def _export_single_domain(domain: DomainType, skip_existing: bool = False) -> Ge
     Args:
         domain: Domain to export ('materials', 'contaminants', 'compounds', 'settings', 'applications')
         skip_existing: Skip items that already have frontmatter files
+        item_workers: Item worker processes within the domain (None: config default)
+        incremental: Skip items unchanged since the last export
         
     Returns:
         GenerationResult with success status and export count
@@ -51,18 +61,22 @@ def _export_single_domain(domain: DomainType, skip_existing: bool = False) -> Ge
         started = time.time()
         config = load_domain_config(domain)
         exporter = FrontmatterExporter(config)
-        result = exporter.export_all(force=not skip_existing)
+        result = exporter.export_all(
+            force=not skip_existing,
+            workers=item_workers,
+            incremental=incremental
+        )
         elapsed = time.time() - started
 
         exported = sum(1 for success in result.values() if success)
-        skipped = len(result) - exported
+        skipped = len(result) - exported - len(exporter.export_errors)
         
         return {
             'success': True,
             'domain': domain,
             'exported': exported,
             'skipped': skipped,
-            'errors': [],
+            'errors': [f"{item_id}: {error}" for item_id, error in exporter.export_errors.items()],
             'elapsed': elapsed
         }
     except Exception as e:
@@ -83,14 +97,24 @@ class ParallelExporter:
     providing 3-4x speedup over sequential export.
     """
     
-    def __init__(self, max_workers: Optional[int] = None):
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        item_workers: Optional[int] = None,
+        incremental: bool = False
+    ):
         """
         Initialize parallel exporter.
         
         Args:
             max_workers: Maximum parallel processes (default: 5 for 5 domains)
+            item_workers: Item worker processes per domain export
+                          (default: each domain config's export_workers, else serial)
+            incremental: Skip items unchanged since the last export
         """
         self.max_workers = max_workers or 5
+        self.item_workers = item_workers
+        self.incremental = incremental
         self.logger = logging.getLogger(__name__)
     
     def export_domains(
@@ -116,7 +140,9 @@ class ParallelExporter:
         with ProcessPoolExecutor(max_workers=min(self.max_workers, len(domains))) as executor:
             # Submit all export tasks
             future_to_domain = {
-                executor.submit(_export_single_domain, domain, skip_existing): domain
+                executor.submit(
+                    _export_single_domain, domain, skip_existing, self.item_workers, self.incremental
+                ): domain
                 for domain in domains
             }
             
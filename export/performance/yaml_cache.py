@@ -6,7 +6,8 @@ Provides in-memory caching for frequently loaded YAML files.
 Reduces file I/O by 80-90% for repeated data access.
 
 Performance Benefits:
-- First load: ~50ms (disk read)
+- First load: ~50ms (disk read; large files come from the on-disk
+  parse snapshot in shared.cache.yaml_snapshot when unchanged)
 - Cached loads: ~0.1ms (memory read) - 500x faster
 - Memory usage: ~2-5MB for typical datasets
 
@@ -32,6 +33,8 @@ from pathlib import Path
 from typing import Any, Dict, Optional
 import yaml
 
+from shared.cache.yaml_snapshot import get_snapshot_store
+
 logger = logging.getLogger(__name__)
 
 
@@ -91,8 +94,7 @@ class YAMLCache:
         self.logger.debug(f"Cache MISS: {file_path}")
         
         start_time = time.time()
-        with open(path, 'r', encoding='utf-8') as f:
-            data = yaml.safe_load(f)
+        data = get_snapshot_store().load(path, 'safe', yaml.safe_load)
         load_time = (time.time() - start_time) * 1000  # Convert to ms
         
         self.logger.debug(f"Loaded {file_path} in {load_time:.1f}ms")
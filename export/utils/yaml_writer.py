@@ -19,18 +19,25 @@ def write_yaml(
     data: Dict[str, Any],
     create_dirs: bool = True,
     width: int = 120
-) -> None:
+) -> bool:
     """
     Write data to YAML file with consistent formatting.
     
     Uses SafeDumper to prevent Python-specific tags (!!python/object)
     that break JavaScript YAML parsers like js-yaml.
+
+    The file is only rewritten when the serialized bytes differ from what is
+    already on disk, so unchanged outputs keep their mtime (downstream static
+    site builds watch mtimes).
     
     Args:
         file_path: Output file path
         data: Dict to serialize
         create_dirs: Create parent directories if needed (default: True)
         width: Line width for YAML formatting (default: 120)
+
+    Returns:
+        True if the file was written, False if its content was already identical
     
     Raises:
         IOError: If write fails
@@ -62,18 +69,27 @@ def write_yaml(
         Dumper=yaml.SafeDumper  # MANDATORY - prevents Python tags, handles OrderedDict
     )
     
+    encoded = yaml_string.encode('utf-8')
+    try:
+        if file_path.stat().st_size == len(encoded) and file_path.read_bytes() == encoded:
+            logger.debug(f"Unchanged {file_path} ({len(data)} fields)")
+            return False
+    except FileNotFoundError:
+        pass
+
     # Write to file
-    with open(file_path, 'w', encoding='utf-8') as f:
-        f.write(yaml_string)
+    with open(file_path, 'wb') as f:
+        f.write(encoded)
     
     logger.debug(f"Wrote {file_path} ({len(data)} fields)")
+    return True
 
 
 def write_frontmatter(
     file_path: Path | str,
     frontmatter: Dict[str, Any],
     create_dirs: bool = True
-) -> None:
+) -> bool:
     """
     Write frontmatter data to YAML file.
     
@@ -83,6 +99,9 @@ def write_frontmatter(
         file_path: Output file path
         frontmatter: Frontmatter dict to write
         create_dirs: Create parent directories if needed (default: True)
+
+    Returns:
+        True if the file was written, False if its content was already identical
     
     Raises:
         IOError: If write fails
@@ -91,7 +110,7 @@ def write_frontmatter(
         from export.utils.yaml_writer import write_frontmatter
         write_frontmatter('frontmatter/materials/aluminum.yaml', data)
     """
-    write_yaml(file_path, frontmatter, create_dirs=create_dirs, width=120)
+    return write_yaml(file_path, frontmatter, create_dirs=create_dirs, width=120)
 
 
 def serialize_yaml(
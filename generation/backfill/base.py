@@ -11,6 +11,9 @@ Unlike export enrichers (temporary), backfill generators:
 Architecture:
 - Atomic writes (temp file + rename)
 - Dry-run support
+- Concurrent populate() calls (bounded thread pool + request rate limit)
+- Checkpoint journal: completed items survive a crash and are resumed
+- Periodic flushes of the source file during long runs
 - ALWAYS overwrite existing content (mandatory for structural variation)
 - Progress tracking and statistics
 
@@ -32,13 +35,29 @@ Usage:
     }
     generator = MyBackfillGenerator(config)
     stats = generator.backfill_all()
+
+Optional engine config keys:
+    concurrency: 4              # populate() calls in flight (default: 1)
+    requests_per_minute: 60     # rate limit across workers (default: unlimited)
+    flush_every: 10             # write source every N completed items (default: 10)
+    rate_limit_retries: 3       # retries for rate-limit errors (default: 3)
+    rate_limit_backoff: 5.0     # first retry delay in seconds, doubled per retry
 """
 
+import copy
+import logging
+import time
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import nullcontext
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, ContextManager, Dict, Optional
 import yaml
 
+from generation.backfill.engine import BackfillJournal, RequestRateLimiter, is_rate_limit_error
+
+logger = logging.getLogger(__name__)
+
 
 class BaseBackfillGenerator(ABC):
     """
@@ -68,11 +87,24 @@ class BaseBackfillGenerator(ABC):
             )
         self.dry_run = config['dry_run']
         self.item_filter = config.get('item_filter')
+
+        # Engine settings (see module docstring)
+        self.concurrency = self._positive_int_config('concurrency', 1)
+        self.flush_every = self._positive_int_config('flush_every', 10)
+        self.rate_limit_retries = config.get('rate_limit_retries', 3)
+        self.rate_limit_backoff = float(config.get('rate_limit_backoff', 5.0))
+        self.requests_per_minute: Optional[float] = config.get('requests_per_minute')
         
         # Validate source file exists
         if not self.source_file.exists():
             raise FileNotFoundError(f"Source file not found: {self.source_file}")
     
+    def _positive_int_config(self, key: str, default: int) -> int:
+        value = self.config.get(key, default)
+        if not isinstance(value, int) or isinstance(value, bool) or value < 1:
+            raise ValueError(f"Invalid config value for {key}: expected int >= 1, got {value!r}")
+        return value
+
     @abstractmethod
     def populate(self, item_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -85,13 +117,30 @@ class BaseBackfillGenerator(ABC):
             Modified item dict (with new/enriched fields)
         """
         pass
+
+    def concurrent_write_scope(self) -> ContextManager[Any]:
+        """
+        Context entered around the worker pool when concurrency > 1.
+
+        Generators whose populate() also writes the source file (e.g. through
+        a DomainAdapter) override this to buffer those writes, so that the
+        only source writes made while workers run are backfill_all's own.
+        The scope is exited before the final source write.
+        """
+        return nullcontext()
     
     def backfill_all(self) -> Dict[str, int]:
         """
         Backfill all items in source YAML file.
+
+        populate() runs on up to `concurrency` worker threads, each on its own
+        copy of the item, subject to `requests_per_minute`. Completed items are
+        journaled as they finish and the source file is rewritten every
+        `flush_every` completions. If a run is interrupted, the next run of the
+        same generator restores the journaled items and only processes the rest.
         
         Returns:
-            Stats dict: {processed, modified, skipped, errors}
+            Stats dict: {processed, modified, skipped, errors, resumed}
         """
         print(f"\\n{'='*80}")
         print(f"🔄 BACKFILLING: {self.__class__.__name__}")
@@ -99,6 +148,9 @@ class BaseBackfillGenerator(ABC):
         print(f"Source: {self.source_file}")
         print(f"Field: {self.field}")
         print(f"Mode: {'DRY RUN' if self.dry_run else 'WRITE'}")
+        if self.concurrency > 1 or self.requests_per_minute:
+            rate = f", {self.requests_per_minute}/min" if self.requests_per_minute else ""
+            print(f"Workers: {self.concurrency}{rate}")
         print()
         
         # Load source YAML
@@ -114,40 +166,98 @@ class BaseBackfillGenerator(ABC):
                 f"Expected '{self.items_key}' to be a dictionary in {self.source_file}, got {type(items).__name__}"
             )
         
-        stats = {'processed': 0, 'modified': 0, 'skipped': 0, 'errors': 0}
+        stats = {'processed': 0, 'modified': 0, 'skipped': 0, 'errors': 0, 'resumed': 0}
+
+        # Restore items completed by an interrupted earlier run
+        journal: Optional[BackfillJournal] = None
+        resumed = set()
+        if not self.dry_run:
+            journal = self.get_journal()
+            for item_id, item_data in journal.entries():
+                if item_id in items:
+                    items[item_id] = item_data
+                    resumed.add(item_id)
+            if resumed:
+                print(f"♻️  Resuming: {len(resumed)} items restored from {journal.journal_path.name}")
         
-        # Process each item
+        # Select items to process (source order)
+        pending = []
         for item_id, item_data in items.items():
             # Skip if item_filter specified and doesn't match
             if self.item_filter and item_id != self.item_filter:
                 continue
-                
+
+            if item_id in resumed:
+                stats['processed'] += 1
+                stats['modified'] += 1
+                stats['resumed'] += 1
+                continue
+
+            # Check if already populated
             try:
-                # Check if already populated
                 if self._should_skip(item_data):
                     stats['skipped'] += 1
                     print(f"   ⏭️  {item_id}: already populated")
                     continue
-                
-                # Generate/enrich data
-                modified_data = self.populate(item_data)
-                
-                # Update in-memory data
-                items[item_id] = modified_data
-                stats['processed'] += 1
-                stats['modified'] += 1
-                print(f"   ✅ {item_id}: populated")
-                
             except Exception as e:
                 stats['errors'] += 1
                 print(f"   ❌ {item_id}: error - {e}")
+                continue
+
+            pending.append(item_id)
+
+        limiter = RequestRateLimiter(self.requests_per_minute)
+        unflushed = len(resumed)
         
+        # Process items (populate works on a copy; results are applied here,
+        # on the calling thread, so flushes never see a half-updated item)
+        write_scope = self.concurrent_write_scope() if self.concurrency > 1 else nullcontext()
+        with write_scope, ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            futures = {
+                executor.submit(self._populate_item, item_id, copy.deepcopy(items[item_id]), limiter): item_id
+                for item_id in pending
+            }
+            try:
+                for future in as_completed(futures):
+                    item_id = futures[future]
+                    try:
+                        modified_data = future.result()
+                    except Exception as e:
+                        stats['errors'] += 1
+                        print(f"   ❌ {item_id}: error - {e}")
+                        continue
+
+                    # Update in-memory data
+                    items[item_id] = modified_data
+                    stats['processed'] += 1
+                    stats['modified'] += 1
+                    print(f"   ✅ {item_id}: populated")
+
+                    if journal is not None:
+                        journal.append(item_id, modified_data)
+                        unflushed += 1
+                        if unflushed >= self.flush_every:
+                            self._write_source(data)
+                            unflushed = 0
+                            print(f"   💾 Checkpoint: {stats['modified']} items saved")
+            except BaseException:
+                # Interrupted: don't start queued items; the journal keeps
+                # everything completed so far for the next run.
+                for future in futures:
+                    future.cancel()
+                raise
+
         # Write back to source YAML (if not dry run)
         if not self.dry_run and stats['modified'] > 0:
-            self._write_source(data)
+            if unflushed > 0:
+                self._write_source(data)
             print(f"\\n💾 Saved {stats['modified']} changes to {self.source_file}")
         elif self.dry_run and stats['modified'] > 0:
             print(f"\\n🔍 DRY RUN: Would save {stats['modified']} changes")
+
+        # Run finished: everything journaled is now in the source file
+        if journal is not None:
+            journal.clear()
         
         # Print summary
         print(f"\\n{'='*80}")
@@ -157,9 +267,51 @@ class BaseBackfillGenerator(ABC):
         print(f"Modified:  {stats['modified']}")
         print(f"Skipped:   {stats['skipped']}")
         print(f"Errors:    {stats['errors']}")
+        if stats['resumed']:
+            print(f"Resumed:   {stats['resumed']}")
         print(f"{'='*80}\\n")
         
         return stats
+
+    def get_journal(self) -> BackfillJournal:
+        """Return the checkpoint journal for this generator's run scope."""
+        return BackfillJournal.for_generator(
+            self.source_file,
+            self.__class__.__name__,
+            {'items_key': self.items_key, 'field': self.field, 'item_filter': self.item_filter},
+        )
+
+    def _populate_item(
+        self,
+        item_id: str,
+        item_data: Dict[str, Any],
+        limiter: RequestRateLimiter
+    ) -> Dict[str, Any]:
+        """
+        Run populate() for one item, retrying provider rate-limit errors.
+
+        Args:
+            item_id: Item identifier (for logging)
+            item_data: Private copy of the item
+            limiter: Shared request rate limiter
+
+        Returns:
+            Populated item data
+        """
+        attempt = 0
+        while True:
+            limiter.acquire()
+            try:
+                return self.populate(item_data)
+            except Exception as e:
+                if attempt >= self.rate_limit_retries or not is_rate_limit_error(e):
+                    raise
+                delay = self.rate_limit_backoff * (2 ** attempt)
+                attempt += 1
+                logger.warning(
+                    f"{item_id}: rate limited ({e}); retry {attempt}/{self.rate_limit_retries} in {delay:.1f}s"
+                )
+                time.sleep(delay)
     
     def _should_skip(self, item_data: Dict[str, Any]) -> bool:
         """
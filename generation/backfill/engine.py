@@ -0,0 +1,160 @@
+"""
+Backfill Engine Support - Checkpoint journal and request rate limiting.
+
+Used by BaseBackfillGenerator.backfill_all() to run populate() calls
+concurrently without losing completed work:
+
+- BackfillJournal: fsync'd JSON-lines record of every completed item, kept
+  next to the source file. A rerun of the same generator replays it and
+  skips the journaled items; it is deleted when a run completes.
+- RequestRateLimiter: token bucket that spaces populate() starts so a
+  concurrent backfill stays under the provider's requests-per-minute limit.
+
+Usage:
+    journal = BackfillJournal.for_generator(source_file, 'UniversalTextGenerator', {'field': 'description'})
+    completed = dict(journal.entries())    # item_id → item data
+
+    limiter = RequestRateLimiter(requests_per_minute=60)
+    limiter.acquire()                      # blocks until a request may start
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+import yaml
+
+logger = logging.getLogger(__name__)
+
+# Substrings of provider errors that mean "slow down and retry".
+RATE_LIMIT_MARKERS = ('429', 'rate limit', 'rate_limit', 'too many requests')
+
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    """Return True if error looks like a provider rate-limit response."""
+    message = str(error).lower()
+    return any(marker in message for marker in RATE_LIMIT_MARKERS)
+
+
+class BackfillJournal:
+    """
+    Append-only record of items completed by one backfill generator run.
+
+    Each line holds the item ID and its populated data (as YAML text, so dates
+    and other non-JSON scalars round-trip). A truncated last line from a crash
+    mid-append is ignored.
+    """
+
+    def __init__(self, journal_path: Path) -> None:
+        self.journal_path = Path(journal_path)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_generator(
+        cls,
+        source_file: Path,
+        generator_name: str,
+        scope: Dict[str, Any],
+    ) -> 'BackfillJournal':
+        """
+        Return the journal for a generator run against source_file.
+
+        Args:
+            source_file: Source YAML being backfilled
+            generator_name: Generator class name
+            scope: Config values that identify the run (field, item filter, ...);
+                   a different scope gets a different journal
+        """
+        source_file = Path(source_file)
+        scope_key = hashlib.sha1(
+            json.dumps([generator_name, scope], sort_keys=True, default=str).encode('utf-8')
+        ).hexdigest()[:10]
+        return cls(source_file.parent / f".{source_file.name}.{generator_name}-{scope_key}.journal.jsonl")
+
+    def exists(self) -> bool:
+        """Return True if a journal from an earlier run is present."""
+        return self.journal_path.exists()
+
+    def append(self, item_id: str, item_data: Dict[str, Any]) -> None:
+        """Durably record a completed item (fsync'd before returning)."""
+        line = json.dumps({
+            'item_id': item_id,
+            'item_yaml': yaml.safe_dump(item_data, allow_unicode=True, sort_keys=False),
+        }, ensure_ascii=False)
+        with self._lock:
+            with open(self.journal_path, 'a', encoding='utf-8') as f:
+                f.write(line + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+
+    def entries(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Yield (item_id, item_data) for every journaled item, in order."""
+        if not self.journal_path.exists():
+            return
+        with open(self.journal_path, 'r', encoding='utf-8') as f:
+            for line_number, line in enumerate(f, start=1):
+                if not line.endswith('\n'):
+                    logger.warning(
+                        f"Ignoring incomplete journal entry {self.journal_path.name}:{line_number}"
+                    )
+                    break
+                entry = json.loads(line)
+                yield entry['item_id'], yaml.safe_load(entry['item_yaml'])
+
+    def clear(self) -> None:
+        """Delete the journal (run completed)."""
+        self.journal_path.unlink(missing_ok=True)
+
+
+class RequestRateLimiter:
+    """
+    Thread-safe token bucket limiting request starts per minute.
+
+    Capacity equals `burst` (default 1), so requests are evenly spaced
+    rather than released in a burst at the start of each minute.
+    """
+
+    def __init__(self, requests_per_minute: Optional[float] = None, burst: int = 1) -> None:
+        """
+        Initialize rate limiter.
+
+        Args:
+            requests_per_minute: Sustained request rate (None or 0: unlimited)
+            burst: Requests that may start back-to-back after an idle period
+        """
+        if requests_per_minute is not None and requests_per_minute < 0:
+            raise ValueError(f"requests_per_minute must be >= 0, got {requests_per_minute}")
+        if burst < 1:
+            raise ValueError(f"burst must be >= 1, got {burst}")
+        self.rate = (requests_per_minute or 0) / 60.0
+        self.capacity = float(burst)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """
+        Block until a request may start.
+
+        Returns:
+            Seconds spent waiting
+        """
+        if self.rate <= 0:
+            return 0.0
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                delay = (1 - self._tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
@@ -5,11 +5,12 @@ Complies with Core Principle 0: Universal Text Processing Pipeline.
 """
 
 from generation.backfill.base import BaseBackfillGenerator
+from generation.backfill.engine import is_rate_limit_error
 from generation.backfill.registry import BackfillRegistry
 from generation.core.evaluated_generator import QualityEvaluatedGenerator
 from shared.text.utils.text_leaf_normalization import coerce_text_leaf_value, normalize_text_output
 from postprocessing.evaluation.subjective_evaluator import SubjectiveEvaluator
-from typing import Optional, Any
+from typing import Optional, Any, ContextManager
 from pathlib import Path
 import yaml
 import logging
@@ -105,6 +106,17 @@ class UniversalTextGenerator(BaseBackfillGenerator):
             raise KeyError("section_display_schema.yaml missing required key: sections")
 
         return payload
+
+    def concurrent_write_scope(self) -> ContextManager[Any]:
+        """
+        Buffer the generator's DomainAdapter writes while workers run.
+
+        Concurrent generate() calls then share one write session (serialized
+        under its lock) instead of rewriting the source file on every call and
+        racing backfill_all's checkpoint writes. The session is flushed when
+        the worker pool finishes.
+        """
+        return self.generator.generator.adapter.session_scope()
     
     def populate(self, item_data: dict) -> dict:
         """
@@ -169,6 +181,9 @@ class UniversalTextGenerator(BaseBackfillGenerator):
                     logger.error(f"{prefix}❌ {field}: Generation failed - {error_msg}")
                     
             except Exception as e:
+                # Let backfill_all retry the item with backoff
+                if is_rate_limit_error(e):
+                    raise
                 prefix = f"    " if self.mode == 'multi' else "  "
                 logger.error(f"{prefix}❌ {field}: Generation error - {e}")
                 import traceback
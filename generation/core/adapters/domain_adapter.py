@@ -14,6 +14,10 @@ Usage:
     adapter = DomainAdapter('settings')
     
     # Uses domains/{domain}/config.yaml for all configuration
+
+    # Batch runs: buffer writes and flush every 10 components
+    with DomainAdapter.write_session('materials', flush_every=10):
+        ...
 """
 
 import logging
@@ -21,15 +25,18 @@ import json
 import re
 import tempfile
 import yaml
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, ClassVar, Dict, Iterator, Optional, Tuple
 
 from shared.utils.yaml_utils import load_yaml
+from shared.utils.yaml_block_index import YAMLItemBlockIndex
 from shared.text.utils.text_leaf_normalization import coerce_text_leaf_value, normalize_text_output
 from shared.text.utils.prompt_registry_service import PromptRegistryService
 
 from generation.core.adapters.base import DataSourceAdapter
+from generation.core.adapters.write_session import DomainWriteSession
 
 logger = logging.getLogger(__name__)
 
@@ -49,6 +56,10 @@ class DomainAdapter(DataSourceAdapter):
         author_key: Path to author ID in item data (default: "author.id")
         context_keys: List of keys to include in context (default: ["category"])
     """
+
+    # Active write-behind sessions by (domain, resolved data file), shared by
+    # all adapter instances; adapters on another copy of the data don't join
+    _sessions: ClassVar[Dict[Tuple[str, str], DomainWriteSession]] = {}
     
     def __init__(self, domain: str, config_override: Optional[Dict] = None):
         """
@@ -91,6 +102,11 @@ class DomainAdapter(DataSourceAdapter):
         
         # Cache for loaded data
         self._data_cache = None
+        self._data_cache_signature = None
+
+        # Line-range index for single-item writes (built on first write)
+        self._block_index: Optional[YAMLItemBlockIndex] = None
+        self._block_index_checked = False
         
         logger.info(f"DomainAdapter initialized for '{domain}' domain")
         logger.debug(f"  Data path: {self.data_path}")
@@ -158,11 +174,15 @@ class DomainAdapter(DataSourceAdapter):
             if not self.data_path.exists():
                 raise FileNotFoundError(f"Data file not found: {self.data_path}")
             
+            self._data_cache_signature = self._data_file_signature()
             with open(self.data_path, 'r', encoding='utf-8') as f:
                 self._data_cache = yaml.safe_load(f)
 
             items = self._get_items_root(self._data_cache)
             self._normalize_author_identity(items)
+            session = self._sessions.get(self._session_key())
+            if session is not None:
+                items.update(session.pending_items)
             item_count = len(items)
             logger.debug(f"Loaded {item_count} items from {self.data_path}")
         
@@ -205,7 +225,223 @@ class DomainAdapter(DataSourceAdapter):
     def invalidate_cache(self):
         """Clear data cache to force reload on next access"""
         self._data_cache = None
+        self._data_cache_signature = None
+
+    def _data_file_signature(self) -> tuple:
+        """(mtime_ns, size) of the data file, used to detect external edits."""
+        stat = self.data_path.stat()
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _get_block_index(self) -> Optional[YAMLItemBlockIndex]:
+        """Return the item block index, or None if the data file layout is not indexable."""
+        if not self._block_index_checked:
+            self._block_index = YAMLItemBlockIndex.build(self.data_path, self.data_root_key)
+            self._block_index_checked = True
+            if self._block_index is None:
+                logger.info(f"{self.data_path} is not block-indexable; using full-file writes")
+        return self._block_index
+
+    def _load_item_for_write(self, identifier: str) -> Dict[str, Any]:
+        """
+        Load fresh item data from disk for a write.
+
+        Parses only the item's own block when it is self-contained; otherwise
+        (shared YAML anchors, unindexable layout, unknown item) reloads the
+        whole file. Inside a write session, buffered item data wins.
+        """
+        session = self._sessions.get(self._session_key())
+        if session is not None and identifier in session.pending_items:
+            return session.pending_items[identifier]
+
+        index = self._get_block_index()
+        if index is not None and index.is_isolated(identifier):
+            item_data = index.read_item(identifier)
+            self._normalize_author_identity({identifier: item_data})
+            return item_data
+
+        self.invalidate_cache()
+        items = self._get_items_root(self.load_all_data())
+        if identifier not in items:
+            raise ValueError(f"'{identifier}' not found in {self.data_path}")
+        return items[identifier]
+
+    def _write_items(self, items: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Persist items to the domain data YAML in one atomic write.
+
+        Splices only the items' blocks when possible; otherwise re-dumps the
+        whole file. The in-memory data cache is patched rather than dropped
+        when it was loaded from the file version being replaced.
+        """
+        signature_before = self._data_file_signature()
+        index = self._get_block_index()
+        if index is not None and all(index.has_item(identifier) for identifier in items):
+            if index.write_items(items):
+                if self._data_cache is not None and self._data_cache_signature == signature_before:
+                    self._get_items_root(self._data_cache).update(items)
+                    self._data_cache_signature = self._data_file_signature()
+                else:
+                    self.invalidate_cache()
+                return
+
+        if self._data_cache_signature != signature_before:
+            self.invalidate_cache()
+        all_data = self.load_all_data()
+        self._get_items_root(all_data).update(items)
+
+        # Atomic write with temp file
+        with tempfile.NamedTemporaryFile(
+            mode='w',
+            encoding='utf-8',
+            dir=self.data_path.parent,
+            delete=False,
+            suffix='.yaml'
+        ) as temp_f:
+            yaml.dump(all_data, temp_f, default_flow_style=False, allow_unicode=True, sort_keys=False)
+            temp_path = temp_f.name
+        
+        Path(temp_path).replace(self.data_path)
+        self.invalidate_cache()
     
+    # ------------------------------------------------------------------
+    # Write-behind sessions
+    # ------------------------------------------------------------------
+
+    def get_journal_path(self) -> Path:
+        """Journal of buffered session writes, kept next to the data file."""
+        return self.data_path.with_name(f".{self.data_path.name}.journal.jsonl")
+
+    def _session_key(self) -> Tuple[str, str]:
+        """Key of this adapter's write session: domain and resolved data file."""
+        return self.domain, str(self.data_path.resolve())
+
+    def get_active_session(self) -> Optional[DomainWriteSession]:
+        """Return the write session active for this domain's data file, if any."""
+        return self._sessions.get(self._session_key())
+
+    def begin_session(
+        self,
+        flush_every: Optional[int] = None,
+        flush_seconds: Optional[float] = None,
+    ) -> DomainWriteSession:
+        """
+        Start buffering write_component calls for this domain's data file.
+
+        Any journal left by a crashed session is replayed and flushed first.
+
+        Args:
+            flush_every: Flush after this many component writes (None: at end only)
+            flush_seconds: Flush when the oldest buffered write is this old
+
+        Raises:
+            RuntimeError: If a session is already active for this domain's data file
+        """
+        key = self._session_key()
+        if key in self._sessions:
+            raise RuntimeError(f"Write session already active for domain '{self.domain}' ({self.data_path})")
+
+        session = DomainWriteSession(
+            self.domain,
+            self.get_journal_path(),
+            flush_every=flush_every,
+            flush_seconds=flush_seconds,
+        )
+        self._sessions[key] = session
+        try:
+            self._recover_journal(session)
+        except Exception:
+            del self._sessions[key]
+            raise
+        logger.info(
+            f"Write session started for '{self.domain}' "
+            f"(flush_every={flush_every}, flush_seconds={flush_seconds})"
+        )
+        return session
+
+    def flush_session(self) -> int:
+        """
+        Write all buffered items in one atomic source write, then sync frontmatter.
+
+        Returns:
+            Number of component writes flushed
+        """
+        session = self._sessions.get(self._session_key())
+        if session is None:
+            return 0
+
+        with session.lock:
+            if not session.has_pending():
+                return 0
+            flushed = session.pending_writes
+            self._write_items(dict(session.pending_items))
+            logger.info(
+                f"✅ Flushed {flushed} buffered write(s) for {len(session.pending_items)} item(s) "
+                f"to {self.data_path}"
+            )
+            for identifier, component_type, content in session.pending_syncs:
+                self._sync_to_frontmatter(identifier, component_type, content)
+            session.mark_flushed()
+            return flushed
+
+    def end_session(self) -> None:
+        """Flush remaining writes and stop buffering for this domain's data file."""
+        key = self._session_key()
+        if key not in self._sessions:
+            return
+        try:
+            self.flush_session()
+        finally:
+            del self._sessions[key]
+            logger.info(f"Write session ended for '{self.domain}'")
+
+    @classmethod
+    @contextmanager
+    def write_session(
+        cls,
+        domain: str,
+        flush_every: Optional[int] = None,
+        flush_seconds: Optional[float] = None,
+    ) -> Iterator[DomainWriteSession]:
+        """
+        Context manager for a write-behind session on a domain.
+
+        Buffered writes are flushed on exit, including when the body raises;
+        if the flush itself fails the journal is kept for the next session.
+        """
+        with cls(domain).session_scope(flush_every=flush_every, flush_seconds=flush_seconds) as session:
+            yield session
+
+    @contextmanager
+    def session_scope(
+        self,
+        flush_every: Optional[int] = None,
+        flush_seconds: Optional[float] = None,
+    ) -> Iterator[DomainWriteSession]:
+        """write_session() on this adapter instance (keeps its data_path)."""
+        session = self.begin_session(flush_every=flush_every, flush_seconds=flush_seconds)
+        try:
+            yield session
+        finally:
+            self.end_session()
+
+    def _recover_journal(self, session: DomainWriteSession) -> None:
+        """Replay and flush writes journaled by a session that never flushed."""
+        entries = list(session.journal_entries())
+        if not entries:
+            if session.journal_path.exists():
+                session.journal_path.unlink()
+            return
+
+        logger.warning(
+            f"Recovering {len(entries)} unflushed write(s) from {session.journal_path}"
+        )
+        for entry in entries:
+            identifier = entry['identifier']
+            item_data = self._load_item_for_write(identifier)
+            item_data = self._apply_component(identifier, item_data, entry['target_field'], entry['content'])
+            session.buffer(identifier, entry['component_type'], entry['content'], item_data)
+        self.flush_session()
+
     def get_item_data(self, identifier: str) -> Dict[str, Any]:
         """
         Get data for specific item.
@@ -219,6 +455,10 @@ class DomainAdapter(DataSourceAdapter):
         Raises:
             ValueError: If item not found
         """
+        session = self._sessions.get(self._session_key())
+        if session is not None and identifier in session.pending_items:
+            return session.pending_items[identifier]
+
         all_data = self.load_all_data()
         items = self._get_items_root(all_data)
         
@@ -459,14 +699,23 @@ class DomainAdapter(DataSourceAdapter):
             component_type: Component type
             content_data: Content to write (may be parsed into title/description)
         """
-        # Reload fresh data
-        self.invalidate_cache()
-        all_data = self.load_all_data()
-        
-        # Verify item exists
-        items = self._get_items_root(all_data)
-        if identifier not in items:
-            raise ValueError(f"'{identifier}' not found in {self.data_path}")
+        session = self._sessions.get(self._session_key())
+        if session is None:
+            self._write_component(identifier, component_type, content_data)
+            return
+        # Writers on other threads share the session buffer
+        with session.lock:
+            self._write_component(identifier, component_type, content_data)
+
+    def _write_component(
+        self,
+        identifier: str,
+        component_type: str,
+        content_data: Any
+    ) -> None:
+        """write_component body (called under the session lock inside a session)."""
+        # Reload fresh item data (raises ValueError if item doesn't exist)
+        item_data = self._load_item_for_write(identifier)
         
         # CHECK FOR SCHEMA-BASED GENERATION (NEW Jan 13, 2026)
         schema_metadata = self.get_section_metadata(component_type)
@@ -485,7 +734,7 @@ class DomainAdapter(DataSourceAdapter):
                 content_data, 
                 component_type, 
                 identifier,
-                items.get(identifier)  # Pass item data for author/metadata
+                item_data  # Pass item data for author/metadata
             )
 
         normalize_components = self.domain_generation.get('normalize_components')
@@ -500,11 +749,42 @@ class DomainAdapter(DataSourceAdapter):
         target_field = self._get_target_field(component_type)
         content_to_save = self._normalize_text_leaf_for_target(target_field, content_to_save)
         
+        item_data = self._apply_component(identifier, item_data, target_field, content_to_save)
+
+        # WRITE-BEHIND SESSION: buffer (journaled) and flush on interval
+        session = self._sessions.get(self._session_key())
+        if session is not None:
+            session.record(identifier, component_type, target_field, content_to_save, item_data)
+            if self._data_cache is not None:
+                self._get_items_root(self._data_cache)[identifier] = item_data
+            logger.info(
+                f"📥 {component_type} buffered for {self.data_root_key}.{identifier} "
+                f"({session.pending_writes} pending)"
+            )
+            if session.should_flush():
+                self.flush_session()
+            return
+        
+        self._write_items({identifier: item_data})
+        
+        logger.info(f"✅ {component_type} written to {self.data_path} → {self.data_root_key}.{identifier}.{component_type}")
+
+        # DUAL-WRITE POLICY (MANDATORY): Immediately sync field to frontmatter
+        self._sync_to_frontmatter(identifier, component_type, content_to_save)
+
+    def _apply_component(
+        self,
+        identifier: str,
+        item_data: Dict[str, Any],
+        target_field: str,
+        content_to_save: Any
+    ) -> Dict[str, Any]:
+        """Set target_field on item_data and apply generation-time enrichment."""
         # Write content to target field
         if '.' in target_field:
             # Nested field (e.g., 'operational.expert_answers')
             parts = target_field.split('.')
-            current = items[identifier]
+            current = item_data
             for part in parts[:-1]:
                 if part not in current:
                     current[part] = {}
@@ -512,41 +792,27 @@ class DomainAdapter(DataSourceAdapter):
             current[parts[-1]] = content_to_save
         else:
             # Top-level field
-            items[identifier][target_field] = content_to_save
+            item_data[target_field] = content_to_save
         
         # GENERATION-TIME ENRICHMENT (Jan 5, 2026): Add ALL metadata at generation time
         # Complies with Core Principle 0.6: "No Build-Time Data Enhancement"
         logger.info(f"🔧 Enriching {identifier} with generation-time metadata...")
         from generation.context.generation_metadata import enrich_for_generation
-        items[identifier] = enrich_for_generation(items[identifier], identifier, self.domain)
+        item_data = enrich_for_generation(item_data, identifier, self.domain)
         logger.info(f"✅ Generation-time enrichment complete for {identifier}")
         
         # PHASE 2 (Jan 7, 2026): Add complete software metadata at generation time
         logger.info(f"🔧 Adding software metadata for {identifier}...")
-        items[identifier] = self.enrich_on_save(items[identifier], identifier)
+        item_data = self.enrich_on_save(item_data, identifier)
         logger.info(f"✅ Software metadata complete for {identifier}")
-        
-        # Atomic write with temp file
-        with tempfile.NamedTemporaryFile(
-            mode='w',
-            encoding='utf-8',
-            dir=self.data_path.parent,
-            delete=False,
-            suffix='.yaml'
-        ) as temp_f:
-            yaml.dump(all_data, temp_f, default_flow_style=False, allow_unicode=True, sort_keys=False)
-            temp_path = temp_f.name
-        
-        Path(temp_path).replace(self.data_path)
-        self.invalidate_cache()
-        
-        logger.info(f"✅ {component_type} written to {self.data_path} → {self.data_root_key}.{identifier}.{component_type}")
+        return item_data
 
-        # DUAL-WRITE POLICY (MANDATORY): Immediately sync field to frontmatter
+    def _sync_to_frontmatter(self, identifier: str, component_type: str, content: Any) -> None:
+        """Dual-write: sync one written field to the item's frontmatter file."""
         logger.info(f"🔄 Syncing {component_type} to frontmatter for {identifier}...")
         try:
             from generation.utils.frontmatter_sync import sync_field_to_frontmatter
-            sync_field_to_frontmatter(identifier, component_type, content_to_save, domain=self.domain)
+            sync_field_to_frontmatter(identifier, component_type, content, domain=self.domain)
             logger.info(f"✅ Frontmatter sync complete for {identifier}.{component_type}")
         except Exception as sync_error:
             raise RuntimeError(
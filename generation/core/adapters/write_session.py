@@ -0,0 +1,181 @@
+"""
+Domain Write Session - Write-behind buffering for DomainAdapter.
+
+Outside a session every DomainAdapter.write_component call persists the item
+to the domain source YAML and syncs the field to frontmatter immediately. In a
+batch run that is one source rewrite per generated component.
+
+Inside a session, DomainAdapter buffers the enriched item data (including
+enrich_on_save results) and the pending frontmatter syncs in memory, and
+flushes them in one atomic source write every `flush_every` components,
+every `flush_seconds`, and at session end.
+
+Concurrent writers (parallel postprocessing workers) share one session; every
+buffer mutation and flush happens under the session lock, so source writes
+are serialized.
+
+Crash safety: every buffered component is appended to a JSON-lines journal
+next to the data file (fsync'd) before write_component returns. Starting a
+new session on the same data file replays any journal left by a crashed run
+and flushes it before new work begins.
+
+Sessions belong to a domain's data file: adapters for the same domain that
+point at another file (e.g. a scratch copy via config_override) neither see
+nor flush its buffered items.
+
+Usage:
+    from generation.core.adapters.domain_adapter import DomainAdapter
+
+    with DomainAdapter.write_session('materials', flush_every=10):
+        for item_id in items:
+            generator.generate(item_id, 'pageDescription')
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import yaml
+
+logger = logging.getLogger(__name__)
+
+
+class DomainWriteSession:
+    """
+    Pending component writes for one domain data file.
+
+    Holds the buffered item data and frontmatter syncs; DomainAdapter owns
+    how they are applied and flushed.
+    """
+
+    def __init__(
+        self,
+        domain: str,
+        journal_path: Path,
+        flush_every: Optional[int] = None,
+        flush_seconds: Optional[float] = None,
+    ) -> None:
+        """
+        Initialize write session.
+
+        Args:
+            domain: Domain name (e.g., 'materials')
+            journal_path: JSON-lines journal of pending writes
+            flush_every: Flush after this many buffered component writes
+                         (None: only at session end)
+            flush_seconds: Flush when the oldest pending write is this old
+                           (None: no time-based flush)
+        """
+        if flush_every is not None and flush_every < 1:
+            raise ValueError(f"flush_every must be >= 1, got {flush_every}")
+        if flush_seconds is not None and flush_seconds <= 0:
+            raise ValueError(f"flush_seconds must be > 0, got {flush_seconds}")
+
+        self.domain = domain
+        self.journal_path = Path(journal_path)
+        self.flush_every = flush_every
+        self.flush_seconds = flush_seconds
+
+        self.pending_items: Dict[str, Dict[str, Any]] = {}
+        self.pending_syncs: List[Tuple[str, str, Any]] = []
+        self.pending_writes = 0
+        self.flush_count = 0
+        self._oldest_pending: Optional[float] = None
+        # Held by DomainAdapter around buffered writes and flushes
+        self.lock = threading.RLock()
+
+    def has_pending(self) -> bool:
+        """Return True if any component writes are buffered."""
+        return bool(self.pending_items)
+
+    def record(
+        self,
+        identifier: str,
+        component_type: str,
+        target_field: str,
+        content: Any,
+        item_data: Dict[str, Any],
+    ) -> None:
+        """
+        Journal and buffer one component write.
+
+        Args:
+            identifier: Item ID
+            component_type: Component type (frontmatter sync field)
+            target_field: Source YAML field path the content was written to
+            content: Normalized content as written to target_field
+            item_data: Full enriched item data after the write
+        """
+        self._append_journal({
+            'identifier': identifier,
+            'component_type': component_type,
+            'target_field': target_field,
+            # YAML keeps dates and other non-JSON scalars lossless.
+            'content_yaml': yaml.safe_dump(content, allow_unicode=True, sort_keys=False),
+        })
+        self.buffer(identifier, component_type, content, item_data)
+
+    def buffer(
+        self,
+        identifier: str,
+        component_type: str,
+        content: Any,
+        item_data: Dict[str, Any],
+    ) -> None:
+        """Buffer a component write without journaling (used by journal replay)."""
+        self.pending_items[identifier] = item_data
+        self.pending_syncs.append((identifier, component_type, content))
+        self.pending_writes += 1
+        if self._oldest_pending is None:
+            self._oldest_pending = time.monotonic()
+
+    def should_flush(self) -> bool:
+        """Return True if a configured flush interval has been reached."""
+        if not self.pending_items:
+            return False
+        if self.flush_every is not None and self.pending_writes >= self.flush_every:
+            return True
+        if self.flush_seconds is not None and self._oldest_pending is not None:
+            return time.monotonic() - self._oldest_pending >= self.flush_seconds
+        return False
+
+    def journal_entries(self) -> Iterator[Dict[str, Any]]:
+        """
+        Yield journaled writes in order.
+
+        A truncated final line (crash mid-append) is skipped; it was never
+        acknowledged to the caller.
+        """
+        if not self.journal_path.exists():
+            return
+        with open(self.journal_path, 'r', encoding='utf-8') as f:
+            for line_number, line in enumerate(f, start=1):
+                if not line.endswith('\n'):
+                    logger.warning(
+                        f"Ignoring incomplete journal entry {self.journal_path.name}:{line_number}"
+                    )
+                    break
+                entry = json.loads(line)
+                entry['content'] = yaml.safe_load(entry.pop('content_yaml'))
+                yield entry
+
+    def mark_flushed(self) -> None:
+        """Drop buffered writes and truncate the journal after a successful flush."""
+        self.pending_items.clear()
+        self.pending_syncs.clear()
+        self.pending_writes = 0
+        self._oldest_pending = None
+        self.flush_count += 1
+        if self.journal_path.exists():
+            self.journal_path.unlink()
+
+    def _append_journal(self, entry: Dict[str, Any]) -> None:
+        self.journal_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.journal_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
@@ -21,12 +21,13 @@ Purpose: Reduce learning complexity from 3 systems to 1 unified interface
 
 import logging
 import json
-import sqlite3
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from shared.utils.sqlite_pool import get_sqlite_pool, pooled_connect
+
 logger = logging.getLogger(__name__)
 
 
@@ -83,10 +84,19 @@ class ConsolidatedLearningSystem:
         self._init_database()
         
         logger.info(f"✅ Consolidated learning system initialized: {db_path}")
+
+    def transaction(self):
+        """
+        Group several log calls into one transaction (one commit).
+
+        Connections are pooled per thread with WAL journaling, so parallel
+        generation runs can log concurrently (see shared.utils.sqlite_pool).
+        """
+        return get_sqlite_pool(self.db_path).transaction()
     
     def _init_database(self) -> None:
         """Initialize consolidated database schema"""
-        with sqlite3.connect(self.db_path) as conn:
+        with pooled_connect(self.db_path) as conn:
             cursor = conn.cursor()
             
             # Single unified generations table
@@ -226,7 +236,7 @@ class ConsolidatedLearningSystem:
             result.ai_pattern_score * 0.3
         ) / 2.3  # Normalize to 0-100 scale
         
-        with sqlite3.connect(self.db_path) as conn:
+        with pooled_connect(self.db_path) as conn:
             cursor = conn.cursor()
             
             cursor.execute("""
@@ -264,7 +274,7 @@ class ConsolidatedLearningSystem:
         Returns:
             Dict with optimal temperature, penalties, and confidence metrics
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with pooled_connect(self.db_path) as conn:
             cursor = conn.cursor()
             
             # Get top 25% of generations by quality score
@@ -321,7 +331,7 @@ class ConsolidatedLearningSystem:
         Returns:
             Dict with quality dimension weights
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with pooled_connect(self.db_path) as conn:
             cursor = conn.cursor()
             
             cursor.execute("""
@@ -359,7 +369,7 @@ class ConsolidatedLearningSystem:
         Returns:
             List of quality insights with impact scores
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with pooled_connect(self.db_path) as conn:
             cursor = conn.cursor()
             
             cursor.execute("""
@@ -395,7 +405,7 @@ class ConsolidatedLearningSystem:
             weights: New quality dimension weights
             sample_count: Number of samples used for learning
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with pooled_connect(self.db_path) as conn:
             cursor = conn.cursor()
 
             required_keys = [
@@ -443,7 +453,7 @@ class ConsolidatedLearningSystem:
             description: Human-readable description
             impact_on_winston: Impact on Winston AI score (-100 to +100)
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with pooled_connect(self.db_path) as conn:
             cursor = conn.cursor()
             
             # Update or insert insight
@@ -491,7 +501,7 @@ class ConsolidatedLearningSystem:
         weights = aggregation['weights']
         criterion_mins = thresholds['criterionMins']
 
-        with sqlite3.connect(self.db_path) as conn:
+        with pooled_connect(self.db_path) as conn:
             cursor = conn.cursor()
 
             cursor.execute("""
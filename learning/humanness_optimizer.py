@@ -24,14 +24,20 @@ import yaml
 import logging
 from pathlib import Path
 from typing import Dict, List, Optional, Any
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 
 from generation.config.config_loader import ProcessingConfig
+from learning.learning_snapshot import LearningSnapshot, SnapshotSection, get_learning_snapshot
 from shared.text.utils.prompt_registry_service import PromptRegistryService
 
 
 logger = logging.getLogger(__name__)
 
+# Snapshot sections computed over time windows (validation feedback: last 7
+# days; overused openings: last 7 days / last ~2 hours) are also rebuilt
+# after this many seconds, even when no rows were logged.
+TIME_WINDOW_REFRESH_SECONDS = 300.0
+
 
 @dataclass
 class WinstonPatterns:
@@ -76,6 +82,10 @@ class HumannessOptimizer:
     Produces:
     - Dynamic humanness instructions for prompt injection
     - Strictness increases with retry attempts (1-5)
+    
+    Extracted patterns are read from the shared learning snapshot
+    (learning/learning_snapshot.py), so retries only re-query a source after
+    it changed.
     """
     
     def __init__(
@@ -193,6 +203,8 @@ class HumannessOptimizer:
         # Lazy-load dependencies
         self._winston_db = None
         self._pattern_learner = None
+        self._learning_snapshot: Optional[LearningSnapshot] = None
+        self._total_evaluations: Optional[int] = None
         
         logger.info(f"✅ HumannessOptimizer initialized (Winston DB: {winston_db_path}, Config: {config_path})")
 
@@ -270,7 +282,8 @@ class HumannessOptimizer:
         Extract conversational patterns from Winston passing samples.
         
         Queries detection_results table for samples with success=1,
-        analyzes content for linguistic features.
+        analyzes content for linguistic features. The result is materialized in
+        the learning snapshot and refreshed only when detection rows are logged.
         
         Returns:
             WinstonPatterns with conversational markers, number usage, excerpts
@@ -280,8 +293,13 @@ class HumannessOptimizer:
             from postprocessing.detection.winston_feedback_db import WinstonFeedbackDatabase
             self._winston_db = WinstonFeedbackDatabase(self.winston_db_path)
         
-        # Use new method from enhanced winston_feedback_db.py
-        patterns_dict = self._winston_db.get_passing_sample_patterns()
+        snapshot = self._get_learning_snapshot()
+        version = (snapshot.table_version(self.winston_db_path, 'detection_results'),)
+        patterns_dict = snapshot.get(
+            f'winston_patterns:{Path(self.winston_db_path).resolve()}',
+            version,
+            lambda previous: self._build_winston_section(previous, version[0]),
+        )['patterns']
 
         required_keys = [
             'sample_count',
@@ -306,6 +324,33 @@ class HumannessOptimizer:
             sample_excerpts=patterns_dict['sample_excerpts']
         )
     
+    def _build_winston_section(self, previous: Optional[SnapshotSection], max_id: int) -> Dict[str, Any]:
+        """
+        Best passing samples and their patterns.
+        
+        detection_results is append-only, so only rows logged after the
+        previous build are read and merged into the stored top samples. A
+        smaller max id than last time (table recreated) rebuilds from scratch.
+        """
+        from postprocessing.detection.winston_feedback_db import PASSING_SAMPLE_LIMIT
+        
+        top_samples: List[Dict[str, Any]] = []
+        after_id = 0
+        if previous is not None and 0 < previous.version[0] <= max_id:
+            top_samples = previous.payload['top_samples']
+            after_id = previous.version[0]
+        
+        merged = {sample['id']: sample for sample in top_samples}
+        for sample in self._winston_db.get_passing_samples(after_id=after_id):
+            merged[sample['id']] = sample
+        top_samples = sorted(merged.values(), key=lambda sample: (sample['ai_score'], sample['id']))
+        top_samples = top_samples[:PASSING_SAMPLE_LIMIT]
+        
+        return {
+            'top_samples': top_samples,
+            'patterns': self._winston_db.summarize_passing_samples(top_samples),
+        }
+    
     def _extract_subjective_patterns(self) -> SubjectivePatterns:
         """
         Extract patterns from subjective evaluation learning system.
@@ -324,9 +369,16 @@ class HumannessOptimizer:
             from learning.subjective_pattern_learner import SubjectivePatternLearner
             self._pattern_learner = SubjectivePatternLearner(self.patterns_file)
         
-        # Use new methods from enhanced subjective_pattern_learner.py
-        avoidance = self._pattern_learner.get_avoidance_patterns()
-        success = self._pattern_learner.get_success_patterns()
+        # learned_patterns.yaml is re-read only when it changed on disk
+        snapshot = self._get_learning_snapshot()
+        section = snapshot.get(
+            f'subjective_patterns:{Path(self.patterns_file).resolve()}',
+            snapshot.file_version(self.patterns_file),
+            self._build_subjective_section,
+        )
+        avoidance = section['avoidance']
+        success = section['success']
+        self._total_evaluations = section['total_evaluations']
 
         required_avoidance_keys = ['theatrical_phrases', 'ai_tendencies', 'penalty_weights']
         missing_avoidance_keys = [key for key in required_avoidance_keys if key not in avoidance]
@@ -342,6 +394,14 @@ class HumannessOptimizer:
             penalty_weights=avoidance['penalty_weights']
         )
     
+    def _build_subjective_section(self, previous: Optional[SnapshotSection]) -> Dict[str, Any]:
+        """Avoidance/success patterns and evaluation count from learned_patterns.yaml"""
+        return {
+            'avoidance': self._pattern_learner.get_avoidance_patterns(),
+            'success': self._pattern_learner.get_success_patterns(),
+            'total_evaluations': self._pattern_learner.get_current_patterns().get('total_evaluations'),
+        }
+    
     def _extract_validation_feedback(self, domain: str = None) -> Dict[str, Any]:
         """
         Extract common validation issues from prompt_validation_feedback table.
@@ -359,12 +419,31 @@ class HumannessOptimizer:
         Returns:
             Dict with issue frequencies, top problems, and avoidance guidance
         """
-        import sqlite3
-        import json
+        try:
+            snapshot = self._get_learning_snapshot()
+            version = (snapshot.table_version(self.winston_db_path, 'prompt_validation_feedback'),)
+            return snapshot.get(
+                f'validation_feedback:{domain or "*"}',
+                version,
+                lambda previous: self._query_validation_feedback(domain),
+                max_age=TIME_WINDOW_REFRESH_SECONDS,
+            )
+        except Exception as e:
+            logger.warning(f"Could not extract validation feedback: {e}")
+            return {
+                'critical': [],
+                'errors': [],
+                'warnings': [],
+                'total_feedback_count': 0
+            }
+    
+    def _query_validation_feedback(self, domain: Optional[str]) -> Dict[str, Any]:
+        """Aggregate the last 7 days of prompt_validation_feedback (see _extract_validation_feedback)"""
+        from shared.utils.sqlite_pool import pooled_connect
         from datetime import datetime, timedelta
         
+        conn = pooled_connect(self.winston_db_path)
         try:
-            conn = sqlite3.connect(self.winston_db_path)
             cursor = conn.cursor()
             
             # Get recent validation feedback (last 7 days)
@@ -408,23 +487,14 @@ class HumannessOptimizer:
                 elif severity == 'WARNING':
                     warning_issues.append(issue)
             
-            conn.close()
-            
             return {
                 'critical': critical_issues[:5],  # Top 5 critical
                 'errors': error_issues[:10],      # Top 10 errors
                 'warnings': warning_issues[:10],  # Top 10 warnings
                 'total_feedback_count': len(rows)
             }
-            
-        except Exception as e:
-            logger.warning(f"Could not extract validation feedback: {e}")
-            return {
-                'critical': [],
-                'errors': [],
-                'warnings': [],
-                'total_feedback_count': 0
-            }
+        finally:
+            conn.close()
     
     def _extract_structural_patterns(self, component_type: str) -> StructuralPatterns:
         """
@@ -442,10 +512,34 @@ class HumannessOptimizer:
         Returns:
             StructuralPatterns with learned diversity insights
         """
-        import sqlite3
+        try:
+            snapshot = self._get_learning_snapshot()
+            version = (snapshot.table_version(self.structural_db_path, 'structural_patterns'),)
+            payload = snapshot.get(
+                f'structural_patterns:{Path(self.structural_db_path).resolve()}:{component_type}',
+                version,
+                lambda previous: asdict(self._query_structural_patterns(component_type)),
+                max_age=TIME_WINDOW_REFRESH_SECONDS,
+            )
+            return StructuralPatterns(**payload)
+        except Exception as e:
+            logger.warning(f"Could not extract structural patterns: {e}")
+            # Return empty patterns (don't fail generation)
+            return StructuralPatterns(
+                sample_count=0,
+                average_diversity=0.0,
+                successful_openings=[],
+                overused_openings=[],
+                diverse_structures=[],
+                linguistic_diversity=[]
+            )
+    
+    def _query_structural_patterns(self, component_type: str) -> StructuralPatterns:
+        """Aggregate structural_patterns for one component (see _extract_structural_patterns)"""
+        from shared.utils.sqlite_pool import pooled_connect
         
+        conn = pooled_connect(self.structural_db_path)
         try:
-            conn = sqlite3.connect(self.structural_db_path)
             cursor = conn.cursor()
             
             # Get successful high-diversity patterns
@@ -509,8 +603,6 @@ class HumannessOptimizer:
             sample_count = stats[0] if stats else 0
             average_diversity = stats[1] if stats and stats[1] else 0.0
             
-            conn.close()
-            
             return StructuralPatterns(
                 sample_count=sample_count,
                 average_diversity=average_diversity,
@@ -519,18 +611,8 @@ class HumannessOptimizer:
                 diverse_structures=diverse_structures[:5],  # Top 5 structure types
                 linguistic_diversity=linguistic_diversity[:12]  # Up to 12 patterns
             )
-            
-        except Exception as e:
-            logger.warning(f"Could not extract structural patterns: {e}")
-            # Return empty patterns (don't fail generation)
-            return StructuralPatterns(
-                sample_count=0,
-                average_diversity=0.0,
-                successful_openings=[],
-                overused_openings=[],
-                diverse_structures=[],
-                linguistic_diversity=[]
-            )
+        finally:
+            conn.close()
     
     def _build_instructions(
         self,
@@ -922,14 +1004,19 @@ NOTE: Voice style comes from assigned author persona (specified in VOICE INSTRUC
         return '\n'.join(lines)
     
     def _get_total_evaluations(self) -> int:
-        """Get total subjective evaluations from patterns file"""
+        """Get total subjective evaluations from patterns file (as of the last snapshot read)"""
         if self._pattern_learner is None:
             return 0
         
-        patterns = self._pattern_learner.get_current_patterns()
-        if 'total_evaluations' not in patterns:
+        if self._total_evaluations is None:
             raise KeyError("Current patterns missing required key: total_evaluations")
-        return patterns['total_evaluations']
+        return self._total_evaluations
+    
+    def _get_learning_snapshot(self) -> LearningSnapshot:
+        """Learning snapshot shared by all optimizers on this Winston database"""
+        if self._learning_snapshot is None:
+            self._learning_snapshot = get_learning_snapshot(self.winston_db_path)
+        return self._learning_snapshot
     
     def get_current_variation(self) -> float:
         """
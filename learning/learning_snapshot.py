@@ -0,0 +1,273 @@
+"""
+Learning Snapshot
+
+Materialized learning analytics for prompt assembly.
+
+HumannessOptimizer.generate_humanness_instructions() reads its analytics
+from a snapshot: the passing-sample scan of detection_results, the
+structural_patterns aggregates, the 7-day validation feedback rollup and
+learned_patterns.yaml.
+
+A snapshot keeps each result as a named section together with the version of
+its source:
+- table sources: MAX(rowid) of the logging table (append-only; O(1) to read)
+- file sources: (mtime_ns, size)
+
+get() returns the stored section while the source version is unchanged and
+rebuilds only that section when new rows were logged. Builders receive the
+previous section, so append-only sources can fold in just the new rows.
+Sections over time windows (last 7 days, last ~2 hours) also take a max_age.
+
+Sections are kept in memory and persisted as JSON in the learning_snapshot
+table of the Winston database, so new processes start from the last build.
+
+Usage:
+    from learning.learning_snapshot import get_learning_snapshot
+
+    snapshot = get_learning_snapshot('z-beam.db')
+    version = (snapshot.table_version('z-beam.db', 'detection_results'),)
+    patterns = snapshot.get('winston', version, lambda previous: build_patterns(previous))
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+from shared.utils.sqlite_pool import pooled_connect
+
+logger = logging.getLogger(__name__)
+
+# Bump when a section payload layout changes; older rows are rebuilt.
+SNAPSHOT_FORMAT_VERSION = 1
+
+# Version of a table that does not exist (yet).
+MISSING_TABLE = -1
+
+
+@dataclass(frozen=True)
+class SnapshotSection:
+    """One materialized result and the source version it was built from."""
+    version: Tuple[Any, ...]
+    built_at: float
+    payload: Any
+
+
+class LearningSnapshot:
+    """Versioned learning sections, cached in memory and in the learning_snapshot table."""
+
+    def __init__(self, db_path: Union[str, Path]):
+        """
+        Initialize snapshot.
+
+        Args:
+            db_path: Database holding the learning_snapshot table (Winston DB)
+        """
+        self.db_path = str(db_path)
+        self.hits = 0
+        self.rebuilds = 0
+        self._sections: Dict[str, SnapshotSection] = {}
+        self._lock = threading.RLock()
+
+    # ------------------------------------------------------------------
+    # Source versions
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def table_version(db_path: Union[str, Path], table: str) -> Optional[int]:
+        """
+        MAX(rowid) of table: 0 when empty, MISSING_TABLE when absent.
+
+        Returns None if the database cannot be read (callers bypass the snapshot).
+        """
+        try:
+            with pooled_connect(db_path) as conn:
+                exists = conn.execute(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+                ).fetchone()
+                if not exists:
+                    return MISSING_TABLE
+                row = conn.execute(f"SELECT MAX(rowid) FROM {table}").fetchone()
+                return row[0] or 0
+        except sqlite3.Error as e:
+            logger.warning(f"Could not read version of {table} in {db_path}: {e}")
+            return None
+
+    @staticmethod
+    def file_version(path: Union[str, Path]) -> Tuple[int, int]:
+        """(mtime_ns, size) of path; (-1, -1) when missing."""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return (-1, -1)
+        return (stat.st_mtime_ns, stat.st_size)
+
+    # ------------------------------------------------------------------
+    # Sections
+    # ------------------------------------------------------------------
+
+    def get(
+        self,
+        name: str,
+        version: Tuple[Any, ...],
+        build: Callable[[Optional[SnapshotSection]], Any],
+        max_age: Optional[float] = None,
+    ) -> Any:
+        """
+        Return section name, rebuilding it when its source changed.
+
+        Args:
+            name: Section name
+            version: Current source version (a None element disables caching)
+            build: Called with the previous section (or None); returns a
+                   JSON-serializable payload
+            max_age: Also rebuild when the section is older than this (seconds)
+
+        Returns:
+            Section payload
+        """
+        version = tuple(version)
+        if any(part is None for part in version):
+            return build(None)
+
+        with self._lock:
+            section = self._sections.get(name)
+            if section is None:
+                section = self._load_section(name)
+            if section is not None and self._is_current(section, version, max_age):
+                self._sections[name] = section
+                self.hits += 1
+                return section.payload
+
+            payload = build(section)
+            # Round-trip through JSON so fresh and persisted payloads look the same
+            encoded = json.dumps(payload)
+            section = SnapshotSection(version, time.time(), json.loads(encoded))
+            self._sections[name] = section
+            self._save_section(name, section, encoded)
+            self.rebuilds += 1
+            logger.debug(f"Learning snapshot rebuilt section '{name}' (version {version})")
+            return section.payload
+
+    def invalidate(self, name: Optional[str] = None) -> None:
+        """Drop one section (or all), in memory and on disk; the next get() rebuilds it."""
+        with self._lock:
+            if name is None:
+                self._sections.clear()
+            else:
+                self._sections.pop(name, None)
+            try:
+                with pooled_connect(self.db_path) as conn:
+                    self._ensure_table(conn)
+                    if name is None:
+                        conn.execute("DELETE FROM learning_snapshot")
+                    else:
+                        conn.execute("DELETE FROM learning_snapshot WHERE section = ?", (name,))
+            except sqlite3.Error as e:
+                logger.warning(f"Could not clear learning snapshot: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return snapshot hit/rebuild statistics."""
+        with self._lock:
+            return {
+                'db_path': self.db_path,
+                'sections': sorted(self._sections),
+                'hits': self.hits,
+                'rebuilds': self.rebuilds,
+            }
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _is_current(section: SnapshotSection, version: Tuple[Any, ...], max_age: Optional[float]) -> bool:
+        if section.version != version:
+            return False
+        return max_age is None or time.time() - section.built_at <= max_age
+
+    @staticmethod
+    def _ensure_table(conn) -> None:
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS learning_snapshot (
+                section TEXT PRIMARY KEY,
+                format_version INTEGER NOT NULL,
+                source_version TEXT NOT NULL,
+                built_at REAL NOT NULL,
+                payload_json TEXT NOT NULL,
+                updated_at TEXT NOT NULL
+            )
+        """)
+
+    def _load_section(self, name: str) -> Optional[SnapshotSection]:
+        try:
+            with pooled_connect(self.db_path) as conn:
+                self._ensure_table(conn)
+                row = conn.execute(
+                    "SELECT format_version, source_version, built_at, payload_json "
+                    "FROM learning_snapshot WHERE section = ?", (name,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Could not read learning snapshot section '{name}': {e}")
+            return None
+        if row is None or row[0] != SNAPSHOT_FORMAT_VERSION:
+            return None
+        return SnapshotSection(tuple(json.loads(row[1])), row[2], json.loads(row[3]))
+
+    def _save_section(self, name: str, section: SnapshotSection, payload_json: str) -> None:
+        try:
+            with pooled_connect(self.db_path) as conn:
+                self._ensure_table(conn)
+                conn.execute("""
+                    INSERT INTO learning_snapshot
+                        (section, format_version, source_version, built_at, payload_json, updated_at)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(section) DO UPDATE SET
+                        format_version = excluded.format_version,
+                        source_version = excluded.source_version,
+                        built_at = excluded.built_at,
+                        payload_json = excluded.payload_json,
+                        updated_at = excluded.updated_at
+                """, (
+                    name,
+                    SNAPSHOT_FORMAT_VERSION,
+                    json.dumps(list(section.version)),
+                    section.built_at,
+                    payload_json,
+                    datetime.now().isoformat(),
+                ))
+        except sqlite3.Error as e:
+            # The in-memory section still serves this process.
+            logger.warning(f"Could not persist learning snapshot section '{name}': {e}")
+
+
+_snapshots: Dict[str, LearningSnapshot] = {}
+_snapshots_lock = threading.Lock()
+
+
+def get_learning_snapshot(db_path: Union[str, Path]) -> LearningSnapshot:
+    """
+    Get the snapshot shared by all optimizers using one Winston database.
+
+    Args:
+        db_path: Winston feedback database path
+    """
+    key = str(Path(db_path).resolve())
+    with _snapshots_lock:
+        snapshot = _snapshots.get(key)
+        if snapshot is None:
+            snapshot = LearningSnapshot(db_path)
+            _snapshots[key] = snapshot
+        return snapshot
+
+
+def reset_learning_snapshots() -> None:
+    """Forget in-memory snapshots (tests); persisted sections are reloaded on use."""
+    with _snapshots_lock:
+        _snapshots.clear()
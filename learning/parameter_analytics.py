@@ -0,0 +1,271 @@
+"""
+Parameter Analytics - Columnar cache of generation parameters and scores.
+
+Backs SweetSpotAnalyzer, which runs before each generation over every
+successful generation_parameters ⨝ detection_results row.
+
+ParameterColumnStore loads the parameter and score columns once into NumPy
+arrays and, on refresh(), appends only rows whose generation_parameters.id is
+above the last one loaded. A full reload happens only if rows were deleted or
+inserted out of id order. Stores are shared per database file, so analyzers
+constructed per generation reuse the loaded columns.
+
+column_statistics() and column_correlations() then compute counts, ranges,
+quartiles, score means/deviations and Pearson/Spearman correlations for all
+parameters in a single vectorized pass (NULL parameters are NaN and excluded
+per column).
+
+Note: rows are cached as first seen; later UPDATEs to scores or success
+flags of already-loaded rows need invalidate() to be picked up.
+
+Usage:
+    from learning.parameter_analytics import get_parameter_column_store, column_statistics
+
+    store = get_parameter_column_store('z-beam.db')
+    store.refresh()
+    stats = column_statistics(store.params, store.human_score)
+"""
+
+import logging
+import threading
+from pathlib import Path
+from typing import Dict, List, Tuple, Union
+
+import numpy as np
+from scipy.stats import rankdata
+
+from shared.utils.sqlite_pool import pooled_connect
+
+logger = logging.getLogger(__name__)
+
+# Numeric generation_parameters columns tracked by the store (column order of
+# ParameterColumnStore.params).
+PARAMETER_COLUMNS = (
+    'temperature',
+    'frequency_penalty',
+    'presence_penalty',
+    'trait_frequency',
+    'opinion_rate',
+    'reader_address_rate',
+    'colloquialism_frequency',
+    'structural_predictability',
+    'emotional_tone',
+    'imperfection_tolerance',
+    'sentence_rhythm_variation',
+    'technical_intensity',
+    'context_detail_level',
+    'engagement_level',
+    'detection_threshold',
+    'grammar_strictness',
+)
+
+
+class ParameterColumnStore:
+    """
+    Columnar, incrementally refreshed view of successful generations.
+
+    Arrays (one entry per successful generation, in generation_parameters.id
+    order):
+        row_ids:        generation_parameters.id
+        human_score:    detection_results.human_score
+        quality_score:  COALESCE(composite_quality_score, human_score)
+        has_composite:  composite_quality_score IS NOT NULL
+        params:         (rows × len(PARAMETER_COLUMNS)) float matrix, NaN for NULL
+    """
+
+    def __init__(self, db_path: Union[str, Path]) -> None:
+        self.db_path = Path(db_path)
+        self._lock = threading.Lock()
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        """Drop all loaded rows; the next refresh() reloads from scratch."""
+        self.row_ids = np.empty(0, dtype=np.int64)
+        self.human_score = np.empty(0, dtype=float)
+        self.quality_score = np.empty(0, dtype=float)
+        self.has_composite = np.empty(0, dtype=bool)
+        self.params = np.empty((0, len(PARAMETER_COLUMNS)), dtype=float)
+        self._max_id = 0
+        self._source_count = 0
+
+    def column_index(self, parameter_name: str) -> int:
+        """Return the params column of a parameter."""
+        return PARAMETER_COLUMNS.index(parameter_name)
+
+    def refresh(self) -> int:
+        """
+        Bring the arrays up to date with the database.
+
+        Returns:
+            Number of successful rows added (after a full reload: all rows)
+        """
+        with self._lock:
+            conn = pooled_connect(self.db_path)
+            try:
+                max_id, source_count = conn.execute(
+                    "SELECT COALESCE(MAX(id), 0), COUNT(*) FROM generation_parameters"
+                ).fetchone()
+                if (max_id, source_count) == (self._max_id, self._source_count):
+                    return 0
+
+                newer = conn.execute(
+                    "SELECT COUNT(*) FROM generation_parameters WHERE id > ?", (self._max_id,)
+                ).fetchone()[0]
+                if source_count != self._source_count + newer:
+                    # Rows deleted or inserted below the high-water mark
+                    logger.debug(f"[PARAM ANALYTICS] Reloading {self.db_path.name}: rows changed below id {self._max_id}")
+                    self.invalidate()
+
+                rows = conn.execute(
+                    f"""
+                    SELECT
+                        gp.id,
+                        dr.human_score,
+                        dr.composite_quality_score,
+                        {', '.join('gp.' + name for name in PARAMETER_COLUMNS)}
+                    FROM generation_parameters gp
+                    JOIN detection_results dr ON gp.detection_result_id = dr.id
+                    WHERE dr.success = 1
+                      AND gp.id > ?
+                    ORDER BY gp.id
+                    """,
+                    (self._max_id,)
+                ).fetchall()
+            finally:
+                conn.close()
+
+            if rows:
+                self._append(rows)
+            self._max_id = max_id
+            self._source_count = source_count
+            return len(rows)
+
+    def _append(self, rows: List[Tuple]) -> None:
+        row_ids = np.fromiter((row[0] for row in rows), dtype=np.int64, count=len(rows))
+        # None → NaN via the float dtype
+        values = np.array([row[1:] for row in rows], dtype=float)
+        human = values[:, 0]
+        composite = values[:, 1]
+        has_composite = ~np.isnan(composite)
+        quality = np.where(has_composite, composite, human)
+
+        self.row_ids = np.concatenate([self.row_ids, row_ids])
+        self.human_score = np.concatenate([self.human_score, human])
+        self.quality_score = np.concatenate([self.quality_score, quality])
+        self.has_composite = np.concatenate([self.has_composite, has_composite])
+        self.params = np.concatenate([self.params, values[:, 2:]])
+
+    def __len__(self) -> int:
+        return len(self.row_ids)
+
+
+_stores: Dict[str, ParameterColumnStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_parameter_column_store(db_path: Union[str, Path]) -> ParameterColumnStore:
+    """Get the shared column store for a learning database."""
+    key = str(Path(db_path).resolve())
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            store = ParameterColumnStore(db_path)
+            _stores[key] = store
+        return store
+
+
+def column_statistics(params: np.ndarray, scores: np.ndarray) -> Dict[str, Dict[str, float]]:
+    """
+    Per-parameter range and score statistics over rows where the parameter is set.
+
+    Args:
+        params: (rows × len(PARAMETER_COLUMNS)) matrix, NaN for NULL
+        scores: Score per row
+
+    Returns:
+        {parameter_name: {count, min, p25, median, p75, max, score_mean, score_stdev}}
+        for parameters with at least one value
+    """
+    mask = ~np.isnan(params)
+    counts = mask.sum(axis=0)
+    present = counts > 0
+    if not present.any():
+        return {}
+
+    values = params[:, present]
+    value_mask = mask[:, present]
+    n = counts[present]
+    score_matrix = np.where(value_mask, scores[:, None], 0.0)
+    score_mean = score_matrix.sum(axis=0) / n
+    deviations = np.where(value_mask, scores[:, None] - score_mean, 0.0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        score_stdev = np.where(n > 1, np.sqrt((deviations ** 2).sum(axis=0) / (n - 1)), 0.0)
+
+    mins = np.nanmin(values, axis=0)
+    maxs = np.nanmax(values, axis=0)
+    p25, medians, p75 = np.nanpercentile(values, [25, 50, 75], axis=0)
+
+    names = [name for name, keep in zip(PARAMETER_COLUMNS, present, strict=True) if keep]
+    return {
+        name: {
+            'count': int(n[i]),
+            'min': float(mins[i]),
+            'p25': float(p25[i]),
+            'median': float(medians[i]),
+            'p75': float(p75[i]),
+            'max': float(maxs[i]),
+            'score_mean': float(score_mean[i]),
+            'score_stdev': float(score_stdev[i]),
+        }
+        for i, name in enumerate(names)
+    }
+
+
+def column_correlations(
+    params: np.ndarray,
+    scores: np.ndarray,
+    method: str = 'pearson'
+) -> Dict[str, Tuple[float, int]]:
+    """
+    Correlation of every parameter with scores.
+
+    Args:
+        params: (rows × len(PARAMETER_COLUMNS)) matrix, NaN for NULL
+        scores: Score per row
+        method: 'pearson' or 'spearman' (Pearson on average ranks)
+
+    Returns:
+        {parameter_name: (correlation, sample_count)}; correlation is 0.0 when
+        either side is constant or fewer than 2 samples exist
+    """
+    if method not in ('pearson', 'spearman'):
+        raise ValueError(f"Unknown correlation method: {method}")
+
+    mask = ~np.isnan(params)
+    x = np.where(mask, params, 0.0)
+    y = np.broadcast_to(scores[:, None], params.shape)
+
+    if method == 'spearman':
+        # Rank within each column's own non-NULL rows
+        x = np.zeros_like(x)
+        y = np.zeros(params.shape, dtype=float)
+        for col in range(params.shape[1]):
+            rows = mask[:, col]
+            if rows.any():
+                x[rows, col] = rankdata(params[rows, col])
+                y[rows, col] = rankdata(scores[rows])
+
+    n = mask.sum(axis=0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        x_mean = np.where(mask, x, 0.0).sum(axis=0) / n
+        y_mean = np.where(mask, y, 0.0).sum(axis=0) / n
+        dx = np.where(mask, x - x_mean, 0.0)
+        dy = np.where(mask, y - y_mean, 0.0)
+        covariance = (dx * dy).sum(axis=0)
+        spread = np.sqrt((dx ** 2).sum(axis=0) * (dy ** 2).sum(axis=0))
+        correlation = np.where((n >= 2) & (spread > 0), covariance / spread, 0.0)
+
+    return {
+        name: (float(np.clip(correlation[i], -1.0, 1.0)), int(n[i]))
+        for i, name in enumerate(PARAMETER_COLUMNS)
+    }
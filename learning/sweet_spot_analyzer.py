@@ -12,10 +12,12 @@ Key Features:
 5. Success Pattern Recognition - What combinations work best together?
 
 Fail-fast design: Requires sufficient database samples for statistical validity.
+
+Parameter/score columns come from the shared ParameterColumnStore
+(learning/parameter_analytics.py), refreshed incrementally per call.
 """
 
 import sqlite3
-import statistics
 import json
 from typing import Dict, List, Optional, Tuple, Any
 from pathlib import Path
@@ -23,6 +25,16 @@ from collections import defaultdict
 from dataclasses import dataclass, asdict
 import logging
 
+import numpy as np
+
+from learning.parameter_analytics import (
+    PARAMETER_COLUMNS,
+    column_correlations,
+    column_statistics,
+    get_parameter_column_store,
+)
+from shared.utils.sqlite_pool import pooled_connect
+
 logger = logging.getLogger(__name__)
 
 
@@ -115,112 +127,60 @@ class SweetSpotAnalyzer:
         Returns:
             Dictionary of {parameter_name: SweetSpot}
         """
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        store = get_parameter_column_store(self.db_path)
+        store.refresh()
         
-        # Build query - Use composite_quality_score when available, fallback to human_score
+        # Quality score = composite_quality_score when available, fallback to human_score
         # NO material/component filtering (generic learning)
-        query = """
-            SELECT 
-                gp.*,
-                dr.human_score,
-                dr.composite_quality_score,
-                COALESCE(dr.composite_quality_score, dr.human_score) as quality_score,
-                dr.material,
-                dr.component_type
-            FROM generation_parameters gp
-            JOIN detection_results dr ON gp.detection_result_id = dr.id
-            WHERE COALESCE(dr.composite_quality_score, dr.human_score) >= ?
-              AND dr.success = 1
-            ORDER BY quality_score DESC
-        """
-        params = [self.success_threshold]
-        
-        cursor = conn.execute(query, params)
-        rows = cursor.fetchall()
-        conn.close()
+        successful = np.flatnonzero(store.quality_score >= self.success_threshold)
         
-        if len(rows) < self.min_samples:
+        if len(successful) < self.min_samples:
             logger.warning(
-                f"[SWEET SPOT] Insufficient data: {len(rows)} samples "
+                f"[SWEET SPOT] Insufficient data: {len(successful)} samples "
                 f"(need {self.min_samples})"
             )
             return {}
         
         # Log quality score usage
-        composite_count = sum(1 for row in rows if row['composite_quality_score'] is not None)
+        composite_count = int(store.has_composite[successful].sum())
         logger.info(
-            f"[SWEET SPOT] Using quality scores: {composite_count}/{len(rows)} with composite, "
-            f"{len(rows)-composite_count} fallback to Winston only"
+            f"[SWEET SPOT] Using quality scores: {composite_count}/{len(successful)} with composite, "
+            f"{len(successful)-composite_count} fallback to Winston only"
         )
         
-        # Take top N%
-        top_n = max(self.min_samples, int(len(rows) * (top_n_percent / 100)))
-        top_performers = rows[:top_n]
+        # Take top N% (best quality first; ties keep insertion order)
+        top_n = max(self.min_samples, int(len(successful) * (top_n_percent / 100)))
+        ranked = successful[np.argsort(-store.quality_score[successful], kind='stable')]
+        top_performers = ranked[:top_n]
         
         logger.info(
             f"[SWEET SPOT] Analyzing {len(top_performers)} top performers "
-            f"({top_n_percent}% of {len(rows)} successful generations)"
+            f"({top_n_percent}% of {len(successful)} successful generations)"
         )
         
-        # Analyze each parameter
-        sweet_spots = {}
-        
-        # Numeric parameters to analyze
-        numeric_params = [
-            'temperature',
-            'frequency_penalty',
-            'presence_penalty',
-            'trait_frequency',
-            'opinion_rate',
-            'reader_address_rate',
-            'colloquialism_frequency',
-            'structural_predictability',
-            'emotional_tone',
-            'imperfection_tolerance',
-            'sentence_rhythm_variation',
-            'technical_intensity',
-            'context_detail_level',
-            'engagement_level',
-            'detection_threshold',
-            'grammar_strictness'
-        ]
+        # All parameters in one vectorized pass
+        stats = column_statistics(
+            store.params[top_performers],
+            store.human_score[top_performers]
+        )
         
-        for param_name in numeric_params:
-            values = []
-            human_scores = []
-            
-            for row in top_performers:
-                if row[param_name] is not None:
-                    values.append(float(row[param_name]))
-                    human_scores.append(row['human_score'])
-            
-            if len(values) >= self.min_samples:
-                sweet_spot = self._calculate_sweet_spot(
-                    param_name,
-                    values,
-                    human_scores
-                )
-                sweet_spots[param_name] = sweet_spot
+        sweet_spots = {}
+        for param_name in PARAMETER_COLUMNS:
+            param_stats = stats.get(param_name)
+            if param_stats and param_stats['count'] >= self.min_samples:
+                sweet_spots[param_name] = self._calculate_sweet_spot(param_name, param_stats)
         
         return sweet_spots
     
     def _calculate_sweet_spot(
         self,
         param_name: str,
-        values: List[float],
-        human_scores: List[float]
+        stats: Dict[str, float]
     ) -> SweetSpot:
-        """Calculate optimal range for a parameter."""
-        # Statistical measures
-        min_val = min(values)
-        max_val = max(values)
-        median_val = statistics.median(values)
-        avg_score = statistics.mean(human_scores)
-        
+        """Build the optimal range for a parameter from its column statistics."""
         # Confidence based on sample size and score variance
-        sample_count = len(values)
-        score_variance = statistics.stdev(human_scores) if len(human_scores) > 1 else 0
+        sample_count = stats['count']
+        score_variance = stats['score_stdev']
         
         if sample_count >= 20 and score_variance < 15:
             confidence = 'high'
@@ -231,10 +191,10 @@ class SweetSpotAnalyzer:
         
         return SweetSpot(
             parameter_name=param_name,
-            optimal_min=round(min_val, 3),
-            optimal_max=round(max_val, 3),
-            optimal_median=round(median_val, 3),
-            avg_human_score=round(avg_score, 2),
+            optimal_min=round(stats['min'], 3),
+            optimal_max=round(stats['max'], 3),
+            optimal_median=round(stats['median'], 3),
+            avg_human_score=round(stats['score_mean'], 2),
             sample_count=sample_count,
             confidence=confidence
         )
@@ -248,7 +208,7 @@ class SweetSpotAnalyzer:
         
         Returns list of MaximumAchievement objects with full parameter details.
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = pooled_connect(self.db_path)
         conn.row_factory = sqlite3.Row
         
         query = """
@@ -290,34 +250,25 @@ class SweetSpotAnalyzer:
         return achievements
     
     def analyze_parameter_correlation(
-        self
+        self,
+        method: str = 'pearson'
     ) -> List[Tuple[str, float]]:
         """
         Analyze which parameters correlate most with human_score.
         
+        Args:
+            method: 'pearson' (linear) or 'spearman' (rank, robust to outliers)
+        
         Returns:
             List of (parameter_name, correlation_strength) sorted by strength
             Correlation: -1.0 (negative) to +1.0 (positive)
         """
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        
-        query = """
-            SELECT 
-                gp.*,
-                dr.human_score
-            FROM generation_parameters gp
-            JOIN detection_results dr ON gp.detection_result_id = dr.id
-            WHERE dr.success = 1
-        """
-        
-        cursor = conn.execute(query)
-        rows = cursor.fetchall()
-        conn.close()
+        store = get_parameter_column_store(self.db_path)
+        store.refresh()
         
-        if len(rows) < self.min_samples:
+        if len(store) < self.min_samples:
             logger.warning(
-                f"[CORRELATION] Insufficient data: {len(rows)} samples"
+                f"[CORRELATION] Insufficient data: {len(store)} samples"
             )
             return []
         
@@ -328,57 +279,19 @@ class SweetSpotAnalyzer:
             'imperfection_tolerance', 'sentence_rhythm_variation'
         ]
         
-        correlations = []
+        all_correlations = column_correlations(store.params, store.human_score, method=method)
         
+        correlations = []
         for param_name in numeric_params:
-            param_values = []
-            human_scores = []
-            
-            for row in rows:
-                if row[param_name] is not None:
-                    param_values.append(float(row[param_name]))
-                    human_scores.append(row['human_score'])
-            
-            if len(param_values) >= self.min_samples:
-                correlation = self._calculate_correlation(
-                    param_values,
-                    human_scores
-                )
-                correlations.append((param_name, correlation))
+            correlation, sample_count = all_correlations[param_name]
+            if sample_count >= self.min_samples:
+                correlations.append((param_name, round(correlation, 3)))
         
         # Sort by absolute correlation strength
         correlations.sort(key=lambda x: abs(x[1]), reverse=True)
         
         return correlations
     
-    def _calculate_correlation(
-        self,
-        values1: List[float],
-        values2: List[float]
-    ) -> float:
-        """Calculate Pearson correlation coefficient."""
-        if len(values1) != len(values2) or len(values1) < 2:
-            return 0.0
-        
-        n = len(values1)
-        
-        # Calculate means
-        mean1 = statistics.mean(values1)
-        mean2 = statistics.mean(values2)
-        
-        # Calculate covariance and standard deviations
-        covariance = sum((values1[i] - mean1) * (values2[i] - mean2) for i in range(n))
-        
-        std1 = statistics.stdev(values1)
-        std2 = statistics.stdev(values2)
-        
-        if std1 == 0 or std2 == 0:
-            return 0.0
-        
-        correlation = covariance / (n * std1 * std2)
-        
-        return round(correlation, 3)
-    
     def get_sweet_spot_table(
         self,
         save_to_db: bool = True
@@ -493,7 +406,7 @@ class SweetSpotAnalyzer:
             return None
 
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = pooled_connect(self.db_path)
             conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
 
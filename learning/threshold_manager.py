@@ -22,13 +22,14 @@ Complies with:
 - Learning architecture: Continuous improvement from success patterns
 """
 
-import sqlite3
 import logging
 from pathlib import Path
 from typing import Dict, Optional
 from datetime import datetime
 import statistics
 
+from shared.utils.sqlite_pool import pooled_connect
+
 logger = logging.getLogger(__name__)
 
 
@@ -145,7 +146,7 @@ class ThresholdManager:
             return self.fallback_winston
         
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = pooled_connect(self.db_path)
             cursor = conn.cursor()
             
             # Get ALL samples with valid Winston scores
@@ -228,7 +229,7 @@ class ThresholdManager:
             return self.fallback_realism
         
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = pooled_connect(self.db_path)
             cursor = conn.cursor()
             
             # Get successful evaluations
@@ -301,7 +302,7 @@ class ThresholdManager:
             return self.fallback_diversity
         
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = pooled_connect(self.db_path)
             cursor = conn.cursor()
             
             # Get recent successful content - simpler query
@@ -413,7 +414,7 @@ class ThresholdManager:
             thresholds: Dictionary of threshold names and values
         """
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = pooled_connect(self.db_path)
             cursor = conn.cursor()
             
             # Create table if needed
@@ -465,7 +466,7 @@ class ThresholdManager:
             List of (timestamp, value) tuples
         """
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = pooled_connect(self.db_path)
             cursor = conn.cursor()
             
             cursor.execute("""
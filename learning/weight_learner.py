@@ -24,16 +24,30 @@ Learning Strategy:
 2. Calculate correlation between each metric and final success
 3. Optimize weights to maximize composite score prediction accuracy
 4. Update continuously based on new feedback
+
+Incremental Mode (default):
+The squared-error objective only depends on sufficient statistics of the
+normalized metrics X and success y (n, XᵀX, Xᵀy, Σy, Σy²). These are folded in
+for detection_results rows above the last processed id, persisted in the
+weight_learner_state table, and the simplex-constrained weights are solved
+from them exactly (active-set enumeration over ≤3 metrics), so a cache miss
+costs O(new rows) instead of a full-table SLSQP refit. Every
+REFIT_INTERVAL new samples the statistics are rebuilt from the full table and
+compared with the incremental ones (drift check: deleted/edited rows).
 """
 
+import json
 import sqlite3
+from datetime import datetime
+from itertools import combinations
 import numpy as np
-from typing import Dict, Optional, Tuple, List
+from typing import Any, Dict, Optional, Tuple
 from pathlib import Path
 from dataclasses import dataclass
 import logging
 from scipy.optimize import minimize
-from scipy import stats
+
+from shared.utils.sqlite_pool import pooled_connect
 
 logger = logging.getLogger(__name__)
 
@@ -49,6 +63,93 @@ class WeightSet:
     context: str  # "global", "material:Steel", "component:micro"
 
 
+class SufficientStatistics:
+    """
+    Running least-squares statistics for predicting success from k metrics.
+
+    Tracks n, XᵀX, Xᵀy, Σy and Σy², which fully determine the mean squared
+    error of any weight vector.
+    """
+
+    def __init__(self, k: int):
+        self.k = k
+        self.n = 0
+        self.gram = np.zeros((k, k))
+        self.cross = np.zeros(k)
+        self.sum_y = 0.0
+        self.sum_yy = 0.0
+
+    def add(self, features: np.ndarray, success: np.ndarray) -> None:
+        """Fold in a batch of rows (features: n×k, success: n)."""
+        if len(success) == 0:
+            return
+        self.n += len(success)
+        self.gram += features.T @ features
+        self.cross += features.T @ success
+        self.sum_y += float(success.sum())
+        self.sum_yy += float(success @ success)
+
+    def residual_sum_of_squares(self, weights: np.ndarray) -> float:
+        """Σ(y - Xw)² without touching the rows."""
+        return float(self.sum_yy - 2 * weights @ self.cross + weights @ self.gram @ weights)
+
+    def solve(self) -> Tuple[np.ndarray, float]:
+        """
+        Minimize Σ(y - Xw)² subject to Σw = 1, w ≥ 0.
+
+        The objective is a convex quadratic, so its minimum is the KKT point
+        of one support set; with k ≤ 3 all 2^k - 1 sets are checked.
+
+        Returns:
+            (weights, r_squared)
+        """
+        best_weights = None
+        best_error = float('inf')
+        for size in range(1, self.k + 1):
+            for support in combinations(range(self.k), size):
+                idx = list(support)
+                kkt = np.zeros((size + 1, size + 1))
+                kkt[:size, :size] = self.gram[np.ix_(idx, idx)]
+                kkt[:size, size] = 1.0
+                kkt[size, :size] = 1.0
+                rhs = np.append(self.cross[idx], 1.0)
+                solution = np.linalg.lstsq(kkt, rhs, rcond=None)[0][:size]
+                if np.any(solution < -1e-9):
+                    continue
+                weights = np.zeros(self.k)
+                weights[idx] = np.clip(solution, 0.0, None)
+                total = weights.sum()
+                if total <= 0:
+                    continue
+                weights /= total
+                error = self.residual_sum_of_squares(weights)
+                if error < best_error - 1e-12:
+                    best_weights, best_error = weights, error
+
+        ss_tot = self.sum_yy - (self.sum_y ** 2) / self.n if self.n else 0.0
+        r_squared = 1 - (best_error / ss_tot) if ss_tot > 0 else 0
+        return best_weights, float(r_squared)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'n': self.n,
+            'gram': self.gram.tolist(),
+            'cross': self.cross.tolist(),
+            'sum_y': self.sum_y,
+            'sum_yy': self.sum_yy,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'SufficientStatistics':
+        restored = cls(len(data['cross']))
+        restored.n = data['n']
+        restored.gram = np.array(data['gram'], dtype=float)
+        restored.cross = np.array(data['cross'], dtype=float)
+        restored.sum_y = data['sum_y']
+        restored.sum_yy = data['sum_yy']
+        return restored
+
+
 class WeightLearner:
     """
     Learn optimal quality metric weights from historical success patterns.
@@ -73,6 +174,10 @@ class WeightLearner:
     # Minimum samples needed for reliable weight learning
     MIN_GLOBAL_SAMPLES = 110  # Need 110+ generations for learned weights
     
+    # Incremental mode: full rebuild + drift check every N new samples
+    REFIT_INTERVAL = 500
+    DRIFT_TOLERANCE = 0.02  # Max per-weight difference before warning
+    
     # Initial optimization seed (not used as runtime fallback)
     INITIAL_WEIGHTS = {
         'winston_weight': 0.6,
@@ -80,18 +185,21 @@ class WeightLearner:
         'readability_weight': 0.1
     }
     
-    def __init__(self, db_path: Optional[Path] = None):
+    def __init__(self, db_path: Optional[Path] = None, incremental: bool = True):
         """
         Initialize weight learner with database connection.
         
         Args:
             db_path: Path to SQLite database (default: z-beam.db - legacy database)
+            incremental: Solve from persisted sufficient statistics (default)
+                instead of refitting over the full table on every cache miss
         """
         if db_path is None:
             # Use legacy z-beam.db database (root of project)
             db_path = Path('z-beam.db')
         
         self.db_path = Path(db_path)
+        self.incremental = incremental
         self._ensure_database()
         
         # Cache for learned weights to avoid repeated DB queries
@@ -123,8 +231,8 @@ class WeightLearner:
         if global_weights:
             return (global_weights.winston_weight, global_weights.subjective_weight, global_weights.readability_weight)
 
-        stats = self.get_weight_statistics()
-        total_samples = stats.get('total_samples', 0)
+        weight_stats = self.get_weight_statistics()
+        total_samples = weight_stats.get('total_samples', 0)
         raise RuntimeError(
             "Insufficient data for weight learning. "
             f"Need {self.MIN_GLOBAL_SAMPLES}+ generations, found {total_samples}."
@@ -161,7 +269,10 @@ class WeightLearner:
             return self._weight_cache[cache_key]
         
         # Learn from all data
-        weights = self._learn_weights_from_data()
+        if self.incremental:
+            weights = self._learn_weights_incrementally()
+        else:
+            weights = self._learn_weights_from_data()
         
         if weights and weights.sample_count >= self.MIN_GLOBAL_SAMPLES:
             self._weight_cache[cache_key] = weights
@@ -195,7 +306,7 @@ class WeightLearner:
             return None
         
         try:
-            conn = sqlite3.connect(str(self.db_path))
+            conn = pooled_connect(self.db_path)
             cursor = conn.cursor()
             
             # Query ALL generations from legacy detection_results table
@@ -347,10 +458,214 @@ class WeightLearner:
             logger.error(f"Error learning weights: {e}", exc_info=True)
             return None
     
+    def _learn_weights_incrementally(self) -> Optional[WeightSet]:
+        """
+        Learn weights from persisted sufficient statistics.
+        
+        Folds in rows logged since the last update, then solves the
+        constrained least-squares problem from the statistics. Selects the
+        same metric set as the full refit: 3 metrics over rows with
+        readability, or 2 metrics over all rows if none have readability.
+        
+        Returns:
+            WeightSet with optimized weights, or None if insufficient data
+        """
+        if not self.db_path.exists():
+            return None
+        
+        try:
+            state = self._update_statistics()
+        except sqlite3.Error as e:
+            logger.error(f"Database error updating weight statistics: {e}")
+            return None
+        
+        return self._weights_from_state(state)
+    
+    def _weights_from_state(self, state: Dict[str, Any]) -> Optional[WeightSet]:
+        """Solve a WeightSet from a statistics state (None if insufficient data)."""
+        three_metric = state['three_metric']
+        two_metric = state['two_metric']
+        
+        if three_metric.n > 0:
+            metric_stats = three_metric
+        else:
+            # Explicit 2-metric learning mode (no readability data available)
+            metric_stats = two_metric
+        
+        if metric_stats.n < self.MIN_GLOBAL_SAMPLES:
+            return None
+        
+        weights, r_squared = metric_stats.solve()
+        if weights is None:
+            logger.warning("Weight optimization failed: no feasible solution")
+            return None
+        if metric_stats is two_metric:
+            weights = np.append(weights, 0.0)
+        
+        return WeightSet(
+            winston_weight=float(weights[0]),
+            subjective_weight=float(weights[1]),
+            readability_weight=float(weights[2]),
+            sample_count=metric_stats.n,
+            prediction_accuracy=r_squared,
+            context="global"
+        )
+    
+    def _update_statistics(self) -> Dict[str, Any]:
+        """
+        Bring the persisted statistics up to date with detection_results.
+        
+        Returns:
+            State dict with 'two_metric'/'three_metric' SufficientStatistics,
+            'last_row_id' and 'samples_since_refit'
+        """
+        with pooled_connect(self.db_path) as conn:
+            self._ensure_state_table(conn)
+            state = self._load_state(conn)
+            if state is None:
+                state = self._rebuild_statistics(conn)
+            else:
+                new_samples = self._fold_rows(conn, state)
+                if not new_samples:
+                    return state
+                state['samples_since_refit'] += new_samples
+                if state['samples_since_refit'] >= self.REFIT_INTERVAL:
+                    state = self._check_drift(conn, state)
+            self._save_state(conn, state)
+        return state
+    
+    def _fold_rows(self, conn, state: Dict[str, Any]) -> int:
+        """Add rows above state['last_row_id'] to the statistics; return count."""
+        rows = conn.execute("""
+            SELECT
+                r.id,
+                r.human_score as winston,
+                r.composite_quality_score as subjective,
+                r.readability_score as readability,
+                r.success as actual_success
+            FROM detection_results r
+            WHERE r.id > ?
+                AND r.human_score IS NOT NULL
+                AND r.composite_quality_score IS NOT NULL
+                AND r.success IS NOT NULL
+            ORDER BY r.id
+        """, (state['last_row_id'],)).fetchall()
+        if not rows:
+            return 0
+        
+        # Same normalization as the full refit; None readability → NaN
+        data = np.array([r[1:] for r in rows], dtype=float)
+        features = data[:, :3] / np.array([100.0, 10.0, 100.0])
+        success = data[:, 3]
+        has_readability = ~np.isnan(features[:, 2])
+        
+        state['two_metric'].add(features[:, :2], success)
+        state['three_metric'].add(features[has_readability], success[has_readability])
+        state['last_row_id'] = rows[-1][0]
+        return len(rows)
+    
+    def _rebuild_statistics(self, conn) -> Dict[str, Any]:
+        """Compute the statistics from scratch over the full table."""
+        state = {
+            'two_metric': SufficientStatistics(2),
+            'three_metric': SufficientStatistics(3),
+            'last_row_id': 0,
+            'samples_since_refit': 0,
+        }
+        self._fold_rows(conn, state)
+        return state
+    
+    def _check_drift(self, conn, state: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Periodic full refit: rebuild the statistics and compare weights.
+        
+        Rows deleted or edited after they were folded in make the incremental
+        statistics drift; the rebuilt state always replaces them.
+        """
+        rebuilt = self._rebuild_statistics(conn)
+        incremental = self._weights_from_state(state)
+        full = self._weights_from_state(rebuilt)
+        
+        if incremental and full:
+            drift = max(
+                abs(incremental.winston_weight - full.winston_weight),
+                abs(incremental.subjective_weight - full.subjective_weight),
+                abs(incremental.readability_weight - full.readability_weight)
+            )
+            if drift > self.DRIFT_TOLERANCE:
+                logger.warning(
+                    f"Incremental weights drifted by {drift:.3f} from full refit "
+                    f"(n={incremental.sample_count} vs {full.sample_count}) - statistics rebuilt"
+                )
+        elif state['two_metric'].n != rebuilt['two_metric'].n:
+            logger.warning(
+                f"Incremental sample count {state['two_metric'].n} != table count "
+                f"{rebuilt['two_metric'].n} - statistics rebuilt"
+            )
+        return rebuilt
+    
+    def _ensure_state_table(self, conn) -> None:
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS weight_learner_state (
+                context TEXT PRIMARY KEY,
+                last_row_id INTEGER NOT NULL,
+                samples_since_refit INTEGER NOT NULL,
+                statistics_json TEXT NOT NULL,
+                updated_at TEXT NOT NULL
+            )
+        """)
+    
+    def _load_state(self, conn) -> Optional[Dict[str, Any]]:
+        row = conn.execute(
+            "SELECT last_row_id, samples_since_refit, statistics_json "
+            "FROM weight_learner_state WHERE context = 'global'"
+        ).fetchone()
+        if row is None:
+            return None
+        statistics = json.loads(row[2])
+        return {
+            'two_metric': SufficientStatistics.from_dict(statistics['two_metric']),
+            'three_metric': SufficientStatistics.from_dict(statistics['three_metric']),
+            'last_row_id': row[0],
+            'samples_since_refit': row[1],
+        }
+    
+    def _save_state(self, conn, state: Dict[str, Any]) -> None:
+        statistics = {
+            'two_metric': state['two_metric'].to_dict(),
+            'three_metric': state['three_metric'].to_dict(),
+        }
+        conn.execute("""
+            INSERT INTO weight_learner_state
+                (context, last_row_id, samples_since_refit, statistics_json, updated_at)
+            VALUES ('global', ?, ?, ?, ?)
+            ON CONFLICT(context) DO UPDATE SET
+                last_row_id = excluded.last_row_id,
+                samples_since_refit = excluded.samples_since_refit,
+                statistics_json = excluded.statistics_json,
+                updated_at = excluded.updated_at
+        """, (
+            state['last_row_id'],
+            state['samples_since_refit'],
+            json.dumps(statistics),
+            datetime.now().isoformat()
+        ))
+    
+    def reset_statistics(self):
+        """
+        Drop the persisted statistics so the next lookup rebuilds them from
+        the full table (e.g. after bulk edits to detection_results).
+        """
+        with pooled_connect(self.db_path) as conn:
+            self._ensure_state_table(conn)
+            conn.execute("DELETE FROM weight_learner_state WHERE context = 'global'")
+        self._weight_cache.clear()
+    
     def invalidate_cache(self):
         """
         Clear weight cache to force relearning from updated data.
-        Call this after new generations are added to database.
+        Call this after new generations are added to database (in incremental
+        mode only the new rows are read).
         """
         self._weight_cache.clear()
         logger.info("Weight cache cleared - will relearn from fresh data")
@@ -369,7 +684,7 @@ class WeightLearner:
             }
         
         try:
-            conn = sqlite3.connect(str(self.db_path))
+            conn = pooled_connect(self.db_path)
             cursor = conn.cursor()
             
             # Count total samples from legacy detection_results table
@@ -18,15 +18,11 @@ import subprocess
 import yaml
 import time
 from pathlib import Path
-from typing import List
-from shared.config.settings import API_PROVIDERS, COMPONENT_CONFIG
-from shared.utils.material_resolver import material_resolver
-from shared.utils.quality_analyzer import quality_analyzer
+from typing import Any, Dict, List
 
-from shared.commands.postprocess import PostprocessCommand
-from export.core.frontmatter_exporter import FrontmatterExporter
-from export.config.loader import load_domain_config
-from export.performance import ParallelExporter, get_yaml_cache
+# Command modules (exporter, postprocessor, resolvers, API clients) are imported
+# inside the command that needs them, so argument parsing and quick commands
+# such as --list-materials do not load the whole generation stack.
 
 
 def _discover_domain_catalog() -> List[str]:
@@ -88,6 +84,7 @@ def _run_domain_bootstrap_validator(domain: str | None = None) -> None:
 
 def postprocess_command(args):
     """Execute postprocessing command"""
+    from shared.commands.postprocess import PostprocessCommand
 
     available_domains = _discover_domain_catalog()
 
@@ -120,7 +117,8 @@ def postprocess_command(args):
         # Batch process all items
         results = cmd.postprocess_all(
             batch_size=args.batch_size,
-            dry_run=args.dry_run
+            dry_run=args.dry_run,
+            concurrency=args.postprocess_workers
         )
         
         # Summary
@@ -143,6 +141,8 @@ def postprocess_command(args):
 
 def export_command(args):
     """Execute export command using Universal Exporter"""
+    from export.config.loader import load_domain_config
+    from export.core.frontmatter_exporter import FrontmatterExporter
 
     available_domains = _discover_domain_catalog()
     
@@ -182,7 +182,11 @@ def export_command(args):
                 print(f"❌ Item not found: {args.item}")
                 sys.exit(1)
         else:
-            results = exporter.export_all(force=force)
+            results = exporter.export_all(
+                force=force,
+                workers=args.item_workers,
+                incremental=args.incremental
+            )
         
         # Summary
         exported = sum(1 for success in results.values() if success)
@@ -217,6 +221,9 @@ def export_command(args):
 
 def export_all_command(args):
     """Export all domains to production (with parallel processing)"""
+    from export.config.loader import load_domain_config
+    from export.core.frontmatter_exporter import FrontmatterExporter
+    from export.performance import ParallelExporter, get_yaml_cache
 
     export_config_root = Path('export/config')
     if export_config_root.exists():
@@ -266,7 +273,11 @@ def export_all_command(args):
             try:
                 config = load_domain_config(domain)
                 exporter = FrontmatterExporter(config)
-                results_dict = exporter.export_all(force=not args.skip_existing)
+                results_dict = exporter.export_all(
+                    force=not args.skip_existing,
+                    workers=args.item_workers,
+                    incremental=args.incremental
+                )
 
                 exported = sum(1 for success in results_dict.values() if success)
                 total += exported
@@ -279,7 +290,11 @@ def export_all_command(args):
     if use_parallel:
         # Use parallel export for 3-4x speedup (fail-fast on failure)
         try:
-            parallel_exporter = ParallelExporter(max_workers=4)
+            parallel_exporter = ParallelExporter(
+                max_workers=4,
+                item_workers=args.item_workers,
+                incremental=args.incremental
+            )
             results = parallel_exporter.export_all(skip_existing=args.skip_existing)
 
             total_exported = sum(r.get('exported', 0) for r in results.values())
@@ -333,6 +348,14 @@ def export_all_command(args):
     print("="*80)
 
 
+def _apply_backfill_engine_args(generator_config: Dict[str, Any], args) -> None:
+    """Apply backfill engine CLI overrides (concurrency, rate limit) to a generator config."""
+    if getattr(args, 'backfill_workers', None) is not None:
+        generator_config['concurrency'] = args.backfill_workers
+    if getattr(args, 'requests_per_minute', None) is not None:
+        generator_config['requests_per_minute'] = args.requests_per_minute
+
+
 def backfill_command(args):
     """Execute backfill command to populate source YAML permanently"""
 
@@ -375,6 +398,7 @@ def backfill_command(args):
         # Add dry-run flag and item filter
         generator_config['dry_run'] = args.dry_run
         generator_config['api_provider'] = provider
+        _apply_backfill_engine_args(generator_config, args)
         if resolved_item_filter:
             generator_config['item_filter'] = resolved_item_filter
         
@@ -412,6 +436,7 @@ def backfill_command(args):
             print(f"\n[{idx}/{total_generators}] 🔄 Running generator: {generator_name}")
             gen_config['dry_run'] = args.dry_run
             gen_config['api_provider'] = provider
+            _apply_backfill_engine_args(gen_config, args)
             if resolved_item_filter:
                 gen_config['item_filter'] = resolved_item_filter
             generator = BackfillRegistry.create(gen_config)
@@ -790,6 +815,9 @@ def _export_single_item(domain: str, item_id: str, dry_run: bool) -> None:
         print("\n🔍 Dry run: skipping frontmatter export")
         return
 
+    from export.config.loader import load_domain_config
+    from export.core.frontmatter_exporter import FrontmatterExporter
+
     config = load_domain_config(domain)
     exporter = FrontmatterExporter(config)
 
@@ -1016,6 +1044,15 @@ def batch_generate_command(args):
     if field_type == 'text':
         print(f"Learning evaluation mode: {'fast (default)' if args.fast_learning_eval else 'full'}")
 
+    # Write-behind: buffer source writes + frontmatter syncs, flush every --batch-size
+    # component writes. Unflushed writes are journaled and recovered on the next run.
+    session_adapter = None
+    if args.write_behind and not args.dry_run:
+        from generation.core.adapters.domain_adapter import DomainAdapter
+        session_adapter = DomainAdapter(args.domain)
+        session_adapter.begin_session(flush_every=args.batch_size)
+        print(f"Write-behind: flush every {args.batch_size} component writes")
+
     success_count = 0
     skipped_count = 0
     failed_count = 0
@@ -1055,6 +1092,8 @@ def batch_generate_command(args):
                     failed_count += 1
                 else:
                     if args.runtime_prompt_gate and not args.dry_run:
+                        if session_adapter is not None:
+                            session_adapter.flush_session()
                         _run_runtime_prompt_gate(
                             domain=args.domain,
                             item_id=item_id,
@@ -1087,6 +1126,9 @@ def batch_generate_command(args):
             failed_count += 1
             print(f"   ❌ Failed: {exc}")
 
+    if session_adapter is not None:
+        session_adapter.end_session()
+
     print("\n" + "=" * 80)
     print("📊 BATCH GENERATE SUMMARY")
     print("=" * 80)
@@ -1110,6 +1152,8 @@ Examples:
   # Export specific domain
   python3 run.py --export --domain materials
   python3 run.py --export --domain compounds --skip-existing
+  python3 run.py --export --domain materials --item-workers 4
+  python3 run.py --export --domain materials --incremental
 
   # Export all domains to production
   python3 run.py --export-all
@@ -1118,6 +1162,7 @@ Examples:
   python3 run.py --backfill --domain contaminants --generator pageDescription --dry-run
   python3 run.py --backfill --domain contaminants --generator pageDescription
   python3 run.py --backfill --domain contaminants  # Run all generators
+  python3 run.py --backfill --domain materials --generator pageDescription --backfill-workers 4 --requests-per-minute 60
 
   # Postprocess single item
   python3 run.py --postprocess --domain materials --item "Aluminum" --field pageDescription
@@ -1128,9 +1173,13 @@ Examples:
   # Batch postprocess with checkpoint every 5 items
   python3 run.py --postprocess --domain contaminants --field pageDescription --all --batch-size 5
 
+  # Batch postprocess 4 items at a time (provider rate limits still apply)
+  python3 run.py --postprocess --domain materials --field pageDescription --all --postprocess-workers 4
+
     # Batch generate any field in any domain
     python3 run.py --batch-generate --domain materials --field pageDescription --all
     python3 run.py --batch-generate --domain materials --field context --items "aluminum-laser-cleaning,steel-laser-cleaning" --force-regenerate
+    python3 run.py --batch-generate --domain materials --field pageDescription --all --write-behind --batch-size 20
 
     # Seed a new page from one keyword, then generate and export
     python3 run.py --seed-from-keyword "Aerospace Coatings" --domain applications
@@ -1166,10 +1215,18 @@ Examples:
                         help='Use parallel export for --export-all (default: True, use --no-parallel to disable)')
     parser.add_argument('--no-parallel', action='store_false', dest='parallel',
                         help='Disable parallel export (use sequential processing)')
+    parser.add_argument('--item-workers', type=int, default=None, metavar='N',
+                        help='Worker processes per domain export (default: config export_workers or 1; 0 = one per CPU)')
+    parser.add_argument('--incremental', action='store_true',
+                        help='Skip items unchanged since the last export (content-hash manifest in .cache/export_manifests)')
     
     # Backfill arguments
     parser.add_argument('--generator', type=str,
                         help='Specific backfill generator to run (e.g., pageDescription, compound_linkage)')
+    parser.add_argument('--backfill-workers', type=int, default=None, metavar='N',
+                        help='Concurrent populate calls per backfill generator (default: generator config concurrency or 1)')
+    parser.add_argument('--requests-per-minute', type=float, default=None, metavar='N',
+                        help='Backfill API request rate limit across workers (default: generator config or unlimited)')
     
     # Postprocessing arguments
     parser.add_argument('--domain', type=str,
@@ -1185,6 +1242,8 @@ Examples:
                         help='Postprocess all items in domain')
     parser.add_argument('--batch-size', type=int, default=10,
                         help='Checkpoint interval for batch operations (default: 10)')
+    parser.add_argument('--postprocess-workers', type=int, default=1, metavar='N',
+                        help='Items postprocessed concurrently with --all, text fields only (default: 1)')
     parser.add_argument('--dry-run', action='store_true',
                         help='Compare versions without saving (preview mode)')
     parser.add_argument('--force-regenerate', action='store_true',
@@ -1195,6 +1254,8 @@ Examples:
                         help='Run full learning evaluations after generation (slower)')
     parser.add_argument('--no-text-bundle', action='store_true',
                         help='Disable auto-expanding text bundles for --batch-generate')
+    parser.add_argument('--write-behind', action='store_true',
+                        help='Buffer --batch-generate source writes and flush every --batch-size components (journaled)')
     parser.add_argument('--api-provider', type=str,
                         choices=['grok', 'deepseek', 'openai'],
                         help='API provider override for compatible commands (default: grok)')
@@ -1290,6 +1351,8 @@ Examples:
 
 def list_materials_command(args):
     """List all available materials with smart formatting"""
+    from shared.utils.material_resolver import material_resolver
+
     print("📋 AVAILABLE MATERIALS:")
     print("="*60)
     
@@ -1322,6 +1385,8 @@ def list_materials_command(args):
 
 def generate_command(args):
     """Generate content for material with smart resolution"""
+    from shared.utils.material_resolver import material_resolver
+
     print("🚀 SIMPLIFIED GENERATION:")
     print("="*60)
     
@@ -1380,6 +1445,9 @@ def generate_command(args):
 
 def test_command(args):
     """Test material content for quality compliance"""
+    from shared.utils.material_resolver import material_resolver
+    from shared.utils.quality_analyzer import quality_analyzer
+
     print("🧪 QUALITY TESTING:")
     print("="*60)
     
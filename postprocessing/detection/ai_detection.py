@@ -22,7 +22,7 @@ Usage:
         print(f"Issues: {result['issues']}")
 """
 
-from typing import Dict, Any
+from typing import Any, Dict, List, Optional
 import re
 import statistics
 from collections import Counter
@@ -31,6 +31,7 @@ import os
 
 # Import centralized config loader
 from generation.config.config_loader import get_config
+from shared.voice.pattern_engine import PatternHit, get_pattern_engine
 
 logger = logging.getLogger(__name__)
 
@@ -184,6 +185,8 @@ class AIDetector:
         """
         self.strict_mode = strict_mode
         self.config = load_patterns(patterns_file)
+        self.pattern_engine = get_pattern_engine(self.config)
+        self._last_scan: Optional[tuple] = None
 
         proc_config = get_config()
         self.ai_threshold = proc_config.get_ai_threshold(strict_mode=strict_mode)
@@ -201,6 +204,15 @@ class AIDetector:
             if key not in values:
                 raise KeyError(f"Missing pattern configuration key: {section}.{key}")
         return values
+
+    def _pattern_hits(self, text: str, category: str) -> List[PatternHit]:
+        """Pattern hits for text; the detect_* methods of one call share a single scan."""
+        # Read the cache once: batch_detect threads share this detector and
+        # may replace it between a check and a second read.
+        scan = self._last_scan
+        if scan is None or scan[0] != text:
+            scan = self._last_scan = (text, self.pattern_engine.scan(text.lower()))
+        return scan[1][category]
     
     def detect(self, text: str) -> Dict:
         """
@@ -220,22 +232,15 @@ class AIDetector:
     
     def detect_grammatical_errors(self, text: str) -> Dict[str, Any]:
         """Detect grammatical errors using loaded patterns."""
-        errors = []
-        text_lower = text.lower()
-        
-        # Use loaded grammar patterns
-        for pattern_def in self.config['grammar_patterns']:
-            try:
-                if re.search(pattern_def['pattern'], text_lower):
-                    errors.append({
-                        'type': pattern_def['name'],
-                        'example': pattern_def['example'],
-                        'severity': pattern_def['severity'],
-                        'pattern': pattern_def['name']
-                    })
-            except re.error as e:
-                logger.warning(f"Invalid regex pattern '{pattern_def['pattern']}': {e}")
-                continue
+        errors = [
+            {
+                'type': hit.definition['name'],
+                'example': hit.definition['example'],
+                'severity': hit.definition['severity'],
+                'pattern': hit.definition['name']
+            }
+            for hit in self._pattern_hits(text, 'grammar')
+        ]
         
         # Calculate severity
         critical_count = sum(1 for e in errors if e['severity'] == 'critical')
@@ -342,24 +347,16 @@ class AIDetector:
     
     def detect_unnatural_phrasing(self, text: str) -> Dict[str, Any]:
         """Detect unnatural phrasing using loaded patterns."""
-        examples = []
-        text_lower = text.lower()
-        
-        # Use loaded phrasing patterns
-        for pattern_def in self.config['phrasing_patterns']:
-            try:
-                matches = re.findall(pattern_def['pattern'], text_lower)
-                if matches:
-                    examples.append({
-                        'type': pattern_def['name'],
-                        'example': pattern_def['example'],
-                        'reason': pattern_def['reason'],
-                        'severity': pattern_def['severity'],
-                        'matches': matches[:3]
-                    })
-            except re.error as e:
-                logger.warning(f"Invalid regex pattern '{pattern_def['pattern']}': {e}")
-                continue
+        examples = [
+            {
+                'type': hit.definition['name'],
+                'example': hit.definition['example'],
+                'reason': hit.definition['reason'],
+                'severity': hit.definition['severity'],
+                'matches': list(hit.matches)
+            }
+            for hit in self._pattern_hits(text, 'phrasing')
+        ]
         
         # Determine severity
         critical_count = sum(1 for e in examples if e.get('severity') == 'critical')
@@ -393,34 +390,18 @@ class AIDetector:
         - Lexical diversity (MTLD scores)
         - Stylistic formality (over-formal word choice)
         """
-        issues = []
-        text_lower = text.lower()
-        
-        # Use loaded linguistic dimension patterns
-        for pattern_def in self.config['linguistic_patterns']:
-            pattern_name = pattern_def['name']
-            
-            try:
-                # For regex-based patterns
-                if 'formal_words' in pattern_name or 'pronoun' in pattern_name:
-                    matches = re.findall(pattern_def['pattern'], text_lower)
-                    if matches:
-                        issues.append({
-                            'type': pattern_name,
-                            'example': pattern_def['example'],
-                            'reason': pattern_def['reason'],
-                            'severity': pattern_def['severity'],
-                            'count': len(matches)
-                        })
-                # For MTLD/dependency patterns (would need specialized calculation)
-                # Note: These require external libraries or scripts, so we flag for manual review
-                elif 'lexical_diversity' in pattern_name or 'dependency' in pattern_name:
-                    # Placeholder: Would need textstat or spacy for actual calculation
-                    # For now, just load the pattern definition for documentation
-                    pass
-            except re.error as e:
-                logger.warning(f"Invalid regex pattern '{pattern_def['pattern']}': {e}")
-                continue
+        # Only the regex-based dimensions (formal words, pronoun bias) are matched;
+        # MTLD/dependency patterns need textstat or spacy and are documentation only
+        issues = [
+            {
+                'type': hit.definition['name'],
+                'example': hit.definition['example'],
+                'reason': hit.definition['reason'],
+                'severity': hit.definition['severity'],
+                'count': len(hit.matches)
+            }
+            for hit in self._pattern_hits(text, 'linguistic')
+        ]
         
         # Calculate severity
         critical_count = sum(1 for i in issues if i['severity'] == 'critical')
@@ -6,6 +6,7 @@ Composite scoring reduces false positives/negatives.
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List
 
 logger = logging.getLogger(__name__)
@@ -91,14 +92,30 @@ class AIDetectorEnsemble:
             logger.error(f"Winston API exception: {e}")
             raise RuntimeError(f"Winston API detection failed: {e}")
     
-    def batch_detect(self, texts: List[str]) -> List[Dict]:
+    def batch_detect(self, texts: List[str], max_workers: int = 4) -> List[Dict]:
         """
         Detect AI in batch.
         
+        Identical texts (e.g. unchanged retries) are sent to Winston once, and
+        distinct texts are requested concurrently. Fails fast like detect():
+        the first failed request raises RuntimeError.
+        
         Args:
             texts: List of texts
+            max_workers: Maximum concurrent Winston requests
             
         Returns:
-            List of detection results
+            List of detection results, in the order of texts
         """
-        return [self.detect(text) for text in texts]
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be >= 1, got {max_workers}")
+        
+        unique_texts = list(dict.fromkeys(texts))
+        if len(unique_texts) <= 1 or max_workers == 1:
+            results = [self.detect(text) for text in unique_texts]
+        else:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(unique_texts))) as executor:
+                results = list(executor.map(self.detect, unique_texts))
+        
+        by_text = dict(zip(unique_texts, results, strict=True))
+        return [dict(by_text[text]) for text in texts]
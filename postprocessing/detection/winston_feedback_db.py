@@ -9,13 +9,21 @@ Compliant with fail-fast architecture - no fallbacks, clear error signaling.
 
 import sqlite3
 import json
+import re
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 import logging
 from pathlib import Path
 
+from shared.utils.sqlite_pool import get_sqlite_pool, pooled_connect
+
 logger = logging.getLogger(__name__)
 
+# Passing samples analyzed for humanness patterns (best AI scores first)
+PASSING_SAMPLE_LIMIT = 20
+
+_NUMBER_UNIT_PATTERN = re.compile(r'\d+\.?\d*\s*[A-Za-z/%³²°]+/?[A-Za-z]*³?')
+
 
 class ConfigurationError(Exception):
     """Database configuration error."""
@@ -60,10 +68,25 @@ class WinstonFeedbackDatabase:
         self._init_database()
         
         logger.info(f"✅ [WINSTON DB] Initialized at {db_path}")
+
+    def transaction(self):
+        """
+        Group several log calls into one transaction (one commit).
+
+        Usage:
+            with db.transaction():
+                detection_id = db.log_detection(...)
+                db.log_generation_parameters(detection_result_id=detection_id, ...)
+                db.log_subjective_evaluation(...)
+
+        All writes commit together when the block exits, or roll back if it
+        raises. Connections are pooled per thread (see shared.utils.sqlite_pool).
+        """
+        return get_sqlite_pool(self.db_path).transaction()
     
     def _init_database(self):
         """Create tables if they don't exist."""
-        with sqlite3.connect(self.db_path) as conn:
+        with pooled_connect(self.db_path) as conn:
             cursor = conn.cursor()
             
             # Create all tables
@@ -428,7 +451,7 @@ class WinstonFeedbackDatabase:
                 f"composite_quality_score must be 0-1.0 normalized, got {composite_quality_score}"
             )
         
-        with sqlite3.connect(self.db_path) as conn:
+        with pooled_connect(self.db_path) as conn:
             cursor = conn.cursor()
             
             # Insert main detection result (ALL scores normalized to 0-1.0)
@@ -464,35 +487,39 @@ class WinstonFeedbackDatabase:
             if not isinstance(sentences, list):
                 raise ValueError("winston_result['sentences'] must be a list")
 
+            sentence_rows = []
             for idx, sentence in enumerate(sentences, 1):
                 if 'text' not in sentence:
                     raise KeyError("Sentence entry missing required key: text")
                 if 'score' not in sentence:
                     raise KeyError("Sentence entry missing required key: score")
-                cursor.execute("""
-                    INSERT INTO sentence_analysis
-                    (detection_result_id, sentence_number, sentence_text, human_score)
-                    VALUES (?, ?, ?, ?)
-                """, (
+                sentence_rows.append((
                     result_id,
                     idx,
                     sentence['text'],
                     sentence['score']
                 ))
+            cursor.executemany("""
+                INSERT INTO sentence_analysis
+                (detection_result_id, sentence_number, sentence_text, human_score)
+                VALUES (?, ?, ?, ?)
+            """, sentence_rows)
             
             # Insert detected AI patterns
             if failure_analysis:
                 patterns = failure_analysis.get('patterns', [])
-                for pattern in patterns:
-                    cursor.execute("""
-                        INSERT INTO ai_patterns
-                        (detection_result_id, pattern, context)
-                        VALUES (?, ?, ?)
-                    """, (
+                cursor.executemany("""
+                    INSERT INTO ai_patterns
+                    (detection_result_id, pattern, context)
+                    VALUES (?, ?, ?)
+                """, [
+                    (
                         result_id,
                         pattern[:50],  # Pattern description
                         pattern        # Full context
-                    ))
+                    )
+                    for pattern in patterns
+                ])
             
             conn.commit()
         
@@ -526,7 +553,7 @@ class WinstonFeedbackDatabase:
         """
         timestamp = datetime.utcnow().isoformat()
         
-        with sqlite3.connect(self.db_path) as conn:
+        with pooled_connect(self.db_path) as conn:
             cursor = conn.cursor()
             
             cursor.execute("""
@@ -567,7 +594,7 @@ class WinstonFeedbackDatabase:
         Returns:
             List of pattern dicts with frequency and scores
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with pooled_connect(self.db_path) as conn:
             cursor = conn.cursor()
             
             query = """
@@ -621,7 +648,7 @@ class WinstonFeedbackDatabase:
         Returns:
             List of correction dicts with original/corrected text
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with pooled_connect(self.db_path) as conn:
             cursor = conn.cursor()
             
             query = """
@@ -717,7 +744,7 @@ class WinstonFeedbackDatabase:
         else:
             logger.warning(f"⚠️ [DEBUG] DATABASE: evaluation_result.narrative_assessment is None/empty")
         
-        with sqlite3.connect(self.db_path) as conn:
+        with pooled_connect(self.db_path) as conn:
             cursor = conn.cursor()
             
             cursor.execute("""
@@ -845,7 +872,7 @@ class WinstonFeedbackDatabase:
                 adjustments_dicts.append(adj)
         adjustments_json = json.dumps(adjustments_dicts)
         
-        with sqlite3.connect(self.db_path) as conn:
+        with pooled_connect(self.db_path) as conn:
             cursor = conn.cursor()
             
             cursor.execute("""
@@ -922,7 +949,7 @@ class WinstonFeedbackDatabase:
         timestamp = datetime.now().isoformat()
         issues_json = json.dumps(issues)
         
-        with sqlite3.connect(self.db_path) as conn:
+        with pooled_connect(self.db_path) as conn:
             cursor = conn.cursor()
             
             cursor.execute("""
@@ -963,7 +990,7 @@ class WinstonFeedbackDatabase:
         Returns:
             Dict with evaluation data or None if not found
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with pooled_connect(self.db_path) as conn:
             conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
             
@@ -1020,7 +1047,7 @@ class WinstonFeedbackDatabase:
         Returns:
             True if enough samples exist and sweet spot should be updated
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with pooled_connect(self.db_path) as conn:
             cursor = conn.cursor()
             
             # Check if global sweet spot already exists
@@ -1061,7 +1088,7 @@ class WinstonFeedbackDatabase:
         Returns:
             Statistics dict with averages and trends
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with pooled_connect(self.db_path) as conn:
             cursor = conn.cursor()
             
             # Build query with filters
@@ -1121,7 +1148,7 @@ class WinstonFeedbackDatabase:
     
     def get_stats(self) -> Dict[str, Any]:
         """Get database statistics."""
-        with sqlite3.connect(self.db_path) as conn:
+        with pooled_connect(self.db_path) as conn:
             cursor = conn.cursor()
             
             # Total detections
@@ -1247,7 +1274,7 @@ class WinstonFeedbackDatabase:
         param_str = json.dumps(params, sort_keys=True)
         param_hash = hashlib.sha256(param_str.encode()).hexdigest()[:16]
         
-        with sqlite3.connect(self.db_path) as conn:
+        with pooled_connect(self.db_path) as conn:
             cursor = conn.cursor()
             
             cursor.execute("""
@@ -1343,7 +1370,7 @@ class WinstonFeedbackDatabase:
         Returns:
             List of parameter dicts ordered by human_score DESC
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with pooled_connect(self.db_path) as conn:
             cursor = conn.cursor()
             
             cursor.execute("""
@@ -1389,7 +1416,7 @@ class WinstonFeedbackDatabase:
         Returns:
             Dict with correlation analysis
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with pooled_connect(self.db_path) as conn:
             cursor = conn.cursor()
             
             query = f"""
@@ -1461,7 +1488,7 @@ class WinstonFeedbackDatabase:
         Returns:
             Row ID of the upserted record
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with pooled_connect(self.db_path) as conn:
             cursor = conn.cursor()
             
             # Extract parameter ranges from sweet_spots dict
@@ -1579,7 +1606,7 @@ class WinstonFeedbackDatabase:
         Returns:
             Dict with sweet spot data or None if not found
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with pooled_connect(self.db_path) as conn:
             conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
             
@@ -1663,84 +1690,102 @@ class WinstonFeedbackDatabase:
                 'number_patterns': List[str]
             }
         """
-        with sqlite3.connect(self.db_path) as conn:
+        return self.summarize_passing_samples(self.get_passing_samples())
+    
+    def get_passing_samples(self, after_id: int = 0, limit: int = PASSING_SAMPLE_LIMIT) -> List[Dict[str, Any]]:
+        """
+        Get the best (lowest AI score) passing samples.
+        
+        Args:
+            after_id: Only consider detection_results rows with a larger id
+                      (incremental refresh of a stored top list)
+            limit: Maximum samples returned
+        
+        Returns:
+            List of {'id', 'generated_text', 'ai_score'} ordered by ai_score, then id
+        """
+        with pooled_connect(self.db_path) as conn:
             conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
             
             # Query passing samples (success=1) ordered by best (lowest) AI score
             cursor.execute("""
-                SELECT 
-                    generated_text,
-                    ai_score,
-                    human_score,
-                    material,
-                    component_type
+                SELECT id, generated_text, ai_score
                 FROM detection_results
-                WHERE success = 1
-                ORDER BY ai_score ASC
-                LIMIT 20
-            """)
-            
-            rows = cursor.fetchall()
-            
-            if not rows:
-                # No passing samples yet - return empty patterns
-                return {
-                    'sample_count': 0,
-                    'best_score': 1.0,
-                    'average_score': 1.0,
-                    'sample_excerpts': [],
-                    'conversational_markers': [],
-                    'number_patterns': []
-                }
-            
-            # Extract patterns from passing samples
-            sample_count = len(rows)
-            ai_scores = [row['ai_score'] for row in rows]
-            best_score = min(ai_scores)
-            average_score = sum(ai_scores) / len(ai_scores)
-            
-            # Get sample excerpts (first 150 chars of best samples)
-            sample_excerpts = []
-            for row in rows[:3]:  # Top 3 best samples
-                text = row['generated_text']
-                excerpt = text[:150] if len(text) > 150 else text
-                sample_excerpts.append(excerpt)
-            
-            # Extract conversational markers from all passing samples
-            conversational_markers = set()
-            number_patterns = set()
-            
-            for row in rows:
-                text = row['generated_text'].lower()
-                
-                # Common conversational markers that appear in human-like text
-                markers = [
-                    'we use', 'around', 'roughly', 'about', 'typically',
-                    'generally', 'usually', 'often', 'sometimes', 'tends to',
-                    'stays near', 'close to', 'approximately', 'nearly'
-                ]
-                
-                for marker in markers:
-                    if marker in text:
-                        conversational_markers.add(marker)
-                
-                # Extract number patterns (number + unit combinations)
-                # Examples: "100 W", "8.8 g/cm³", "0.5%"
-                import re
-                number_unit_pattern = r'\d+\.?\d*\s*[A-Za-z/%³²°]+/?[A-Za-z]*³?'
-                matches = re.findall(number_unit_pattern, row['generated_text'])
-                for match in matches[:3]:  # Top 3 from each sample
-                    if len(match) < 20:  # Reasonable length
-                        number_patterns.add(match.strip())
+                WHERE success = 1 AND id > ?
+                ORDER BY ai_score ASC, id ASC
+                LIMIT ?
+            """, (after_id, limit))
             
+            return [
+                {'id': row['id'], 'generated_text': row['generated_text'], 'ai_score': row['ai_score']}
+                for row in cursor.fetchall()
+            ]
+    
+    @staticmethod
+    def summarize_passing_samples(rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Extract humanness patterns from passing samples (see get_passing_sample_patterns).
+        
+        Args:
+            rows: Samples with 'generated_text' and 'ai_score', best first
+        """
+        if not rows:
+            # No passing samples yet - return empty patterns
             return {
-                'sample_count': sample_count,
-                'best_score': best_score,
-                'average_score': average_score,
-                'sample_excerpts': sample_excerpts,
-                'conversational_markers': sorted(list(conversational_markers)),
-                'number_patterns': sorted(list(number_patterns))[:10]  # Top 10 patterns
+                'sample_count': 0,
+                'best_score': 1.0,
+                'average_score': 1.0,
+                'sample_excerpts': [],
+                'conversational_markers': [],
+                'number_patterns': []
             }
+        
+        # Extract patterns from passing samples
+        sample_count = len(rows)
+        ai_scores = [row['ai_score'] for row in rows]
+        best_score = min(ai_scores)
+        average_score = sum(ai_scores) / len(ai_scores)
+        
+        # Get sample excerpts (first 150 chars of best samples)
+        sample_excerpts = []
+        for row in rows[:3]:  # Top 3 best samples
+            text = row['generated_text']
+            excerpt = text[:150] if len(text) > 150 else text
+            sample_excerpts.append(excerpt)
+        
+        # Extract conversational markers from all passing samples
+        conversational_markers = set()
+        number_patterns = set()
+        
+        for row in rows:
+            text = row['generated_text'].lower()
+            
+            # Common conversational markers that appear in human-like text
+            markers = [
+                'we use', 'around', 'roughly', 'about', 'typically',
+                'generally', 'usually', 'often', 'sometimes', 'tends to',
+                'stays near', 'close to', 'approximately', 'nearly'
+            ]
+            
+            for marker in markers:
+                if marker in text:
+                    conversational_markers.add(marker)
+            
+            # Extract number patterns (number + unit combinations)
+            # Examples: "100 W", "8.8 g/cm³", "0.5%"
+            matches = _NUMBER_UNIT_PATTERN.findall(row['generated_text'])
+            for match in matches[:3]:  # Top 3 from each sample
+                if len(match) < 20:  # Reasonable length
+                    number_patterns.add(match.strip())
+        
+        return {
+            'sample_count': sample_count,
+            'best_score': best_score,
+            'average_score': average_score,
+            'sample_excerpts': sample_excerpts,
+            'conversational_markers': sorted(list(conversational_markers)),
+            'number_patterns': sorted(list(number_patterns))[:10]  # Top 10 patterns
+        }
 
 
@@ -1,9 +1,16 @@
 #!/usr/bin/env python3
 """Compatibility wrapper for the legacy CLI entrypoint."""
 
-from shared.config.settings import API_PROVIDERS, COMPONENT_CONFIG
-from legacy.run import main
+from shared.utils.lazy_exports import lazy_exports
+
+# `from run import API_PROVIDERS` / `COMPONENT_CONFIG` (shared.config, shared.api)
+# resolve on first use, so starting the CLI does not load the settings package.
+__getattr__, __dir__ = lazy_exports(__name__, {
+    'API_PROVIDERS': 'shared.config.settings',
+    'COMPONENT_CONFIG': 'shared.config.settings',
+})
 
 
 if __name__ == '__main__':
+    from legacy.run import main
     main()
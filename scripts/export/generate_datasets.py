@@ -31,6 +31,12 @@ Usage:
     # Dry run (no file writes)
     python3 scripts/export/generate_datasets.py --dry-run
 
+In-process (reuses already-loaded domain data, no second interpreter):
+    from scripts.export.generate_datasets import DatasetGenerator
+
+    generator = DatasetGenerator('../z-beam', materials_data=data, quiet=True)
+    generator.generate_all(domain='materials')
+
 Output:
     ../z-beam/public/datasets/materials/*.{json,csv,txt}
     ../z-beam/public/datasets/contaminants/*.{json,csv,txt}
@@ -41,9 +47,10 @@ import json
 import csv
 import logging
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime, timezone
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Callable, List, Optional, Tuple
 
 # Add project root to path
 project_root = Path(__file__).resolve().parents[2]
@@ -63,16 +70,34 @@ class DatasetGenerator:
     detect all fields from YAML data without hardcoded field lists.
     """
     
-    def __init__(self, z_beam_path: str, dry_run: bool = False):
+    def __init__(
+        self,
+        z_beam_path: str,
+        dry_run: bool = False,
+        materials_data: Optional[Dict[str, Any]] = None,
+        settings_data: Optional[Dict[str, Any]] = None,
+        workers: Optional[int] = None,
+        quiet: bool = False
+    ):
         """
         Initialize dataset generator.
         
         Args:
             z_beam_path: Path to z-beam project root
             dry_run: If True, don't write files
+            materials_data: Already-loaded Materials.yaml data (e.g. from
+                FrontmatterExporter); loaded from disk when omitted
+            settings_data: Already-loaded Settings.yaml data; loaded (cached)
+                from disk when omitted
+            workers: Thread pool size for per-item output (None: executor default)
+            quiet: If True, only the summary is printed
         """
         self.z_beam_path = Path(z_beam_path)
         self.dry_run = dry_run
+        self.workers = workers
+        self.quiet = quiet
+        self._materials_data = materials_data
+        self._settings_data = settings_data
         
         # Validate paths
         if not self.z_beam_path.exists():
@@ -85,9 +110,10 @@ class DatasetGenerator:
         # Load site config
         self.site_config = self._load_site_config()
         
-        # Initialize Dataset classes (replaces manual data loaders)
-        self.materials_dataset = MaterialsDataset()
-        self.contaminants_dataset = ContaminantsDataset()
+        # Dataset classes are built on first use, so a materials-only run
+        # never loads contaminants data (and vice versa)
+        self._materials_dataset: Optional[MaterialsDataset] = None
+        self._contaminants_dataset: Optional[ContaminantsDataset] = None
         
         # Statistics
         self.stats = {
@@ -101,6 +127,61 @@ class DatasetGenerator:
             self.materials_dir.mkdir(parents=True, exist_ok=True)
             self.contaminants_dir.mkdir(parents=True, exist_ok=True)
     
+    @property
+    def materials_dataset(self) -> MaterialsDataset:
+        """Materials dataset with machine settings merged (ADR 005)."""
+        if self._materials_dataset is None:
+            from export.utils import load_domain_data
+
+            materials_data = self._materials_data
+            if materials_data is None:
+                materials_data = load_domain_data(
+                    project_root / 'data' / 'materials' / 'Materials.yaml',
+                    items_key='materials'
+                )
+            settings_data = self._settings_data
+            if settings_data is None:
+                settings_data = load_domain_data(
+                    project_root / 'data' / 'settings' / 'Settings.yaml',
+                    items_key='settings'
+                )
+            self._materials_dataset = MaterialsDataset.from_domain_data(materials_data, settings_data)
+        return self._materials_dataset
+
+    @property
+    def contaminants_dataset(self) -> ContaminantsDataset:
+        """Contaminants dataset with compounds merged (ADR 005)."""
+        if self._contaminants_dataset is None:
+            self._contaminants_dataset = ContaminantsDataset()
+        return self._contaminants_dataset
+
+    def _say(self, message: str = "") -> None:
+        """Print progress output unless running quietly."""
+        if not self.quiet:
+            print(message)
+
+    def _run_items(
+        self,
+        items: Dict[str, Dict[str, Any]],
+        build: Callable[[str, Dict[str, Any]], None]
+    ) -> List[Tuple[str, Optional[Exception]]]:
+        """
+        Run build(item_id, item_data) for every item on a thread pool.
+
+        Items only read shared dataset state and write their own files, so
+        they are independent. Outcomes are returned in source order.
+        """
+        def run(entry: Tuple[str, Dict[str, Any]]) -> Tuple[str, Optional[Exception]]:
+            item_id, item_data = entry
+            try:
+                build(item_id, item_data)
+                return item_id, None
+            except Exception as e:
+                return item_id, e
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            return list(executor.map(run, items.items()))
+
     def _load_site_config(self) -> Dict[str, Any]:
         """Load site configuration from z-beam/site-config.json"""
         config_path = self.z_beam_path / "site-config.json"
@@ -123,19 +204,20 @@ class DatasetGenerator:
             logger.warning(f"Failed to load site config: {e}, using defaults")
             return default_config
     
-    def generate_all(self, domain: Optional[str] = None):
+    def generate_all(self, domain: Optional[str] = None, show_summary: bool = True):
         """
         Generate all datasets.
         
         Args:
             domain: If specified, only generate for this domain
+            show_summary: If True, print the generation summary
         """
-        print("=" * 80)
-        print("🚀 DATASET GENERATION (Direct from Source YAML)")
-        print("=" * 80)
-        print(f"Mode: {'DRY RUN' if self.dry_run else 'WRITE'}")
-        print(f"Output: {self.z_beam_path / 'public' / 'datasets'}")
-        print()
+        self._say("=" * 80)
+        self._say("🚀 DATASET GENERATION (Direct from Source YAML)")
+        self._say("=" * 80)
+        self._say(f"Mode: {'DRY RUN' if self.dry_run else 'WRITE'}")
+        self._say(f"Output: {self.z_beam_path / 'public' / 'datasets'}")
+        self._say()
         
         # Generate materials datasets
         if domain is None or domain == "materials":
@@ -146,42 +228,43 @@ class DatasetGenerator:
             self._generate_contaminants()
         
         # Print summary
-        self._print_summary()
+        if show_summary:
+            self._print_summary()
     
     def _generate_materials(self):
         """Generate material datasets using MaterialsDataset (dynamic field detection)"""
-        print("📊 Generating Materials Datasets (Dynamic Field Detection)...")
-        print("-" * 80)
+        self._say("📊 Generating Materials Datasets (Dynamic Field Detection)...")
+        self._say("-" * 80)
         
         try:
             # Get all materials from Dataset class
             materials = self.materials_dataset.get_all_materials()
             
-            print(f"Found {len(materials)} materials")
+            self._say(f"Found {len(materials)} materials")
+
+            def build(slug: str, material_data: Dict[str, Any]) -> None:
+                # Extract base slug (remove -laser-cleaning suffix)
+                base_slug = self.materials_dataset.get_base_slug(slug)
+
+                # Generate all formats using Dataset class methods
+                self._write_material_json(base_slug, material_data)
+                self._write_material_csv(base_slug, material_data)
+                self._write_material_txt(base_slug, material_data)
             
             # Generate dataset for each material
-            for slug, material_data in materials.items():
-                try:
-                    # Extract base slug (remove -laser-cleaning suffix)
-                    base_slug = self.materials_dataset.get_base_slug(slug)
-                    
-                    # Generate all formats using Dataset class methods
-                    self._write_material_json(base_slug, material_data)
-                    self._write_material_csv(base_slug, material_data)
-                    self._write_material_txt(base_slug, material_data)
-                    
+            for slug, error in self._run_items(materials, build):
+                if error is None:
                     self.stats["materials"]["generated"] += 1
                     self.stats["total_files"] += 3
                     
                     if not self.dry_run:
-                        logger.info(f"✅ Generated {base_slug}")
-                    
-                except Exception as e:
+                        logger.info(f"✅ Generated {self.materials_dataset.get_base_slug(slug)}")
+                else:
                     self.stats["materials"]["errors"] += 1
-                    logger.error(f"❌ Error generating {slug}: {e}")
+                    logger.error(f"❌ Error generating {slug}: {error}")
                     print(f"❌ Error: {slug}")
             
-            print()
+            self._say()
             
         except Exception as e:
             logger.error(f"Fatal error loading materials: {e}")
@@ -189,38 +272,38 @@ class DatasetGenerator:
     
     def _generate_contaminants(self):
         """Generate contaminant datasets using ContaminantsDataset (dynamic field detection)"""
-        print("🧪 Generating Contaminants Datasets (Dynamic Field Detection)...")
-        print("-" * 80)
+        self._say("🧪 Generating Contaminants Datasets (Dynamic Field Detection)...")
+        self._say("-" * 80)
         
         try:
             # Get all contaminants from Dataset class
             contaminants = self.contaminants_dataset.get_all_contaminants()
             
-            print(f"Found {len(contaminants)} contaminants")
+            self._say(f"Found {len(contaminants)} contaminants")
+
+            def build(pattern_id: str, pattern_data: Dict[str, Any]) -> None:
+                # Merge compound data using Dataset class (ADR 005)
+                enriched_data = self.contaminants_dataset.merge_compounds(pattern_data)
+
+                # Generate all formats using Dataset class methods
+                self._write_contaminant_json(pattern_id, enriched_data)
+                self._write_contaminant_csv(pattern_id, enriched_data)
+                self._write_contaminant_txt(pattern_id, enriched_data)
             
             # Generate dataset for each contaminant
-            for pattern_id, pattern_data in contaminants.items():
-                try:
-                    # Merge compound data using Dataset class (ADR 005)
-                    enriched_data = self.contaminants_dataset.merge_compounds(pattern_data)
-                    
-                    # Generate all formats using Dataset class methods
-                    self._write_contaminant_json(pattern_id, enriched_data)
-                    self._write_contaminant_csv(pattern_id, enriched_data)
-                    self._write_contaminant_txt(pattern_id, enriched_data)
-                    
+            for pattern_id, error in self._run_items(contaminants, build):
+                if error is None:
                     self.stats["contaminants"]["generated"] += 1
                     self.stats["total_files"] += 3
                     
                     if not self.dry_run:
                         logger.info(f"✅ Generated {pattern_id}")
-                    
-                except Exception as e:
+                else:
                     self.stats["contaminants"]["errors"] += 1
-                    logger.error(f"❌ Error generating {pattern_id}: {e}")
+                    logger.error(f"❌ Error generating {pattern_id}: {error}")
                     print(f"❌ Error: {pattern_id}")
             
-            print()
+            self._say()
             
         except Exception as e:
             logger.error(f"Fatal error loading contaminants: {e}")
@@ -236,7 +319,7 @@ class DatasetGenerator:
         output_path = self.materials_dir / f"{slug}-material-dataset.json"
         
         if self.dry_run:
-            print(f"  [DRY RUN] Would write: {output_path.name}")
+            self._say(f"  [DRY RUN] Would write: {output_path.name}")
             return
         
         # Generate using Dataset class (dynamic field detection)
@@ -411,7 +494,7 @@ class DatasetGenerator:
         output_path = self.contaminants_dir / f"{pattern_id}-contaminant-dataset.json"
         
         if self.dry_run:
-            print(f"  [DRY RUN] Would write: {output_path.name}")
+            self._say(f"  [DRY RUN] Would write: {output_path.name}")
             return
         
         # Generate using Dataset class (dynamic field detection)
@@ -676,6 +759,12 @@ def main():
         default='../z-beam',
         help='Path to z-beam project (default: ../z-beam)'
     )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=None,
+        help='Thread pool size for per-item output (default: executor default)'
+    )
     parser.add_argument(
         '--verbose',
         action='store_true',
@@ -695,7 +784,8 @@ def main():
         # Initialize generator
         generator = DatasetGenerator(
             z_beam_path=args.z_beam_path,
-            dry_run=args.dry_run
+            dry_run=args.dry_run,
+            workers=args.workers
         )
         
         # Generate datasets
@@ -66,6 +66,7 @@ sys.path.insert(0, str(PROJECT_ROOT))
 
 from shared.matching.entity_matcher import (
     CandidateEntity,
+    CandidateIndex,
     EntityMatcher,
     HostEntity,
     MatchConfig,
@@ -461,6 +462,8 @@ def run(
         return
 
     matcher = EntityMatcher()
+    # Tokenize/index candidates once; each host then scores only plausible matches
+    candidate_index = CandidateIndex(candidates)
 
     # Load source YAML for write-back (only needed for non-video hosts)
     cfg = DOMAIN_CONFIG[host_domain]
@@ -500,7 +503,7 @@ def run(
             continue
 
         # Run matching
-        ranked = matcher.rank_candidates(host, candidates, config)
+        ranked = matcher.rank_candidates(host, candidate_index, config)
         slugs = [slug for slug, _score, _diag in ranked]
 
         # Hydrate to full objects if required
@@ -5,7 +5,6 @@ Validates all internal links in frontmatter files.
 """
 
 import sys
-import yaml
 import re
 from pathlib import Path
 from collections import defaultdict
@@ -14,82 +13,60 @@ from collections import defaultdict
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
-def load_yaml(file_path):
-    """Load YAML file"""
-    try:
-        with open(file_path, 'r') as f:
-            return yaml.safe_load(f) or {}
-    except Exception as e:
-        return {}
+from shared.cache.frontmatter_corpus import FrontmatterVisitor, get_frontmatter_corpus
 
-def main():
-    print("=" * 80)
-    print("PHASE 4: COMPREHENSIVE LINK VALIDATION")
-    print("=" * 80)
-    print()
-    
-    # Locate frontmatter directory
-    frontmatter_dir = project_root.parent / "z-beam/frontmatter"
-    
-    if not frontmatter_dir.exists():
-        print(f"❌ ERROR: Frontmatter directory not found: {frontmatter_dir}")
-        return
-    
-    print(f"📁 Scanning frontmatter directory: {frontmatter_dir}")
-    print()
-    
-    # Build index of all frontmatter files
-    print("🔍 Building frontmatter index...")
-    file_index = {}
-    for domain in ['materials', 'contaminants', 'compounds', 'settings', 'applications']:
-        domain_dir = frontmatter_dir / domain
-        if domain_dir.exists():
-            for yaml_file in domain_dir.glob('*.yaml'):
-                slug = yaml_file.stem
-                file_index[slug] = {
-                    'path': yaml_file,
-                    'domain': domain
-                }
-    
-    print(f"   Indexed {len(file_index)} files")
-    print()
-    
-    # Validation results
-    validation_results = {
-        'files_scanned': 0,
-        'total_links': 0,
-        'structural_errors': [],
-        'broken_links': [],
-        'format_errors': [],
-        'bidirectional_mismatches': [],
-        'orphaned_items': [],
-        'stats': defaultdict(int)
-    }
-    
-    print("🔎 Validating links...")
-    print("-" * 80)
+DOMAINS = ['materials', 'contaminants', 'compounds', 'settings', 'applications']
+
+# URL patterns for each domain
+URL_PATTERNS = {
+    'materials': r'^/materials/[\w-]+/[\w-]+/[\w-]+$',
+    'settings': r'^/settings/[\w-]+/[\w-]+/[\w-]+-settings$',
+    'contaminants': r'^/contaminants/[\w-]+/[\w-]+/[\w-]+$',
+    'compounds': r'^/compounds/[\w-]+/[\w-]+/[\w-]+-compound$',
+    'applications': r'^/applications/[\w-]+$'
+}
+
+
+class ComprehensiveLinkVisitor(FrontmatterVisitor):
+    """Collects link validation results over the shared frontmatter corpus"""
     
-    # URL patterns for each domain
-    url_patterns = {
-        'materials': r'^/materials/[\w-]+/[\w-]+/[\w-]+$',
-        'settings': r'^/settings/[\w-]+/[\w-]+/[\w-]+-settings$',
-        'contaminants': r'^/contaminants/[\w-]+/[\w-]+/[\w-]+$',
-        'compounds': r'^/compounds/[\w-]+/[\w-]+/[\w-]+-compound$',
-        'applications': r'^/applications/[\w-]+$'
-    }
+    def __init__(self):
+        self.file_index = {}
+        self.validation_results = {
+            'files_scanned': 0,
+            'total_links': 0,
+            'structural_errors': [],
+            'broken_links': [],
+            'format_errors': [],
+            'bidirectional_mismatches': [],
+            'orphaned_items': [],
+            'stats': defaultdict(int)
+        }
+        # Relationship tracking for bidirectional check
+        self.all_relationships = defaultdict(lambda: defaultdict(list))
     
-    # Relationship tracking for bidirectional check
-    all_relationships = defaultdict(lambda: defaultdict(list))
+    def begin(self, corpus):
+        """Build index of all frontmatter files (slug -> path, domain)"""
+        for document in corpus.documents():
+            self.file_index[document.slug] = {
+                'path': document.path,
+                'domain': document.domain
+            }
     
-    # Scan all files
-    for slug, file_info in file_index.items():
+    def visit(self, document):
+        slug = document.slug
+        # Slugs shared across domains are validated once, like the index keeps them
+        if self.file_index[slug]['path'] != document.path:
+            return
+        
+        validation_results = self.validation_results
         validation_results['files_scanned'] += 1
-        file_path = file_info['path']
-        domain = file_info['domain']
+        file_path = document.path
+        domain = document.domain
         
-        data = load_yaml(file_path)
+        data = (document.data if document.ok else None) or {}
         if not data:
-            continue
+            return
         
         # Check for relationships section
         if 'relationships' not in data:
@@ -98,7 +75,7 @@ def main():
                 'domain': domain,
                 'path': str(file_path)
             })
-            continue
+            return
         
         relationships = data['relationships']
         if not relationships:
@@ -107,7 +84,7 @@ def main():
                 'domain': domain,
                 'path': str(file_path)
             })
-            continue
+            return
         
         # Validate each relationship section
         for rel_type, links in relationships.items():
@@ -139,7 +116,7 @@ def main():
                 
                 # Target existence validation
                 target_slug = link.get('slug', '')
-                if target_slug not in file_index:
+                if target_slug not in self.file_index:
                     validation_results['broken_links'].append({
                         'source': str(file_path),
                         'target_slug': target_slug,
@@ -148,9 +125,9 @@ def main():
                     continue
                 
                 # Full path format validation
-                target_domain = file_index[target_slug]['domain']
+                target_domain = self.file_index[target_slug]['domain']
                 full_path = link.get('full_path', '')
-                pattern = url_patterns.get(target_domain)
+                pattern = URL_PATTERNS.get(target_domain)
                 
                 if pattern and not re.match(pattern, full_path):
                     validation_results['format_errors'].append({
@@ -161,20 +138,55 @@ def main():
                     })
                 
                 # Track for bidirectional check
-                all_relationships[slug][target_slug].append(rel_type)
+                self.all_relationships[slug][target_slug].append(rel_type)
     
-    # Bidirectional consistency check
-    print("\n🔄 Checking bidirectional consistency...")
-    for source_slug, targets in all_relationships.items():
-        for target_slug in targets.keys():
-            # Check if reverse relationship exists
-            if target_slug in all_relationships:
-                if source_slug not in all_relationships[target_slug]:
-                    validation_results['bidirectional_mismatches'].append({
-                        'source': source_slug,
-                        'target': target_slug,
-                        'note': f"{source_slug}→{target_slug} exists, but {target_slug}→{source_slug} missing"
-                    })
+    def finish(self, corpus):
+        """Bidirectional consistency check"""
+        print("\n🔄 Checking bidirectional consistency...")
+        all_relationships = self.all_relationships
+        for source_slug, targets in all_relationships.items():
+            for target_slug in targets.keys():
+                # Check if reverse relationship exists
+                if target_slug in all_relationships:
+                    if source_slug not in all_relationships[target_slug]:
+                        self.validation_results['bidirectional_mismatches'].append({
+                            'source': source_slug,
+                            'target': target_slug,
+                            'note': f"{source_slug}→{target_slug} exists, but {target_slug}→{source_slug} missing"
+                        })
+
+
+def main():
+    print("=" * 80)
+    print("PHASE 4: COMPREHENSIVE LINK VALIDATION")
+    print("=" * 80)
+    print()
+    
+    # Locate frontmatter directory
+    frontmatter_dir = project_root.parent / "z-beam/frontmatter"
+    
+    if not frontmatter_dir.exists():
+        print(f"❌ ERROR: Frontmatter directory not found: {frontmatter_dir}")
+        return
+    
+    print(f"📁 Scanning frontmatter directory: {frontmatter_dir}")
+    print()
+    
+    # Parse (or reuse the cached parse of) every frontmatter file once
+    print("🔍 Building frontmatter index...")
+    corpus = get_frontmatter_corpus(frontmatter_dir, DOMAINS)
+    corpus.scan()
+    visitor = ComprehensiveLinkVisitor()
+    visitor.begin(corpus)
+    print(f"   Indexed {len(visitor.file_index)} files")
+    print()
+    
+    print("🔎 Validating links...")
+    print("-" * 80)
+    for document in corpus.documents():
+        visitor.visit(document)
+    visitor.finish(corpus)
+    validation_results = visitor.validation_results
     
     # Print results
     print()
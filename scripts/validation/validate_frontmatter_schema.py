@@ -21,13 +21,16 @@ import argparse
 import os
 import sys
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Any, Dict, List, Tuple
 
 import yaml
 from jsonschema import Draft7Validator, ValidationError
 
+from shared.cache.frontmatter_corpus import FrontmatterDocument, FrontmatterVisitor, get_frontmatter_corpus
 from shared.utils.file_ops.path_manager import PathManager
 
+DOMAINS = ['materials', 'contaminants', 'compounds', 'settings', 'applications']
+
 
 def load_schema(schema_path: str) -> Dict:
     """Load schema from JSON or YAML file."""
@@ -49,7 +52,20 @@ def validate_file(filepath: str, validator: Draft7Validator) -> Tuple[bool, List
     try:
         with open(filepath, 'r') as f:
             frontmatter = yaml.safe_load(f)
-        
+        return validate_frontmatter(frontmatter, validator)
+    
+    except Exception as e:
+        return False, [f"Failed to load file: {str(e)}"]
+
+
+def validate_frontmatter(frontmatter: Any, validator: Draft7Validator) -> Tuple[bool, List[str]]:
+    """
+    Validate one parsed frontmatter document.
+    
+    Returns:
+        (is_valid, error_messages)
+    """
+    try:
         errors = []
         for error in validator.iter_errors(frontmatter):
             # Format error message
@@ -78,13 +94,28 @@ def validate_file(filepath: str, validator: Draft7Validator) -> Tuple[bool, List
         return False, [f"Failed to load file: {str(e)}"]
 
 
+class SchemaVisitor(FrontmatterVisitor):
+    """Collects schema results per domain from a shared FrontmatterCorpus."""
+    
+    def __init__(self, validator: Draft7Validator):
+        self.validator = validator
+        self.results: Dict[str, List[Tuple[str, bool, List[str]]]] = {}
+    
+    def visit(self, document: FrontmatterDocument) -> None:
+        if document.error is not None:
+            is_valid, errors = False, [f"Failed to load file: {document.error}"]
+        else:
+            is_valid, errors = validate_frontmatter(document.data, self.validator)
+        self.results.setdefault(document.domain, []).append((document.path.name, is_valid, errors))
+
+
 def main():
     project_root = PathManager.get_project_root()
     default_schema = str(PathManager.get_path('schemas', 'all_domains_schema.yaml'))
     default_frontmatter_dir = str(project_root.parent / 'z-beam' / 'frontmatter')
 
     parser = argparse.ArgumentParser(description='Validate frontmatter files against schema')
-    parser.add_argument('--domain', choices=['materials', 'contaminants', 'compounds', 'settings', 'applications'],
+    parser.add_argument('--domain', choices=DOMAINS,
                         help='Validate specific domain only')
     parser.add_argument('--strict', action='store_true',
                         help='Exit with code 1 if any validation errors found')
@@ -109,7 +140,11 @@ def main():
     if args.domain:
         domains = [args.domain]
     else:
-        domains = ['materials', 'contaminants', 'compounds', 'settings', 'applications']
+        domains = list(DOMAINS)
+    
+    # Validate the parse shared with the other frontmatter validators
+    schema_visitor = SchemaVisitor(validator)
+    get_frontmatter_corpus(args.frontmatter_dir, DOMAINS).accept(schema_visitor, domain=args.domain)
     
     # Validate each domain
     total_files = 0
@@ -123,16 +158,13 @@ def main():
             print(f"⚠️  {domain.upper()}: Directory not found")
             continue
         
-        files = [f for f in os.listdir(domain_path) if f.endswith('.yaml')]
+        files = schema_visitor.results.get(domain, [])
         domain_passed = 0
         domain_failed = 0
         
         print(f"📂 {domain.upper()}: Validating {len(files)} files...")
         
-        for filename in files:
-            filepath = os.path.join(domain_path, filename)
-            is_valid, errors = validate_file(filepath, validator)
-            
+        for filename, is_valid, errors in files:
             total_files += 1
             
             if is_valid:
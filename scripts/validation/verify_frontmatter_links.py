@@ -16,13 +16,24 @@ Usage:
     python3 scripts/validation/verify_frontmatter_links.py --report links_report.md
 """
 
+import sys
 import yaml
 import argparse
 from pathlib import Path
-from typing import Dict, List, Set, Tuple, Any
+from typing import Dict, List, Optional, Set, Tuple, Any
 from collections import defaultdict
 from dataclasses import dataclass, field
 
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from shared.cache.frontmatter_corpus import (
+    FrontmatterCorpus,
+    FrontmatterDocument,
+    FrontmatterVisitor,
+    get_frontmatter_corpus,
+)
+
 
 @dataclass
 class LinkIssue:
@@ -61,8 +72,13 @@ class ValidationReport:
         return len(self.missing_backlinks) + len(self.orphaned_items) + len(self.warnings)
 
 
-class FrontmatterLinkValidator:
-    """Validates internal links across all frontmatter files"""
+class FrontmatterLinkValidator(FrontmatterVisitor):
+    """
+    Validates internal links across all frontmatter files
+
+    Runs as a visitor over the shared FrontmatterCorpus, so every file is
+    parsed once for both the ID index and the link checks.
+    """
     
     DOMAINS = ['materials', 'contaminants', 'compounds', 'settings', 'applications']
     
@@ -84,8 +100,9 @@ class FrontmatterLinkValidator:
         ('contaminants', 'recommended_settings'): ('settings', 'effective_contaminants'),
     }
     
-    def __init__(self, frontmatter_root: Path):
+    def __init__(self, frontmatter_root: Path, corpus: Optional[FrontmatterCorpus] = None):
         self.frontmatter_root = frontmatter_root
+        self.corpus = corpus or get_frontmatter_corpus(frontmatter_root, self.DOMAINS)
         self.index: Dict[str, Set[str]] = {domain: set() for domain in self.DOMAINS}
         self.challenge_library: Dict[str, Any] = {}
         self.link_graph: Dict[str, Dict[str, List[str]]] = defaultdict(lambda: defaultdict(list))
@@ -113,15 +130,16 @@ class FrontmatterLinkValidator:
                 print(f"⚠️  Domain path not found: {domain_path}")
                 continue
             
-            for file_path in domain_path.glob('*.yaml'):
+            for document in self.corpus.documents(domain):
                 try:
-                    data = yaml.safe_load(file_path.read_text())
-                    item_id = data.get('id')
+                    if document.error is not None:
+                        raise ValueError(document.error)
+                    item_id = document.data.get('id')
                     if item_id:
                         self.index[domain].add(item_id)
                         self.report.total_files += 1
                 except Exception as e:
-                    print(f"❌ Error reading {file_path}: {e}")
+                    print(f"❌ Error reading {document.path}: {e}")
         
         for domain, ids in self.index.items():
             print(f"   ✅ {domain}: {len(ids)} items indexed")
@@ -139,25 +157,33 @@ class FrontmatterLinkValidator:
                 missing_domains.append(domain)
                 print(f"   ⚠️  Missing: {domain_path}")
             else:
-                file_count = len(list(domain_path.glob('*.yaml')))
+                file_count = len(self.corpus.documents(domain))
                 print(f"   ✅ Found: {domain_path} ({file_count} files)")
         
         if missing_domains:
             print(f"\n⚠️  {len(missing_domains)} domain directories missing: {', '.join(missing_domains)}")
             print("   Validation will only check existing domains.")
         
-        self.build_index()
+        self.begin(self.corpus)
         
         for domain in self.DOMAINS:
             self.validate_domain(domain)
         
+        self.finish(self.corpus)
+        
+        return self.report
+    
+    def begin(self, corpus: FrontmatterCorpus):
+        """Visitor hook: index every ID before links are checked"""
+        self.build_index()
+    
+    def finish(self, corpus: FrontmatterCorpus):
+        """Visitor hook: cross-file checks once every file was visited"""
         # Only check bidirectional consistency if we have multiple domains
         if len([d for d in self.DOMAINS if len(self.index[d]) > 0]) > 1:
             self.check_bidirectional_consistency()
         
         self.find_orphaned_items()
-        
-        return self.report
     
     def validate_domain(self, domain: str):
         """Validate all links in a specific domain"""
@@ -167,13 +193,21 @@ class FrontmatterLinkValidator:
         
         print(f"\n📂 Validating {domain} domain...")
         
-        for file_path in domain_path.glob('*.yaml'):
-            self.validate_file(file_path, domain)
+        for document in self.corpus.documents(domain):
+            self.visit(document)
     
     def validate_file(self, file_path: Path, domain: str):
         """Validate all links in a single file"""
+        self.visit(self.corpus.document(file_path))
+    
+    def visit(self, document: FrontmatterDocument):
+        """Validate all links in a single parsed file"""
+        file_path = document.path
+        domain = document.domain
         try:
-            data = yaml.safe_load(file_path.read_text())
+            if document.error is not None:
+                raise ValueError(document.error)
+            data = document.data
             source_id = data.get('id')
             
             if not source_id:
@@ -5,49 +5,55 @@ This package provides standardized, fail-fast API client management
 with consistent behavior across all providers and environments.
 """
 
-# Main API client and factory
-from .client import APIClient, APIResponse, GenerationRequest
+from shared.utils.lazy_exports import lazy_exports
 
-# Client caching for performance
-from .client_cache import (
-    APIClientCache,
-    api_client_cache,
-    get_cached_api_client,
-    get_cached_client_for_component,
-)
-from .client_factory import (
-    APIClientFactory,
-    create_api_client,
-    get_api_client_for_component,
-)
+# Export name -> submodule, or (submodule, attribute). Exports are imported on
+# first access: most callers need one client, not every provider module, the
+# cache layers and the async client.
+_EXPORTS = {
+    # Main API client and factory
+    'APIClient': '.client',
+    'APIResponse': '.client',
+    'GenerationRequest': '.client',
+    # Concurrent client (asyncio, connection-pooled)
+    'AsyncAPIClient': '.async_client',
+    # Client caching for performance
+    'APIClientCache': '.client_cache',
+    'api_client_cache': '.client_cache',
+    'get_cached_api_client': '.client_cache',
+    'get_cached_client_for_component': '.client_cache',
+    'APIClientFactory': '.client_factory',
+    'create_api_client': '.client_factory',
+    'get_api_client_for_component': '.client_factory',
+    # Client management
+    'get_component_client': ('.client_manager', 'get_api_client_for_component'),
+    'setup_api_client': '.client_manager',
+    'test_api_connectivity': '.client_manager',
+    'validate_api_environment': '.client_manager',
+    # Configuration and key management
+    'get_api_providers': '.config',
+    'get_default_config': '.config',
+    # Specialized clients
+    'DeepSeekClient': '.deepseek',
+    'create_deepseek_client': '.deepseek',
+    'APIKeyManager': '.key_manager',
+    'get_api_key': '.key_manager',
+    'get_masked_api_key': '.key_manager',
+    'is_provider_available': '.key_manager',
+    'validate_all_api_keys': '.key_manager',
+}
 
-# Client management
-from .client_manager import get_api_client_for_component as get_component_client
-from .client_manager import (
-    setup_api_client,
-    test_api_connectivity,
-    validate_api_environment,
-)
+# Environment loading (DEPRECATED - use key_manager for all new code)
+# from .env_loader import EnvLoader  # REMOVED - no longer supported
 
-# Configuration and key management
-from .config import get_api_providers, get_default_config
 
-# Specialized clients
-from .deepseek import DeepSeekClient, create_deepseek_client
-from .key_manager import (
-    APIKeyManager,
-    get_api_key,
-    get_masked_api_key,
-    is_provider_available,
-    validate_all_api_keys,
-)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
-# Environment loading (DEPRECATED - use key_manager for all new code)
-# from .env_loader import EnvLoader  # REMOVED - no longer supported
 
 __all__ = [
     # Main classes
     "APIClient",
+    "AsyncAPIClient",
     "APIClientFactory", 
     "APIClientCache",
     "APIKeyManager",
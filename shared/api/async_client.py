@@ -0,0 +1,338 @@
+#!/usr/bin/env python3
+"""
+Async API Client for Z-Beam Generator
+
+asyncio sibling of APIClient with the same GenerationRequest/APIResponse
+contract. APIClient sends one blocking request at a time (single-connection
+pool, time.sleep backoff); AsyncAPIClient lets batch generation, research and
+detection keep several requests in flight so network latency overlaps.
+
+Features:
+- Shared connection pool: one requests.Session per client, sized to the
+  provider concurrency limit; blocking I/O runs on the client's worker threads
+- Per-provider concurrency limits: every client for the same base_url shares
+  one process-wide in-flight limit (max_concurrency) and one request rate
+  limit (requests_per_minute), across threads and event loops
+- Jittered exponential backoff, retrying timeouts, connection errors,
+  malformed responses, HTTP 429 (honouring Retry-After) and HTTP 5xx
+- Sync facade: generate() / generate_many() for existing synchronous callers
+
+Usage:
+    from shared.api.async_client import AsyncAPIClient
+
+    client = AsyncAPIClient(config=config, max_concurrency=4, requests_per_minute=60)
+
+    # Async callers
+    responses = await client.agenerate_many(requests)
+
+    # Sync callers (drop-in for APIClient.generate)
+    response = client.generate(request)
+    responses = client.generate_many(requests)
+"""
+
+import asyncio
+import logging
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence
+
+import requests
+
+from shared.api.client import APIClient, APIResponse, GenerationRequest
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONCURRENCY = 4
+
+# HTTP status codes worth retrying (rate limited / transient server errors)
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+class AsyncTokenBucket:
+    """
+    Token bucket rate limiter usable from any event loop.
+
+    Each acquire() reserves the next free slot under a thread lock and then
+    sleeps outside it, so waiters on different loops (or threads) queue fairly
+    without holding the lock while sleeping.
+    """
+
+    def __init__(self, requests_per_minute: float, burst: int = 1) -> None:
+        if requests_per_minute <= 0:
+            raise ValueError(f"requests_per_minute must be > 0, got {requests_per_minute}")
+        if burst < 1:
+            raise ValueError(f"burst must be >= 1, got {burst}")
+        self.rate = requests_per_minute / 60.0
+        self.capacity = float(burst)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take one token (possibly going into debt); return seconds to wait."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    async def acquire(self) -> float:
+        """Wait until a request may start; return seconds waited."""
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+
+
+class ProviderLimits:
+    """
+    Concurrency and rate limits shared by all async clients of one provider.
+
+    The sync facade runs every call on its own event loop, usually from
+    several caller threads at once, so the in-flight limit is a thread
+    semaphore taken by the worker thread that sends the request rather than
+    a per-loop asyncio.Semaphore.
+    """
+
+    def __init__(self, max_concurrency: int, requests_per_minute: Optional[float] = None) -> None:
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be >= 1, got {max_concurrency}")
+        self.max_concurrency = max_concurrency
+        self.requests_per_minute = requests_per_minute
+        self.bucket = AsyncTokenBucket(requests_per_minute) if requests_per_minute else None
+        # Held (blocking) by the worker thread for the duration of one request
+        self.slots = threading.BoundedSemaphore(max_concurrency)
+
+
+_provider_limits: Dict[str, ProviderLimits] = {}
+_provider_limits_lock = threading.Lock()
+
+
+def get_provider_limits(
+    base_url: str,
+    max_concurrency: int,
+    requests_per_minute: Optional[float] = None,
+) -> ProviderLimits:
+    """
+    Get the shared limits for a provider endpoint.
+
+    The first client registered for a base_url sets its limits; later clients
+    with different values share the existing limits (logged at debug level).
+    """
+    with _provider_limits_lock:
+        limits = _provider_limits.get(base_url)
+        if limits is None:
+            limits = ProviderLimits(max_concurrency, requests_per_minute)
+            _provider_limits[base_url] = limits
+        elif (limits.max_concurrency, limits.requests_per_minute) != (max_concurrency, requests_per_minute):
+            logger.debug(
+                f"Reusing provider limits for {base_url}: "
+                f"max_concurrency={limits.max_concurrency}, requests_per_minute={limits.requests_per_minute}"
+            )
+        return limits
+
+
+def reset_provider_limits() -> None:
+    """Forget all shared provider limits (tests, reconfiguration)."""
+    with _provider_limits_lock:
+        _provider_limits.clear()
+
+
+class AsyncAPIClient(APIClient):
+    """
+    Connection-pooled API client with bounded concurrent requests.
+
+    Configuration is validated exactly as for APIClient. Additional optional
+    config keys: max_concurrency (default 4), requests_per_minute (default
+    unlimited). Constructor arguments override config values.
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        model: Optional[str] = None,
+        config: Optional[Dict] = None,
+        max_concurrency: Optional[int] = None,
+        requests_per_minute: Optional[float] = None,
+    ):
+        """Initialize the async API client with configuration"""
+        if config is None:
+            raise ValueError("Configuration must be provided explicitly - no defaults allowed in fail-fast architecture")
+        self.max_concurrency = max_concurrency or self._optional_config(config, "max_concurrency") or DEFAULT_MAX_CONCURRENCY
+        self.requests_per_minute = requests_per_minute or self._optional_config(config, "requests_per_minute")
+
+        super().__init__(api_key=api_key, base_url=base_url, model=model, config=config)
+
+        self.limits = get_provider_limits(self.base_url, self.max_concurrency, self.requests_per_minute)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_concurrency,
+            thread_name_prefix="async-api",
+        )
+        self._stats_lock = threading.Lock()
+
+    @staticmethod
+    def _optional_config(config: Any, key: str) -> Any:
+        value = getattr(config, key, None)
+        if value is None and hasattr(config, "get"):
+            value = config.get(key)
+        return value
+
+    def _required_config(self, key: str) -> Any:
+        value = self._optional_config(self.config, key)
+        if value is None:
+            raise RuntimeError(f"CONFIGURATION ERROR: {key} not defined in run.py API_PROVIDERS")
+        return value
+
+    def _setup_session(self):
+        """Setup the shared session with a connection pool sized for concurrency"""
+        super()._setup_session()
+        adapter = requests.adapters.HTTPAdapter(
+            max_retries=0,  # Retries are handled in agenerate()
+            pool_connections=1,
+            pool_maxsize=self.max_concurrency,
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    # ------------------------------------------------------------------
+    # Async API
+    # ------------------------------------------------------------------
+
+    async def agenerate(self, request: GenerationRequest) -> APIResponse:
+        """Generate content, waiting for a provider slot and retrying transient failures"""
+
+        max_retries = self._required_config("max_retries")
+        retry_delay = self._required_config("retry_delay")
+        start_time = time.time()
+        self._record_stat("total_requests")
+
+        response: Optional[APIResponse] = None
+        for attempt in range(max_retries + 1):
+            retry_after: Optional[float] = None
+            try:
+                http_response = await self._post(request)
+                if http_response.status_code in RETRYABLE_STATUS_CODES and attempt < max_retries:
+                    retry_after = self._retry_after(http_response)
+                    error = f"HTTP {http_response.status_code}"
+                else:
+                    response = self._process_response(http_response, start_time)
+                    response.retry_count = attempt
+                    break
+            except Exception as e:
+                # Timeouts, connection errors and malformed responses, as in APIClient.generate()
+                error = f"{type(e).__name__}: {e}"
+                if attempt == max_retries:
+                    response = APIResponse(
+                        success=False,
+                        content="",
+                        error=f"{error} (after {max_retries + 1} attempts)",
+                        response_time=time.time() - start_time,
+                        retry_count=attempt,
+                    )
+                    break
+
+            delay = retry_after if retry_after is not None else self._backoff_delay(retry_delay, attempt)
+            logger.info(f"🔄 [ASYNC API] {error} on attempt {attempt + 1}/{max_retries + 1}, retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+
+        if response is None:
+            response = APIResponse(
+                success=False,
+                content="",
+                error="Maximum retries exceeded",
+                response_time=time.time() - start_time,
+                retry_count=max_retries,
+            )
+
+        if response.success:
+            self._record_stat("successful_requests")
+            if response.token_count:
+                self._record_stat("total_tokens", response.token_count)
+        else:
+            self._record_stat("failed_requests")
+        self._record_stat("total_response_time", response.response_time or 0)
+        return response
+
+    async def agenerate_many(self, batch: Sequence[GenerationRequest]) -> List[APIResponse]:
+        """Generate all requests concurrently (bounded by provider limits); results in input order"""
+        return list(await asyncio.gather(*(self.agenerate(request) for request in batch)))
+
+    # ------------------------------------------------------------------
+    # Sync facade
+    # ------------------------------------------------------------------
+
+    def generate(self, request: GenerationRequest) -> APIResponse:
+        """Synchronous wrapper around agenerate() (APIClient-compatible)"""
+        return self._run_sync(self.agenerate(request))
+
+    def generate_many(self, batch: Sequence[GenerationRequest]) -> List[APIResponse]:
+        """Synchronous wrapper around agenerate_many()"""
+        return self._run_sync(self.agenerate_many(batch))
+
+    def close(self) -> None:
+        """Release worker threads and pooled connections"""
+        self._executor.shutdown(wait=True)
+        self.session.close()
+
+    def __enter__(self) -> "AsyncAPIClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _run_sync(coroutine):
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coroutine)
+        coroutine.close()
+        raise RuntimeError(
+            "AsyncAPIClient sync methods cannot be called from a running event loop - use agenerate()"
+        )
+
+    async def _post(self, request: GenerationRequest) -> requests.Response:
+        payload = self._build_payload(request)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._post_within_limits, payload)
+
+    def _post_within_limits(self, payload: Dict[str, Any]) -> requests.Response:
+        """Send one request once a provider slot (and rate-limit token) is free; runs on a worker thread"""
+        with self.limits.slots:
+            if self.limits.bucket is not None:
+                delay = self.limits.bucket.reserve()
+                if delay > 0:
+                    time.sleep(delay)
+            return self.session.post(
+                f"{self.base_url}/v1/chat/completions",
+                json=payload,
+                timeout=(self.timeout_connect, self.timeout_read),
+            )
+
+    @staticmethod
+    def _backoff_delay(retry_delay: float, attempt: int) -> float:
+        """Exponential backoff with equal jitter: half fixed, half random"""
+        base = retry_delay * (2 ** attempt)
+        return base / 2 + random.uniform(0, base / 2)
+
+    @staticmethod
+    def _retry_after(response: requests.Response) -> Optional[float]:
+        value = response.headers.get("Retry-After")
+        if value is None:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            return None
+
+    def _record_stat(self, key: str, amount: float = 1) -> None:
+        with self._stats_lock:
+            self.stats[key] += amount
@@ -312,12 +312,6 @@ class APIClient:
 
         start_time = time.time()
 
-        # Standard OpenAI-compatible format for all providers
-        messages = []
-        if request.system_prompt:
-            messages.append({"role": "system", "content": request.system_prompt})
-        messages.append({"role": "user", "content": request.prompt})
-
         # Log API request details (dual logging: terminal + file)
         print(f"\n{'─'*80}")
         print(f"🌐 [API REQUEST] Calling {self.model}")
@@ -344,25 +338,7 @@ class APIClient:
         logger.info(f"🔧 Base URL: {self.base_url}")
         logger.info(f"🔧 Model: {self.model}")
 
-        # Prepare payload
-        payload = {
-            "model": self.model,
-            "messages": messages,
-            "max_tokens": request.max_tokens,
-            "temperature": request.temperature,
-            "top_p": request.top_p,
-            "stream": False,
-        }
-
-        # Add provider-specific parameters
-        # NOTE: Only certain providers support frequency_penalty and presence_penalty
-        # ✅ SUPPORTED: OpenAI GPT, DeepSeek
-        # ❌ NOT SUPPORTED: X.AI Grok, Anthropic Claude
-        # These parameters ARE calculated and logged for all providers (research/learning purposes)
-        # but only sent to providers that accept them.
-        if "grok" not in self.model.lower() and "claude" not in self.model.lower():
-            payload["frequency_penalty"] = request.frequency_penalty
-            payload["presence_penalty"] = request.presence_penalty
+        payload = self._build_payload(request)
 
         # Make request with enhanced timeout handling
         try:
@@ -404,6 +380,42 @@ class APIClient:
                 response_time=time.time() - start_time,
             )
 
+        return self._process_response(response, start_time)
+
+    def _build_payload(self, request: GenerationRequest) -> Dict[str, Any]:
+        """Build the chat completions payload for a request"""
+
+        # Standard OpenAI-compatible format for all providers
+        messages = []
+        if request.system_prompt:
+            messages.append({"role": "system", "content": request.system_prompt})
+        messages.append({"role": "user", "content": request.prompt})
+
+        # Prepare payload
+        payload = {
+            "model": self.model,
+            "messages": messages,
+            "max_tokens": request.max_tokens,
+            "temperature": request.temperature,
+            "top_p": request.top_p,
+            "stream": False,
+        }
+
+        # Add provider-specific parameters
+        # NOTE: Only certain providers support frequency_penalty and presence_penalty
+        # ✅ SUPPORTED: OpenAI GPT, DeepSeek
+        # ❌ NOT SUPPORTED: X.AI Grok, Anthropic Claude
+        # These parameters ARE calculated and logged for all providers (research/learning purposes)
+        # but only sent to providers that accept them.
+        if "grok" not in self.model.lower() and "claude" not in self.model.lower():
+            payload["frequency_penalty"] = request.frequency_penalty
+            payload["presence_penalty"] = request.presence_penalty
+
+        return payload
+
+    def _process_response(self, response: requests.Response, start_time: float) -> APIResponse:
+        """Convert a chat completions HTTP response into an APIResponse"""
+
         response_time = time.time() - start_time
 
         # Debug: Log response details
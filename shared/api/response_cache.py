@@ -4,18 +4,76 @@ API Response Cache
 
 Caches API responses to disk to reduce costs and improve performance.
 Implements fail-fast architecture with explicit configuration requirements.
+
+Storage: a single SQLite database (WAL mode) in storage_location, opened
+through the shared per-thread connection pool (shared.utils.sqlite_pool).
+- Indexed primary-key lookup per request hash
+- Running size/entry totals maintained by triggers (no directory scans)
+- TTL + LRU eviction in one DELETE when the size limit is exceeded
+- Optional zlib compression of response bodies (config 'compression': true)
 """
 
 import hashlib
 import json
 import logging
-import os
+import sqlite3
 import time
+import zlib
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+from shared.utils.sqlite_pool import PooledConnection, get_sqlite_pool
+
 logger = logging.getLogger(__name__)
 
+DB_FILENAME = 'responses.sqlite3'
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    cache_key TEXT PRIMARY KEY,
+    cached_at REAL NOT NULL,
+    last_access REAL NOT NULL,
+    size_bytes INTEGER NOT NULL,
+    compressed INTEGER NOT NULL,
+    request_meta TEXT NOT NULL,
+    body BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_responses_last_access ON responses(last_access);
+CREATE INDEX IF NOT EXISTS idx_responses_cached_at ON responses(cached_at);
+
+CREATE TABLE IF NOT EXISTS cache_totals (
+    id INTEGER PRIMARY KEY CHECK (id = 0),
+    total_bytes INTEGER NOT NULL,
+    entry_count INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO cache_totals (id, total_bytes, entry_count) VALUES (0, 0, 0);
+
+CREATE TRIGGER IF NOT EXISTS responses_size_insert AFTER INSERT ON responses BEGIN
+    UPDATE cache_totals SET total_bytes = total_bytes + NEW.size_bytes, entry_count = entry_count + 1 WHERE id = 0;
+END;
+CREATE TRIGGER IF NOT EXISTS responses_size_delete AFTER DELETE ON responses BEGIN
+    UPDATE cache_totals SET total_bytes = total_bytes - OLD.size_bytes, entry_count = entry_count - 1 WHERE id = 0;
+END;
+CREATE TRIGGER IF NOT EXISTS responses_size_update AFTER UPDATE OF size_bytes ON responses BEGIN
+    UPDATE cache_totals SET total_bytes = total_bytes - OLD.size_bytes + NEW.size_bytes WHERE id = 0;
+END;
+"""
+
+# Evicts expired entries plus the least recently used entries beyond the
+# byte budget (newest entries are kept until their running total exceeds it).
+_EVICT_SQL = """
+DELETE FROM responses
+WHERE cached_at < :expired_before
+   OR cache_key IN (
+        SELECT cache_key FROM (
+            SELECT cache_key,
+                   SUM(size_bytes) OVER (ORDER BY last_access DESC, cache_key) AS kept_bytes
+            FROM responses
+        )
+        WHERE kept_bytes > :target_bytes
+   )
+"""
+
 
 class ResponseCache:
     """
@@ -32,10 +90,12 @@ class ResponseCache:
         Args:
             config: Cache configuration dictionary with required keys:
                 - enabled (bool): Whether caching is enabled
-                - storage_location (str): Directory path for cache files
+                - storage_location (str): Directory path for the cache database
                 - ttl_seconds (int): Time-to-live for cached responses
                 - max_size_mb (int): Maximum cache size in megabytes
                 - key_strategy (str): Strategy for generating cache keys
+                Optional keys:
+                - compression (bool): zlib-compress response bodies (default: False)
         
         Raises:
             ValueError: If required configuration is missing
@@ -54,6 +114,7 @@ class ResponseCache:
         self.ttl_seconds = config['ttl_seconds']
         self.max_size_mb = config['max_size_mb']
         self.key_strategy = config['key_strategy']
+        self.compression = config.get('compression', False)
         
         # Validate configuration values
         if not isinstance(self.enabled, bool):
@@ -70,11 +131,19 @@ class ResponseCache:
                 f"cache.key_strategy must be one of: prompt_hash, prompt_hash_with_model, full_request_hash. "
                 f"Got: {self.key_strategy}"
             )
+
+        if not isinstance(self.compression, bool):
+            raise ValueError(f"cache.compression must be boolean, got {type(self.compression)}")
+        
+        self.db_path = self.storage_location / DB_FILENAME
+        self.max_size_bytes = int(self.max_size_mb * 1024 * 1024)
+        self._pool = get_sqlite_pool(self.db_path)
         
-        # Initialize cache directory if enabled
+        # Initialize cache database if enabled
         if self.enabled:
             self.storage_location.mkdir(parents=True, exist_ok=True)
-            logger.info(f"🗄️  [RESPONSE CACHE] Initialized at {self.storage_location}")
+            self._connection().executescript(_SCHEMA)
+            logger.info(f"🗄️  [RESPONSE CACHE] Initialized at {self.db_path}")
             logger.info(f"🗄️  [RESPONSE CACHE] TTL: {self.ttl_seconds}s, Max size: {self.max_size_mb}MB")
         else:
             logger.info("🗄️  [RESPONSE CACHE] Caching disabled by configuration")
@@ -103,32 +172,31 @@ class ResponseCache:
         
         try:
             cache_key = self._generate_cache_key(request_data)
-            cache_file = self.storage_location / f"{cache_key}.json"
+            conn = self._connection()
+            row = conn.execute(
+                "SELECT cached_at, compressed, body FROM responses WHERE cache_key = ?",
+                (cache_key,)
+            ).fetchone()
             
-            if not cache_file.exists():
+            if row is None:
                 self.stats['misses'] += 1
                 return None
             
-            # Load cached response
-            with open(cache_file, 'r') as f:
-                cached_data = json.load(f)
-
-            if not isinstance(cached_data, dict):
-                raise RuntimeError("Cached entry must be a dictionary")
-            if 'cached_at' not in cached_data:
-                raise RuntimeError("Cached entry missing required 'cached_at' field")
-            if 'response' not in cached_data:
-                raise RuntimeError("Cached entry missing required 'response' field")
-            
             # Check if expired
-            cached_time = cached_data['cached_at']
-            age_seconds = time.time() - cached_time
+            cached_time, compressed, body = row
+            now = time.time()
+            age_seconds = now - cached_time
             
             if age_seconds > self.ttl_seconds:
                 logger.debug(f"🗄️  [RESPONSE CACHE] Cache EXPIRED (age: {age_seconds:.1f}s)")
-                cache_file.unlink()  # Remove expired cache
+                with conn:
+                    conn.execute("DELETE FROM responses WHERE cache_key = ?", (cache_key,))  # Remove expired cache
                 self.stats['misses'] += 1
                 return None
+
+            response = json.loads(zlib.decompress(body) if compressed else body)
+            with conn:
+                conn.execute("UPDATE responses SET last_access = ? WHERE cache_key = ?", (now, cache_key))
             
             # Cache hit!
             self.stats['hits'] += 1
@@ -138,7 +206,7 @@ class ResponseCache:
                 f"Hit rate: {hit_rate:.1f}% ({self.stats['hits']}/{self.stats['hits'] + self.stats['misses']})"
             )
             
-            return cached_data['response']
+            return response
             
         except Exception as e:
             self.stats['errors'] += 1
@@ -161,7 +229,6 @@ class ResponseCache:
         
         try:
             cache_key = self._generate_cache_key(request_data)
-            cache_file = self.storage_location / f"{cache_key}.json"
             
             # Prepare cache entry
             required_request_keys = ['model', 'temperature', 'max_tokens', 'prompt']
@@ -171,20 +238,39 @@ class ResponseCache:
                     f"Request data missing required keys for caching: {missing_request_keys}"
                 )
 
-            cache_entry = {
-                'cached_at': time.time(),
-                'request_data': {
-                    'model': request_data['model'],
-                    'temperature': request_data['temperature'],
-                    'max_tokens': request_data['max_tokens'],
-                    'prompt_length': len(str(request_data['prompt']))
-                },
-                'response': response
-            }
+            request_meta = json.dumps({
+                'model': request_data['model'],
+                'temperature': request_data['temperature'],
+                'max_tokens': request_data['max_tokens'],
+                'prompt_length': len(str(request_data['prompt']))
+            })
+            body = json.dumps(response).encode('utf-8')
+            compressed = False
+            if self.compression:
+                packed = zlib.compress(body, 6)
+                if len(packed) < len(body):
+                    body, compressed = packed, True
+            size_bytes = len(body) + len(request_meta)
+            now = time.time()
             
-            # Write to cache
-            with open(cache_file, 'w') as f:
-                json.dump(cache_entry, f, indent=2)
+            # Write to cache (upsert keeps the size triggers exact)
+            conn = self._connection()
+            with conn:
+                conn.execute(
+                    """
+                    INSERT INTO responses
+                        (cache_key, cached_at, last_access, size_bytes, compressed, request_meta, body)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(cache_key) DO UPDATE SET
+                        cached_at = excluded.cached_at,
+                        last_access = excluded.last_access,
+                        size_bytes = excluded.size_bytes,
+                        compressed = excluded.compressed,
+                        request_meta = excluded.request_meta,
+                        body = excluded.body
+                    """,
+                    (cache_key, now, now, size_bytes, int(compressed), request_meta, sqlite3.Binary(body))
+                )
             
             self.stats['writes'] += 1
             logger.debug(f"💾 [RESPONSE CACHE] Cached response: {cache_key[:16]}...")
@@ -236,46 +322,40 @@ class ResponseCache:
         # Generate SHA256 hash
         return hashlib.sha256(key_data.encode()).hexdigest()
     
+    def _connection(self) -> PooledConnection:
+        """Return a handle on this thread's pooled connection to the cache database."""
+        return self._pool.connection()
+
+    def _totals(self) -> tuple:
+        """Return (total_bytes, entry_count) from the running totals."""
+        return self._connection().execute(
+            "SELECT total_bytes, entry_count FROM cache_totals WHERE id = 0"
+        ).fetchone()
+    
     def _enforce_size_limit(self) -> None:
         """
-        Enforce maximum cache size by evicting oldest entries.
+        Enforce maximum cache size by evicting expired and least recently used entries.
         """
         try:
-            # Calculate current cache size
-            total_size_mb = sum(
-                f.stat().st_size for f in self.storage_location.glob('*.json')
-            ) / (1024 * 1024)
-            
-            if total_size_mb <= self.max_size_mb:
+            total_bytes, _ = self._totals()
+            if total_bytes <= self.max_size_bytes:
                 return  # Within limits
             
             logger.info(
-                f"🗑️  [RESPONSE CACHE] Cache size {total_size_mb:.1f}MB exceeds limit {self.max_size_mb}MB, "
+                f"🗑️  [RESPONSE CACHE] Cache size {total_bytes / (1024 * 1024):.1f}MB exceeds limit {self.max_size_mb}MB, "
                 f"evicting oldest entries..."
             )
             
-            # Get all cache files sorted by modification time (oldest first)
-            cache_files = sorted(
-                self.storage_location.glob('*.json'),
-                key=lambda f: f.stat().st_mtime
-            )
-            
-            # Evict oldest files until under limit
-            evicted = 0
-            for cache_file in cache_files:
-                cache_file.unlink()
-                evicted += 1
-                self.stats['evictions'] += 1
-                
-                # Recalculate size
-                total_size_mb = sum(
-                    f.stat().st_size for f in self.storage_location.glob('*.json')
-                ) / (1024 * 1024)
-                
-                if total_size_mb <= self.max_size_mb * 0.8:  # Leave 20% buffer
-                    break
+            conn = self._connection()
+            with conn:
+                evicted = conn.execute(_EVICT_SQL, {
+                    'expired_before': time.time() - self.ttl_seconds,
+                    'target_bytes': int(self.max_size_bytes * 0.8),  # Leave 20% buffer
+                }).rowcount
+            self.stats['evictions'] += evicted
             
-            logger.info(f"🗑️  [RESPONSE CACHE] Evicted {evicted} entries, new size: {total_size_mb:.1f}MB")
+            total_bytes, _ = self._totals()
+            logger.info(f"🗑️  [RESPONSE CACHE] Evicted {evicted} entries, new size: {total_bytes / (1024 * 1024):.1f}MB")
             
         except Exception as e:
             logger.warning(f"⚠️  [RESPONSE CACHE] Error enforcing size limit: {e}")
@@ -291,11 +371,9 @@ class ResponseCache:
             return 0
         
         try:
-            cache_files = list(self.storage_location.glob('*.json'))
-            count = len(cache_files)
-            
-            for cache_file in cache_files:
-                cache_file.unlink()
+            conn = self._connection()
+            with conn:
+                count = conn.execute("DELETE FROM responses").rowcount
             
             logger.info(f"🧹 [RESPONSE CACHE] Cleared {count} cached responses")
             
@@ -313,6 +391,10 @@ class ResponseCache:
         except Exception as e:
             logger.error(f"❌ [RESPONSE CACHE] Error clearing cache: {e}")
             return 0
+
+    def close(self) -> None:
+        """Close the pooled connections to the cache database (all threads)."""
+        self._pool.close_all()
     
     def get_stats(self) -> Dict[str, Any]:
         """
@@ -324,13 +406,11 @@ class ResponseCache:
         total_requests = self.stats['hits'] + self.stats['misses']
         hit_rate = (self.stats['hits'] / total_requests * 100) if total_requests > 0 else 0
         
-        # Calculate current cache size
+        # Current cache size from the running totals
         try:
-            cache_size_mb = sum(
-                f.stat().st_size for f in self.storage_location.glob('*.json')
-            ) / (1024 * 1024)
-            entry_count = len(list(self.storage_location.glob('*.json')))
-        except:
+            total_bytes, entry_count = self._totals() if self.enabled else (0, 0)
+            cache_size_mb = total_bytes / (1024 * 1024)
+        except sqlite3.Error:
             cache_size_mb = 0
             entry_count = 0
         
@@ -0,0 +1,360 @@
+"""
+FrontmatterCorpus - One shared, parallel parse of the exported frontmatter tree.
+
+The corpus parses each frontmatter file once and runs the post-export
+validators (link verification, comprehensive link checks, schema validation,
+pre-generation frontmatter checks) as visitors over the shared result:
+
+- Files are parsed with the LibYAML safe loader (CSafeLoader when available)
+  in a process pool; small batches are parsed in-process
+- Parses are cached by (path, mtime_ns, size), in memory and in a pickle under
+  .cache/frontmatter_corpus/, so validators started as separate processes
+  (deploy checks, run.py --validate) only re-parse files that changed
+- Parse failures become per-document errors instead of exceptions, so each
+  validator keeps reporting them in its own format
+
+Visitors must treat document data as read-only; every visitor sees the same
+objects.
+
+Cache file layout (two consecutive pickles):
+    1. header:  {'version', 'root', 'domains'}
+    2. entries: {path: (mtime_ns, size, data, error)}
+
+Usage:
+    from shared.cache.frontmatter_corpus import FrontmatterVisitor, get_frontmatter_corpus
+
+    corpus = get_frontmatter_corpus(frontmatter_root, domains=['materials', 'settings'])
+    for document in corpus.documents('materials'):
+        print(document.slug, document.error or document.data.get('id'))
+
+    corpus.accept(link_visitor, schema_visitor)   # one scan, one pass per visitor
+
+Environment:
+    Z_BEAM_NO_FRONTMATTER_CACHE=true   Disable the on-disk parse cache
+"""
+
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+import threading
+from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+DEFAULT_CACHE_DIR = PROJECT_ROOT / '.cache' / 'frontmatter_corpus'
+
+# Bump when the header or entry layout changes.
+CORPUS_FORMAT_VERSION = 1
+
+# Below this many files to parse, a process pool costs more than it saves.
+PARALLEL_MIN_FILES = 32
+
+CACHE_ENABLED = os.environ.get("Z_BEAM_NO_FRONTMATTER_CACHE", "").lower() != "true"
+
+# (mtime_ns, size, data, error)
+_Entry = Tuple[int, int, Any, Optional[str]]
+
+
+def _parse_file(path: str) -> Tuple[Any, Optional[str]]:
+    """Parse one frontmatter file; returns (data, error message). Runs in pool workers."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return yaml.load(f, Loader=_SafeLoader), None
+    except Exception as e:
+        return None, str(e)
+
+
+@dataclass(frozen=True)
+class FrontmatterDocument:
+    """One parsed frontmatter file."""
+    path: Path
+    domain: str
+    data: Any
+    error: Optional[str] = None
+
+    @property
+    def slug(self) -> str:
+        return self.path.stem
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class FrontmatterVisitor(ABC):
+    """
+    Base class for validators run by FrontmatterCorpus.accept().
+
+    begin() runs before the first document (build indexes from the corpus
+    there), visit() once per document, finish() after the last one.
+    """
+
+    def begin(self, corpus: 'FrontmatterCorpus') -> None:
+        """Called before the first document; default: nothing to prepare."""
+        return None
+
+    @abstractmethod
+    def visit(self, document: FrontmatterDocument) -> None:
+        pass
+
+    def finish(self, corpus: 'FrontmatterCorpus') -> None:
+        """Called after the last document; default: nothing to report."""
+        return None
+
+
+class FrontmatterCorpus:
+    """
+    Cached parse of every *.yaml file under a frontmatter root.
+
+    With domains, files are read from root/<domain>/*.yaml (the exported
+    layout); without, from root/*.yaml with an empty domain.
+    """
+
+    def __init__(
+        self,
+        root: Union[str, Path],
+        domains: Optional[Sequence[str]] = None,
+        cache_dir: Optional[Path] = None,
+        max_workers: Optional[int] = None,
+        persist: bool = CACHE_ENABLED,
+    ) -> None:
+        """
+        Initialize corpus.
+
+        Args:
+            root: Frontmatter root directory
+            domains: Domain subdirectories to read (None: root itself)
+            cache_dir: Directory for the parse cache (default: .cache/frontmatter_corpus)
+            max_workers: Parse processes (default: CPU count; 1 parses in-process)
+            persist: Load and save the on-disk parse cache
+        """
+        self.root = Path(root)
+        self.domains: Tuple[str, ...] = tuple(domains) if domains else ()
+        self.cache_dir = Path(cache_dir or DEFAULT_CACHE_DIR)
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.persist = persist
+        self.hits = 0
+        self.misses = 0
+        self._entries: Optional[Dict[str, _Entry]] = None
+        self._documents: List[FrontmatterDocument] = []
+        self._by_path: Dict[str, FrontmatterDocument] = {}
+        self._lock = threading.RLock()
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def scan(self) -> List[FrontmatterDocument]:
+        """
+        Stat the tree and (re)parse files whose mtime or size changed.
+
+        Returns:
+            All documents, in domain order then file name order
+        """
+        with self._lock:
+            if self._entries is None:
+                self._entries = self._load_cache()
+
+            files = self._list_files()
+            entries: Dict[str, _Entry] = {}
+            stale: List[Tuple[str, int, int]] = []
+            for path, _domain in files:
+                stat = os.stat(path)
+                cached = self._entries.get(path)
+                if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+                    entries[path] = cached
+                else:
+                    stale.append((path, stat.st_mtime_ns, stat.st_size))
+
+            for (path, mtime_ns, size), (data, error) in zip(stale, self._parse_all([p for p, _, _ in stale]), strict=True):
+                entries[path] = (mtime_ns, size, data, error)
+
+            self.hits += len(files) - len(stale)
+            self.misses += len(stale)
+            changed = bool(stale) or len(entries) != len(self._entries)
+            self._entries = entries
+            if changed:
+                self._save_cache()
+
+            self._documents = [
+                FrontmatterDocument(Path(path), domain, entries[path][2], entries[path][3])
+                for path, domain in files
+            ]
+            self._by_path = {str(document.path): document for document in self._documents}
+            if stale:
+                logger.info(f"Frontmatter corpus {self.root}: parsed {len(stale)}, cached {len(files) - len(stale)}")
+            return list(self._documents)
+
+    def documents(self, domain: Optional[str] = None) -> List[FrontmatterDocument]:
+        """Documents from the last scan (scanning first if there was none)."""
+        with self._lock:
+            if self._entries is None:
+                self.scan()
+            if domain is None:
+                return list(self._documents)
+            return [document for document in self._documents if document.domain == domain]
+
+    def document(self, path: Union[str, Path]) -> FrontmatterDocument:
+        """Document for one file of the corpus, re-scanning if it changed since."""
+        key = str(path)
+        with self._lock:
+            if self._entries is None:
+                self.scan()
+            document = self._by_path.get(key)
+            cached = self._entries.get(key)
+            if document is None or not self._is_current(key, cached):
+                self.scan()
+                document = self._by_path.get(key)
+            if document is None:
+                raise KeyError(f"Not a file of frontmatter corpus {self.root}: {path}")
+            return document
+
+    def accept(self, *visitors: FrontmatterVisitor, domain: Optional[str] = None) -> None:
+        """Scan once, then run each visitor over the documents (of domain, if given)."""
+        self.scan()
+        documents = self.documents(domain)
+        for visitor in visitors:
+            visitor.begin(self)
+            for document in documents:
+                visitor.visit(document)
+            visitor.finish(self)
+
+    def cache_path(self) -> Path:
+        """Cache file for this root and domain set."""
+        key = hashlib.blake2b(
+            f"{self.root.resolve()}|{','.join(self.domains)}".encode('utf-8'),
+            digest_size=8,
+        ).hexdigest()
+        return self.cache_dir / f"corpus_{key}.pkl"
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return cache hit/miss statistics."""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'root': str(self.root),
+                'files': len(self._documents),
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': (self.hits / total * 100) if total > 0 else 0,
+            }
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _list_files(self) -> List[Tuple[str, str]]:
+        """(path, domain) of every YAML file, sorted by name within a domain."""
+        if not self.domains:
+            return [(str(path), '') for path in sorted(self.root.glob('*.yaml'))]
+        files = []
+        for domain in self.domains:
+            files.extend((str(path), domain) for path in sorted((self.root / domain).glob('*.yaml')))
+        return files
+
+    @staticmethod
+    def _is_current(path: str, cached: Optional[_Entry]) -> bool:
+        if cached is None:
+            return False
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return False
+        return cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size
+
+    def _parse_all(self, paths: List[str]) -> List[Tuple[Any, Optional[str]]]:
+        """Parse paths, in a process pool when there are enough of them."""
+        if self.max_workers <= 1 or len(paths) < PARALLEL_MIN_FILES:
+            return [_parse_file(path) for path in paths]
+
+        workers = min(self.max_workers, len(paths))
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                return list(executor.map(_parse_file, paths, chunksize=max(1, len(paths) // (workers * 4))))
+        except (OSError, BrokenProcessPool, NotImplementedError) as e:
+            # Sandboxes without process support still validate, just serially.
+            logger.warning(f"Parallel frontmatter parse unavailable, parsing serially: {e}")
+            return [_parse_file(path) for path in paths]
+
+    def _header(self) -> Dict[str, Any]:
+        return {
+            'version': CORPUS_FORMAT_VERSION,
+            'root': str(self.root.resolve()),
+            'domains': self.domains,
+        }
+
+    def _load_cache(self) -> Dict[str, _Entry]:
+        """Persisted entries, or {} if disabled, missing, unreadable or for another layout."""
+        path = self.cache_path()
+        if not self.persist or not path.exists():
+            return {}
+        try:
+            with open(path, 'rb') as f:
+                if pickle.load(f) != self._header():
+                    return {}
+                return pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError) as e:
+            logger.warning(f"Discarding unreadable frontmatter corpus cache {path.name}: {e}")
+            return {}
+
+    def _save_cache(self) -> None:
+        """Atomically write the current entries."""
+        if not self.persist:
+            return
+        path = self.cache_path()
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(mode='wb', dir=path.parent, delete=False, suffix='.tmp') as f:
+                pickle.dump(self._header(), f, protocol=pickle.HIGHEST_PROTOCOL)
+                pickle.dump(self._entries, f, protocol=pickle.HIGHEST_PROTOCOL)
+                temp_path = Path(f.name)
+            temp_path.replace(path)
+        except OSError as e:
+            # Read-only checkouts still validate; they just re-parse next run.
+            logger.warning(f"Could not write frontmatter corpus cache: {e}")
+
+
+_corpora: Dict[Tuple[str, Tuple[str, ...]], FrontmatterCorpus] = {}
+_corpora_lock = threading.Lock()
+
+
+def get_frontmatter_corpus(
+    root: Union[str, Path],
+    domains: Optional[Iterable[str]] = None,
+) -> FrontmatterCorpus:
+    """
+    Get the corpus shared by all validators of one frontmatter root in this process.
+
+    Args:
+        root: Frontmatter root directory
+        domains: Domain subdirectories to read (None: root itself)
+    """
+    domains = tuple(domains) if domains else ()
+    key = (str(Path(root).resolve()), domains)
+    with _corpora_lock:
+        corpus = _corpora.get(key)
+        if corpus is None:
+            corpus = FrontmatterCorpus(root, domains)
+            _corpora[key] = corpus
+        return corpus
+
+
+def reset_frontmatter_corpora() -> None:
+    """Forget all shared corpora (tests, long-running processes)."""
+    with _corpora_lock:
+        _corpora.clear()
@@ -0,0 +1,255 @@
+"""
+YAMLSnapshotStore - Disk-backed pre-parsed snapshots of large YAML files.
+
+Parsing the large domain files (Materials.yaml, contaminants.yaml,
+DomainAssociations.yaml, ...) dominates CLI cold-start time. This store keeps
+a pickled copy of each parse on disk, keyed by a hash of the source bytes, and
+returns it instead of re-parsing when the source is unchanged.
+
+Snapshot file layout (two consecutive pickles):
+    1. header: {'version', 'source', 'source_hash', 'loader'}
+    2. data:   the parsed YAML document
+
+The header is read first so a stale snapshot is rejected without unpickling
+the (large) payload. Snapshots are written atomically (temp file + rename).
+
+Usage:
+    from shared.cache.yaml_snapshot import get_snapshot_store
+
+    store = get_snapshot_store()
+    data = store.load(Path('data/materials/Materials.yaml'), 'safe', yaml.safe_load)
+
+Environment:
+    Z_BEAM_NO_YAML_SNAPSHOTS=true   Disable snapshots (always parse YAML)
+    Z_BEAM_YAML_SNAPSHOT_DIR=<path> Override snapshot directory
+"""
+
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+DEFAULT_SNAPSHOT_DIR = PROJECT_ROOT / '.cache' / 'yaml_snapshots'
+
+# Bump when the header or payload layout changes.
+SNAPSHOT_FORMAT_VERSION = 1
+
+# Files smaller than this parse fast enough that a snapshot is not worth it.
+MIN_SNAPSHOT_BYTES = 256 * 1024
+
+SNAPSHOTS_ENABLED = os.environ.get("Z_BEAM_NO_YAML_SNAPSHOTS", "").lower() != "true"
+
+
+class YAMLSnapshotStore:
+    """
+    Content-hash keyed store of pickled YAML parses.
+
+    Each (source path, loader name) pair maps to one snapshot file. The loader
+    name keeps parses from different loaders (safe vs. full) apart, since they
+    may produce different Python objects for the same document.
+    """
+
+    def __init__(
+        self,
+        snapshot_dir: Optional[Path] = None,
+        min_bytes: int = MIN_SNAPSHOT_BYTES,
+        enabled: bool = SNAPSHOTS_ENABLED,
+    ) -> None:
+        """
+        Initialize snapshot store.
+
+        Args:
+            snapshot_dir: Directory for snapshot files
+                          (default: $Z_BEAM_YAML_SNAPSHOT_DIR or .cache/yaml_snapshots)
+            min_bytes: Only snapshot sources at least this large
+            enabled: When False, load() always parses the source
+        """
+        env_dir = os.environ.get("Z_BEAM_YAML_SNAPSHOT_DIR")
+        self.snapshot_dir = Path(snapshot_dir or env_dir or DEFAULT_SNAPSHOT_DIR)
+        self.min_bytes = min_bytes
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def load(
+        self,
+        source: Union[str, Path],
+        loader_name: str,
+        parse: Callable[[str], Any],
+    ) -> Any:
+        """
+        Return the parsed document for source, from snapshot when current.
+
+        Args:
+            source: Path to YAML file
+            loader_name: Short loader identifier ('safe', 'fast', ...)
+            parse: Callable that parses YAML text (e.g. yaml.safe_load)
+
+        Returns:
+            Parsed YAML data
+
+        Raises:
+            FileNotFoundError: If source doesn't exist
+            yaml.YAMLError: If source is invalid YAML (on snapshot miss)
+        """
+        source = Path(source)
+        raw = source.read_bytes()
+
+        if not self.enabled or len(raw) < self.min_bytes:
+            return parse(raw.decode('utf-8'))
+
+        source_hash = hashlib.blake2b(raw, digest_size=20).hexdigest()
+        snapshot_path = self.snapshot_path(source, loader_name)
+
+        data = self._read_snapshot(snapshot_path, source_hash, loader_name)
+        if data is not _MISS:
+            with self._lock:
+                self.hits += 1
+            logger.debug(f"Snapshot HIT: {source.name} ({loader_name})")
+            return data
+
+        with self._lock:
+            self.misses += 1
+        logger.debug(f"Snapshot MISS: {source.name} ({loader_name})")
+
+        data = parse(raw.decode('utf-8'))
+        self._write_snapshot(snapshot_path, source, source_hash, loader_name, data)
+        return data
+
+    def snapshot_path(self, source: Union[str, Path], loader_name: str) -> Path:
+        """Return the snapshot file path for a source/loader pair."""
+        source = Path(source).resolve()
+        path_key = hashlib.sha1(str(source).encode('utf-8')).hexdigest()[:12]
+        return self.snapshot_dir / f"{source.stem}.{path_key}.{loader_name}.pickle"
+
+    def invalidate(self, source: Union[str, Path]) -> int:
+        """
+        Delete all snapshots of a source file (any loader).
+
+        Returns:
+            Number of snapshot files removed
+        """
+        source = Path(source).resolve()
+        path_key = hashlib.sha1(str(source).encode('utf-8')).hexdigest()[:12]
+        removed = 0
+        if self.snapshot_dir.exists():
+            for snapshot in self.snapshot_dir.glob(f"{source.stem}.{path_key}.*.pickle"):
+                snapshot.unlink(missing_ok=True)
+                removed += 1
+        return removed
+
+    def clear(self) -> int:
+        """Delete every snapshot file. Returns number removed."""
+        removed = 0
+        if self.snapshot_dir.exists():
+            for snapshot in self.snapshot_dir.glob("*.pickle"):
+                snapshot.unlink(missing_ok=True)
+                removed += 1
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+        logger.info(f"YAML snapshots cleared ({removed} files)")
+        return removed
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return snapshot hit/miss statistics."""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'enabled': self.enabled,
+                'snapshot_dir': str(self.snapshot_dir),
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': (self.hits / total * 100) if total > 0 else 0,
+            }
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _read_snapshot(self, snapshot_path: Path, source_hash: str, loader_name: str) -> Any:
+        """Return snapshot payload, or _MISS if absent, stale or unreadable."""
+        if not snapshot_path.exists():
+            return _MISS
+        try:
+            with open(snapshot_path, 'rb') as f:
+                header = pickle.load(f)
+                if (
+                    header.get('version') != SNAPSHOT_FORMAT_VERSION
+                    or header.get('source_hash') != source_hash
+                    or header.get('loader') != loader_name
+                ):
+                    return _MISS
+                return pickle.load(f)
+        except Exception as e:
+            # A damaged snapshot is only a cache miss; the source is re-parsed
+            # and the snapshot rewritten below.
+            logger.warning(f"Discarding unreadable YAML snapshot {snapshot_path.name}: {e}")
+            return _MISS
+
+    def _write_snapshot(
+        self,
+        snapshot_path: Path,
+        source: Path,
+        source_hash: str,
+        loader_name: str,
+        data: Any,
+    ) -> None:
+        """Atomically write header + payload for a fresh parse."""
+        header = {
+            'version': SNAPSHOT_FORMAT_VERSION,
+            'source': str(source),
+            'source_hash': source_hash,
+            'loader': loader_name,
+        }
+        try:
+            snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                mode='wb',
+                dir=snapshot_path.parent,
+                delete=False,
+                suffix='.tmp'
+            ) as tmp_file:
+                pickle.dump(header, tmp_file, protocol=pickle.HIGHEST_PROTOCOL)
+                pickle.dump(data, tmp_file, protocol=pickle.HIGHEST_PROTOCOL)
+                tmp_path = Path(tmp_file.name)
+            tmp_path.replace(snapshot_path)
+        except OSError as e:
+            # Read-only checkouts still work; they just parse every time.
+            logger.warning(f"Could not write YAML snapshot for {source.name}: {e}")
+
+
+class _Miss:
+    """Sentinel type for snapshot misses (None is a valid YAML document)."""
+
+
+_MISS = _Miss()
+
+
+# Global singleton store instance
+_global_store: Optional[YAMLSnapshotStore] = None
+
+
+def get_snapshot_store() -> YAMLSnapshotStore:
+    """
+    Get global YAML snapshot store instance.
+
+    Returns:
+        Global YAMLSnapshotStore singleton
+    """
+    global _global_store
+    if _global_store is None:
+        _global_store = YAMLSnapshotStore()
+    return _global_store
@@ -5,52 +5,40 @@ Command Handlers Package
 Organized command handlers extracted from run.py for better modularity.
 """
 
-# Audit commands
-from .audit import (
-    handle_material_audit,
-)
+from shared.utils.lazy_exports import lazy_exports
 
-# Deployment commands
-from .deployment import (
-    deploy_to_production,
-)
+# Handler name -> submodule. Handlers are imported on first access, so using
+# one command module (e.g. shared.commands.postprocess) does not load every
+# other handler's dependencies (global evaluation pulls in scipy).
+_HANDLER_MODULES = {
+    # Audit commands
+    'handle_material_audit': '.audit',
+    # Deployment commands
+    'deploy_to_production': '.deployment',
+    # Generation commands
+    'handle_component_summaries_generation': '.generation',
+    'handle_description_generation': '.generation',
+    'handle_faq_generation': '.generation',
+    'handle_micro_generation': '.generation',
+    'handle_settings_description_generation': '.generation',
+    # Global evaluation
+    'run_global_subjective_evaluation': '.global_evaluation',
+    # Research commands
+    'handle_data_completeness_report': '.research',
+    'handle_data_gaps': '.research',
+    'handle_fix_analysis': '.research',
+    'handle_research_missing_properties': '.research',
+    # Sanitization commands
+    'run_frontmatter_sanitization': '.sanitization',
+    # Validation commands
+    'generate_content_validation_report': '.validation',
+    # Data validation commands
+    'run_data_validation': '.validation_data',
+}
 
-# Generation commands
-from .generation import (
-    handle_component_summaries_generation,
-    handle_description_generation,
-    handle_faq_generation,
-    handle_micro_generation,
-    handle_settings_description_generation,
-)
 
-# Global evaluation
-from .global_evaluation import (
-    run_global_subjective_evaluation,
-)
+__getattr__, __dir__ = lazy_exports(__name__, _HANDLER_MODULES)
 
-# Research commands
-from .research import (
-    handle_data_completeness_report,
-    handle_data_gaps,
-    handle_fix_analysis,
-    handle_research_missing_properties,
-)
-
-# Sanitization commands
-from .sanitization import (
-    run_frontmatter_sanitization,
-)
-
-# Validation commands
-from .validation import (
-    generate_content_validation_report,
-)
-
-# Data validation commands
-from .validation_data import (
-    run_data_validation,
-)
 
 __all__ = [
     # Generation
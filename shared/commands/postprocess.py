@@ -29,6 +29,7 @@ import logging
 import re
 import random
 import tempfile
+import threading
 import uuid
 from pathlib import Path
 from typing import Any, Dict, List, Optional
@@ -40,6 +41,9 @@ from generation.core.generator import Generator
 from generation.utils.frontmatter_sync import sync_field_to_frontmatter
 from postprocessing.evaluation.subjective_evaluator import SubjectiveEvaluator
 from shared.api.client_factory import create_api_client
+from shared.commands.postprocess_pipeline import rate_limited, run_ordered
+from shared.commands.source_data_session import SourceDataSession
+from shared.text.validation.similarity_index import CrossItemSimilarityIndex
 from shared.text.validation.structural_variation_checker import StructuralVariationChecker
 
 logger = logging.getLogger(__name__)
@@ -68,21 +72,33 @@ class PostprocessCommand:
     - Saves best regenerated result when available
     """
     
-    def __init__(self, domain: str, field: str):
+    def __init__(
+        self,
+        domain: str,
+        field: str,
+        domain_adapter: Optional[Any] = None,
+        load_generators: bool = True
+    ):
         """
         Initialize postprocessing command.
         
         Args:
             domain: Domain name (materials, contaminants, settings, compounds)
             field: Field name to postprocess (description, micro, faq, etc.)
+            domain_adapter: Source data adapter (default: DomainAdapter(domain));
+                           its data file is the one postprocessed
+            load_generators: Create the API client, evaluators and generators
+                            (False: source data access only, nothing is generated)
         """
         self.domain = domain
         self.requested_field = field
-        # Initialize API client
-        self.api_client = create_api_client()
 
-        from generation.core.adapters.domain_adapter import DomainAdapter
-        self.domain_adapter = DomainAdapter(domain)
+        # An injected adapter also decides which source data file is read
+        data_path = Path(domain_adapter.data_path) if domain_adapter is not None else None
+        if domain_adapter is None:
+            from generation.core.adapters.domain_adapter import DomainAdapter
+            domain_adapter = DomainAdapter(domain)
+        self.domain_adapter = domain_adapter
         
         # Use FieldRouter to determine generator type
         from generation.field_router import FieldRouter
@@ -94,6 +110,20 @@ class PostprocessCommand:
             self.field_aliases.append(self.requested_field)
         
         self.field_type = FieldRouter.get_field_type(domain, self.field)
+        self._similarity_index: Optional[CrossItemSimilarityIndex] = None
+        # Set by postprocess_all() for text fields (one parse + buffered writes per run)
+        self._source_session: Optional[SourceDataSession] = None
+        self._data_path: Optional[Path] = data_path
+        # Concurrent postprocess_all workers share the similarity index
+        self._index_lock = threading.RLock()
+        
+        if not load_generators:
+            self.api_client = None
+            self.structural_variation_checker = None
+            return
+        
+        # Initialize API client
+        self.api_client = create_api_client()
         
         if self.field_type == 'text':
             # Text field - use full quality pipeline
@@ -158,6 +188,13 @@ class PostprocessCommand:
 
     def _collect_same_field_peer_contents(self, item_id: str) -> List[str]:
         """Collect non-empty same-field values for all peer items in the domain."""
+        normalized_item = str(item_id).lower()
+        if self._source_session is not None:
+            return [
+                content for key, content in self._source_session.contents().items()
+                if key.lower() != normalized_item
+            ]
+
         data_path = self._get_data_path()
         if not data_path.exists():
             raise FileNotFoundError(f"Source data file not found: {data_path}")
@@ -172,7 +209,6 @@ class PostprocessCommand:
             )
 
         peers: List[str] = []
-        normalized_item = str(item_id).lower()
         for key, item_data in items.items():
             if str(key).lower() == normalized_item:
                 continue
@@ -181,6 +217,83 @@ class PostprocessCommand:
                 peers.append(content)
         return peers
     
+    def _get_similarity_index(self) -> CrossItemSimilarityIndex:
+        """
+        Get the persistent cross-item similarity index for this domain/field.
+
+        The source YAML is only re-parsed when it changed since the index was
+        last synced; then only items whose field text changed are re-indexed.
+        Inside a source data session the session view (file + buffered writes)
+        is indexed instead, and the index is saved when the session flushes.
+        """
+        if self.structural_variation_checker is None:
+            raise RuntimeError(f"Cross-item similarity index requires a text field, got '{self.field}'")
+
+        with self._index_lock:
+            return self._sync_similarity_index()
+
+    def _sync_similarity_index(self) -> CrossItemSimilarityIndex:
+        """Load the similarity index if needed and bring it up to date (caller holds _index_lock)."""
+        if self._similarity_index is None:
+            self._similarity_index = CrossItemSimilarityIndex.load(
+                self.domain, self.field, self.structural_variation_checker.similarity_features
+            )
+
+        data_path = self._get_data_path()
+        if not data_path.exists():
+            raise FileNotFoundError(f"Source data file not found: {data_path}")
+
+        if self._source_session is not None:
+            stale = self._similarity_index.is_stale(data_path)
+            self._similarity_index.sync(self._source_session.contents(), data_path if stale else None)
+            if stale:
+                self._similarity_index.save()
+            return self._similarity_index
+
+        if self._similarity_index.is_stale(data_path):
+            with open(data_path, 'r', encoding='utf-8') as handle:
+                all_data = yaml.safe_load(handle) or {}
+
+            items = self.domain_adapter.get_items_root(all_data)
+            if not isinstance(items, dict):
+                raise ValueError(
+                    f"Expected dict at root key in {data_path}, got {type(items).__name__}"
+                )
+
+            contents = {}
+            for key, item_data in items.items():
+                content = self._get_field_content(item_data or {})
+                if content:
+                    contents[str(key)] = content
+            self._similarity_index.sync(contents, data_path)
+            self._similarity_index.save()
+
+        return self._similarity_index
+
+    def _check_cross_item_variation(
+        self,
+        text: str,
+        similarity_index: Optional[CrossItemSimilarityIndex],
+        item_id: str,
+    ) -> Dict[str, Any]:
+        """Cross-item variation check, serialized with index updates from other workers."""
+        with self._index_lock:
+            return self.structural_variation_checker.check_cross_item_variation(
+                text, similarity_index=similarity_index, exclude_item=item_id
+            )
+
+    def _update_similarity_index(self, item_key: str, content: str, data_path: Path) -> None:
+        """Re-index one item after writing its field (no full re-sync needed)."""
+        if self._similarity_index is None:
+            return
+        normalized = self._get_field_content({self.field: content})
+        if normalized:
+            self._similarity_index.upsert(str(item_key), normalized)
+        else:
+            self._similarity_index.remove(str(item_key))
+        self._similarity_index.mark_synced(data_path)
+        self._similarity_index.save()
+
     def _load_source_data(self, item_id: str) -> Dict[str, Any]:
         """
         Load item data from SOURCE DATA file (data/*.yaml) - NOT frontmatter.
@@ -197,6 +310,12 @@ class PostprocessCommand:
             FileNotFoundError: If data file or item not found
         """
         data_path = self._get_data_path()
+
+        if self._source_session is not None:
+            key = self._source_session.resolve_key(item_id)
+            if key is None:
+                raise FileNotFoundError(f"Item '{item_id}' not found in {data_path}")
+            return self._source_session.get_item(key)
         
         if not data_path.exists():
             raise FileNotFoundError(f"Source data file not found: {data_path}")
@@ -225,12 +344,23 @@ class PostprocessCommand:
         
         🚨 MANDATORY: Only writes to data/*.yaml files (FRONTMATTER_SOURCE_OF_TRUTH_POLICY)
         User must run --export after postprocessing to update frontmatter.
+
+        Inside a source data session the write is buffered (journaled) and
+        persisted, with its frontmatter sync, at the next batch checkpoint.
         
         Args:
             item_id: Item identifier (slug/key in source data)
             content: Content to save
         """
         data_path = self._get_data_path()
+
+        if self._source_session is not None:
+            target_key = self._source_session.resolve_key(item_id)
+            if target_key is None:
+                raise FileNotFoundError(f"Item '{item_id}' not found in {data_path}")
+            self._source_session.save_field(target_key, content)
+            logger.info(f"📥 {self.field} buffered for {target_key}.{self.field}")
+            return
         
         if not data_path.exists():
             raise FileNotFoundError(f"Source data file not found: {data_path}")
@@ -271,6 +401,7 @@ class PostprocessCommand:
         
         Path(temp_path).replace(data_path)
         logger.info(f"✅ {self.field} written to {data_path} → {target_key}.{self.field}")
+        self._update_similarity_index(target_key, content, data_path)
 
         # Dual-write: sync updated field to frontmatter immediately
         sync_field_to_frontmatter(
@@ -295,11 +426,59 @@ class PostprocessCommand:
     
     def _get_data_path(self) -> Path:
         """Get path to domain source data YAML file (data/*.yaml)"""
-        config = self._load_domain_config()
-        data_path = config.get('data_path')
-        if not isinstance(data_path, str) or not data_path:
-            raise KeyError(f"Domain config missing required key: data_path")
-        return Path(data_path)
+        if self._data_path is None:
+            config = self._load_domain_config()
+            data_path = config.get('data_path')
+            if not isinstance(data_path, str) or not data_path:
+                raise KeyError(f"Domain config missing required key: data_path")
+            self._data_path = Path(data_path)
+        return self._data_path
+
+    def _begin_source_session(self) -> bool:
+        """
+        Open the source data session for a batch run.
+
+        Reuses a write session the caller already opened for this domain.
+
+        Returns:
+            True if this call started the domain write session (and must end it)
+        """
+        owns_write_session = self.domain_adapter.get_active_session() is None
+        if owns_write_session:
+            self.domain_adapter.begin_session()
+        try:
+            self._source_session = SourceDataSession(
+                self.domain_adapter,
+                self.field,
+                lambda item_data: self._get_field_content(item_data or {}),
+            )
+        except Exception:
+            if owns_write_session:
+                self.domain_adapter.end_session()
+            raise
+        return owns_write_session
+
+    def _flush_source_session(self) -> int:
+        """Persist buffered writes (one source write) and save the similarity index."""
+        if self._source_session is None:
+            return 0
+        flushed = self._source_session.flush()
+        if flushed and self._similarity_index is not None:
+            with self._index_lock:
+                self._similarity_index.sync(self._source_session.contents(), self._get_data_path())
+                self._similarity_index.save()
+        if flushed:
+            print(f"💾 Flushed {len(flushed)} item(s) to {self._get_data_path()}")
+        return len(flushed)
+
+    def _end_source_session(self, owns_write_session: bool) -> None:
+        """Flush remaining writes and close the source data session."""
+        try:
+            self._flush_source_session()
+        finally:
+            self._source_session = None
+            if owns_write_session:
+                self.domain_adapter.end_session()
 
     
     def _get_field_content(self, item_data: Dict[str, Any]) -> Optional[str]:
@@ -541,8 +720,11 @@ class PostprocessCommand:
         # Existing content - evaluate using pipeline's QualityAnalyzer
         print(f"📄 Current content: {len(existing_content)} chars")
 
-        peer_contents = self._collect_same_field_peer_contents(item_id)
-        print(f"📚 Same-field peers available: {len(peer_contents)}")
+        similarity_index = self._get_similarity_index() if self.structural_variation_checker else None
+        if similarity_index is not None:
+            print(f"📚 Same-field peers available: {similarity_index.peer_count(exclude=item_id)}")
+        else:
+            print(f"📚 Same-field peers available: {len(self._collect_same_field_peer_contents(item_id))}")
         
         # Use same quality analyzer as generation pipeline
         from shared.voice.quality_analyzer import QualityAnalyzer
@@ -588,7 +770,7 @@ class PostprocessCommand:
         ) / 3
         old_readability = self._check_readability(existing_content)
         old_cross_item_variation = (
-            self.structural_variation_checker.check_cross_item_variation(existing_content, peer_contents)
+            self._check_cross_item_variation(existing_content, similarity_index, item_id)
             if self.structural_variation_checker else {
                 'status': 'pass',
                 'violations': [],
@@ -774,7 +956,7 @@ class PostprocessCommand:
                 attempt_readability_pass = attempt_readability.get('status') == 'pass'
                 attempt_readability_violations = attempt_readability.get('violations', [])
                 attempt_cross_item_variation = (
-                    self.structural_variation_checker.check_cross_item_variation(new_content, peer_contents)
+                    self._check_cross_item_variation(new_content, similarity_index, item_id)
                     if self.structural_variation_checker else {
                         'status': 'pass',
                         'violations': [],
@@ -1012,17 +1194,93 @@ class PostprocessCommand:
             'new_cross_item_variation': best_cross_item_variation,
         }
     
-    def postprocess_all(self, batch_size: int = 10, dry_run: bool = False) -> List[Dict[str, Any]]:
+    def postprocess_all(
+        self,
+        batch_size: int = 10,
+        dry_run: bool = False,
+        concurrency: int = 1,
+    ) -> List[Dict[str, Any]]:
         """
         Postprocess all items in domain with this field.
+
+        Text fields run against one source data session: the source YAML is
+        parsed once, and writes are buffered and persisted at each checkpoint
+        and at the end of the run.
+
+        With concurrency > 1 (text fields only) up to that many items are
+        postprocessed at once, so their detection, regeneration and evaluation
+        requests overlap. Every API request waits for its provider's shared
+        rate limit, source writes are serialized through the write session,
+        and results keep the item order.
         
         Args:
             batch_size: Number of items to process before checkpoint
             dry_run: If True, compare but don't save
+            concurrency: Items postprocessed in parallel
             
         Returns:
             List of result dictionaries
         """
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be >= 1, got {batch_size}")
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be >= 1, got {concurrency}")
+
+        if self.field_type != 'text':
+            if concurrency > 1:
+                raise ValueError(
+                    f"Concurrent postprocessing requires a text field; '{self.field}' is a "
+                    f"{self.field_type} field (its generator writes the source file directly)"
+                )
+            return self._postprocess_items(batch_size, dry_run)
+
+        owns_write_session = self._begin_source_session()
+        try:
+            if concurrency > 1:
+                self._apply_provider_rate_limits()
+            return self._postprocess_items(batch_size, dry_run, concurrency)
+        finally:
+            self._end_source_session(owns_write_session)
+
+    def _apply_provider_rate_limits(self) -> None:
+        """Route this command's API clients through their providers' shared rate limiters."""
+        limited_client = rate_limited(self.api_client)
+        self.api_client = limited_client
+        self.evaluator.api_client = limited_client
+        self.generator.api_client = limited_client
+        self.generator.generator.api_client = limited_client
+        if self.generator.grok_humanness_evaluator is None:
+            # Created up front: the generator would otherwise build one lazily
+            # (unlimited, and racily) on each worker's first evaluation
+            from learning.grok_humanness_runtime import GrokHumannessRuntimeEvaluator
+            self.generator.grok_humanness_evaluator = GrokHumannessRuntimeEvaluator(
+                api_client=rate_limited(create_api_client('grok'))
+            )
+        else:
+            evaluator = self.generator.grok_humanness_evaluator
+            evaluator.api_client = rate_limited(evaluator.api_client)
+
+    def _postprocess_item_safely(self, item_id: str, dry_run: bool) -> Dict[str, Any]:
+        """postprocess_item(), reporting unexpected errors as an ERROR result."""
+        try:
+            return self.postprocess_item(item_id, dry_run=dry_run)
+        except Exception as e:
+            print(f"❌ Error processing {item_id}: {e}")
+            return {
+                'item': item_id,
+                'field': self.field,
+                'action': 'ERROR',
+                'improved': False,
+                'error': str(e)
+            }
+
+    def _postprocess_items(
+        self,
+        batch_size: int,
+        dry_run: bool,
+        concurrency: int = 1,
+    ) -> List[Dict[str, Any]]:
+        """Run postprocess_item over every item, with checkpoints every batch_size completions."""
         # Get all items in domain
         items = self._list_items_with_field()
         
@@ -1033,6 +1291,8 @@ class PostprocessCommand:
         print(f"Field: {self.field}")
         print(f"Total items: {len(items)}")
         print(f"Batch size: {batch_size}")
+        if concurrency > 1:
+            print(f"Workers: {concurrency}")
         print(f"Dry run: {dry_run}")
         print(f"{'='*80}\n")
         
@@ -1042,38 +1302,38 @@ class PostprocessCommand:
             print(f"   Check data_root_key in domains/{self.domain}/config.yaml")
             return []
         
-        results = []
         improved_count = 0
         failed_count = 0
-        
-        for i, item in enumerate(items, 1):
-            try:
-                result = self.postprocess_item(item, dry_run=dry_run)
-                results.append(result)
-                
-                if result.get('improved'):
-                    improved_count += 1
-                elif result.get('action') in ['POSTPROCESS_FAILED', 'GENERATION_FAILED']:
-                    failed_count += 1
-                
-                if i % batch_size == 0:
-                    print(f"\n{'='*80}")
-                    print(f"📊 CHECKPOINT: {i}/{len(items)} items processed")
-                    print(f"   Improved: {improved_count}")
-                    print(f"   Failed: {failed_count}")
-                    print(f"   Kept original: {i - improved_count - failed_count}")
-                    print(f"{'='*80}\n")
-            
-            except Exception as e:
-                print(f"❌ Error processing {item}: {e}")
-                results.append({
-                    'item': item,
-                    'field': self.field,
-                    'action': 'ERROR',
-                    'improved': False,
-                    'error': str(e)
-                })
+
+        def record(completed: int, result: Dict[str, Any]) -> None:
+            nonlocal improved_count, failed_count
+            if result.get('improved'):
+                improved_count += 1
+            elif result.get('action') in ['POSTPROCESS_FAILED', 'GENERATION_FAILED', 'ERROR']:
                 failed_count += 1
+
+            if completed % batch_size == 0:
+                self._flush_source_session()
+                print(f"\n{'='*80}")
+                print(f"📊 CHECKPOINT: {completed}/{len(items)} items processed")
+                print(f"   Improved: {improved_count}")
+                print(f"   Failed: {failed_count}")
+                print(f"   Kept original: {completed - improved_count - failed_count}")
+                print(f"{'='*80}\n")
+
+        if concurrency == 1:
+            results = []
+            for i, item in enumerate(items, 1):
+                result = self._postprocess_item_safely(item, dry_run)
+                results.append(result)
+                record(i, result)
+        else:
+            results = run_ordered(
+                items,
+                lambda item: self._postprocess_item_safely(item, dry_run),
+                max_workers=concurrency,
+                on_complete=lambda completed, _index, result: record(completed, result),
+            )
         
         # Final summary (guarded against zero division)
         print(f"\n{'='*80}")
@@ -1096,6 +1356,12 @@ class PostprocessCommand:
         Returns item IDs/keys as they exist in source YAML files
         """
         data_path = self._get_data_path()
+
+        if self._source_session is not None:
+            item_keys = self._source_session.item_keys()
+            if not item_keys:
+                raise ValueError(f"No items found in {data_path}")
+            return sorted(item_keys)
         
         if not data_path.exists():
             raise FileNotFoundError(f"Source data file not found: {data_path}")
@@ -0,0 +1,155 @@
+"""
+Postprocess Pipeline - Concurrent item scheduling for PostprocessCommand.
+
+A field-wide postprocess pass is dominated by network latency: every item
+runs quality detection, several LLM regenerations and Grok humanness
+evaluations. Items are independent, so their stages can overlap across items:
+
+- run_ordered(): bounded worker pool over items; results are returned in
+  input order no matter which item finishes first, and a completion callback
+  runs on the calling thread (checkpoints, progress counts)
+- RateLimitedClient: API client proxy that starts every request through the
+  provider's shared RequestRateLimiter, so N workers together stay within
+  the provider's configured requests_per_minute (API_PROVIDERS rate_limit)
+
+Source writes are not scheduled here: workers buffer them in the domain's
+write session, which serializes them (see DomainWriteSession.lock).
+
+Usage:
+    from shared.commands.postprocess_pipeline import rate_limited, run_ordered
+
+    client = rate_limited(create_api_client('grok'))
+    results = run_ordered(item_ids, process_item, max_workers=4,
+                          on_complete=lambda done, index, result: print(done))
+"""
+
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, List, Optional, Sequence, TypeVar
+
+from generation.backfill.engine import RequestRateLimiter
+from shared.api.client_factory import get_api_providers
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+_provider_limiters: Dict[str, RequestRateLimiter] = {}
+_provider_limiters_lock = threading.Lock()
+
+
+def _provider_requests_per_minute(base_url: str) -> Optional[float]:
+    """requests_per_minute of the configured provider serving base_url (None: unlimited)."""
+    for provider_config in get_api_providers().values():
+        if provider_config.get('base_url') == base_url:
+            rate_limit = provider_config.get('rate_limit') or {}
+            return rate_limit.get('requests_per_minute')
+    return None
+
+
+def get_provider_rate_limiter(base_url: str) -> RequestRateLimiter:
+    """
+    Get the request rate limiter shared by all clients of a provider endpoint.
+
+    The limit comes from the provider's API_PROVIDERS rate_limit config;
+    endpoints without a configured provider are not limited.
+    """
+    with _provider_limiters_lock:
+        limiter = _provider_limiters.get(base_url)
+        if limiter is None:
+            requests_per_minute = _provider_requests_per_minute(base_url)
+            limiter = RequestRateLimiter(requests_per_minute)
+            _provider_limiters[base_url] = limiter
+            logger.debug(f"Rate limiter for {base_url}: {requests_per_minute or 'unlimited'}/min")
+        return limiter
+
+
+def reset_provider_rate_limiters() -> None:
+    """Forget all shared provider rate limiters (tests, reconfiguration)."""
+    with _provider_limiters_lock:
+        _provider_limiters.clear()
+
+
+class RateLimitedClient:
+    """
+    API client proxy that waits for the provider rate limiter before each request.
+
+    Request methods (generate, generate_simple, detect_ai_content, check_text)
+    acquire one slot; every other attribute is the wrapped client's.
+    """
+
+    def __init__(self, client: Any, limiter: RequestRateLimiter) -> None:
+        self.client = client
+        self.limiter = limiter
+
+    def generate(self, request: Any) -> Any:
+        self.limiter.acquire()
+        return self.client.generate(request)
+
+    def generate_simple(self, *args: Any, **kwargs: Any) -> Any:
+        self.limiter.acquire()
+        return self.client.generate_simple(*args, **kwargs)
+
+    def detect_ai_content(self, text: str) -> Dict[str, Any]:
+        self.limiter.acquire()
+        return self.client.detect_ai_content(text)
+
+    def check_text(self, text: str) -> Dict[str, Any]:
+        self.limiter.acquire()
+        return self.client.check_text(text)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.client, name)
+
+
+def rate_limited(client: Any) -> Any:
+    """Wrap client with its provider's shared rate limiter (idempotent)."""
+    if isinstance(client, RateLimitedClient):
+        return client
+    return RateLimitedClient(client, get_provider_rate_limiter(client.base_url))
+
+
+def run_ordered(
+    items: Sequence[T],
+    worker: Callable[[T], R],
+    max_workers: int,
+    on_complete: Optional[Callable[[int, int, R], None]] = None,
+) -> List[R]:
+    """
+    Run worker over items on a bounded thread pool.
+
+    Args:
+        items: Work items
+        worker: Called once per item on a worker thread
+        max_workers: Maximum items in flight
+        on_complete: Called on the calling thread as each item finishes,
+                     with (completed count, item index, result)
+
+    Returns:
+        Worker results in the order of items
+
+    Raises:
+        The first worker exception; queued items are not started
+    """
+    if max_workers < 1:
+        raise ValueError(f"max_workers must be >= 1, got {max_workers}")
+
+    results: List[Any] = [None] * len(items)
+    if not items:
+        return results
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        futures = {executor.submit(worker, item): index for index, item in enumerate(items)}
+        try:
+            for completed, future in enumerate(as_completed(futures), start=1):
+                index = futures[future]
+                results[index] = future.result()
+                if on_complete is not None:
+                    on_complete(completed, index, results[index])
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+    return results
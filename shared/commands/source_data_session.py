@@ -0,0 +1,140 @@
+"""
+Source Data Session - One in-memory view of a domain's source YAML per batch run.
+
+Used by PostprocessCommand.postprocess_all for item lookups, peer
+collection and saves across a whole batch. Inside a session:
+
+- the file is parsed once (through DomainAdapter.load_all_data)
+- items are resolved through a name → key index built once
+- same-field peer contents are precomputed and updated as items change
+- writes are buffered in the domain's DomainAdapter write session (journaled,
+  shared with the generator's own writes) and flushed at batch checkpoints
+
+Usage:
+    from shared.commands.source_data_session import SourceDataSession
+
+    session = SourceDataSession(adapter, 'pageDescription', get_content)
+    key = session.resolve_key('Aluminum')
+    session.save_field(key, 'New text')
+    flushed_items = session.flush()
+"""
+
+import copy
+import logging
+from typing import Any, Callable, Dict, List, Optional
+
+from generation.core.adapters.domain_adapter import DomainAdapter
+
+logger = logging.getLogger(__name__)
+
+
+class SourceDataSession:
+    """
+    Domain source data parsed once, with buffered field writes.
+
+    Reads prefer items buffered in the active write session, so writes made by
+    other DomainAdapter instances for the same domain (the generator's) are
+    visible immediately. Mutations hold the write session lock, so concurrent
+    postprocess workers can share one session.
+    """
+
+    def __init__(
+        self,
+        adapter: DomainAdapter,
+        field: str,
+        get_content: Callable[[Dict[str, Any]], Optional[str]],
+    ) -> None:
+        """
+        Initialize session view.
+
+        Args:
+            adapter: Domain adapter whose write session buffers the writes
+            field: Source field written by save_field()
+            get_content: Extracts the normalized field text from item data
+                         (None when empty)
+
+        Raises:
+            RuntimeError: If no write session is active for the adapter's domain
+        """
+        self.write_session = adapter.get_active_session()
+        if self.write_session is None:
+            raise RuntimeError(
+                f"SourceDataSession requires an active write session for domain '{adapter.domain}'"
+            )
+        self.adapter = adapter
+        self.field = field
+        self.get_content = get_content
+
+        # Parse fresh at session start; the adapter keeps this parse cached
+        adapter.invalidate_cache()
+        self._items = adapter.get_items_root(adapter.load_all_data())
+        self._keys_by_name: Dict[str, str] = {}
+        for key, item_data in self._items.items():
+            name = item_data.get('name') if isinstance(item_data, dict) else None
+            if isinstance(name, str):
+                # First occurrence wins, like the linear scan it replaces
+                self._keys_by_name.setdefault(name.lower(), key)
+
+        self.peer_contents: Dict[str, str] = {}
+        for key, item_data in self._items.items():
+            self._update_peer(key, item_data)
+        self._refresh_pending()
+
+    def item_keys(self) -> List[str]:
+        """Keys of all items in the source file."""
+        return list(self._items)
+
+    def resolve_key(self, item_id: str) -> Optional[str]:
+        """Source key for item_id: exact key first, then case-insensitive name."""
+        if item_id in self._items or item_id in self.write_session.pending_items:
+            return item_id
+        return self._keys_by_name.get(item_id.lower())
+
+    def get_item(self, key: str) -> Dict[str, Any]:
+        """Current item data (buffered writes included)."""
+        if key in self.write_session.pending_items:
+            return self.write_session.pending_items[key]
+        return self._items[key]
+
+    def contents(self) -> Dict[str, str]:
+        """Non-empty field text per item key, including buffered writes."""
+        with self.write_session.lock:
+            self._refresh_pending()
+            return dict(self.peer_contents)
+
+    def save_field(self, key: str, content: str) -> None:
+        """Buffer content as the item's field value (journaled; written on flush)."""
+        with self.write_session.lock:
+            item_data = copy.deepcopy(self.get_item(key))
+            item_data[self.field] = content
+            self.write_session.record(key, self.field, self.field, content, item_data)
+            self._items[key] = item_data
+            self._update_peer(key, item_data)
+
+    def flush(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Write all buffered items in one source write and sync frontmatter.
+
+        Returns:
+            The flushed items ({key: item data}); empty if nothing was pending
+        """
+        with self.write_session.lock:
+            pending = dict(self.write_session.pending_items)
+            if not pending:
+                return {}
+            self.adapter.flush_session()
+            self._items.update(pending)
+            for key, item_data in pending.items():
+                self._update_peer(key, item_data)
+            return pending
+
+    def _refresh_pending(self) -> None:
+        for key, item_data in self.write_session.pending_items.items():
+            self._update_peer(key, item_data)
+
+    def _update_peer(self, key: str, item_data: Any) -> None:
+        content = self.get_content(item_data) if isinstance(item_data, dict) else None
+        if content:
+            self.peer_contents[str(key)] = content
+        else:
+            self.peer_contents.pop(str(key), None)
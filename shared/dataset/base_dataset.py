@@ -54,16 +54,17 @@ class BaseDataset(ABC):
     }
     STRUCTURAL_MARKERS: Set[str] = {'_section', '_meta', '_config'}
     
-    def __init__(self, source_yaml_path: Optional[Path] = None):
+    def __init__(self, source_yaml_path: Optional[Path] = None, data: Optional[Dict[str, Any]] = None):
         """
         Initialize with optional source YAML file path.
         
         Args:
             source_yaml_path: Path to source YAML file (optional)
+            data: Already-loaded source data (skips _load_yaml())
         """
         self.source_path = source_yaml_path
-        # Always load YAML data (subclasses implement _load_yaml())
-        self.data = self._load_yaml()
+        # Load YAML data unless the caller already has it (subclasses implement _load_yaml())
+        self.data = data if data is not None else self._load_yaml()
         
     @abstractmethod
     def _load_yaml(self) -> Dict[str, Any]:
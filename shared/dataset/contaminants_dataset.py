@@ -56,12 +56,13 @@ class ContaminantsDataset(BaseDataset):
         txt_content = dataset.to_txt('rust', enriched_data)
     """
     
-    def __init__(self, source_yaml_path: Path = None):
+    def __init__(self, source_yaml_path: Path = None, data: Dict[str, Any] = None):
         """
         Initialize contaminants dataset.
         
         Args:
             source_yaml_path: Optional path to Contaminants.yaml
+            data: Already-loaded contaminants data (skips loading Contaminants.yaml)
         """
         # Initialize loaders BEFORE calling super().__init__
         self.contaminants_loader = ContaminantsDataLoader()
@@ -71,8 +72,8 @@ class ContaminantsDataset(BaseDataset):
         compounds_data = self.compounds_loader.load_compounds()
         self.compounds = compounds_data.get('compounds', {})
         
-        # Call parent __init__ which will call _load_yaml()
-        super().__init__(source_yaml_path)
+        # Call parent __init__ which will call _load_yaml() unless data is given
+        super().__init__(source_yaml_path, data=data)
     
     def _load_yaml(self) -> Dict[str, Any]:
         """
@@ -22,6 +22,7 @@ sys.path.insert(0, str(project_root))
 
 from shared.dataset.base_dataset import BaseDataset
 from shared.data.loader_factory import MaterialsDataLoader
+from domains.materials.loaders.data_loader_v2 import MaterialsDataLoader as MaterialsDomainLoader
 from shared.exceptions import DataError
 import logging
 
@@ -56,17 +57,42 @@ class MaterialsDataset(BaseDataset):
         txt_content = dataset.to_txt('aluminum', material_data)
     """
     
-    def __init__(self, source_yaml_path: Path = None):
+    def __init__(self, source_yaml_path: Path = None, data: Dict[str, Any] = None):
         """
         Initialize materials dataset.
         
         Args:
             source_yaml_path: Optional path to Materials.yaml
+            data: Already-loaded materials data ({'materials': {...}}) with
+                  machine_settings merged; see from_domain_data()
         """
         # Initialize loader BEFORE calling super().__init__
         self.loader = MaterialsDataLoader()
-        # Call parent __init__ which will call _load_yaml()
-        super().__init__(source_yaml_path)
+        # Call parent __init__ which will call _load_yaml() unless data is given
+        super().__init__(source_yaml_path, data=data)
+
+    @classmethod
+    def from_domain_data(
+        cls,
+        materials_data: Dict[str, Any],
+        settings_data: Dict[str, Any] = None
+    ) -> 'MaterialsDataset':
+        """
+        Build a dataset from already-loaded Materials.yaml (and Settings.yaml) data.
+
+        Merges each material's machineSettings from Settings.yaml as
+        machine_settings (ADR 005) with the loader's merge_machine_settings(),
+        without mutating the inputs.
+
+        Args:
+            materials_data: Parsed Materials.yaml ({'materials': {...}, ...})
+            settings_data: Parsed Settings.yaml ({'settings': {...}}), optional
+
+        Returns:
+            MaterialsDataset over the merged data
+        """
+        merged = MaterialsDomainLoader.merge_machine_settings(materials_data, settings_data or {})
+        return cls(data=merged)
     
     def _load_yaml(self) -> Dict[str, Any]:
         """
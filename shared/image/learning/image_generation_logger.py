@@ -11,6 +11,12 @@ Captures:
 - Success/failure patterns by material category
 - Feedback effectiveness (A/B testing)
 
+Feedback search uses an FTS5 index (feedback_fts) over
+generation_attempts.feedback_text, kept in sync by triggers and ranked with
+bm25. SQLite builds without FTS5 fall back to LIKE scans. The feedback
+indexes are created by the first feedback query, not when the logger opens a
+database, so opening (e.g. for learned defaults) leaves the file unchanged.
+
 Database: SQLite (lightweight, no infrastructure)
 Location: domains/materials/image/learning/generation_history.db
 
@@ -20,13 +26,20 @@ Date: November 25, 2025
 
 import json
 import logging
+import re
 import sqlite3
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
 
+from shared.utils.sqlite_pool import get_sqlite_pool, pooled_connect
+
 logger = logging.getLogger(__name__)
 
+# Full-text index over generation_attempts.feedback_text (external content:
+# the index stores tokens only, rows are read from generation_attempts)
+FEEDBACK_FTS_TABLE = "feedback_fts"
+
 
 class ImageGenerationLogger:
     """
@@ -68,12 +81,29 @@ class ImageGenerationLogger:
         
         self.db_path = db_path
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.fts_enabled: Optional[bool] = None  # None: feedback indexes not checked yet
         
         # Initialize database schema
         self._init_database()
         
         logger.info(f"✅ Image generation logger initialized: {self.db_path}")
     
+    def transaction(self):
+        """
+        Group several learning writes into one transaction (one commit).
+        
+        Usage:
+            with logger.transaction():
+                logger.log_attempt(...)
+                logger.update_pattern_effectiveness(...)
+                logger.update_learned_defaults_from_success(...)
+        
+        log_attempt() and the update_* methods write through the shared
+        connection pool (see shared.utils.sqlite_pool), so inside the block
+        they commit together when it exits, or roll back if it raises.
+        """
+        return get_sqlite_pool(self.db_path).transaction()
+    
     def _init_database(self):
         """Create database schema if it doesn't exist."""
         conn = sqlite3.connect(self.db_path)
@@ -112,7 +142,7 @@ class ImageGenerationLogger:
                 prompt_chars_after_opt INTEGER,
                 pre_validation_passed BOOLEAN,
                 pre_validation_errors INTEGER,
-                pre_validation_warnings INTEGER
+                pre_validation_warnings INTEGER,
                 
                 -- Validation results
                 val_prompt_length INTEGER,
@@ -285,6 +315,111 @@ class ImageGenerationLogger:
         
         logger.debug("✅ Database schema initialized")
     
+    def _ensure_feedback_indexes(self) -> bool:
+        """
+        Create the feedback indexes on first use (search_feedback, get_category_feedback).
+        
+        Returns:
+            False if this SQLite build has no FTS5 (search falls back to LIKE)
+        """
+        if self.fts_enabled is None:
+            conn = sqlite3.connect(self.db_path)
+            cursor = conn.cursor()
+            # Failed attempts with feedback, by category (get_category_feedback)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_failed_feedback_category
+                ON generation_attempts(category)
+                WHERE passed = 0 AND feedback_text IS NOT NULL AND feedback_text != ''
+            """)
+            self.fts_enabled = self._init_feedback_index(cursor)
+            conn.commit()
+            conn.close()
+        return self.fts_enabled
+    
+    def _init_feedback_index(self, cursor: sqlite3.Cursor) -> bool:
+        """
+        Create the feedback_fts index and its sync triggers.
+        
+        Existing databases are indexed once when the table is first created.
+        
+        Returns:
+            False if this SQLite build has no FTS5 (search falls back to LIKE)
+        """
+        cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (FEEDBACK_FTS_TABLE,)
+        )
+        exists = cursor.fetchone() is not None
+        
+        try:
+            cursor.execute(f"""
+                CREATE VIRTUAL TABLE IF NOT EXISTS {FEEDBACK_FTS_TABLE} USING fts5(
+                    feedback_text,
+                    content='generation_attempts',
+                    content_rowid='rowid',
+                    tokenize='porter unicode61'
+                )
+            """)
+        except sqlite3.OperationalError as e:
+            logger.warning(f"⚠️  FTS5 unavailable, feedback search will scan: {e}")
+            return False
+        
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS feedback_fts_insert
+            AFTER INSERT ON generation_attempts BEGIN
+                INSERT INTO {FEEDBACK_FTS_TABLE}(rowid, feedback_text)
+                VALUES (new.rowid, new.feedback_text);
+            END
+        """)
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS feedback_fts_delete
+            AFTER DELETE ON generation_attempts BEGIN
+                INSERT INTO {FEEDBACK_FTS_TABLE}({FEEDBACK_FTS_TABLE}, rowid, feedback_text)
+                VALUES ('delete', old.rowid, old.feedback_text);
+            END
+        """)
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS feedback_fts_update
+            AFTER UPDATE OF feedback_text ON generation_attempts BEGIN
+                INSERT INTO {FEEDBACK_FTS_TABLE}({FEEDBACK_FTS_TABLE}, rowid, feedback_text)
+                VALUES ('delete', old.rowid, old.feedback_text);
+                INSERT INTO {FEEDBACK_FTS_TABLE}(rowid, feedback_text)
+                VALUES (new.rowid, new.feedback_text);
+            END
+        """)
+        
+        if not exists:
+            cursor.execute(f"INSERT INTO {FEEDBACK_FTS_TABLE}({FEEDBACK_FTS_TABLE}) VALUES ('rebuild')")
+            logger.info(f"✅ Indexed existing feedback for full-text search ({FEEDBACK_FTS_TABLE})")
+        return True
+    
+    def rebuild_feedback_index(self):
+        """
+        Re-index all feedback.
+        
+        Needed after VACUUM (generation_attempts has a TEXT primary key, so
+        VACUUM may renumber the rowids the index refers to) or bulk edits made
+        without the triggers.
+        """
+        if not self._ensure_feedback_indexes():
+            return
+        conn = sqlite3.connect(self.db_path)
+        conn.execute(f"INSERT INTO {FEEDBACK_FTS_TABLE}({FEEDBACK_FTS_TABLE}) VALUES ('rebuild')")
+        conn.commit()
+        conn.close()
+    
+    @staticmethod
+    def _feedback_match_query(search_term: str, prefix: bool = True) -> str:
+        """
+        FTS5 MATCH expression for a free-text search term.
+        
+        Each word is quoted (so FTS operators and punctuation in user input
+        are literal) and, with prefix, matches words starting with it:
+        "contam" finds "contamination". All words must match.
+        """
+        words = re.findall(r'\w+', search_term)
+        suffix = '*' if prefix else ''
+        return ' '.join(f'"{word}"{suffix}' for word in words)
+    
     def log_attempt(
         self,
         material: str,
@@ -337,7 +472,7 @@ class ImageGenerationLogger:
         attempt_id = str(uuid.uuid4())
         timestamp = datetime.utcnow().isoformat()
         
-        conn = sqlite3.connect(self.db_path)
+        conn = pooled_connect(self.db_path)
         cursor = conn.cursor()
         
         cursor.execute("""
@@ -771,27 +906,73 @@ class ImageGenerationLogger:
         
         return patterns
     
-    def search_feedback(self, search_term: str) -> List[Dict]:
+    def search_feedback(
+        self,
+        search_term: str,
+        category: Optional[str] = None,
+        feedback_category: Optional[str] = None,
+        limit: Optional[int] = None,
+        prefix: bool = True
+    ) -> List[Dict]:
         """
         Search feedback text for specific keywords or patterns.
         
+        Results are ranked by relevance (bm25), most recent first among ties.
+        
         Args:
-            search_term: Text to search for (e.g., "contamination", "physics")
+            search_term: Words to search for (e.g., "contamination", "rust visible");
+                        every word must appear
+            category: Optional material category filter (e.g., "metal_ferrous")
+            feedback_category: Optional feedback category filter (e.g., "physics")
+            limit: Maximum results (None: all matches)
+            prefix: Match words starting with each search word
             
         Returns:
             List of attempts with matching feedback
         """
+        filters = []
+        params: List = []
+        if category:
+            filters.append("AND a.category = ?")
+            params.append(category)
+        if feedback_category:
+            filters.append("AND a.feedback_category = ?")
+            params.append(feedback_category)
+        
+        if self._ensure_feedback_indexes():
+            match = self._feedback_match_query(search_term, prefix=prefix)
+            if not match:
+                return []
+            query = f"""
+                SELECT 
+                    a.material, a.feedback_text, a.feedback_category,
+                    a.realism_score, a.passed, a.timestamp
+                FROM {FEEDBACK_FTS_TABLE} f
+                JOIN generation_attempts a ON a.rowid = f.rowid
+                WHERE {FEEDBACK_FTS_TABLE} MATCH ?
+                    {' '.join(filters)}
+                ORDER BY bm25({FEEDBACK_FTS_TABLE}), a.timestamp DESC
+            """
+            params.insert(0, match)
+        else:
+            query = f"""
+                SELECT 
+                    a.material, a.feedback_text, a.feedback_category,
+                    a.realism_score, a.passed, a.timestamp
+                FROM generation_attempts a
+                WHERE a.feedback_text LIKE ?
+                    {' '.join(filters)}
+                ORDER BY a.timestamp DESC
+            """
+            params.insert(0, f'%{search_term}%')
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
         
-        cursor.execute("""
-            SELECT 
-                material, feedback_text, feedback_category,
-                realism_score, passed, timestamp
-            FROM generation_attempts
-            WHERE feedback_text LIKE ?
-            ORDER BY timestamp DESC
-        """, (f'%{search_term}%',))
+        cursor.execute(query, params)
         
         results = []
         for row in cursor.fetchall():
@@ -886,6 +1067,7 @@ class ImageGenerationLogger:
             #          - Clean side contaminated - must be visibly clean
             #          - Rust not visible enough - needs higher contrast"
         """
+        self._ensure_feedback_indexes()
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
         
@@ -1406,7 +1588,7 @@ class ImageGenerationLogger:
             aging_weight: Weight used (if applicable)
             contamination_weight: Weight used (if applicable)
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = pooled_connect(self.db_path)
         cursor = conn.cursor()
         timestamp = datetime.utcnow().isoformat()
         
@@ -1482,7 +1664,7 @@ class ImageGenerationLogger:
             passed: Whether generation passed validation
             realism_score: Score achieved
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = pooled_connect(self.db_path)
         cursor = conn.cursor()
         timestamp = datetime.utcnow().isoformat()
         
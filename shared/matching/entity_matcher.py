@@ -22,13 +22,19 @@ Usage
     for slug, score, diag in scores:
         if score >= config.min_score:
             print(slug, score)
+
+    # Batch runs (one candidate pool, many hosts): build the index once
+    index = CandidateIndex(candidates)
+    for host in hosts:
+        ranked = matcher.rank_candidates(host, index, config=MatchConfig())
 """
 
 from __future__ import annotations
 
 import re
+from bisect import bisect_right
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple, Union
 
 
 # ---------------------------------------------------------------------------
@@ -195,6 +201,137 @@ def _specific_keywords(keywords: List[str]) -> List[str]:
     return result
 
 
+# ---------------------------------------------------------------------------
+# Prepared entities
+# ---------------------------------------------------------------------------
+
+def _candidate_haystack(candidate: CandidateEntity) -> str:
+    fragments = [
+        candidate.slug,
+        candidate.subject,
+        candidate.page_title,
+        candidate.page_description,
+        *candidate.keywords,
+    ]
+    return _sanitize(" ".join(f for f in fragments if f)).lower()
+
+
+@dataclass
+class _HostProfile:
+    """Host-side values shared by every candidate comparison."""
+    tokens: Set[str]
+    keywords: List[str]
+    direct_slugs: Set[str]
+    supporting_slugs: Dict[str, Set[str]]
+    subject_norm: str
+    title_norm: str
+    category_norm: str
+    subcategory_norm: str
+    slug_subject: str
+
+    @classmethod
+    def build(cls, host: HostEntity) -> "_HostProfile":
+        host_fragments = [
+            host.subject,
+            host.page_title,
+            host.page_description,
+            host.category,
+            host.subcategory,
+            *host.keywords,
+        ]
+        subject_norm = _normalize_phrase(host.subject)
+        return cls(
+            tokens=set(tokenize(" ".join(f for f in host_fragments if f))),
+            keywords=_specific_keywords(host.keywords),
+            direct_slugs=set(host.association_slugs.get(host.domain, []) + [host.slug]),
+            supporting_slugs={
+                domain: set(slugs)
+                for domain, slugs in host.association_slugs.items()
+                if domain != host.domain
+            },
+            subject_norm=subject_norm,
+            title_norm=_normalize_phrase(host.page_title),
+            category_norm=_normalize_phrase(host.category),
+            subcategory_norm=_normalize_phrase(host.subcategory),
+            slug_subject=subject_norm.replace(" ", "-"),
+        )
+
+
+class CandidateIndex:
+    """
+    Candidate pool prepared once for scoring against many hosts.
+
+    Holds each candidate's sanitized haystack and token set, plus postings
+    (token → candidates, (domain, slug) association → candidates) and a joined
+    haystack/slug corpus for substring lookups. rank_candidates() then scores
+    only candidates that share a token, an association, or contain one of the
+    host's phrases — every other candidate scores 0 with empty diagnostics.
+    """
+
+    def __init__(self, candidates: Sequence[CandidateEntity]):
+        self.candidates: List[CandidateEntity] = list(candidates)
+        self.haystacks: List[str] = [_candidate_haystack(c) for c in self.candidates]
+        self.token_sets: List[Set[str]] = [set(tokenize(h)) for h in self.haystacks]
+
+        self._token_postings: Dict[str, List[int]] = {}
+        self._association_postings: Dict[Tuple[str, str], List[int]] = {}
+        for idx, (candidate, tokens) in enumerate(zip(self.candidates, self.token_sets, strict=True)):
+            for token in tokens:
+                self._token_postings.setdefault(token, []).append(idx)
+            for domain, slugs in candidate.authored_associations.items():
+                for slug in set(slugs):
+                    self._association_postings.setdefault((domain, slug), []).append(idx)
+
+        # Sanitized haystacks never contain "\n", so phrases cannot match across entries
+        self._haystack_corpus, self._haystack_starts = self._join(self.haystacks)
+        self._slug_corpus, self._slug_starts = self._join([c.slug for c in self.candidates])
+
+    def __len__(self) -> int:
+        return len(self.candidates)
+
+    @staticmethod
+    def _join(texts: List[str]) -> Tuple[str, List[int]]:
+        starts = []
+        offset = 0
+        for text in texts:
+            starts.append(offset)
+            offset += len(text) + 1
+        return "\n".join(texts), starts
+
+    @staticmethod
+    def _find_all(corpus: str, starts: List[int], needle: str, found: Set[int]) -> None:
+        if not needle or "\n" in needle:
+            return
+        pos = corpus.find(needle)
+        while pos != -1:
+            idx = bisect_right(starts, pos) - 1
+            found.add(idx)
+            # Continue after this entry; one hit per candidate is enough
+            next_start = starts[idx + 1] if idx + 1 < len(starts) else len(corpus)
+            pos = corpus.find(needle, next_start)
+
+    def retrieve(self, host: HostEntity, profile: _HostProfile) -> List[int]:
+        """Indices (in candidate order) of candidates that can score above 0."""
+        found: Set[int] = set()
+        for token in profile.tokens:
+            found.update(self._token_postings.get(token, ()))
+        for slug in profile.direct_slugs:
+            found.update(self._association_postings.get((host.domain, slug), ()))
+        for domain, slugs in profile.supporting_slugs.items():
+            for slug in slugs:
+                found.update(self._association_postings.get((domain, slug), ()))
+        for phrase in (
+            profile.subject_norm,
+            profile.title_norm,
+            profile.category_norm,
+            profile.subcategory_norm,
+            *profile.keywords,
+        ):
+            self._find_all(self._haystack_corpus, self._haystack_starts, phrase, found)
+        self._find_all(self._slug_corpus, self._slug_starts, profile.slug_subject, found)
+        return sorted(found)
+
+
 # ---------------------------------------------------------------------------
 # Scorer
 # ---------------------------------------------------------------------------
@@ -216,53 +353,46 @@ class EntityMatcher:
         config: MatchConfig,
     ) -> Tuple[float, MatchDiagnostics]:
         """Return (score, diagnostics) for one host↔candidate pair."""
-        diag = MatchDiagnostics()
-
-        # --- Build candidate's searchable text and token set ---
-        candidate_fragments = [
-            candidate.slug,
-            candidate.subject,
-            candidate.page_title,
-            candidate.page_description,
-            *candidate.keywords,
-        ]
-        haystack = _sanitize(" ".join(f for f in candidate_fragments if f)).lower()
-        candidate_tokens = set(tokenize(haystack))
+        haystack = _candidate_haystack(candidate)
+        return self._score_prepared(
+            host,
+            _HostProfile.build(host),
+            candidate,
+            haystack,
+            set(tokenize(haystack)),
+            config,
+        )
 
-        # --- Build host's token set ---
-        host_fragments = [
-            host.subject,
-            host.page_title,
-            host.page_description,
-            host.category,
-            host.subcategory,
-            *host.keywords,
-        ]
-        host_tokens = set(tokenize(" ".join(f for f in host_fragments if f)))
-        host_keywords = _specific_keywords(host.keywords)
+    def _score_prepared(
+        self,
+        host: HostEntity,
+        profile: _HostProfile,
+        candidate: CandidateEntity,
+        haystack: str,
+        candidate_tokens: Set[str],
+        config: MatchConfig,
+    ) -> Tuple[float, MatchDiagnostics]:
+        diag = MatchDiagnostics()
 
         # --- Association scoring ---
         # Direct: candidate claims to relate to host's own domain slugs
-        host_direct_slugs = set(host.association_slugs.get(host.domain, []) + [host.slug])
         candidate_direct = candidate.authored_associations.get(host.domain, [])
-        diag.direct_association_matches = self._count_overlap(candidate_direct, host_direct_slugs)
+        diag.direct_association_matches = self._count_overlap(candidate_direct, profile.direct_slugs)
 
         # Supporting: candidate's other-domain associations overlap with host's associations
-        for domain, host_slugs in host.association_slugs.items():
-            if domain == host.domain:
-                continue
+        for domain, host_slugs in profile.supporting_slugs.items():
             candidate_related = candidate.authored_associations.get(domain, [])
-            diag.supporting_association_matches += self._count_overlap(candidate_related, set(host_slugs))
+            diag.supporting_association_matches += self._count_overlap(candidate_related, host_slugs)
 
         diag.score += diag.direct_association_matches * config.direct_association_weight
         diag.score += diag.supporting_association_matches * config.supporting_association_weight
 
         # --- Phrase matching ---
-        subject_norm = _normalize_phrase(host.subject)
-        title_norm = _normalize_phrase(host.page_title)
-        category_norm = _normalize_phrase(host.category)
-        subcategory_norm = _normalize_phrase(host.subcategory)
-        slug_subject = subject_norm.replace(" ", "-")
+        subject_norm = profile.subject_norm
+        title_norm = profile.title_norm
+        category_norm = profile.category_norm
+        subcategory_norm = profile.subcategory_norm
+        slug_subject = profile.slug_subject
 
         diag.exact_subject_match = bool(subject_norm) and _is_specific_phrase(subject_norm) and subject_norm in haystack
         diag.exact_title_match = bool(title_norm) and _is_specific_phrase(title_norm) and title_norm in haystack
@@ -282,7 +412,7 @@ class EntityMatcher:
             diag.score += config.slug_subject_weight
 
         # --- Keyword matching ---
-        for kw in host_keywords:
+        for kw in profile.keywords:
             if kw in haystack:
                 diag.exact_keyword_matches += 1
                 weight = config.keyword_phrase_weight if " " in kw else config.keyword_token_weight
@@ -290,7 +420,7 @@ class EntityMatcher:
 
         # --- Token overlap ---
         for token in candidate_tokens:
-            if token in host_tokens:
+            if token in profile.tokens:
                 diag.token_overlap_count += 1
                 if len(token) >= 7:
                     diag.long_token_overlap_count += 1
@@ -325,21 +455,35 @@ class EntityMatcher:
     def rank_candidates(
         self,
         host: HostEntity,
-        candidates: List[CandidateEntity],
+        candidates: Union[List[CandidateEntity], CandidateIndex],
         config: Optional[MatchConfig] = None,
     ) -> List[Tuple[str, float, MatchDiagnostics]]:
         """
         Score and rank all candidates against the host.
 
+        Pass a CandidateIndex when ranking the same candidates for many hosts;
+        a plain list is indexed on the fly.
+
         Returns list of (slug, score, diagnostics) for eligible matches,
         sorted by score descending, limited to config.max_results.
         """
         if config is None:
             config = MatchConfig()
+        index = candidates if isinstance(candidates, CandidateIndex) else CandidateIndex(candidates)
+        profile = _HostProfile.build(host)
+
+        if self.is_eligible(MatchDiagnostics(), config):
+            # Zero-score candidates qualify under this config: score everything
+            positions: Sequence[int] = range(len(index))
+        else:
+            positions = index.retrieve(host, profile)
 
         scored = []
-        for candidate in candidates:
-            score, diag = self.score(host, candidate, config)
+        for idx in positions:
+            candidate = index.candidates[idx]
+            score, diag = self._score_prepared(
+                host, profile, candidate, index.haystacks[idx], index.token_sets[idx], config
+            )
             if self.is_eligible(diag, config):
                 scored.append((candidate.slug, score, diag))
 
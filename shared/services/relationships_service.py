@@ -134,18 +134,7 @@ class DomainLinkagesService:
             linkages['contaminants'] = contaminants
         
         # Get compounds (transitive: Material → Contaminant → Compound)
-        related_compounds = []
-        seen_compounds = set()
-        
-        for contaminant in contaminants:
-            contaminant_id = contaminant.get('id')
-            if contaminant_id:
-                compounds = self.associations_validator.get_compounds_for_contaminant(contaminant_id)
-                for compound in compounds:
-                    compound_id = compound.get('id')
-                    if compound_id and compound_id not in seen_compounds:
-                        seen_compounds.add(compound_id)
-                        related_compounds.append(compound)
+        related_compounds = self.associations_validator.get_compounds_for_material(material_id)
         
         if related_compounds:
             linkages['related_compounds'] = related_compounds
@@ -175,10 +164,9 @@ class DomainLinkagesService:
             linkages['contaminants'] = sorted([c['id'] for c in contaminants])
         
         # Get compounds for contaminants (transitive)
-        all_compounds = set()
-        for contaminant in contaminants:
-            compounds = self.associations_validator.get_compounds_for_contaminant(contaminant['id'])
-            all_compounds.update(c['id'] for c in compounds)
+        all_compounds = {
+            c['id'] for c in self.associations_validator.get_compounds_for_material(material_id)
+        }
         
         if all_compounds:
             linkages['compounds'] = sorted(all_compounds)
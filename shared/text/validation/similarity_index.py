@@ -0,0 +1,299 @@
+"""
+Cross-Item Similarity Index - Persistent near-duplicate index per (domain, field).
+
+Used by StructuralVariationChecker.check_cross_item_variation, which compares
+a text against every other value of the same field. The index keeps, per
+item:
+- the precomputed similarity features (word count, opening tokens, sentence
+  starters, word-trigram shingles)
+- a MinHash signature of the trigram shingles, bucketed into LSH bands
+
+Checks then reuse peer features, find near-duplicate candidates through the
+LSH buckets, and estimate trigram similarity of all other peers from their
+signatures in one vectorized step (exact Jaccard only where it matters; see
+StructuralVariationChecker.check_cross_item_variation).
+
+Items are keyed by source key and re-featurized only when their text changes
+(content hash). The index is pickled to .cache/similarity_index/ and knows the
+source file state (mtime/size) it was last synced with.
+
+Usage:
+    from shared.text.validation.similarity_index import CrossItemSimilarityIndex
+
+    index = CrossItemSimilarityIndex.load('materials', 'description', checker.similarity_features)
+    if index.is_stale(data_path):
+        index.sync(field_values_by_key, data_path)
+        index.save()
+    candidates = index.candidates(features, exclude='aluminum')
+"""
+
+import hashlib
+import logging
+import pickle
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, FrozenSet, Iterator, List, Optional, Set, Tuple, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+DEFAULT_INDEX_DIR = PROJECT_ROOT / '.cache' / 'similarity_index'
+
+# Bump when the pickle layout or SimilarityFeatures extraction changes.
+INDEX_FORMAT_VERSION = 1
+
+NUM_PERMUTATIONS = 128
+# 64 bands × 2 rows: pairs with trigram Jaccard 0.2 collide with p≈0.93,
+# 0.3 with p≈0.998 (near-duplicate weighted scores need ≈0.2+ at default weights)
+LSH_BANDS = 64
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+
+@dataclass(frozen=True)
+class SimilarityFeatures:
+    """Precomputed inputs of the cross-item structural similarity score."""
+    word_count: int
+    opening_tokens: FrozenSet[str]
+    starters: FrozenSet[str]
+    trigrams: FrozenSet[str]
+
+
+class MinHasher:
+    """Deterministic MinHash signatures over string shingles."""
+
+    def __init__(self, num_perm: int = NUM_PERMUTATIONS, seed: int = 1):
+        rng = np.random.default_rng(seed)
+        self.num_perm = num_perm
+        self._a = rng.integers(1, _MERSENNE_PRIME, size=num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, _MERSENNE_PRIME, size=num_perm, dtype=np.uint64)
+
+    def signature(self, shingles: FrozenSet[str]) -> np.ndarray:
+        if not shingles:
+            return np.full(self.num_perm, _MAX_HASH, dtype=np.uint64)
+        # Stable 32-bit shingle hashes (builtin hash() is salted per process)
+        values = np.fromiter(
+            (
+                int.from_bytes(hashlib.blake2b(s.encode('utf-8'), digest_size=4).digest(), 'little')
+                for s in shingles
+            ),
+            dtype=np.uint64,
+            count=len(shingles),
+        )
+        # (a*x + b) mod p, x < 2^32 and a, b < 2^61 → computed modulo 2^64 then reduced;
+        # any fixed hash family works as long as it is the same for all items
+        permuted = (np.outer(values, self._a) + self._b) % _MERSENNE_PRIME
+        return (permuted & _MAX_HASH).min(axis=0)
+
+
+@dataclass
+class _Entry:
+    content_hash: str
+    features: SimilarityFeatures
+    signature: np.ndarray
+
+
+class CrossItemSimilarityIndex:
+    """
+    Per-(domain, field) similarity index with MinHash/LSH candidate lookup.
+
+    The featurize callable must be StructuralVariationChecker.similarity_features
+    (or equivalent), so stored features match what checks compute for new text.
+    """
+
+    def __init__(
+        self,
+        domain: str,
+        field: str,
+        featurize: Callable[[str], SimilarityFeatures],
+        index_dir: Optional[Path] = None,
+        num_perm: int = NUM_PERMUTATIONS,
+        bands: int = LSH_BANDS,
+    ) -> None:
+        if num_perm % bands != 0:
+            raise ValueError(f"num_perm ({num_perm}) must be divisible by bands ({bands})")
+        self.domain = domain
+        self.field = field
+        self.featurize = featurize
+        self.index_dir = Path(index_dir or DEFAULT_INDEX_DIR)
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.hasher = MinHasher(num_perm)
+        self._entries: Dict[str, _Entry] = {}
+        self._buckets: List[Dict[bytes, Set[str]]] = [{} for _ in range(bands)]
+        self._source_state: Optional[Tuple[str, int, int]] = None
+        self._matrix_cache: Optional[Tuple[List[str], np.ndarray]] = None
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    @property
+    def index_path(self) -> Path:
+        return self.index_dir / f"{self.domain}__{self.field}.pkl"
+
+    @classmethod
+    def load(
+        cls,
+        domain: str,
+        field: str,
+        featurize: Callable[[str], SimilarityFeatures],
+        index_dir: Optional[Path] = None,
+    ) -> 'CrossItemSimilarityIndex':
+        """Load the persisted index, or return an empty one if missing/outdated."""
+        index = cls(domain, field, featurize, index_dir=index_dir)
+        path = index.index_path
+        if not path.exists():
+            return index
+        try:
+            with open(path, 'rb') as handle:
+                header = pickle.load(handle)
+                if header != index._header():
+                    logger.debug(f"Similarity index outdated, rebuilding: {path.name}")
+                    return index
+                source_state, entries = pickle.load(handle)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable similarity index {path}: {e}")
+            return index
+        for item_id, entry in entries.items():
+            index._add(item_id, entry)
+        index._source_state = source_state
+        return index
+
+    def save(self) -> None:
+        """Write the index atomically (temp file + rename)."""
+        self.index_dir.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            mode='wb', dir=self.index_dir, delete=False, suffix='.tmp'
+        ) as handle:
+            pickle.dump(self._header(), handle, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump((self._source_state, self._entries), handle, protocol=pickle.HIGHEST_PROTOCOL)
+            temp_path = handle.name
+        Path(temp_path).replace(self.index_path)
+
+    def _header(self) -> Dict[str, Union[str, int]]:
+        return {
+            'version': INDEX_FORMAT_VERSION,
+            'domain': self.domain,
+            'field': self.field,
+            'num_perm': self.hasher.num_perm,
+            'bands': self.bands,
+        }
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _stat(source: Path) -> Tuple[str, int, int]:
+        stat = source.stat()
+        return (str(source.resolve()), stat.st_mtime_ns, stat.st_size)
+
+    def is_stale(self, source: Path) -> bool:
+        """True if source changed since the last sync()/mark_synced()."""
+        return self._source_state != self._stat(Path(source))
+
+    def mark_synced(self, source: Path) -> None:
+        """Record source's current state (after upserting our own write)."""
+        self._source_state = self._stat(Path(source))
+
+    def sync(self, contents: Dict[str, str], source: Optional[Path] = None) -> int:
+        """
+        Make the index match contents ({item key: field text}).
+
+        Unchanged texts keep their entries; returns number of items
+        added, updated or removed.
+        """
+        changed = 0
+        for item_id in [key for key in self._entries if key not in contents]:
+            self.remove(item_id)
+            changed += 1
+        for item_id, text in contents.items():
+            if self.upsert(item_id, text):
+                changed += 1
+        if source is not None:
+            self.mark_synced(source)
+        if changed:
+            logger.debug(f"Similarity index {self.domain}.{self.field}: {changed} items updated")
+        return changed
+
+    def upsert(self, item_id: str, text: str) -> bool:
+        """Index (or re-index) one item's text; returns False if unchanged."""
+        content_hash = hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+        existing = self._entries.get(item_id)
+        if existing is not None and existing.content_hash == content_hash:
+            return False
+        if existing is not None:
+            self.remove(item_id)
+        features = self.featurize(text)
+        self._add(item_id, _Entry(content_hash, features, self.hasher.signature(features.trigrams)))
+        return True
+
+    def remove(self, item_id: str) -> None:
+        entry = self._entries.pop(item_id, None)
+        if entry is None:
+            return
+        for band, key in enumerate(self._band_keys(entry.signature)):
+            bucket = self._buckets[band].get(key)
+            if bucket is not None:
+                bucket.discard(item_id)
+                if not bucket:
+                    del self._buckets[band][key]
+        self._matrix_cache = None
+
+    def _add(self, item_id: str, entry: _Entry) -> None:
+        self._entries[item_id] = entry
+        for band, key in enumerate(self._band_keys(entry.signature)):
+            self._buckets[band].setdefault(key, set()).add(item_id)
+        self._matrix_cache = None
+
+    def _band_keys(self, signature: np.ndarray) -> Iterator[bytes]:
+        for band in range(self.bands):
+            yield signature[band * self.rows:(band + 1) * self.rows].tobytes()
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _excluded(item_id: str, exclude: Optional[str]) -> bool:
+        return exclude is not None and item_id.lower() == str(exclude).lower()
+
+    def peers(self, exclude: Optional[str] = None) -> List[Tuple[str, SimilarityFeatures]]:
+        """(item key, features) for every indexed item except exclude (case-insensitive)."""
+        return [
+            (item_id, entry.features)
+            for item_id, entry in self._entries.items()
+            if not self._excluded(item_id, exclude)
+        ]
+
+    def peer_count(self, exclude: Optional[str] = None) -> int:
+        return sum(1 for item_id in self._entries if not self._excluded(item_id, exclude))
+
+    def candidates(self, features: SimilarityFeatures, exclude: Optional[str] = None) -> Set[str]:
+        """Items sharing at least one LSH band with features' trigram signature."""
+        found: Set[str] = set()
+        signature = self.hasher.signature(features.trigrams)
+        for band, key in enumerate(self._band_keys(signature)):
+            found.update(self._buckets[band].get(key, ()))
+        return {item_id for item_id in found if not self._excluded(item_id, exclude)}
+
+    def estimate_trigram_similarity(self, features: SimilarityFeatures) -> Dict[str, float]:
+        """MinHash estimate of trigram Jaccard similarity against every item."""
+        if not self._entries:
+            return {}
+        if self._matrix_cache is None:
+            item_ids = list(self._entries)
+            matrix = np.vstack([self._entries[item_id].signature for item_id in item_ids])
+            self._matrix_cache = (item_ids, matrix)
+        item_ids, matrix = self._matrix_cache
+        signature = self.hasher.signature(features.trigrams)
+        estimates = (matrix == signature).mean(axis=1)
+        return dict(zip(item_ids, estimates.tolist(), strict=True))
@@ -16,10 +16,11 @@ import re
 import sqlite3
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 
 import yaml
 from generation.config.config_loader import ProcessingConfig
+from shared.text.validation.similarity_index import CrossItemSimilarityIndex, SimilarityFeatures
 
 logger = logging.getLogger(__name__)
 
@@ -419,16 +420,16 @@ class StructuralVariationChecker:
         return [chunk.strip() for chunk in chunks if chunk.strip()]
 
     @staticmethod
-    def _jaccard_similarity(left: List[str], right: List[str]) -> float:
+    def _jaccard_similarity(left: Iterable[str], right: Iterable[str]) -> float:
         """Compute Jaccard similarity between token collections."""
-        left_set = set(left)
-        right_set = set(right)
+        left_set = left if isinstance(left, (set, frozenset)) else set(left)
+        right_set = right if isinstance(right, (set, frozenset)) else set(right)
         if not left_set and not right_set:
             return 1.0
         if not left_set or not right_set:
             return 0.0
         intersection = len(left_set & right_set)
-        union = len(left_set | right_set)
+        union = len(left_set) + len(right_set) - intersection
         return intersection / union if union else 0.0
 
     @staticmethod
@@ -438,36 +439,42 @@ class StructuralVariationChecker:
             return words
         return [" ".join(words[i:i + 3]) for i in range(len(words) - 2)]
 
+    def similarity_features(self, text: str) -> SimilarityFeatures:
+        """Extract the inputs of the cross-item similarity score from one text."""
+        words = self._tokenize_words(text)
+        starters = []
+        for sentence in self._sentence_list(text):
+            sentence_words = self._tokenize_words(sentence)
+            if sentence_words:
+                starters.append(sentence_words[0])
+        return SimilarityFeatures(
+            word_count=len(words),
+            opening_tokens=frozenset(self._tokenize_words(self._extract_opening_pattern(text))),
+            starters=frozenset(starters),
+            trigrams=frozenset(self._word_trigrams(words)),
+        )
+
     def _cross_item_similarity(self, text: str, peer_text: str) -> Dict[str, float]:
         """Calculate structural similarity metrics between two field values."""
-        text_words = self._tokenize_words(text)
-        peer_words = self._tokenize_words(peer_text)
-
-        text_opening = self._extract_opening_pattern(text)
-        peer_opening = self._extract_opening_pattern(peer_text)
-        opening_similarity = self._jaccard_similarity(
-            self._tokenize_words(text_opening),
-            self._tokenize_words(peer_opening),
+        return self._similarity_from_features(
+            self.similarity_features(text),
+            self.similarity_features(peer_text),
         )
 
-        text_starters = [
-            self._tokenize_words(sentence)[0]
-            for sentence in self._sentence_list(text)
-            if self._tokenize_words(sentence)
-        ]
-        peer_starters = [
-            self._tokenize_words(sentence)[0]
-            for sentence in self._sentence_list(peer_text)
-            if self._tokenize_words(sentence)
-        ]
-        starter_similarity = self._jaccard_similarity(text_starters, peer_starters)
-
-        text_trigrams = self._word_trigrams(text_words)
-        peer_trigrams = self._word_trigrams(peer_words)
-        trigram_similarity = self._jaccard_similarity(text_trigrams, peer_trigrams)
-
-        max_word_count = max(len(text_words), len(peer_words), 1)
-        length_similarity = 1.0 - (abs(len(text_words) - len(peer_words)) / max_word_count)
+    def _similarity_from_features(
+        self,
+        features: SimilarityFeatures,
+        peer: SimilarityFeatures,
+        trigram_similarity: Optional[float] = None,
+    ) -> Dict[str, float]:
+        """Similarity metrics from precomputed features (trigram score may be supplied)."""
+        opening_similarity = self._jaccard_similarity(features.opening_tokens, peer.opening_tokens)
+        starter_similarity = self._jaccard_similarity(features.starters, peer.starters)
+        if trigram_similarity is None:
+            trigram_similarity = self._jaccard_similarity(features.trigrams, peer.trigrams)
+
+        max_word_count = max(features.word_count, peer.word_count, 1)
+        length_similarity = 1.0 - (abs(features.word_count - peer.word_count) / max_word_count)
 
         weighted_similarity = (
             self.cross_item_opening_weight * opening_similarity
@@ -484,11 +491,49 @@ class StructuralVariationChecker:
             'weighted_similarity': weighted_similarity,
         }
 
+    # Peers whose MinHash-estimated score is within this margin of the
+    # near-duplicate threshold are rescored exactly (covers estimate error)
+    CROSS_ITEM_ESTIMATE_MARGIN = 0.1
+
+    def _indexed_similarities(
+        self,
+        content: str,
+        similarity_index: CrossItemSimilarityIndex,
+        exclude_item: Optional[str],
+        threshold: float,
+    ) -> List[float]:
+        """
+        Weighted similarity of content against every indexed peer.
+
+        Opening/starter/length similarities are exact (precomputed peer
+        features). Trigram Jaccard is exact for LSH candidates and for peers
+        whose estimated score comes near the threshold, and the MinHash
+        estimate otherwise. Near-duplicate counts and violations therefore
+        match a full scan; scores well below the threshold (and so the
+        reported max/avg when nothing is close) carry the estimate error.
+        """
+        features = self.similarity_features(content)
+        candidates = similarity_index.candidates(features, exclude=exclude_item)
+        estimates = similarity_index.estimate_trigram_similarity(features)
+
+        similarities: List[float] = []
+        for item_id, peer in similarity_index.peers(exclude=exclude_item):
+            if item_id in candidates:
+                metrics = self._similarity_from_features(features, peer)
+            else:
+                metrics = self._similarity_from_features(features, peer, estimates[item_id])
+                if metrics['weighted_similarity'] >= threshold - self.CROSS_ITEM_ESTIMATE_MARGIN:
+                    metrics = self._similarity_from_features(features, peer)
+            similarities.append(float(metrics['weighted_similarity']))
+        return similarities
+
     def check_cross_item_variation(
         self,
         content: str,
-        peer_contents: List[str],
+        peer_contents: Optional[List[str]] = None,
         near_duplicate_threshold: Optional[float] = None,
+        similarity_index: Optional[CrossItemSimilarityIndex] = None,
+        exclude_item: Optional[str] = None,
     ) -> Dict[str, object]:
         """
         Validate structural variation against other values of the same field.
@@ -497,22 +542,33 @@ class StructuralVariationChecker:
             content: Candidate text to validate.
             peer_contents: Other texts from the same domain/field.
             near_duplicate_threshold: Weighted similarity score considered too close.
+            similarity_index: Prebuilt index of the field's values; used instead
+                of peer_contents (see _indexed_similarities).
+            exclude_item: Item key to leave out of the indexed peers (the item
+                being checked).
 
         Returns:
             Dict with pass/fail status, aggregate metrics, and violations.
         """
-        comparable_peers = [
-            value for value in (peer_contents or [])
-            if isinstance(value, str) and value.strip()
-        ]
-
         threshold = (
             float(near_duplicate_threshold)
             if near_duplicate_threshold is not None
             else self.cross_item_near_duplicate_threshold
         )
 
-        if not comparable_peers:
+        if similarity_index is not None:
+            if peer_contents is not None:
+                raise ValueError("Pass either peer_contents or similarity_index, not both")
+            similarities = self._indexed_similarities(content, similarity_index, exclude_item, threshold)
+        else:
+            features = self.similarity_features(content)
+            similarities = [
+                float(self._similarity_from_features(features, self.similarity_features(value))['weighted_similarity'])
+                for value in (peer_contents or [])
+                if isinstance(value, str) and value.strip()
+            ]
+
+        if not similarities:
             return {
                 'status': 'pass',
                 'violations': [],
@@ -524,15 +580,7 @@ class StructuralVariationChecker:
                 },
             }
 
-        similarities: List[float] = []
-        near_duplicate_count = 0
-
-        for peer_text in comparable_peers:
-            metrics = self._cross_item_similarity(content, peer_text)
-            weighted_similarity = float(metrics['weighted_similarity'])
-            similarities.append(weighted_similarity)
-            if weighted_similarity >= threshold:
-                near_duplicate_count += 1
+        near_duplicate_count = sum(1 for similarity in similarities if similarity >= threshold)
 
         max_similarity = max(similarities)
         avg_similarity = sum(similarities) / len(similarities)
@@ -547,7 +595,7 @@ class StructuralVariationChecker:
             'status': 'fail' if violations else 'pass',
             'violations': violations,
             'metrics': {
-                'peer_count': len(comparable_peers),
+                'peer_count': len(similarities),
                 'near_duplicate_count': near_duplicate_count,
                 'max_weighted_similarity': round(max_similarity, 4),
                 'avg_weighted_similarity': round(avg_similarity, 4),
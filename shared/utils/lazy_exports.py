@@ -0,0 +1,56 @@
+"""
+Lazy Exports - Module-level __getattr__/__dir__ for on-demand package exports.
+
+Packages whose __init__ re-exports names from many submodules use this so
+that importing the package (or one of its submodules) does not import every
+other submodule and its dependencies. Each export is imported on first
+attribute access and then cached in the module globals.
+
+Usage:
+    from shared.utils.lazy_exports import lazy_exports
+
+    _EXPORTS = {
+        'APIClient': '.client',                          # same attribute name
+        'get_component_client': ('.client_manager', 'get_api_client_for_component'),
+        'API_PROVIDERS': 'shared.config.settings',       # absolute module
+    }
+    __getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+
+Module names starting with '.' are relative to module_name.
+"""
+
+import importlib
+import sys
+from typing import Callable, Dict, List, Tuple, Union
+
+ExportTarget = Union[str, Tuple[str, str]]
+
+
+def lazy_exports(
+    module_name: str,
+    exports: Dict[str, ExportTarget],
+) -> Tuple[Callable[[str], object], Callable[[], List[str]]]:
+    """
+    Build __getattr__ and __dir__ for a module with lazily imported exports.
+
+    Args:
+        module_name: __name__ of the exporting module
+        exports: Export name -> module, or -> (module, attribute)
+
+    Returns:
+        (__getattr__, __dir__) to assign at module level
+    """
+
+    def __getattr__(name: str) -> object:
+        target = exports.get(name)
+        if target is None:
+            raise AttributeError(f"module '{module_name}' has no attribute '{name}'")
+        source, attribute = target if isinstance(target, tuple) else (target, name)
+        value = getattr(importlib.import_module(source, module_name), attribute)
+        setattr(sys.modules[module_name], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[module_name])) | set(exports))
+
+    return __getattr__, __dir__
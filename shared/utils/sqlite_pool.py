@@ -0,0 +1,237 @@
+"""
+SQLite Connection Pool - Shared access layer for the learning databases.
+
+Used by the learning stores (WinstonFeedbackDatabase, SweetSpotAnalyzer,
+ThresholdManager, WeightLearner, HumannessOptimizer,
+ConsolidatedLearningSystem) and the API response cache. The pool keeps one
+connection per (database file, thread):
+- WAL journaling + synchronous=NORMAL: readers never block the writer
+- busy_timeout so concurrent writers wait instead of failing
+- connections live for the thread, so sqlite3's prepared-statement cache
+  (cached_statements) is reused across calls
+- pool.transaction(): groups several log calls into one commit; nested
+  pooled_connect() blocks join the outer transaction instead of committing
+- pool.executemany(): batched inserts in a single transaction
+
+pooled_connect() is a drop-in for sqlite3.connect() in existing code:
+`with pooled_connect(path) as conn:` commits on success and rolls back on
+error exactly as before, conn.close() releases instead of closing, and
+conn.row_factory applies only to cursors created through that handle.
+
+Usage:
+    from shared.utils.sqlite_pool import get_sqlite_pool, pooled_connect
+
+    with pooled_connect(db_path) as conn:
+        conn.execute("INSERT INTO ...", values)
+
+    with get_sqlite_pool(db_path).transaction():
+        db.log_detection(...)
+        db.log_generation_parameters(...)
+        db.log_subjective_evaluation(...)
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Type, Union
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BUSY_TIMEOUT = 30.0
+DEFAULT_CACHED_STATEMENTS = 256
+
+
+class PooledConnection:
+    """
+    Handle on a pooled per-thread connection.
+
+    Behaves like sqlite3.Connection for the calls the learning code makes;
+    anything else is delegated to the underlying connection.
+    """
+
+    def __init__(self, pool: 'SQLitePool', conn: sqlite3.Connection) -> None:
+        self._pool = pool
+        self._conn = conn
+        self.row_factory = None
+
+    def cursor(self) -> sqlite3.Cursor:
+        cursor = self._conn.cursor()
+        cursor.row_factory = self.row_factory
+        return cursor
+
+    def execute(self, sql: str, parameters: Union[Sequence[Any], Dict[str, Any]] = ()) -> sqlite3.Cursor:
+        cursor = self.cursor()
+        cursor.execute(sql, parameters)
+        return cursor
+
+    def executemany(self, sql: str, seq_of_parameters: Iterable[Any]) -> sqlite3.Cursor:
+        cursor = self.cursor()
+        cursor.executemany(sql, seq_of_parameters)
+        return cursor
+
+    def commit(self) -> None:
+        """Commit, unless an enclosing pool.transaction() owns the commit."""
+        if not self._pool.in_transaction():
+            self._conn.commit()
+
+    def rollback(self) -> None:
+        """Roll back, unless an enclosing pool.transaction() owns the outcome."""
+        if not self._pool.in_transaction():
+            self._conn.rollback()
+
+    def close(self) -> None:
+        """Release the handle; uncommitted work outside a transaction is discarded, as on close()."""
+        if not self._pool.in_transaction() and self._conn.in_transaction:
+            self._conn.rollback()
+
+    def __enter__(self) -> 'PooledConnection':
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        if exc_type is None:
+            self.commit()
+        else:
+            self.rollback()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._conn, name)
+
+
+class SQLitePool:
+    """
+    Per-thread WAL connections to one SQLite database file.
+
+    Connections are reopened after fork (sqlite3 connections must not be
+    shared across processes).
+    """
+
+    def __init__(
+        self,
+        db_path: Union[str, Path],
+        timeout: float = DEFAULT_BUSY_TIMEOUT,
+        cached_statements: int = DEFAULT_CACHED_STATEMENTS,
+    ) -> None:
+        self.db_path = Path(db_path)
+        self.timeout = timeout
+        self.cached_statements = cached_statements
+        self._local = threading.local()
+        self._pid = os.getpid()
+        self._connections: List[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+
+    def connection(self) -> PooledConnection:
+        """Return a handle on this thread's connection."""
+        return PooledConnection(self, self._raw_connection())
+
+    def in_transaction(self) -> bool:
+        """Return True inside a transaction() block on this thread."""
+        return getattr(self._local, 'depth', 0) > 0
+
+    @contextmanager
+    def transaction(self) -> Iterator[PooledConnection]:
+        """
+        Run the block in one write transaction (BEGIN IMMEDIATE ... COMMIT).
+
+        Nested transaction() blocks and pooled_connect() blocks on the same
+        thread join the outermost transaction; it commits when the outermost
+        block exits cleanly and rolls back if it raises.
+        """
+        conn = self._raw_connection()
+        depth = getattr(self._local, 'depth', 0)
+        if depth == 0:
+            if conn.in_transaction:
+                conn.commit()
+            conn.execute("BEGIN IMMEDIATE")
+        self._local.depth = depth + 1
+        try:
+            yield PooledConnection(self, conn)
+        except BaseException:
+            self._local.depth = depth
+            if depth == 0:
+                conn.rollback()
+            raise
+        else:
+            self._local.depth = depth
+            if depth == 0:
+                conn.commit()
+
+    def executemany(self, sql: str, rows: Iterable[Sequence[Any]]) -> int:
+        """Execute a batched statement in one transaction; return affected rows."""
+        with self.transaction() as conn:
+            return conn.executemany(sql, rows).rowcount
+
+    def close_all(self) -> None:
+        """Close every connection opened by this pool (all threads)."""
+        with self._lock:
+            for conn in self._connections:
+                try:
+                    conn.close()
+                except sqlite3.Error:
+                    pass
+            self._connections = []
+        self._local = threading.local()
+
+    def _raw_connection(self) -> sqlite3.Connection:
+        if self._pid != os.getpid():
+            # Forked child: parent connections are unusable here
+            self._pid = os.getpid()
+            self._local = threading.local()
+            self._connections = []
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(
+                self.db_path,
+                timeout=self.timeout,
+                cached_statements=self.cached_statements,
+                check_same_thread=False,
+            )
+            conn.execute(f"PRAGMA busy_timeout = {int(self.timeout * 1000)}")
+            try:
+                conn.execute("PRAGMA journal_mode=WAL")
+            except sqlite3.OperationalError as e:
+                # Another process holds a lock during the mode switch; the
+                # database keeps its current mode (WAL is persistent once set).
+                logger.debug(f"Could not enable WAL for {self.db_path.name}: {e}")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            with self._lock:
+                self._connections.append(conn)
+        return conn
+
+
+_pools: Dict[str, SQLitePool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_sqlite_pool(db_path: Union[str, Path]) -> SQLitePool:
+    """Get the shared pool for a database file (keyed by resolved path)."""
+    key = str(Path(db_path).resolve())
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = SQLitePool(db_path)
+            _pools[key] = pool
+        return pool
+
+
+def pooled_connect(db_path: Union[str, Path]) -> PooledConnection:
+    """Drop-in for sqlite3.connect(db_path) backed by the shared pool."""
+    return get_sqlite_pool(db_path).connection()
+
+
+def close_all_pools() -> None:
+    """Close every pooled connection (tests, shutdown)."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close_all()
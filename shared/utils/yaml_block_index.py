@@ -0,0 +1,348 @@
+"""
+YAML Item Block Index - Line-range index of top-level items in a domain YAML.
+
+Domain source files keep every item under one root key:
+
+    materials:
+      Aluminum:
+        ...
+      Steel:
+        ...
+
+The index records the line range of each item block under the root key so
+a single item can be read (parsing only its own block) and replaced (dumping
+only its own block, spliced into the file and atomically renamed). All bytes
+outside the replaced block are left untouched.
+
+The index is rebuilt automatically when the file's (mtime, size) changes, so
+edits made by other processes are picked up.
+
+Usage:
+    from shared.utils.yaml_block_index import YAMLItemBlockIndex
+
+    index = YAMLItemBlockIndex.build(Path('data/materials/Materials.yaml'), 'materials')
+    if index is not None:
+        item = index.read_item('Aluminum')
+        item['description'] = '...'
+        index.write_item('Aluminum', item)
+
+Created: October 16, 2026
+"""
+
+import logging
+import re
+import shutil
+import tempfile
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import yaml
+
+from shared.utils.yaml_utils import _CDumper, _CLoader
+
+logger = logging.getLogger(__name__)
+
+# Matches "key:" at the start of a stripped line, with plain or quoted keys.
+_KEY_PATTERN = re.compile(
+    r"""^(?P<key>'(?:[^']|'')*'|"(?:[^"\\]|\\.)*"|[^'"#\s][^#]*?):(?:\s|$)"""
+)
+
+# Anchor (&name) or alias (*name) tokens. Deliberately loose: a false match
+# inside scalar text only makes an item non-isolated (full rewrite), never wrong.
+_NODE_REF_PATTERN = re.compile(r"(?:^|(?<=[\s\[{,]))([&*])([A-Za-z0-9_-]+)(?=[\s,\]}]|$)")
+
+_ITEM_INDENT = '  '
+
+
+def _parse_block_key(stripped_line: str) -> Optional[str]:
+    """Return the mapping key of an item header line, or None."""
+    match = _KEY_PATTERN.match(stripped_line)
+    if not match:
+        return None
+    try:
+        key = yaml.load(match.group('key'), Loader=_CLoader)
+    except yaml.YAMLError:
+        return None
+    return None if key is None else str(key)
+
+
+def _scan_node_refs(lines: List[str]) -> Tuple[Set[str], Counter]:
+    """Return (anchors defined, alias use counts) for a run of lines."""
+    anchors: Set[str] = set()
+    aliases: Counter = Counter()
+    for line in lines:
+        if '&' not in line and '*' not in line:
+            continue
+        for kind, name in _NODE_REF_PATTERN.findall(line):
+            if kind == '&':
+                anchors.add(name)
+            else:
+                aliases[name] += 1
+    return anchors, aliases
+
+
+def _is_comment_or_blank(line: str) -> bool:
+    stripped = line.strip()
+    return not stripped or stripped.startswith('#')
+
+
+class YAMLItemBlockIndex:
+    """
+    Line-range index of the item blocks under a YAML file's root key.
+
+    Only block-style layouts (as produced by yaml.dump with
+    default_flow_style=False) are indexable; build() returns None otherwise
+    and callers should use a full load/dump instead.
+
+    Items that share YAML anchors/aliases with the rest of the file cannot be
+    parsed or rewritten on their own; is_isolated() reports whether an item's
+    block is self-contained.
+    """
+
+    def __init__(self, file_path: Path, root_key: str) -> None:
+        self.file_path = Path(file_path)
+        self.root_key = root_key
+        self._lines: List[str] = []
+        self._blocks: Dict[str, Tuple[int, int]] = {}
+        self._block_refs: Dict[str, Tuple[Set[str], Counter]] = {}
+        self._file_aliases: Counter = Counter()
+        self._signature: Optional[Tuple[int, int]] = None
+
+    @classmethod
+    def build(cls, file_path: Path, root_key: str) -> Optional['YAMLItemBlockIndex']:
+        """
+        Build an index for file_path, or return None if its layout is not indexable.
+
+        Raises:
+            FileNotFoundError: If file doesn't exist
+        """
+        index = cls(file_path, root_key)
+        if not index._rebuild():
+            return None
+        return index
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def has_item(self, identifier: str) -> bool:
+        """Return True if identifier has a block under the root key."""
+        self._ensure_current()
+        return identifier in self._blocks
+
+    def item_ids(self) -> List[str]:
+        """Return indexed item identifiers in file order."""
+        self._ensure_current()
+        return list(self._blocks)
+
+    def line_range(self, identifier: str) -> Tuple[int, int]:
+        """Return the [start, end) line range of an item block."""
+        self._ensure_current()
+        if identifier not in self._blocks:
+            raise KeyError(f"'{identifier}' not found under '{self.root_key}' in {self.file_path}")
+        return self._blocks[identifier]
+
+    def is_isolated(self, identifier: str) -> bool:
+        """
+        Return True if the item block neither uses aliases defined elsewhere
+        nor defines anchors that are aliased outside the block.
+        """
+        self._ensure_current()
+        if identifier not in self._blocks:
+            return False
+        anchors, aliases = self._block_refs[identifier]
+        if any(name not in anchors for name in aliases):
+            return False
+        return all(self._file_aliases[name] == aliases[name] for name in anchors)
+
+    def read_item(self, identifier: str) -> Any:
+        """
+        Parse and return a single item, reading only its own block.
+
+        Raises:
+            KeyError: If identifier is not indexed
+            ValueError: If the block is not isolated (see is_isolated)
+            yaml.YAMLError: If the block is not valid YAML
+        """
+        if not self.is_isolated(identifier):
+            raise ValueError(f"Item block for '{identifier}' in {self.file_path} shares YAML anchors")
+        start, end = self.line_range(identifier)
+        block_text = f"{self.root_key}:\n" + ''.join(self._lines[start:end])
+        parsed = yaml.load(block_text, Loader=_CLoader)
+        if not isinstance(parsed, dict) or not isinstance(parsed.get(self.root_key), dict):
+            raise ValueError(f"Item block for '{identifier}' in {self.file_path} did not parse as a mapping")
+        items = parsed[self.root_key]
+        if len(items) != 1:
+            raise ValueError(
+                f"Item block for '{identifier}' in {self.file_path} parsed to {len(items)} items; "
+                "file layout is not block-indexable"
+            )
+        return next(iter(items.values()))
+
+    def write_item(self, identifier: str, item_data: Any) -> bool:
+        """
+        Replace a single item's block and atomically rewrite the file.
+
+        Returns:
+            True if the block was spliced. False (file untouched) if the item
+            is not isolated or its rendering needs YAML anchors, which could
+            collide with anchor names elsewhere in the file.
+
+        Raises:
+            KeyError: If identifier is not indexed
+        """
+        return self.write_items({identifier: item_data})
+
+    def write_items(self, items: Dict[str, Any]) -> bool:
+        """
+        Replace several item blocks in one atomic rewrite.
+
+        All-or-nothing: returns False (file untouched) if any item cannot be
+        spliced (see write_item).
+
+        Raises:
+            KeyError: If any identifier is not indexed
+        """
+        replacements: List[Tuple[int, int, str, List[str], Counter]] = []
+        for identifier, item_data in items.items():
+            if not self.is_isolated(identifier):
+                return False
+            start, end = self.line_range(identifier)
+            rendered = yaml.dump(
+                {self.root_key: {identifier: item_data}},
+                Dumper=_CDumper,
+                default_flow_style=False,
+                allow_unicode=True,
+                sort_keys=False,
+            )
+            # Drop the "root_key:" header line; keep the indented item block.
+            new_block = rendered.split('\n', 1)[1].splitlines(keepends=True)
+            new_anchors, new_aliases = _scan_node_refs(new_block)
+            if new_anchors or new_aliases:
+                return False
+            replacements.append((start, end, identifier, new_block, new_aliases))
+
+        new_lines: List[str] = []
+        new_ranges: Dict[str, Tuple[int, int]] = {}
+        cursor = 0
+        for start, end, identifier, new_block, _ in sorted(replacements):
+            new_lines.extend(self._lines[cursor:start])
+            new_ranges[identifier] = (len(new_lines), len(new_lines) + len(new_block))
+            new_lines.extend(new_block)
+            cursor = end
+        new_lines.extend(self._lines[cursor:])
+        self._atomic_write(''.join(new_lines))
+
+        # Shift untouched blocks by the size change of replacements above them.
+        deltas = sorted(
+            (start, len(new_block) - (end - start))
+            for start, end, _, new_block, _ in replacements
+        )
+        for key, (block_start, block_end) in self._blocks.items():
+            if key in new_ranges:
+                continue
+            shift = sum(delta for start, delta in deltas if start < block_start)
+            self._blocks[key] = (block_start + shift, block_end + shift)
+        self._blocks.update(new_ranges)
+        for _, _, identifier, _, new_aliases in replacements:
+            self._file_aliases -= self._block_refs[identifier][1]
+            self._block_refs[identifier] = (set(), new_aliases)
+        self._lines = new_lines
+        self._signature = self._stat_signature()
+
+        logger.debug(f"Spliced {len(replacements)} item(s) into {self.file_path.name}")
+        return True
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _stat_signature(self) -> Tuple[int, int]:
+        stat = self.file_path.stat()
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _ensure_current(self) -> None:
+        if self._signature != self._stat_signature():
+            logger.debug(f"{self.file_path.name} changed on disk; rebuilding block index")
+            if not self._rebuild():
+                raise ValueError(
+                    f"{self.file_path} is no longer block-indexable under root key '{self.root_key}'"
+                )
+
+    def _rebuild(self) -> bool:
+        """Scan the file and record item line ranges. Returns False if not indexable."""
+        if not self.file_path.exists():
+            raise FileNotFoundError(f"YAML file not found: {self.file_path}")
+
+        signature = self._stat_signature()
+        with open(self.file_path, 'r', encoding='utf-8') as f:
+            lines = f.readlines()
+
+        root_header = f"{self.root_key}:"
+        root_line = next(
+            (i for i, line in enumerate(lines) if line.rstrip() == root_header),
+            None
+        )
+        if root_line is None:
+            logger.debug(f"No block-style '{root_header}' line in {self.file_path.name}")
+            return False
+
+        # Root section ends at the next column-0 content line.
+        section_end = len(lines)
+        for i in range(root_line + 1, len(lines)):
+            line = lines[i]
+            if line[:1] not in ('', ' ', '\n', '\r', '#'):
+                section_end = i
+                break
+
+        headers: List[Tuple[int, str]] = []
+        for i in range(root_line + 1, section_end):
+            line = lines[i]
+            if not line.startswith(_ITEM_INDENT) or line[len(_ITEM_INDENT):len(_ITEM_INDENT) + 1] in (' ', '\n', '\r', ''):
+                continue
+            stripped = line.strip()
+            if stripped.startswith('#'):
+                continue
+            key = _parse_block_key(stripped)
+            if key is None:
+                logger.debug(f"Unindexable item header at {self.file_path.name}:{i + 1}")
+                return False
+            headers.append((i, key))
+
+        blocks: Dict[str, Tuple[int, int]] = {}
+        for n, (start, key) in enumerate(headers):
+            end = headers[n + 1][0] if n + 1 < len(headers) else section_end
+            # Leave trailing comments (and the blank lines around them) in place
+            # so they survive a splice of this block.
+            trailing = end
+            while trailing > start + 1 and _is_comment_or_blank(lines[trailing - 1]):
+                trailing -= 1
+            if any(lines[j].strip().startswith('#') for j in range(trailing, end)):
+                end = trailing
+            if key in blocks:
+                logger.debug(f"Duplicate item key '{key}' in {self.file_path.name}")
+                return False
+            blocks[key] = (start, end)
+
+        self._lines = lines
+        self._blocks = blocks
+        self._block_refs = {
+            key: _scan_node_refs(lines[start:end]) for key, (start, end) in blocks.items()
+        }
+        self._file_aliases = _scan_node_refs(lines)[1]
+        self._signature = signature
+        return True
+
+    def _atomic_write(self, text: str) -> None:
+        with tempfile.NamedTemporaryFile(
+            mode='w',
+            encoding='utf-8',
+            dir=self.file_path.parent,
+            delete=False,
+            suffix='.yaml'
+        ) as temp_f:
+            temp_f.write(text)
+            temp_path = temp_f.name
+        shutil.copymode(self.file_path, temp_path)
+        Path(temp_path).replace(self.file_path)
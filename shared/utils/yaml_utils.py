@@ -289,12 +289,19 @@ def load_yaml_fast(file_path: Union[str, Path]) -> Any:
 
     Performance:
         ~0.5s for 3 MB file with C loader vs ~5s with Python loader.
+        Large files are served from the on-disk parse snapshot
+        (shared.cache.yaml_snapshot) when their content hash is unchanged.
     """
+    from shared.cache.yaml_snapshot import get_snapshot_store
+
     file_path = Path(file_path)
     if not file_path.exists():
         raise FileNotFoundError(f"YAML file not found: {file_path}")
-    with open(file_path, 'r', encoding='utf-8') as f:
-        return yaml.load(f, Loader=_CLoader)
+    return get_snapshot_store().load(
+        file_path,
+        _CLoader.__name__,
+        lambda text: yaml.load(text, Loader=_CLoader),
+    )
 
 
 def dump_yaml_fast(data: Any, file_path: Union[str, Path], **kwargs) -> None:
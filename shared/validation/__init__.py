@@ -5,26 +5,37 @@ Provides consolidated validation functions for content validation,
 reference validation, and other validation tasks.
 """
 
-from .frontmatter_validator import FrontmatterDependencyValidator
-from .layer_validator import LayerValidator
-from .content.quality_validator import QualityScoreValidator
+from shared.utils.lazy_exports import lazy_exports
+
+# Export name -> submodule. Exports are imported on first access, so importing
+# one validation submodule (errors, services, helpers) does not load every
+# validator and its dependencies.
+_EXPORTS = {
+    'FrontmatterDependencyValidator': '.frontmatter_validator',
+    'LayerValidator': '.layer_validator',
+    'QualityScoreValidator': '.content.quality_validator',
+    # Reference validation (new)
+    'ReferenceInfo': '.reference_registry',
+    'ReferenceRegistry': '.reference_registry',
+    'ValidationSchema': '.validation_schema',
+    # Unified validation
+    'FixAction': '.validator',
+    'IssueCategory': '.validator',
+    'IssueSeverity': '.validator',
+    'Validator': '.validator',
+    'ValidationIssue': '.validator',
+    'ValidationReport': '.validator',
+    'ValidationStage': '.validator',
+    'ValidationStatus': '.validator',
+    'create_validator': '.validator',
+    'validate_and_fix': '.validator',
+    'validate_prompt_quick': '.validator',
+}
+
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+
 
-# Reference validation (new)
-from .reference_registry import ReferenceInfo, ReferenceRegistry
-from .validation_schema import ValidationSchema
-from .validator import (
-    FixAction,
-    IssueCategory,
-    IssueSeverity,
-    Validator,
-    ValidationIssue,
-    ValidationReport,
-    ValidationStage,
-    ValidationStatus,
-    create_validator,
-    validate_and_fix,
-    validate_prompt_quick,
-)
 __all__ = [
     "QualityScoreValidator",
     "FrontmatterDependencyValidator",
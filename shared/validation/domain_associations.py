@@ -18,11 +18,19 @@ USAGE:
     # Get bidirectional linkages for export
     contaminant_links = validator.get_contaminants_for_material('aluminum-laser-cleaning')
     compound_links = validator.get_compounds_for_contaminant('rust-oxidation-contamination')
+
+INDEXING:
+    The `associations` list (~9.5k entries) is indexed once per load into an
+    adjacency table keyed by (source_domain, source_id, relationship_type), plus
+    an O(1) edge table keyed by the full (source, relationship, target) tuple.
+    Linkage results (including the transitive material → contaminant → compound
+    table) are memoized per load and returned as copies.
 """
 
+import logging
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 import yaml
 
@@ -33,6 +41,11 @@ from shared.utils.formatters import (
     normalize_taxonomy,
 )
 
+logger = logging.getLogger(__name__)
+
+AdjacencyKey = Tuple[str, str, str]
+EdgeKey = Tuple[str, str, str, str, str]
+
 
 @dataclass
 class Association:
@@ -76,6 +89,13 @@ class DomainAssociationsValidator:
         self._valid_contaminant_ids: Optional[Set[str]] = None
         self._valid_compound_ids: Optional[Set[str]] = None
         self._valid_settings_ids: Optional[Set[str]] = None
+
+        # Association graph index (built from self.data on first lookup)
+        self._indexed_data: Optional[Dict] = None
+        self._adjacency: Dict[AdjacencyKey, List[Dict]] = {}
+        self._edges: Dict[EdgeKey, Dict] = {}
+        self._compound_sources: Optional[Dict[str, List[Dict]]] = None
+        self._linkage_cache: Dict[Tuple[str, str], List[Dict]] = {}
     
     def load(self) -> None:
         """Load associations and domain data files"""
@@ -111,6 +131,102 @@ class DomainAssociationsValidator:
             with open(settings_file, 'r', encoding='utf-8') as f:
                 self.settings_data = yaml.safe_load(f)
 
+        self._build_index()
+
+    def _build_index(self) -> None:
+        """
+        Index the associations list for O(1) lookups.
+
+        Adjacency lists keep file order and duplicates, so indexed lookups
+        return exactly what a linear scan of `associations` would.
+        """
+        self._adjacency = {}
+        self._edges = {}
+        self._compound_sources = None
+        self._linkage_cache = {}
+        self._indexed_data = self.data
+
+        if not isinstance(self.data, dict):
+            return
+
+        associations = self.data.get('associations')
+        if isinstance(associations, list):
+            for assoc in associations:
+                if not isinstance(assoc, dict):
+                    continue
+                key = (
+                    assoc.get('source_domain'),
+                    assoc.get('source_id'),
+                    assoc.get('relationship_type'),
+                )
+                self._adjacency.setdefault(key, []).append(assoc)
+                edge_key = key + (assoc.get('target_domain'), assoc.get('target_id'))
+                # First match wins, as with the previous linear scan.
+                self._edges.setdefault(edge_key, assoc)
+
+        cont_comp = self.data.get('contaminant_compound_associations')
+        if isinstance(cont_comp, list):
+            self._compound_sources = {}
+            for assoc in cont_comp:
+                if isinstance(assoc, dict):
+                    self._compound_sources.setdefault(assoc.get('compound_id'), []).append(assoc)
+
+        logger.debug(
+            f"Indexed {len(self._edges)} association edges "
+            f"across {len(self._adjacency)} (source, relationship) keys"
+        )
+
+    def _ensure_index(self) -> None:
+        """Rebuild the index if associations data was loaded or replaced since."""
+        if self._indexed_data is not self.data:
+            self._build_index()
+
+    def get_associations(
+        self,
+        source_domain: str,
+        source_id: str,
+        relationship_type: str,
+        target_domain: Optional[str] = None,
+    ) -> List[Dict]:
+        """
+        Return association entries for a source node and relationship, in file order.
+
+        Args:
+            source_domain: e.g. 'materials', 'contaminants'
+            source_id: Source ID exactly as stored in DomainAssociations.yaml
+            relationship_type: e.g. 'can_have_contamination', 'generates_byproduct'
+            target_domain: Optional target domain filter
+        """
+        if not self.data:
+            self.load()
+        self._ensure_index()
+        entries = self._adjacency.get((source_domain, source_id, relationship_type), [])
+        if target_domain is None:
+            return list(entries)
+        return [a for a in entries if a.get('target_domain') == target_domain]
+
+    def get_association(
+        self,
+        source_domain: str,
+        source_id: str,
+        relationship_type: str,
+        target_domain: str,
+        target_id: str,
+    ) -> Optional[Dict]:
+        """Return the metadata of a single association edge (O(1)), or None."""
+        if not self.data:
+            self.load()
+        self._ensure_index()
+        return self._edges.get((source_domain, source_id, relationship_type, target_domain, target_id))
+
+    def _cached_linkages(self, kind: str, item_id: str, build) -> List[Dict]:
+        """Memoize a linkage list per load; callers get independent copies."""
+        self._ensure_index()
+        key = (kind, item_id)
+        if key not in self._linkage_cache:
+            self._linkage_cache[key] = build()
+        return [dict(link) for link in self._linkage_cache[key]]
+
     @staticmethod
     def _require_dict(container: Dict, key: str, context: str) -> Dict:
         """Require a dictionary key and validate dictionary type."""
@@ -299,7 +415,15 @@ class DomainAssociationsValidator:
             raise ValueError("Associations data must be a dictionary")
         if not isinstance(self.contaminants_data, dict):
             raise ValueError("Contaminants data must be a dictionary")
-        
+
+        return self._cached_linkages(
+            'contaminants_for_material',
+            material_id,
+            lambda: self._build_contaminants_for_material(material_id),
+        )
+
+    def _build_contaminants_for_material(self, material_id: str) -> List[Dict]:
+        """Build contaminant linkages for a material (uncached)."""
         # Strip -laser-cleaning suffix if present (lookup index uses base material ID)
         base_material_id = material_id.replace('-laser-cleaning', '')
         
@@ -313,23 +437,12 @@ class DomainAssociationsValidator:
         if not contaminant_ids:
             return []
 
-        associations = self._require_list(self.data, 'associations', 'Associations data')
+        self._require_list(self.data, 'associations', 'Associations data')
         contamination_patterns = self._require_dict(self.contaminants_data, 'contaminants', 'Contaminants data')
         
         results = []
         
         for contaminant_id in contaminant_ids:
-            # Find full association data in associations list
-            assoc = None
-            for a in associations:
-                if (a.get('source_domain') == 'materials' and 
-                    a.get('source_id') == base_material_id and
-                    a.get('target_domain') == 'contaminants' and
-                    a.get('target_id') == contaminant_id and
-                    a.get('relationship_type') == 'can_have_contamination'):
-                    assoc = a
-                    break
-            
             # Get contaminant details from Contaminants.yaml
             full_contaminant_id = contaminant_id if contaminant_id.endswith('-contamination') else f"{contaminant_id}-contamination"
             if full_contaminant_id not in contamination_patterns:
@@ -381,7 +494,15 @@ class DomainAssociationsValidator:
             raise ValueError("Associations data must be a dictionary")
         if not isinstance(self.materials_data, dict):
             raise ValueError("Materials data must be a dictionary")
-        
+
+        return self._cached_linkages(
+            'materials_for_contaminant',
+            contaminant_id,
+            lambda: self._build_materials_for_contaminant(contaminant_id),
+        )
+
+    def _build_materials_for_contaminant(self, contaminant_id: str) -> List[Dict]:
+        """Build material linkages for a contaminant (uncached)."""
         # Ensure full ID with -contamination suffix (lookup index uses full IDs)
         full_contaminant_id = contaminant_id if contaminant_id.endswith('-contamination') else f"{contaminant_id}-contamination"
         
@@ -459,19 +580,27 @@ class DomainAssociationsValidator:
             raise ValueError("Associations data must be a dictionary")
         if not isinstance(self.compounds_data, dict):
             raise ValueError("Compounds data must be a dictionary")
-        
+
+        return self._cached_linkages(
+            'compounds_for_contaminant',
+            contaminant_id,
+            lambda: self._build_compounds_for_contaminant(contaminant_id),
+        )
+
+    def _build_compounds_for_contaminant(self, contaminant_id: str) -> List[Dict]:
+        """Build compound linkages for a contaminant (uncached)."""
         # Strip -contamination suffix if present
         base_contaminant_id = contaminant_id.replace('-contamination', '')
         
-        # Find compound associations in associations list
-        compound_ids = []
-        associations = self._require_list(self.data, 'associations', 'Associations data')
-        for assoc in associations:
-            if (assoc.get('source_domain') == 'contaminants' and
-                assoc.get('source_id') == base_contaminant_id and
-                assoc.get('target_domain') == 'compounds' and
-                assoc.get('relationship_type') == 'generates_byproduct'):
-                compound_ids.append(assoc.get('target_id'))
+        # Find compound associations via the adjacency index
+        self._require_list(self.data, 'associations', 'Associations data')
+        compound_ids = [
+            assoc.get('target_id')
+            for assoc in self._adjacency.get(
+                ('contaminants', base_contaminant_id, 'generates_byproduct'), []
+            )
+            if assoc.get('target_domain') == 'compounds'
+        ]
         
         if not compound_ids:
             return []
@@ -514,6 +643,37 @@ class DomainAssociationsValidator:
             })
         
         return results
+
+    def get_compounds_for_material(self, material_id: str) -> List[Dict]:
+        """
+        Get compounds produced by a material's contaminants (transitive lookup)
+
+        Material → contaminant → compound, de-duplicated by compound ID in
+        first-seen order.
+
+        Args:
+            material_id: Material ID (e.g., 'aluminum-laser-cleaning' or 'aluminum')
+
+        Returns:
+            List of compound linkage dictionaries
+        """
+        def build() -> List[Dict]:
+            results = []
+            seen: Set[Any] = set()
+            for contaminant in self.get_contaminants_for_material(material_id):
+                contaminant_id = contaminant.get('id')
+                if not contaminant_id:
+                    continue
+                for compound in self.get_compounds_for_contaminant(contaminant_id):
+                    compound_id = compound.get('id')
+                    if compound_id and compound_id not in seen:
+                        seen.add(compound_id)
+                        results.append(compound)
+            return results
+
+        if not self.data:
+            self.load()
+        return self._cached_linkages('compounds_for_material', material_id, build)
     
     def get_contaminants_for_compound(self, compound_id: str) -> List[Dict]:
         """
@@ -532,13 +692,21 @@ class DomainAssociationsValidator:
             raise ValueError("Associations data must be a dictionary")
         if not isinstance(self.contaminants_data, dict):
             raise ValueError("Contaminants data must be a dictionary")
-        
-        associations = self._require_list(self.data, 'contaminant_compound_associations', 'Associations data')
+
+        return self._cached_linkages(
+            'contaminants_for_compound',
+            compound_id,
+            lambda: self._build_contaminants_for_compound(compound_id),
+        )
+
+    def _build_contaminants_for_compound(self, compound_id: str) -> List[Dict]:
+        """Build contaminant linkages for a compound (uncached)."""
+        self._require_list(self.data, 'contaminant_compound_associations', 'Associations data')
         results = []
 
         contamination_patterns = self._require_dict(self.contaminants_data, 'contaminants', 'Contaminants data')
         
-        for assoc in associations:
+        for assoc in self._compound_sources.get(compound_id, []):
             if assoc.get('compound_id') == compound_id:
                 contaminant_id = assoc['contaminant_id']
                 
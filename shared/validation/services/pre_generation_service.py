@@ -38,6 +38,8 @@ from scripts.validation.comprehensive_validation_agent import (
     RelationshipRule,
 )
 
+from shared.cache.frontmatter_corpus import get_frontmatter_corpus
+
 # Import unified error types
 from shared.exceptions import ConfigurationError
 from shared.validation.errors import (
@@ -385,12 +387,13 @@ class PreGenerationValidationService:
             ))
             return result
         
-        files = list(self.frontmatter_dir.glob("*.yaml"))
-        
-        for file_path in files:
+        # Shared parallel parse (cached by path, mtime and size) with the other frontmatter validators
+        for document in get_frontmatter_corpus(self.frontmatter_dir).scan():
+            file_path = document.path
             try:
-                with open(file_path) as f:
-                    frontmatter_data = yaml.safe_load(f)
+                if document.error is not None:
+                    raise ValueError(document.error)
+                frontmatter_data = document.data
                 
                 if not frontmatter_data:
                     result.add_error(VError(
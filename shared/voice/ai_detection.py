@@ -26,7 +26,9 @@ import os
 import re
 import statistics
 from collections import Counter
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
+
+from shared.voice.pattern_engine import PatternHit, get_pattern_engine
 
 logger = logging.getLogger(__name__)
 
@@ -178,6 +180,8 @@ class AIDetector:
         """
         self.strict_mode = strict_mode
         self.config = load_patterns(patterns_file)
+        self.pattern_engine = get_pattern_engine(self.config, categories=('grammar', 'phrasing'))
+        self._last_scan: Optional[tuple] = None
         
         # FAIL-FAST: Thresholds must be configured, no defaults
         if not self.config.get('thresholds'):
@@ -190,6 +194,15 @@ class AIDetector:
         default_threshold = thresholds['ai_detection']
         strict_threshold = thresholds['strict_mode']
         self.ai_threshold = strict_threshold if strict_mode else default_threshold
+
+    def _pattern_hits(self, text: str, category: str) -> List[PatternHit]:
+        """Pattern hits for text; the detect_* methods of one call share a single scan."""
+        # Read the cache once: batch_detect threads share this detector and
+        # may replace it between a check and a second read.
+        scan = self._last_scan
+        if scan is None or scan[0] != text:
+            scan = self._last_scan = (text, self.pattern_engine.scan(text.lower()))
+        return scan[1][category]
     
     def detect_grammatical_errors(self, text: str) -> Dict[str, Any]:
         """
@@ -212,18 +225,13 @@ class AIDetector:
         text_lower = text.lower()
         
         # Use loaded grammar patterns
-        for pattern_def in self.config['grammar_patterns']:
-            try:
-                if re.search(pattern_def['pattern'], text_lower):
-                    errors.append({
-                        'type': pattern_def['name'],
-                        'example': pattern_def['example'],
-                        'severity': pattern_def['severity'],
-                        'pattern': pattern_def['name']
-                    })
-            except re.error as e:
-                logger.warning(f"Invalid regex pattern '{pattern_def['pattern']}': {e}")
-                continue
+        for hit in self._pattern_hits(text, 'grammar'):
+            errors.append({
+                'type': hit.definition['name'],
+                'example': hit.definition['example'],
+                'severity': hit.definition['severity'],
+                'pattern': hit.definition['name']
+            })
         
         # Fallback to hardcoded patterns if config is empty
         if not self.config['grammar_patterns']:
@@ -484,20 +492,14 @@ class AIDetector:
         text_lower = text.lower()
         
         # Use loaded phrasing patterns
-        for pattern_def in self.config['phrasing_patterns']:
-            try:
-                matches = re.findall(pattern_def['pattern'], text_lower)
-                if matches:
-                    examples.append({
-                        'type': pattern_def['name'],
-                        'example': pattern_def['example'],
-                        'reason': pattern_def['reason'],
-                        'severity': pattern_def['severity'],
-                        'matches': matches[:3]  # Show first 3 matches
-                    })
-            except re.error as e:
-                logger.warning(f"Invalid regex pattern '{pattern_def['pattern']}': {e}")
-                continue
+        for hit in self._pattern_hits(text, 'phrasing'):
+            examples.append({
+                'type': hit.definition['name'],
+                'example': hit.definition['example'],
+                'reason': hit.definition['reason'],
+                'severity': hit.definition['severity'],
+                'matches': list(hit.matches)  # First 3 matches
+            })
         
         # Fallback to hardcoded patterns if config is empty
         if not self.config['phrasing_patterns']:
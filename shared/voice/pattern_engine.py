@@ -0,0 +1,228 @@
+"""
+AI Pattern Engine - Precompiled matcher for the AI-detection pattern files.
+
+The engine compiles the pattern definitions of ai_detection_patterns.txt
+once (shared by all detectors built from the same definitions) and scans a
+text in one step:
+
+1. Literal screen: each pattern's required literals (strings every match must
+   contain, derived from the parsed regex) are looked up in the text once.
+   Patterns none of whose literals occur are skipped without running the regex.
+2. Only the remaining candidate patterns run, collecting exactly what
+   re.findall would return (first `limit` items per category).
+
+Invalid patterns are reported once at compile time instead of on every call.
+
+Usage:
+    from shared.voice.pattern_engine import get_pattern_engine
+
+    engine = get_pattern_engine(config, categories=('grammar', 'phrasing'))
+    scan = engine.scan(text.lower())
+    for hit in scan['phrasing']:
+        print(hit.definition['name'], hit.matches)
+"""
+
+import logging
+import re
+import threading
+from dataclasses import dataclass
+from itertools import islice
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple
+
+try:
+    from re import _constants as sre_constants, _parser as sre_parse
+except ImportError:  # Python < 3.11
+    import sre_constants
+    import sre_parse
+
+logger = logging.getLogger(__name__)
+
+# category -> (config key, max matches kept per hit; None keeps all)
+CATEGORIES: Dict[str, Tuple[str, Optional[int]]] = {
+    'grammar': ('grammar_patterns', 1),
+    'phrasing': ('phrasing_patterns', 3),
+    'linguistic': ('linguistic_patterns', None),
+}
+
+# Linguistic dimensions that are regexes; the others (MTLD, dependency length)
+# are pseudo-patterns describing metrics and are not matched against text
+REGEX_LINGUISTIC_MARKERS = ('formal_words', 'pronoun')
+
+# Shorter literals (single letters) would not screen anything out
+MIN_LITERAL_LENGTH = 2
+
+_REPEATS = {sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT}
+if hasattr(sre_constants, 'POSSESSIVE_REPEAT'):
+    _REPEATS.add(sre_constants.POSSESSIVE_REPEAT)
+
+
+def required_literals(pattern: str) -> Optional[FrozenSet[str]]:
+    """
+    Literal strings of which every match of pattern contains at least one.
+
+    Returns None when no useful set can be derived (case-insensitive
+    patterns, patterns built from character classes only, ...); such
+    patterns are always run.
+    """
+    try:
+        parsed = sre_parse.parse(pattern)
+    except (re.error, RecursionError):
+        return None
+    if parsed.state.flags & re.IGNORECASE:
+        return None
+    return _sequence_literals(parsed)
+
+
+def _selectivity(literals: FrozenSet[str]) -> Tuple[int, int]:
+    return (min(len(literal) for literal in literals), -len(literals))
+
+
+def _sequence_literals(items: Iterable[Tuple[Any, Any]]) -> Optional[FrozenSet[str]]:
+    """All items of a sequence must match, so any one item's literals are required; keep the most selective."""
+    best: Optional[FrozenSet[str]] = None
+    run: List[str] = []
+
+    def consider(literals: Optional[FrozenSet[str]]) -> None:
+        nonlocal best
+        if not literals or min(len(literal) for literal in literals) < MIN_LITERAL_LENGTH:
+            return
+        if best is None or _selectivity(literals) > _selectivity(best):
+            best = literals
+
+    for op, av in items:
+        if op is sre_constants.LITERAL:
+            run.append(chr(av))
+            continue
+        if run:
+            consider(frozenset([''.join(run)]))
+            run = []
+        consider(_node_literals(op, av))
+    if run:
+        consider(frozenset([''.join(run)]))
+    return best
+
+
+def _node_literals(op: Any, av: Any) -> Optional[FrozenSet[str]]:
+    if op is sre_constants.SUBPATTERN:
+        _group, add_flags, _del_flags, sub = av
+        if add_flags & re.IGNORECASE:
+            return None
+        return _sequence_literals(sub)
+    if op is sre_constants.BRANCH:
+        union = set()
+        for branch in av[1]:
+            literals = _sequence_literals(branch)
+            if literals is None:
+                return None
+            union.update(literals)
+        return frozenset(union)
+    if op in _REPEATS:
+        minimum, _maximum, sub = av
+        return _sequence_literals(sub) if minimum >= 1 else None
+    if op is getattr(sre_constants, 'ATOMIC_GROUP', None):
+        return _sequence_literals(av)
+    return None
+
+
+def _findall_item(match: 're.Match[str]', group_count: int) -> Any:
+    """The item re.findall returns for match."""
+    if group_count == 0:
+        return match.group(0)
+    if group_count == 1:
+        return match.group(1) or ''
+    return match.groups('')
+
+
+@dataclass(frozen=True)
+class CompiledPattern:
+    """One pattern definition compiled for scanning."""
+    category: str
+    definition: Dict[str, Any]
+    regex: 're.Pattern[str]'
+    literals: Optional[FrozenSet[str]]
+    limit: Optional[int]
+
+    def findall(self, text: str) -> List[Any]:
+        """re.findall(pattern, text), truncated to the category limit."""
+        group_count = self.regex.groups
+        found = (_findall_item(match, group_count) for match in self.regex.finditer(text))
+        return list(islice(found, self.limit) if self.limit is not None else found)
+
+
+@dataclass(frozen=True)
+class PatternHit:
+    """A pattern that matched, with its (possibly truncated) findall result."""
+    definition: Dict[str, Any]
+    matches: List[Any]
+
+
+class PatternEngine:
+    """Compiled pattern set for one detector configuration."""
+
+    def __init__(self, config: Dict[str, Any], categories: Sequence[str] = tuple(CATEGORIES)):
+        unknown = [category for category in categories if category not in CATEGORIES]
+        if unknown:
+            raise ValueError(f"Unknown pattern categories: {', '.join(unknown)}")
+        self.categories = tuple(categories)
+        self.patterns: List[CompiledPattern] = []
+        for category in self.categories:
+            key, limit = CATEGORIES[category]
+            for definition in config.get(key, []):
+                if category == 'linguistic' and not any(
+                    marker in definition['name'] for marker in REGEX_LINGUISTIC_MARKERS
+                ):
+                    continue
+                try:
+                    regex = re.compile(definition['pattern'])
+                except re.error as e:
+                    logger.warning(f"Invalid regex pattern '{definition['pattern']}': {e}")
+                    continue
+                self.patterns.append(CompiledPattern(
+                    category=category,
+                    definition=definition,
+                    regex=regex,
+                    literals=required_literals(definition['pattern']),
+                    limit=limit,
+                ))
+        self._literals = sorted({
+            literal for pattern in self.patterns if pattern.literals for literal in pattern.literals
+        })
+
+    def candidates(self, text: str) -> List[CompiledPattern]:
+        """Patterns that can match text according to the literal screen."""
+        present = {literal for literal in self._literals if literal in text}
+        return [
+            pattern for pattern in self.patterns
+            if pattern.literals is None or not pattern.literals.isdisjoint(present)
+        ]
+
+    def scan(self, text: str) -> Dict[str, List[PatternHit]]:
+        """
+        Every pattern hit in text, per category, in definition order.
+
+        Callers pass the text exactly as the patterns expect it (the
+        detectors match against text.lower()).
+        """
+        hits: Dict[str, List[PatternHit]] = {category: [] for category in self.categories}
+        for pattern in self.candidates(text):
+            matches = pattern.findall(text)
+            if matches:
+                hits[pattern.category].append(PatternHit(pattern.definition, matches))
+        return hits
+
+
+_engines: Dict[Tuple[Any, ...], PatternEngine] = {}
+_engines_lock = threading.Lock()
+
+
+def get_pattern_engine(config: Dict[str, Any], categories: Sequence[str] = tuple(CATEGORIES)) -> PatternEngine:
+    """Shared engine for config's pattern definitions (compiled once per distinct set)."""
+    key = tuple(
+        (category, tuple(tuple(sorted(definition.items())) for definition in config.get(CATEGORIES[category][0], [])))
+        for category in categories if category in CATEGORIES
+    ) + (tuple(categories),)
+    with _engines_lock:
+        engine = _engines.get(key)
+        if engine is None:
+            engine = _engines[key] = PatternEngine(config, categories)
+        return engine
@@ -118,6 +118,59 @@ def prod_frontmatter():
     return PROD_ROOT / 'frontmatter'
 
 
+# ============================================================================
+# Source Data Fixtures
+# ============================================================================
+
+SYNTHETIC_SETTINGS_ITEMS = [
+    ('aluminum', 'Aluminum', 'metal'),
+    ('brass', 'Brass', 'metal'),
+    ('copper', 'Copper', 'metal'),
+    ('steel', 'Steel', 'metal'),
+    ('granite', 'Granite', 'stone'),
+    ('marble', 'Marble', 'stone'),
+    ('oak', 'Oak', 'wood'),
+    ('birch', 'Birch', 'wood'),
+    ('glass', 'Glass', 'glass'),
+    ('nylon', 'Nylon', 'plastic'),
+]
+
+
+@pytest.fixture
+def settings_adapter(tmp_path):
+    """Settings DomainAdapter on a small synthetic Settings.yaml in tmp_path."""
+    import copy
+    import yaml
+    from generation.core.adapters.domain_adapter import DomainAdapter
+
+    items = {
+        f"{slug}-settings": {
+            'id': f"{slug}-settings",
+            'name': name,
+            'category': category,
+            'author': {'id': index % 4 + 1},
+            'pageDescription': f"{name} cleans well at moderate fluence with a short pulse width.",
+        }
+        for index, (slug, name, category) in enumerate(SYNTHETIC_SETTINGS_ITEMS)
+    }
+    data_path = tmp_path / "Settings.yaml"
+    with open(data_path, 'w', encoding='utf-8') as f:
+        yaml.safe_dump({'schemaVersion': '5.0.0', 'settings': items}, f, sort_keys=False, allow_unicode=True)
+
+    config = copy.deepcopy(DomainAdapter('settings').config)
+    config['data_adapter']['data_path'] = str(data_path)
+    return DomainAdapter('settings', config_override=config)
+
+
+@pytest.fixture
+def postprocess_command(settings_adapter):
+    """Source-data-only PostprocessCommand for settings pageDescription (no API clients)."""
+    from shared.commands.postprocess import PostprocessCommand
+
+    return PostprocessCommand('settings', 'pageDescription', domain_adapter=settings_adapter,
+                              load_generators=False)
+
+
 @pytest.fixture(scope="session")
 def all_domain_configs():
     """Load all domain configs once per test session"""
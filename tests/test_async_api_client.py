@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Test AsyncAPIClient
+===================
+Tests bounded concurrent requests, shared provider limits, retries of
+rate-limited responses and the synchronous facade.
+"""
+
+import asyncio
+import json
+import threading
+import time
+
+import pytest
+import requests
+
+from shared.api.async_client import AsyncAPIClient, AsyncTokenBucket, reset_provider_limits
+from shared.api.client import GenerationRequest
+
+
+def _config(**overrides):
+    config = {
+        "api_key": "test-key",
+        "base_url": "https://api.example.test",
+        "model": "deepseek-chat",
+        "timeout_connect": 1,
+        "timeout_read": 1,
+        "max_retries": 2,
+        "retry_delay": 0.01,
+    }
+    config.update(overrides)
+    return config
+
+
+def _http_response(status_code=200, content="ok", headers=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update(headers or {})
+    if status_code == 200:
+        body = {
+            "model": "deepseek-chat",
+            "choices": [{"message": {"content": content}}],
+            "usage": {"total_tokens": 3, "prompt_tokens": 1, "completion_tokens": 2},
+        }
+    else:
+        body = {"error": {"message": "slow down"}}
+    response._content = json.dumps(body).encode("utf-8")
+    return response
+
+
+class FakeTransport:
+    """Stands in for Session.post; records peak concurrency."""
+
+    def __init__(self, delay=0.05, responses=None):
+        self.delay = delay
+        self.responses = list(responses or [])
+        self.active = 0
+        self.max_active = 0
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, url, json=None, timeout=None):
+        with self._lock:
+            self.calls += 1
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+            response = self.responses.pop(0) if self.responses else _http_response(content=json["messages"][-1]["content"])
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        return response
+
+
+@pytest.fixture(autouse=True)
+def _fresh_limits():
+    reset_provider_limits()
+    yield
+    reset_provider_limits()
+
+
+def _requests(count):
+    return [GenerationRequest(prompt=f"prompt-{n}", max_tokens=10, temperature=0.5) for n in range(count)]
+
+
+def test_generate_many_overlaps_requests_within_limit():
+    client = AsyncAPIClient(config=_config(), max_concurrency=3)
+    transport = FakeTransport(delay=0.05)
+    client.session.post = transport
+
+    start = time.monotonic()
+    responses = client.generate_many(_requests(6))
+    elapsed = time.monotonic() - start
+    client.close()
+
+    assert [r.content for r in responses] == [f"prompt-{n}" for n in range(6)]
+    assert transport.max_active == 3
+    assert elapsed < 6 * 0.05
+    assert client.stats["successful_requests"] == 6
+
+
+def test_clients_for_same_provider_share_concurrency_limit():
+    first = AsyncAPIClient(config=_config(), max_concurrency=2)
+    second = AsyncAPIClient(config=_config(), max_concurrency=2)
+    transport = FakeTransport(delay=0.05)
+    first.session.post = transport
+    second.session.post = transport
+
+    async def run_both():
+        return await asyncio.gather(
+            first.agenerate_many(_requests(3)),
+            second.agenerate_many(_requests(3)),
+        )
+
+    asyncio.run(run_both())
+    assert transport.max_active == 2
+
+
+def test_sync_generate_from_many_threads_respects_provider_limit():
+    """Each sync call runs its own event loop; the limit still holds across them."""
+    clients = [AsyncAPIClient(config=_config(), max_concurrency=2) for _ in range(2)]
+    transport = FakeTransport(delay=0.05)
+    for client in clients:
+        client.session.post = transport
+
+    requests_ = _requests(8)
+    threads = [
+        threading.Thread(target=clients[n % 2].generate, args=(request,))
+        for n, request in enumerate(requests_)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    for client in clients:
+        client.close()
+
+    assert transport.calls == 8
+    assert transport.max_active == 2
+
+
+def test_rate_limited_response_is_retried():
+    client = AsyncAPIClient(config=_config())
+    transport = FakeTransport(delay=0, responses=[_http_response(429, headers={"Retry-After": "0"})])
+    client.session.post = transport
+
+    response = client.generate(_requests(1)[0])
+
+    assert response.success
+    assert response.retry_count == 1
+    assert transport.calls == 2
+
+
+def test_connection_errors_exhaust_retries():
+    client = AsyncAPIClient(config=_config(max_retries=1))
+
+    def refuse(*args, **kwargs):
+        raise requests.exceptions.ConnectionError("refused")
+
+    client.session.post = refuse
+    response = client.generate(_requests(1)[0])
+
+    assert not response.success
+    assert response.retry_count == 1
+    assert "ConnectionError" in response.error
+    assert client.stats["failed_requests"] == 1
+
+
+def test_sync_facade_rejected_inside_event_loop():
+    client = AsyncAPIClient(config=_config())
+
+    async def call_sync():
+        client.generate(_requests(1)[0])
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(call_sync())
+
+
+def test_token_bucket_spaces_requests():
+    bucket = AsyncTokenBucket(requests_per_minute=1200)  # one per 50ms
+
+    async def acquire_three():
+        for _ in range(3):
+            await bucket.acquire()
+
+    start = time.monotonic()
+    asyncio.run(acquire_three())
+    assert time.monotonic() - start >= 0.09
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Test Backfill Engine
+====================
+Tests concurrent populate() runs, journal resume after a crash, periodic
+flushes and rate-limit retries in BaseBackfillGenerator.backfill_all().
+"""
+
+import copy
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from generation.backfill.base import BaseBackfillGenerator
+from generation.backfill.engine import BackfillJournal, RequestRateLimiter
+from generation.core.adapters.domain_adapter import DomainAdapter
+
+
+class TagBackfill(BaseBackfillGenerator):
+    """Writes 'tag: <item_id>-tagged'; can fail on demand."""
+
+    def __init__(self, config, fail_on=(), delay=0.0):
+        super().__init__(config)
+        self.fail_on = set(fail_on)
+        self.delay = delay
+        self.calls = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def populate(self, item_data):
+        item_id = item_data['name']
+        with self._lock:
+            self.calls.append(item_id)
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(self.delay)
+            if item_id in self.fail_on:
+                raise RuntimeError(f"boom {item_id}")
+            item_data[self.field] = f"{item_id}-tagged"
+            return item_data
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+@pytest.fixture
+def source_file(tmp_path):
+    path = tmp_path / "Items.yaml"
+    items = {f"item-{n}": {'name': f"item-{n}"} for n in range(6)}
+    path.write_text(yaml.safe_dump({'items': items}, sort_keys=False), encoding='utf-8')
+    return path
+
+
+def _config(source_file, **overrides):
+    config = {
+        'source_file': str(source_file),
+        'items_key': 'items',
+        'field': 'tag',
+        'dry_run': False,
+    }
+    config.update(overrides)
+    return config
+
+
+def _tags(source_file):
+    items = yaml.safe_load(source_file.read_text(encoding='utf-8'))['items']
+    return {item_id: item.get('tag') for item_id, item in items.items()}
+
+
+def test_concurrent_backfill_populates_all_items(source_file):
+    """Workers run populate() concurrently and every result is written."""
+    generator = TagBackfill(_config(source_file, concurrency=3), delay=0.05)
+    stats = generator.backfill_all()
+
+    assert stats['modified'] == 6
+    assert generator.max_active > 1
+    assert _tags(source_file) == {f"item-{n}": f"item-{n}-tagged" for n in range(6)}
+    # Source order preserved in the written file
+    assert list(_tags(source_file)) == [f"item-{n}" for n in range(6)]
+    assert not generator.get_journal().exists()
+
+
+def test_interrupted_run_resumes_from_journal(source_file):
+    """Items completed before an interruption are not populated again."""
+    first = TagBackfill(_config(source_file, flush_every=100))
+    original_populate = first.populate
+
+    def interrupt_at_item_2(item_data):
+        if item_data['name'] == 'item-2':
+            raise KeyboardInterrupt
+        return original_populate(item_data)
+
+    first.populate = interrupt_at_item_2
+    with pytest.raises(KeyboardInterrupt):
+        first.backfill_all()
+    journal = first.get_journal()
+    assert journal.exists()
+    assert not any(_tags(source_file).values())
+
+    second = TagBackfill(_config(source_file))
+    stats = second.backfill_all()
+
+    assert stats['resumed'] == 2
+    assert 'item-0' not in second.calls and 'item-1' not in second.calls
+    assert all(tag == f"{item_id}-tagged" for item_id, tag in _tags(source_file).items())
+    assert not journal.exists()
+
+
+def test_failed_items_do_not_block_completion(source_file):
+    generator = TagBackfill(_config(source_file, concurrency=2), fail_on={'item-4'})
+    stats = generator.backfill_all()
+    assert stats['errors'] == 1
+    assert stats['modified'] == 5
+    assert _tags(source_file)['item-4'] is None
+
+
+def test_periodic_flush_writes_source_during_run(source_file):
+    """The source file is rewritten every flush_every completions."""
+    generator = TagBackfill(_config(source_file, flush_every=2))
+    writes = []
+    original_write = generator._write_source
+    generator._write_source = lambda data: (writes.append(1), original_write(data))
+    generator.backfill_all()
+    assert len(writes) == 3
+
+
+def test_dry_run_does_not_journal_or_write(source_file):
+    before = source_file.read_text(encoding='utf-8')
+    generator = TagBackfill(_config(source_file, dry_run=True, concurrency=2))
+    stats = generator.backfill_all()
+    assert stats['modified'] == 6
+    assert source_file.read_text(encoding='utf-8') == before
+    assert not generator.get_journal().exists()
+
+
+def test_rate_limit_errors_are_retried(source_file):
+    class FlakyBackfill(TagBackfill):
+        def populate(self, item_data):
+            if item_data['name'] == 'item-2' and 'item-2' not in self.calls:
+                self.calls.append('item-2')
+                raise RuntimeError("HTTP 429: Too Many Requests")
+            return super().populate(item_data)
+
+    generator = FlakyBackfill(_config(source_file, rate_limit_backoff=0.01))
+    stats = generator.backfill_all()
+    assert stats['errors'] == 0
+    assert _tags(source_file)['item-2'] == 'item-2-tagged'
+
+
+class AdapterBackfill(BaseBackfillGenerator):
+    """Writes pageDescription through a DomainAdapter, like UniversalTextGenerator."""
+
+    def __init__(self, config, adapter):
+        super().__init__(config)
+        self.adapter = adapter
+
+    def concurrent_write_scope(self):
+        return self.adapter.session_scope()
+
+    def populate(self, item_data):
+        text = f"Generated description for {item_data['id']}."
+        time.sleep(0.01)
+        self.adapter.write_component(item_data['id'], 'pageDescription', text)
+        item_data['pageDescription'] = text
+        return item_data
+
+
+@patch('generation.utils.frontmatter_sync.sync_field_to_frontmatter')
+def test_concurrent_backfill_with_adapter_writes_keeps_every_item(mock_sync, tmp_path):
+    """populate() writing the same source file from 4 workers loses nothing."""
+    base = DomainAdapter('settings')
+    data = yaml.safe_load(base.data_path.read_text(encoding='utf-8'))
+    item_ids = list(data['settings'])[:12]
+    data['settings'] = {item_id: data['settings'][item_id] for item_id in item_ids}
+    for item in data['settings'].values():
+        item.pop('pageDescription', None)
+    data_copy = tmp_path / "Settings.yaml"
+    data_copy.write_text(yaml.safe_dump(data, sort_keys=False, allow_unicode=True), encoding='utf-8')
+
+    config = copy.deepcopy(base.config)
+    config['data_adapter']['data_path'] = str(data_copy)
+    adapter = DomainAdapter('settings', config_override=config)
+    generator = AdapterBackfill(
+        {
+            'source_file': str(data_copy),
+            'items_key': 'settings',
+            'field': 'pageDescription',
+            'dry_run': False,
+            'concurrency': 4,
+            'flush_every': 3,
+        },
+        adapter,
+    )
+    try:
+        stats = generator.backfill_all()
+    finally:
+        DomainAdapter._sessions.pop(adapter._session_key(), None)
+
+    assert stats['modified'] == len(item_ids)
+    assert stats['errors'] == 0
+    items = yaml.safe_load(data_copy.read_text(encoding='utf-8'))['settings']
+    assert list(items) == item_ids
+    for item_id in item_ids:
+        assert items[item_id]['pageDescription'] == f"Generated description for {item_id}."
+    assert not adapter.get_journal_path().exists()
+
+
+def test_invalid_concurrency_rejected(source_file):
+    with pytest.raises(ValueError):
+        TagBackfill(_config(source_file, concurrency=0))
+
+
+def test_journal_ignores_truncated_line(tmp_path):
+    journal = BackfillJournal(tmp_path / ".x.journal.jsonl")
+    journal.append('a', {'v': 1})
+    with open(journal.journal_path, 'a', encoding='utf-8') as f:
+        f.write('{"item_id": "b", "item_y')
+    assert list(journal.entries()) == [('a', {'v': 1})]
+
+
+def test_rate_limiter_spaces_requests():
+    limiter = RequestRateLimiter(requests_per_minute=1200)  # one per 50ms
+    start = time.monotonic()
+    for _ in range(3):
+        limiter.acquire()
+    assert time.monotonic() - start >= 0.09
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Test CLI Import Budget
+======================
+Tests that starting the CLI only imports what argument parsing needs: command
+modules, API clients and validators are loaded by the command that uses them,
+and the shared.commands / shared.api / shared.validation packages export
+their names lazily.
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# Modules no quick command may load
+HEAVY_MODULES = [
+    'scipy',
+    'export.core.frontmatter_exporter',
+    'export.performance',
+    'shared.api.client',
+    'shared.commands.global_evaluation',
+    'shared.commands.postprocess',
+    'shared.utils.quality_analyzer',
+    'shared.validation.validator',
+]
+
+
+def _python(*args):
+    return subprocess.run(
+        [sys.executable, *args], cwd=PROJECT_ROOT, capture_output=True, text=True, timeout=120,
+    )
+
+
+HELP_SCRIPT = '''
+import json, runpy, sys
+sys.argv = ['run.py', '--help']
+try:
+    runpy.run_path('run.py', run_name='__main__')
+except SystemExit as exit_:
+    code = exit_.code
+print(json.dumps({'exit_code': code, 'modules': sorted(sys.modules)}))
+'''
+
+
+def test_help_does_not_import_heavy_modules():
+    result = _python('-c', HELP_SCRIPT)
+    assert result.returncode == 0, result.stderr
+    assert '--list-materials' in result.stdout
+
+    output = json.loads(result.stdout.strip().splitlines()[-1])
+    assert output['exit_code'] in (0, None)
+    names = output['modules']
+    loaded_heavy = [m for m in HEAVY_MODULES if m in names or any(n.startswith(m + '.') for n in names)]
+    assert loaded_heavy == []
+
+
+def test_packages_export_lazily():
+    script = '''
+import json, sys
+import run, legacy.run, shared.api, shared.commands, shared.validation
+before = sorted(m for m in sys.modules if m.startswith(('shared.api.', 'shared.commands.', 'shared.validation.')))
+from shared.validation import ValidationSchema
+resolved = {
+    'validation': ValidationSchema.__module__,
+    'api': shared.api.get_component_client.__module__,
+    'commands': shared.commands.deploy_to_production.__module__,
+    'in_dir': 'create_api_client' in dir(shared.api),
+}
+try:
+    shared.commands.no_such_handler
+except AttributeError:
+    resolved['missing'] = 'AttributeError'
+print(json.dumps({'before': before, 'resolved': resolved}))
+'''
+    result = _python('-c', script)
+    assert result.returncode == 0, result.stderr
+    output = json.loads(result.stdout.strip().splitlines()[-1])
+    assert output['before'] == []
+    assert output['resolved'] == {
+        'validation': 'shared.validation.validation_schema',
+        'api': 'shared.api.client_manager',
+        'commands': 'shared.commands.deployment',
+        'in_dir': True,
+        'missing': 'AttributeError',
+    }
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Test Contamination Compatibility Matrix
+=======================================
+Tests that ContaminationPatternSelector answers validity from a precomputed,
+persisted material × pattern matrix that matches the direct rule evaluation
+and is rebuilt when either source file or the rule code changes.
+"""
+
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from domains.materials.image.research.compatibility_matrix import CompatibilityMatrix
+from domains.materials.image.research.contamination_pattern_selector import ContaminationPatternSelector
+
+PATTERNS = {
+    'rust-oxidation': {'name': 'Rust', 'valid_materials': ['Steel', 'Iron'], 'commonality_score': 80},
+    'copper-patina': {'name': 'Patina', 'valid_materials': ['Copper', 'Bronze'], 'commonality_score': 70},
+    'environmental-dust': {'name': 'Dust', 'valid_materials': ['ALL'], 'commonality_score': 90},
+    'industrial-oil': {'name': 'Oil', 'valid_materials': ['Steel', 'Aluminum'], 'commonality_score': 60},
+    'wood-rot': {'name': 'Rot', 'valid_materials': ['Oak', 'Pine'], 'commonality_score': 50},
+    'uv-chalking': {
+        'name': 'Chalking', 'valid_materials': ['ALL'], 'invalid_materials': ['Stainless Steel'],
+        'commonality_score': 40,
+    },
+    'scale-buildup': {'name': 'Scale', 'valid_materials': ['stainless_steel_316'], 'commonality_score': 55},
+}
+
+MATERIALS = {
+    'stainless-steel-316-laser-cleaning': {
+        'name': 'Stainless Steel 316', 'category': 'metal',
+        'contamination': {'valid': ['scale_buildup'], 'prohibited': ['industrial_oil']},
+    },
+    'aluminum-laser-cleaning': {'name': 'Aluminum', 'category': 'metal'},
+    'bronze-laser-cleaning': {'name': 'Bronze', 'category': 'metal'},
+    'oak-laser-cleaning': {'name': 'Oak', 'category': 'wood'},
+}
+
+
+@pytest.fixture
+def source_files(tmp_path):
+    contaminants = tmp_path / 'contaminants.yaml'
+    materials = tmp_path / 'Materials.yaml'
+    contaminants.write_text(yaml.safe_dump({'contamination_patterns': PATTERNS}))
+    materials.write_text(yaml.safe_dump({'materials': MATERIALS}))
+    return contaminants, materials
+
+
+def _selector(source_files, tmp_path):
+    contaminants, materials = source_files
+    return ContaminationPatternSelector(contaminants, materials, cache_dir=tmp_path / 'cache')
+
+
+def _direct_valid_patterns(selector, material_name):
+    """The per-call rule evaluation the matrix replaces."""
+    return [
+        pattern_id for pattern_id, pattern in selector._load_data()['contamination_patterns'].items()
+        if selector._is_pattern_valid_for_material(pattern_id, pattern, material_name)
+        and selector._material_matches_valid_list(material_name, pattern.get('valid_materials', []))
+    ]
+
+
+@pytest.mark.parametrize('material_name', [
+    'Stainless Steel 316', 'stainless-steel-316-laser-cleaning', 'Aluminum', 'BRONZE', 'Oak',
+    'Carbon Steel', 'Unlisted Polymer',
+])
+def test_matrix_matches_direct_rules(source_files, tmp_path, material_name):
+    selector = _selector(source_files, tmp_path)
+    assert selector.get_valid_patterns_for_material(material_name) == _direct_valid_patterns(selector, material_name)
+
+
+def test_physics_rules_and_material_rules(source_files, tmp_path):
+    selector = _selector(source_files, tmp_path)
+    matrix = selector.get_compatibility_matrix()
+    assert not matrix.is_valid('Aluminum', 'rust-oxidation')
+    assert matrix.is_valid('Bronze', 'copper-patina')
+    assert 'uv-chalking' not in selector.get_valid_patterns_for_material('Stainless Steel')
+    assert matrix.row('Stainless Steel') is not None
+    assert matrix.is_valid('stainless-steel-316-laser-cleaning', 'scale-buildup')
+    assert selector._get_material_contamination_rules('stainless-steel-316-laser-cleaning') == {
+        'valid': ['scale-buildup'], 'prohibited': ['industrial-oil'],
+    }
+    assert selector._get_material_contamination_rules('Aluminum') == {'valid': [], 'prohibited': []}
+
+    with patch('builtins.print'):
+        selected = selector.select_patterns('stainless-steel-316-laser-cleaning', num_patterns=5)
+    selected_ids = [result['pattern_id'] for result in selected]
+    assert 'industrial-oil' not in selected_ids
+    assert 'copper-patina' not in selected_ids
+
+
+def test_matrix_persists_and_rebuilds_on_change(source_files, tmp_path):
+    contaminants, materials = source_files
+    first = _selector(source_files, tmp_path)
+    built = first.get_compatibility_matrix()
+    cache_path = CompatibilityMatrix.cache_path(contaminants, materials, tmp_path / 'cache')
+    assert cache_path.exists()
+
+    second = _selector(source_files, tmp_path)
+    with patch.object(ContaminationPatternSelector, '_build_compatibility_matrix') as build, \
+            patch.object(ContaminationPatternSelector, '_load_materials_data') as load_materials:
+        loaded = second.get_compatibility_matrix()
+        assert second.get_valid_patterns_for_material('Oak') == first.get_valid_patterns_for_material('Oak')
+    build.assert_not_called()
+    load_materials.assert_not_called()
+    assert loaded.content_hash == built.content_hash
+    assert len(loaded) == len(built)
+
+    changed = dict(PATTERNS)
+    changed['mold-mildew'] = {'name': 'Mold', 'valid_materials': ['Oak']}
+    contaminants.write_text(yaml.safe_dump({'contamination_patterns': changed}))
+    third = _selector(source_files, tmp_path)
+    assert third.get_compatibility_matrix().content_hash != built.content_hash
+    assert 'mold-mildew' in third.get_valid_patterns_for_material('Oak')
+
+
+def test_matrix_rebuilds_when_rule_code_changes(source_files, tmp_path, monkeypatch):
+    """Editing the validity rules invalidates the persisted matrix."""
+    import domains.materials.image.research.contamination_pattern_selector as selector_module
+
+    rule_source = tmp_path / 'rules.py'
+    rule_source.write_text("RULES = 1\n")
+    monkeypatch.setattr(selector_module, 'MATRIX_RULE_SOURCES', (rule_source,))
+    built = _selector(source_files, tmp_path).get_compatibility_matrix()
+
+    rule_source.write_text("RULES = 2\n")
+    with patch.object(ContaminationPatternSelector, '_build_compatibility_matrix') as build:
+        build.return_value = CompatibilityMatrix('rebuilt')
+        _selector(source_files, tmp_path).get_compatibility_matrix()
+    build.assert_called_once()
+    assert build.call_args.args[0] != built.content_hash
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Test ContentGenerator task plan
+===============================
+Tests that the task list is compiled once (handlers resolved, config files
+loaded, adjacent tree rewrites fused) and that the fused traversal returns
+what the sequential tasks return.
+"""
+
+import builtins
+import copy
+
+import pytest
+
+from export.generation.universal_content_generator import ContentGenerator
+
+FRONTMATTER = {
+    'id': 'aluminum-laser-cleaning',
+    'name': 'Aluminum',
+    'page_title': {'title': 'Aluminum Laser Cleaning'},
+    'page_description': '### Description: Aluminum cleans well.',
+    'content_type': 'material',
+    'properties': {
+        'materialCharacteristics': {
+            '_section': {'sectionTitle': 'Characteristics', 'sectionDescription': {'description': 'Physical properties'}},
+            'density': {'value': 2.7, 'image_url': '/img.png'},
+        },
+    },
+    'relationships': {
+        'safety': {'regulatoryStandards': {'items': [{'display_name': 'FDA', 'page_title': 'FDA'}]}},
+    },
+}
+
+TEXT = {'type': 'text_field_normalization', 'fields': ['page_description', 'pageDescription']}
+CAMEL = {'type': 'camelcase_normalization'}
+
+
+def _sequential(frontmatter):
+    generator = ContentGenerator({})
+    frontmatter = generator._task_text_field_normalization(frontmatter, TEXT)
+    return generator._task_camelcase_normalization(frontmatter, CAMEL)
+
+
+def test_adjacent_tree_rewrites_are_fused():
+    generator = ContentGenerator({'tasks': [{'type': 'slug_generation'}, TEXT, CAMEL, {'type': 'timestamp'}]})
+    assert [step.task_type for step in generator.plan] == [
+        'slug_generation', 'text_field_normalization+camelcase_normalization', 'timestamp'
+    ]
+    fused = ContentGenerator({'tasks': [TEXT, CAMEL]}).generate(copy.deepcopy(FRONTMATTER))
+    assert fused == _sequential(copy.deepcopy(FRONTMATTER))
+    assert list(fused) == list(_sequential(copy.deepcopy(FRONTMATTER)))
+    assert fused['pageTitle'] == 'Aluminum Laser Cleaning'
+    assert fused['pageDescription'] == 'Aluminum cleans well.'
+
+
+def test_non_adjacent_tree_rewrites_stay_separate():
+    generator = ContentGenerator({'tasks': [CAMEL, TEXT, {'type': 'slug_generation'}, CAMEL]})
+    assert [step.task_type for step in generator.plan] == [
+        'camelcase_normalization', 'text_field_normalization', 'slug_generation', 'camelcase_normalization'
+    ]
+
+
+def test_invalid_tasks_are_rejected_up_front():
+    generator = ContentGenerator({'tasks': [
+        {'type': 'no_such_task'},
+        {'type': 'seo_description', 'source_field': 'description'},
+        {'type': 'slug_generation'},
+    ]})
+    assert [step.task_type for step in generator.plan] == ['slug_generation']
+    with pytest.raises(ValueError):
+        ContentGenerator({'tasks': [{'type': 'relationships', 'required': True}]})
+
+
+def test_items_are_exported_without_disk_reads(tmp_path, monkeypatch):
+    config_file = tmp_path / 'sections.yaml'
+    config_file.write_text(
+        "sections:\n  properties.materialCharacteristics:\n    sectionTitle: Material Characteristics\n    icon: wrench\n"
+    )
+    generator = ContentGenerator({'tasks': [
+        {'type': 'section_metadata', 'config_file': str(config_file), 'required': True},
+        {'type': 'field_ordering', 'domain': 'settings', 'required': True},
+    ]})
+    expected = generator.generate(copy.deepcopy(FRONTMATTER))
+
+    def _no_open(*args, **kwargs):
+        raise AssertionError(f"unexpected file read: {args[0]}")
+
+    monkeypatch.setattr(builtins, 'open', _no_open)
+    assert generator.generate(copy.deepcopy(FRONTMATTER)) == expected
+    assert expected['properties']['materialCharacteristics']['_section']['icon'] == 'wrench'
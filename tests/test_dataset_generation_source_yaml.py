@@ -610,6 +610,74 @@ class TestDataConsistency:
         pass
 
 
+class TestInProcessGeneration:
+    """Test DatasetGenerator on already-loaded domain data (no subprocess)"""
+
+    TIER1_SETTINGS = {
+        param: {'min': 1, 'max': 10, 'value': 5, 'unit': 'u'}
+        for param in (
+            'laserPower', 'wavelength', 'spotSize', 'frequency',
+            'pulseWidth', 'scanSpeed', 'passCount', 'overlapRatio'
+        )
+    }
+
+    def _domain_data(self):
+        materials_data = {
+            'materials': {
+                f"{name}-laser-cleaning": {
+                    'name': name.title(),
+                    'category': 'metal',
+                    'subcategory': 'non-ferrous',
+                }
+                for name in ('aluminum', 'copper', 'zinc')
+            }
+        }
+        settings_data = {
+            'settings': {
+                f"{name}-settings": {'machineSettings': self.TIER1_SETTINGS}
+                for name in ('aluminum', 'copper')
+            }
+        }
+        return materials_data, settings_data
+
+    def test_from_domain_data_does_not_mutate_input(self):
+        """Machine settings are merged into copies of the loaded items"""
+        import copy
+        from shared.dataset import MaterialsDataset
+
+        materials_data, settings_data = self._domain_data()
+        original = copy.deepcopy(materials_data)
+        dataset = MaterialsDataset.from_domain_data(materials_data, settings_data)
+
+        materials = dataset.get_all_materials()
+        assert materials['aluminum-laser-cleaning']['machine_settings'] == self.TIER1_SETTINGS
+        assert 'machine_settings' not in materials['zinc-laser-cleaning']
+        assert materials_data == original
+
+    def test_generate_from_loaded_data(self, tmp_path):
+        """All formats written per item; failures counted per item"""
+        from scripts.export.generate_datasets import DatasetGenerator
+
+        materials_data, settings_data = self._domain_data()
+        generator = DatasetGenerator(
+            str(tmp_path),
+            materials_data=materials_data,
+            settings_data=settings_data,
+            workers=2,
+            quiet=True
+        )
+        generator.generate_all(domain='materials', show_summary=False)
+
+        # zinc has no settings → Tier 1 violation, reported without stopping others
+        assert generator.stats['materials'] == {'generated': 2, 'skipped': 0, 'errors': 1}
+        output_dir = tmp_path / 'public' / 'datasets' / 'materials'
+        for slug in ('aluminum', 'copper'):
+            for ext in ('json', 'csv', 'txt'):
+                assert (output_dir / f"{slug}-material-dataset.{ext}").exists()
+        dataset = json.loads((output_dir / 'aluminum-material-dataset.json').read_text(encoding='utf-8'))
+        assert dataset['version'] == '3.0'
+
+
 class TestPerformance:
     """Test generation performance"""
     
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Test DomainAssociationsValidator Indexing
+=========================================
+Tests that indexed association lookups match the association list and that
+memoized linkage results are isolated from callers.
+"""
+
+from shared.validation.domain_associations import DomainAssociationsValidator
+
+
+def _assoc(source_domain, source_id, target_domain, target_id, relationship_type):
+    return {
+        'source_domain': source_domain,
+        'source_id': source_id,
+        'target_domain': target_domain,
+        'target_id': target_id,
+        'relationship_type': relationship_type,
+    }
+
+
+def _validator():
+    validator = DomainAssociationsValidator()
+    validator.data = {
+        'material_to_contaminant': {'aluminum': ['rust-oxidation', 'oil-film']},
+        'associations': [
+            _assoc('materials', 'aluminum', 'contaminants', 'rust-oxidation', 'can_have_contamination'),
+            _assoc('contaminants', 'rust-oxidation', 'compounds', 'iron-oxide-compound', 'generates_byproduct'),
+            _assoc('contaminants', 'rust-oxidation', 'compounds', 'carbon-monoxide-compound', 'generates_byproduct'),
+            _assoc('contaminants', 'oil-film', 'compounds', 'carbon-monoxide-compound', 'generates_byproduct'),
+            _assoc('contaminants', 'oil-film', 'materials', 'aluminum', 'generates_byproduct'),
+        ],
+    }
+    validator.contaminants_data = {
+        'contaminants': {
+            'rust-oxidation-contamination': {'name': 'Rust', 'category': 'oxidation', 'subcategory': 'ferrous'},
+            'oil-film-contamination': {'name': 'Oil Film', 'category': 'organic', 'subcategory': 'oils'},
+        }
+    }
+    validator.compounds_data = {
+        'compounds': {
+            'iron-oxide': {'category': 'metal-oxide', 'subcategory': 'iron', 'full_path': '/compounds/iron-oxide'},
+            'carbon-monoxide': {'category': 'gas', 'subcategory': 'toxic', 'full_path': '/compounds/carbon-monoxide'},
+        }
+    }
+    return validator
+
+
+def test_indexed_lookups_follow_file_order():
+    """Adjacency lookups return entries in associations-list order."""
+    validator = _validator()
+    compounds = validator.get_associations('contaminants', 'rust-oxidation', 'generates_byproduct')
+    assert [a['target_id'] for a in compounds] == ['iron-oxide-compound', 'carbon-monoxide-compound']
+    assert validator.get_associations(
+        'contaminants', 'oil-film', 'generates_byproduct', target_domain='compounds'
+    ) == [validator.data['associations'][3]]
+    assert validator.get_association(
+        'materials', 'aluminum', 'can_have_contamination', 'contaminants', 'rust-oxidation'
+    ) is validator.data['associations'][0]
+    assert validator.get_association(
+        'materials', 'aluminum', 'can_have_contamination', 'contaminants', 'oil-film'
+    ) is None
+
+
+def test_compounds_for_contaminant_filters_target_domain():
+    """Only compound targets are returned, with the -contamination suffix ignored."""
+    validator = _validator()
+    compounds = validator.get_compounds_for_contaminant('oil-film-contamination')
+    assert [c['id'] for c in compounds] == ['carbon-monoxide-compound']
+
+
+def test_compounds_for_material_is_transitive_and_deduplicated():
+    """Material → contaminant → compound, first-seen order, no duplicates."""
+    validator = _validator()
+    compounds = validator.get_compounds_for_material('aluminum-laser-cleaning')
+    assert [c['id'] for c in compounds] == ['iron-oxide-compound', 'carbon-monoxide-compound']
+
+
+def test_memoized_results_are_copies_and_reset_on_reload():
+    """Mutating a returned linkage does not leak into later calls."""
+    validator = _validator()
+    first = validator.get_contaminants_for_material('aluminum')
+    first[0]['title'] = 'Changed'
+    assert validator.get_contaminants_for_material('aluminum')[0]['title'] == 'Rust'
+
+    validator.data = dict(validator.data, material_to_contaminant={'aluminum': ['oil-film']})
+    assert [c['id'] for c in validator.get_contaminants_for_material('aluminum')] == ['oil-film-contamination']
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Test DomainAdapter Write-Behind Sessions
+========================================
+Tests that session writes are buffered, journaled, flushed on interval and
+recovered after a crash.
+"""
+
+import copy
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from generation.core.adapters.domain_adapter import DomainAdapter
+
+
+def _read_items(adapter):
+    with open(adapter.data_path, 'r', encoding='utf-8') as f:
+        return yaml.safe_load(f)['settings']
+
+
+@patch('generation.utils.frontmatter_sync.sync_field_to_frontmatter')
+def test_session_buffers_until_flush_interval(mock_sync, settings_adapter):
+    """Writes stay in memory until flush_every is reached."""
+    item_ids = list(_read_items(settings_adapter))[:3]
+    original = _read_items(settings_adapter)
+
+    settings_adapter.begin_session(flush_every=2)
+    settings_adapter.write_component(item_ids[0], 'pageDescription', 'First buffered description.')
+
+    assert _read_items(settings_adapter)[item_ids[0]] == original[item_ids[0]]
+    assert settings_adapter.get_item_data(item_ids[0])['pageDescription'] == 'First buffered description.'
+    assert mock_sync.call_count == 0
+
+    settings_adapter.write_component(item_ids[1], 'pageDescription', 'Second buffered description.')
+    assert mock_sync.call_count == 2
+    assert _read_items(settings_adapter)[item_ids[1]]['pageDescription'] == 'Second buffered description.'
+
+    settings_adapter.write_component(item_ids[2], 'pageDescription', 'Third buffered description.')
+    settings_adapter.end_session()
+
+    items = _read_items(settings_adapter)
+    assert items[item_ids[2]]['pageDescription'] == 'Third buffered description.'
+    assert mock_sync.call_count == 3
+    assert not settings_adapter.get_journal_path().exists()
+
+
+@patch('generation.utils.frontmatter_sync.sync_field_to_frontmatter')
+def test_journal_is_replayed_after_crash(mock_sync, settings_adapter):
+    """A session that never flushed is recovered by the next session."""
+    item_id = list(_read_items(settings_adapter))[0]
+
+    settings_adapter.begin_session()
+    settings_adapter.write_component(item_id, 'pageDescription', 'Recovered description.')
+    # Simulate a crash: the session disappears without flushing.
+    DomainAdapter._sessions.pop(settings_adapter._session_key())
+    assert settings_adapter.get_journal_path().exists()
+    assert 'Recovered description.' != _read_items(settings_adapter)[item_id].get('pageDescription')
+
+    settings_adapter.begin_session()
+    settings_adapter.end_session()
+
+    assert _read_items(settings_adapter)[item_id]['pageDescription'] == 'Recovered description.'
+    assert not settings_adapter.get_journal_path().exists()
+    mock_sync.assert_called_once()
+
+
+@patch('generation.utils.frontmatter_sync.sync_field_to_frontmatter')
+def test_sessions_are_scoped_to_the_data_file(mock_sync, settings_adapter, tmp_path):
+    """An adapter on another copy of the domain's data neither sees nor flushes the session."""
+    item_id = list(_read_items(settings_adapter))[0]
+    scratch = tmp_path / "scratch" / "Settings.yaml"
+    scratch.parent.mkdir()
+    scratch.write_bytes(settings_adapter.data_path.read_bytes())
+    config = copy.deepcopy(settings_adapter.config)
+    config['data_adapter']['data_path'] = str(scratch)
+    scratch_adapter = DomainAdapter('settings', config_override=config)
+    original = _read_items(scratch_adapter)[item_id]['pageDescription']
+
+    settings_adapter.begin_session()
+    settings_adapter.write_component(item_id, 'pageDescription', 'Buffered description.')
+    assert scratch_adapter.get_active_session() is None
+    assert scratch_adapter.get_item_data(item_id)['pageDescription'] == original
+
+    scratch_adapter.begin_session()
+    scratch_adapter.end_session()
+    settings_adapter.end_session()
+
+    assert _read_items(scratch_adapter)[item_id]['pageDescription'] == original
+    assert _read_items(settings_adapter)[item_id]['pageDescription'] == 'Buffered description.'
+
+
+def test_nested_sessions_rejected(settings_adapter):
+    """Only one write session may be active per data file."""
+    settings_adapter.begin_session()
+    with pytest.raises(RuntimeError):
+        settings_adapter.begin_session()
+    settings_adapter.end_session()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Test EntityMatcher candidate index
+==================================
+Tests that ranking through a CandidateIndex (token/association postings and
+phrase lookups) returns exactly what scoring every candidate returns.
+"""
+
+import random
+
+import pytest
+
+from shared.matching.entity_matcher import (
+    CandidateEntity,
+    CandidateIndex,
+    EntityMatcher,
+    HostEntity,
+    MatchConfig,
+    _HostProfile,
+)
+
+WORDS = [
+    "stainless", "steel", "aluminum", "anodized", "titanium", "copper", "brass",
+    "graffiti", "adhesive", "carbon", "deposits", "marine", "fouling", "mould",
+    "bronze", "patina", "turbine", "blades", "welding", "spatter", "concrete",
+]
+SLUGS = [f"item-{n}" for n in range(30)]
+
+
+def _text(rng, count):
+    return " ".join(rng.choice(WORDS) for _ in range(count))
+
+
+def _candidates(rng, count=200):
+    candidates = []
+    for n in range(count):
+        subject = _text(rng, 2)
+        candidates.append(CandidateEntity(
+            slug=f"{subject.replace(' ', '-')}-{n}",
+            domain="videos",
+            subject=subject,
+            page_title=_text(rng, 4),
+            page_description=_text(rng, rng.randint(0, 12)),
+            keywords=[_text(rng, rng.randint(1, 2)) for _ in range(rng.randint(0, 3))],
+            authored_associations={
+                "materials": rng.sample(SLUGS, rng.randint(0, 2)),
+                "contaminants": rng.sample(SLUGS, rng.randint(0, 1)),
+            },
+        ))
+    return candidates
+
+
+def _hosts(rng, count=40):
+    return [
+        HostEntity(
+            slug=rng.choice(SLUGS),
+            domain="materials",
+            subject=_text(rng, 2),
+            page_title=_text(rng, 3),
+            page_description=_text(rng, rng.randint(0, 8)),
+            keywords=[_text(rng, rng.randint(1, 3)) for _ in range(rng.randint(0, 4))],
+            category=_text(rng, 1),
+            subcategory=_text(rng, 2),
+            association_slugs={
+                "materials": rng.sample(SLUGS, 1),
+                "contaminants": rng.sample(SLUGS, rng.randint(0, 2)),
+            },
+        )
+        for _ in range(count)
+    ]
+
+
+def _brute_force(matcher, host, candidates, config):
+    scored = []
+    for candidate in candidates:
+        score, diag = matcher.score(host, candidate, config)
+        if matcher.is_eligible(diag, config):
+            scored.append((candidate.slug, score, diag))
+    scored.sort(key=lambda x: x[1], reverse=True)
+    return scored[: config.max_results]
+
+
+@pytest.mark.parametrize("config", [
+    MatchConfig(),
+    MatchConfig(max_results=50),
+    MatchConfig(max_results=50, require_primary_phrase=False, min_score=2.0),
+    MatchConfig(max_results=10, require_primary_phrase=False, min_score=0.0),
+])
+def test_indexed_ranking_matches_brute_force(config):
+    rng = random.Random(11)
+    candidates = _candidates(rng)
+    index = CandidateIndex(candidates)
+    matcher = EntityMatcher()
+
+    for host in _hosts(rng):
+        assert matcher.rank_candidates(host, index, config) == _brute_force(matcher, host, candidates, config)
+
+
+def test_retrieval_skips_unrelated_candidates():
+    matcher = EntityMatcher()
+    related = CandidateEntity(slug="stainless-steel-passivation", domain="videos",
+                              subject="Stainless Steel Passivation")
+    unrelated = CandidateEntity(slug="graffiti-removal", domain="videos", subject="Graffiti Removal")
+    host = HostEntity(slug="stainless-steel", domain="materials", subject="Stainless Steel")
+    index = CandidateIndex([unrelated, related])
+    assert index.retrieve(host, _HostProfile.build(host)) == [1]
+    ranked = matcher.rank_candidates(host, index)
+    assert [slug for slug, _score, _diag in ranked] == ["stainless-steel-passivation"]
+
+
+def test_substring_phrase_without_shared_token_is_retrieved():
+    # "stainless steel" occurs only inside longer tokens, so no token is shared
+    candidate = CandidateEntity(slug="video-1", domain="videos", subject="Nonstainless Steelwork")
+    host = HostEntity(slug="x", domain="materials", subject="Stainless Steel")
+    config = MatchConfig(min_score=5.0)
+    matcher = EntityMatcher()
+    assert matcher.rank_candidates(host, CandidateIndex([candidate]), config) == \
+        _brute_force(matcher, host, [candidate], config)
+    assert matcher.rank_candidates(host, [candidate], config)
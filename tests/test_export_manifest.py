@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Test Incremental Export Manifest
+================================
+Tests that incremental exports skip unchanged items, re-export changed or
+missing ones, and never rewrite files whose bytes are identical.
+"""
+
+import pytest
+import yaml
+
+import export.performance.export_manifest as export_manifest
+from export.core.frontmatter_exporter import FrontmatterExporter
+from export.utils import clear_cache
+from export.utils.yaml_writer import write_yaml
+
+
+def _items():
+    return {
+        f"item-{n}": {
+            'name': f"Item {n}",
+            'datePublished': '2026-01-01T00:00:00Z',
+            'dateModified': '2026-01-01T00:00:00Z',
+        }
+        for n in range(3)
+    }
+
+
+@pytest.fixture
+def make_exporter(tmp_path, monkeypatch):
+    monkeypatch.setattr(export_manifest, 'DEFAULT_MANIFEST_DIR', tmp_path / 'manifests')
+    source = tmp_path / "Applications.yaml"
+
+    def _make(items, config_extra=None):
+        clear_cache()
+        source.write_text(yaml.safe_dump({'applications': items}, sort_keys=False), encoding='utf-8')
+        config = {
+            'domain': 'applications',
+            'source_file': str(source),
+            'output_path': str(tmp_path / 'out'),
+            'items_key': 'applications',
+            'id_field': 'id',
+            'generators': [],
+        }
+        config.update(config_extra or {})
+        return FrontmatterExporter(config, validate=False)
+
+    return _make
+
+
+def test_second_run_skips_unchanged_items(make_exporter):
+    """Only items whose source subtree changed are exported again."""
+    make_exporter(_items()).export_all(show_progress=False, incremental=True)
+
+    items = _items()
+    items['item-1']['name'] = 'Renamed'
+    exporter = make_exporter(items)
+    results = exporter.export_all(show_progress=False, incremental=True)
+
+    assert results == {'item-0': False, 'item-1': True, 'item-2': False}
+    assert exporter.last_export_report['unchanged'] == ['item-0', 'item-2']
+    assert exporter.last_export_report['changed_outputs'] == ['item-1']
+
+
+def test_missing_output_and_config_change_trigger_export(make_exporter, tmp_path):
+    """Deleted outputs and config edits invalidate the manifest."""
+    make_exporter(_items()).export_all(show_progress=False, incremental=True)
+
+    (tmp_path / 'out' / 'item-0.yaml').unlink()
+    results = make_exporter(_items()).export_all(show_progress=False, incremental=True)
+    assert results == {'item-0': True, 'item-1': False, 'item-2': False}
+
+    results = make_exporter(_items(), {'prune_stale_files': True}).export_all(
+        show_progress=False, incremental=True
+    )
+    assert all(results.values())
+
+
+def test_identical_content_is_not_rewritten(tmp_path):
+    """write_yaml leaves files with identical bytes untouched."""
+    target = tmp_path / 'item.yaml'
+    assert write_yaml(target, {'id': 'item', 'name': 'Item'}) is True
+    mtime = target.stat().st_mtime_ns
+
+    assert write_yaml(target, {'id': 'item', 'name': 'Item'}) is False
+    assert target.stat().st_mtime_ns == mtime
+    assert write_yaml(target, {'id': 'item', 'name': 'Other'}) is True
+
+
+def test_generator_chain_fingerprint_follows_imports(tmp_path, monkeypatch):
+    """Imported shared/ code and export config files are part of the fingerprint."""
+    (tmp_path / 'export' / 'config').mkdir(parents=True)
+    (tmp_path / 'shared').mkdir()
+    (tmp_path / 'export' / 'chain.py').write_text(
+        "def run():\n    from shared.helper import emit\n    return emit()\n", encoding='utf-8'
+    )
+    (tmp_path / 'export' / 'config' / 'base.yaml').write_text("a: 1\n", encoding='utf-8')
+    (tmp_path / 'shared' / '__init__.py').write_text("", encoding='utf-8')
+    (tmp_path / 'shared' / 'helper.py').write_text("def emit():\n    return 1\n", encoding='utf-8')
+    (tmp_path / 'shared' / 'unrelated.py').write_text("X = 1\n", encoding='utf-8')
+    monkeypatch.setattr(export_manifest, 'PROJECT_ROOT', tmp_path)
+
+    baseline = export_manifest.generator_chain_fingerprint()
+    (tmp_path / 'shared' / 'unrelated.py').write_text("X = 2\n", encoding='utf-8')
+    assert export_manifest.generator_chain_fingerprint() == baseline
+
+    (tmp_path / 'shared' / 'helper.py').write_text("def emit():\n    return 2\n", encoding='utf-8')
+    changed = export_manifest.generator_chain_fingerprint()
+    assert changed != baseline
+
+    (tmp_path / 'export' / 'config' / 'base.yaml').write_text("a: 2\n", encoding='utf-8')
+    assert export_manifest.generator_chain_fingerprint() != changed
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Test Frontmatter Corpus
+=======================
+Tests that frontmatter validators share one cached parse of the exported tree:
+files are parsed once, re-parsed only when their mtime or size changes, and
+parse failures reach each validator as per-document errors.
+"""
+
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from scripts.validation.verify_frontmatter_links import FrontmatterLinkValidator
+from shared.cache import frontmatter_corpus
+from shared.cache.frontmatter_corpus import FrontmatterCorpus, FrontmatterVisitor
+
+
+def _write(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(yaml.safe_dump(data))
+
+
+@pytest.fixture
+def tree(tmp_path):
+    root = tmp_path / 'frontmatter'
+    _write(root / 'materials' / 'aluminum.yaml', {
+        'id': 'aluminum',
+        'relationships': {'related_contaminants': [{'id': 'rust'}, {'id': 'missing-item'}]},
+    })
+    _write(root / 'materials' / 'steel.yaml', {'id': 'steel'})
+    _write(root / 'contaminants' / 'rust.yaml', {
+        'id': 'rust',
+        'relationships': {'related_materials': [{'id': 'aluminum'}]},
+    })
+    (root / 'contaminants' / 'broken.yaml').write_text('id: [unclosed\n')
+    return root
+
+
+def _corpus(root, tmp_path, **kwargs):
+    kwargs.setdefault('max_workers', 1)
+    return FrontmatterCorpus(root, ['materials', 'contaminants'], cache_dir=tmp_path / 'cache', persist=True, **kwargs)
+
+
+def test_scan_parses_once_and_reuses_cache(tree, tmp_path):
+    real_parse = frontmatter_corpus._parse_file
+    with patch.object(frontmatter_corpus, '_parse_file', side_effect=real_parse) as parse:
+        corpus = _corpus(tree, tmp_path)
+        documents = corpus.scan()
+        assert parse.call_count == 4
+        corpus.scan()
+        assert parse.call_count == 4
+
+        # A fresh process (new corpus) reads the parses from disk
+        _corpus(tree, tmp_path).scan()
+        assert parse.call_count == 4
+
+        # Only the changed file is re-parsed
+        _write(tree / 'materials' / 'steel.yaml', {'id': 'steel', 'name': 'Steel'})
+        refreshed = _corpus(tree, tmp_path).scan()
+        assert parse.call_count == 5
+    assert [(d.domain, d.slug) for d in documents] == [
+        ('materials', 'aluminum'), ('materials', 'steel'), ('contaminants', 'broken'), ('contaminants', 'rust'),
+    ]
+    assert {d.slug: d.data for d in refreshed}['steel'] == {'id': 'steel', 'name': 'Steel'}
+
+    broken = corpus.document(tree / 'contaminants' / 'broken.yaml')
+    assert not broken.ok and broken.data is None
+
+    (tree / 'materials' / 'steel.yaml').unlink()
+    assert 'steel' not in [d.slug for d in corpus.scan()]
+    with pytest.raises(KeyError):
+        corpus.document(tree / 'materials' / 'steel.yaml')
+
+
+def test_parallel_parse_matches_safe_load(tmp_path, monkeypatch):
+    root = tmp_path / 'frontmatter'
+    for index in range(12):
+        _write(root / 'settings' / f'item-{index:02d}.yaml', {'id': f'item-{index}', 'values': list(range(index))})
+    monkeypatch.setattr(frontmatter_corpus, 'PARALLEL_MIN_FILES', 4)
+    corpus = FrontmatterCorpus(root, ['settings'], max_workers=3, persist=False)
+    documents = corpus.scan()
+    assert len(documents) == 12
+    for document in documents:
+        assert document.data == yaml.safe_load(document.path.read_text())
+    assert corpus.get_stats()['misses'] == 12
+
+
+def test_accept_runs_each_visitor_over_one_scan(tree, tmp_path):
+    events = []
+
+    class Recorder(FrontmatterVisitor):
+        def __init__(self, name):
+            self.name = name
+
+        def begin(self, corpus):
+            events.append((self.name, 'begin'))
+
+        def visit(self, document):
+            events.append((self.name, document.slug))
+
+        def finish(self, corpus):
+            events.append((self.name, 'finish'))
+
+    corpus = _corpus(tree, tmp_path)
+    with patch.object(corpus, 'scan', wraps=corpus.scan) as scan:
+        corpus.accept(Recorder('a'), Recorder('b'), domain='materials')
+    scan.assert_called_once()
+    assert events == [
+        ('a', 'begin'), ('a', 'aluminum'), ('a', 'steel'), ('a', 'finish'),
+        ('b', 'begin'), ('b', 'aluminum'), ('b', 'steel'), ('b', 'finish'),
+    ]
+
+
+def test_link_validator_uses_shared_parse(tree, tmp_path):
+    corpus = _corpus(tree, tmp_path)
+    validator = FrontmatterLinkValidator(tree, corpus=corpus)
+    with patch('builtins.print'), patch.object(frontmatter_corpus, '_parse_file',
+                                               side_effect=frontmatter_corpus._parse_file) as parse:
+        report = validator.validate_all()
+
+    # Index and link checks read every file exactly once between them
+    assert parse.call_count == 4
+    assert validator.index['materials'] == {'aluminum', 'steel'}
+    assert validator.index['contaminants'] == {'rust'}
+    assert report.total_links == 3
+    assert [issue.target_id for issue in report.broken_links] == ['missing-item']
+    assert any(issue.issue_type == 'parse_error' and issue.source_file.endswith('broken.yaml')
+               for issue in report.warnings)
+    assert [issue.target_id for issue in report.orphaned_items] == ['steel']
+
+
+def test_link_validator_validates_domain_by_domain(tree, tmp_path):
+    """validate_all keeps per-domain progress and reports missing domain directories."""
+    corpus = _corpus(tree, tmp_path)
+    validator = FrontmatterLinkValidator(tree, corpus=corpus)
+    with patch('builtins.print') as printed, \
+            patch.object(validator, 'validate_domain', wraps=validator.validate_domain) as validate_domain:
+        validator.validate_all()
+
+    assert [call.args[0] for call in validate_domain.call_args_list] == FrontmatterLinkValidator.DOMAINS
+    output = [' '.join(str(arg) for arg in call.args) for call in printed.call_args_list]
+    assert any('Validating materials domain' in line for line in output)
+    assert any('Validating contaminants domain' in line for line in output)
+    assert any('Missing:' in line and 'settings' in line for line in output)
+
+
+def test_visitor_requires_visit():
+    with pytest.raises(TypeError):
+        FrontmatterVisitor()
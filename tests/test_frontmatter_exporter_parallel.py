@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Test FrontmatterExporter Item Workers
+=====================================
+Tests that forked item workers produce the same files and results, in the same
+order, as a serial export, and that per-item failures are collected.
+"""
+
+import multiprocessing
+
+import pytest
+import yaml
+
+from export.core.frontmatter_exporter import FrontmatterExporter
+
+pytestmark = pytest.mark.skipif(
+    'fork' not in multiprocessing.get_all_start_methods(),
+    reason="Parallel item export requires fork()",
+)
+
+
+def _make_exporter(tmp_path, name, exporter_cls=FrontmatterExporter):
+    source = tmp_path / "Applications.yaml"
+    if not source.exists():
+        items = {
+            f"item-{n:02d}": {
+                'name': f"Item {n}",
+                'pageTitle': f"Item {n}",
+                'datePublished': '2026-01-01T00:00:00Z',
+                'dateModified': '2026-01-01T00:00:00Z',
+            }
+            for n in range(12)
+        }
+        source.write_text(yaml.safe_dump({'applications': items}, sort_keys=False), encoding='utf-8')
+    config = {
+        'domain': 'applications',
+        'source_file': str(source),
+        'output_path': str(tmp_path / name),
+        'items_key': 'applications',
+        'id_field': 'id',
+        'generators': [],
+    }
+    return exporter_cls(config, validate=False)
+
+
+def test_parallel_export_matches_serial(tmp_path):
+    """Worker export writes identical files and returns results in source order."""
+    serial = _make_exporter(tmp_path, 'serial')
+    parallel = _make_exporter(tmp_path, 'parallel')
+
+    serial_results = serial.export_all(show_progress=False, workers=1)
+    parallel_results = parallel.export_all(show_progress=False, workers=3)
+
+    assert list(parallel_results.items()) == list(serial_results.items())
+    assert all(parallel_results.values())
+    for serial_file in sorted(serial.output_path.glob('*.yaml')):
+        parallel_file = parallel.output_path / serial_file.name
+        assert parallel_file.read_bytes() == serial_file.read_bytes()
+
+
+class _FailingExporter(FrontmatterExporter):
+    def export_single(self, item_id, item_data, force=False):
+        if item_id.endswith('7'):
+            raise ValueError(f"bad item {item_id}")
+        return super().export_single(item_id, item_data, force)
+
+
+def test_parallel_export_collects_item_errors(tmp_path):
+    """A failing item is reported without aborting the rest of the domain."""
+    exporter = _make_exporter(tmp_path, 'out', exporter_cls=_FailingExporter)
+
+    results = exporter.export_all(show_progress=False, workers=2)
+
+    assert results['item-07'] is False
+    assert exporter.export_errors == {'item-07': 'bad item item-07'}
+    assert sum(results.values()) == 11
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Test Image Batch Pipeline
+=========================
+Tests that ImageBatchPipeline overlaps image generation across materials,
+spends each material's retry budget on failed validations and errors, writes
+learning records in batched transactions (flushed before a retry prompt), and
+resumes an interrupted batch from its journal.
+"""
+
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from domains.materials.image.batch_pipeline import (
+    ERROR,
+    FAILED,
+    PASSED,
+    BatchItem,
+    ImageBatchPipeline,
+)
+from domains.materials.image.material_config import MaterialImageConfig
+from shared.image.learning.image_generation_logger import ImageGenerationLogger
+from shared.utils.sqlite_pool import get_sqlite_pool
+
+
+class FakePipeline:
+    """Stage methods of ImageGenerationPipeline with scripted outcomes."""
+
+    def __init__(self, db_path, scores=None, generation_errors=None):
+        self.learning_logger = ImageGenerationLogger(db_path=db_path)
+        self.scores = scores or {}                        # material -> [score per attempt]
+        self.generation_errors = generation_errors or {}  # material -> [exception or None per attempt]
+        self.prompts = []
+        self.generations = []
+        self.learning = []
+        self.interrupt_on = None
+        self._lock = threading.Lock()
+
+    def prepare_prompt(self, material, config, shape_override=None):
+        with self._lock:
+            self.prompts.append((material, len([r for r in self.learning if r[0] == material])))
+        return {'prompt': f"{material} prompt", 'research_data': {}}
+
+    def generate_image(self, prompt_package, output_path):
+        material = prompt_package['prompt'].split()[0]
+        with self._lock:
+            attempt = sum(1 for m in self.generations if m == material)
+            self.generations.append(material)
+        errors = self.generation_errors.get(material, [])
+        if attempt < len(errors) and errors[attempt] is not None:
+            raise errors[attempt]
+        output_path.write_bytes(b'png')
+        return 3
+
+    def validate_image(self, material, config, prompt_package, output_path):
+        scores = self.scores.get(material, [90])
+        with self._lock:
+            attempt = sum(1 for r in self.learning if r[0] == material)
+        score = scores[min(attempt, len(scores) - 1)]
+        return SimpleNamespace(passed=score >= 75, realism_score=score)
+
+    def record_learning(self, material, config, prompt_package, validation_result, output_path,
+                        file_size, shape_override=None):
+        if material == self.interrupt_on:
+            raise KeyboardInterrupt
+        in_transaction = get_sqlite_pool(self.learning_logger.db_path).in_transaction()
+        self.learning.append((material, validation_result.realism_score, in_transaction))
+
+
+@pytest.fixture(autouse=True)
+def learned_defaults_db(tmp_path, monkeypatch):
+    """Keep MaterialImageConfig's learned-defaults lookups off the tracked generation_history.db."""
+    monkeypatch.setattr('shared.image.learning.create_logger',
+                        lambda db_path=tmp_path / 'defaults.db': ImageGenerationLogger(db_path=db_path))
+
+
+def _items(tmp_path, *materials):
+    return [
+        BatchItem(material, MaterialImageConfig(material=material, category='metals_ferrous'),
+                  tmp_path / f"{material.lower()}.png")
+        for material in materials
+    ]
+
+
+def _batch(pipeline, **kwargs):
+    kwargs.setdefault('rate_limit_backoff', 0.0)
+    return ImageBatchPipeline(pipeline, **kwargs)
+
+
+def test_generation_runs_concurrently_and_results_keep_item_order(tmp_path, capsys):
+    pipeline = FakePipeline(tmp_path / 'learning.db')
+    barrier = threading.Barrier(2, timeout=5)
+    generate = pipeline.generate_image
+
+    def generate_together(prompt_package, output_path):
+        barrier.wait()  # both generation workers must be busy at once
+        return generate(prompt_package, output_path)
+
+    pipeline.generate_image = generate_together
+    items = _items(tmp_path, 'Iron', 'Steel', 'Brass', 'Copper')
+    results = _batch(pipeline, generation_workers=2, learning_batch_size=3).run(items)
+
+    assert [r.material for r in results] == ['Iron', 'Steel', 'Brass', 'Copper']
+    assert all(r.status == PASSED and r.attempts == 1 for r in results)
+    assert all(Path(r.output_path).exists() for r in results)
+    # Learning writes were batched into transactions
+    assert len(pipeline.learning) == 4
+    assert all(in_transaction for _, _, in_transaction in pipeline.learning)
+
+
+def test_retry_budget_and_feedback_before_retry_prompt(tmp_path):
+    pipeline = FakePipeline(
+        tmp_path / 'learning.db',
+        scores={'Brass': [40, 88], 'Lead': [30, 35, 50]},
+        generation_errors={'Zinc': [RuntimeError('500 internal'), RuntimeError('500 internal')],
+                           'Tin': [RuntimeError('429 Too Many Requests'), None]},
+    )
+    items = _items(tmp_path, 'Brass', 'Lead', 'Zinc', 'Tin')
+    results = {r.material: r for r in _batch(pipeline, max_attempts=2, learning_batch_size=10).run(items)}
+
+    assert (results['Brass'].status, results['Brass'].attempts, results['Brass'].realism_score) == (PASSED, 2, 88)
+    assert (results['Lead'].status, results['Lead'].attempts, results['Lead'].realism_score) == (FAILED, 2, 35)
+    assert (results['Zinc'].status, results['Zinc'].attempts) == (ERROR, 2)
+    assert 'generation: 500 internal' in results['Zinc'].error
+    # Rate limiting is retried with backoff and does not use the budget
+    assert (results['Tin'].status, results['Tin'].attempts) == (PASSED, 1)
+
+    # Each retry prompt was built after the failed attempt reached the learning DB
+    assert ('Brass', 1) in pipeline.prompts
+    assert ('Lead', 1) in pipeline.prompts
+    assert [m for m, _, _ in pipeline.learning].count('Lead') == 2
+
+
+def test_interrupted_batch_resumes_from_journal(tmp_path):
+    items = _items(tmp_path, 'Iron', 'Steel', 'Brass')
+    pipeline = FakePipeline(tmp_path / 'learning.db')
+    pipeline.interrupt_on = 'Steel'
+    steel_interrupted = threading.Event()
+    record_learning, validate_image = pipeline.record_learning, pipeline.validate_image
+
+    def record_then_release(material, **record):
+        try:
+            return record_learning(material, **record)
+        finally:
+            if material == 'Steel':
+                steel_interrupted.set()
+
+    def validate_after_interrupt(material, *args):
+        if material == 'Brass':
+            steel_interrupted.wait(timeout=5)  # Brass can't finish before the run is interrupted
+        return validate_image(material, *args)
+
+    pipeline.record_learning = record_then_release
+    pipeline.validate_image = validate_after_interrupt
+    batch = _batch(pipeline, generation_workers=1, validation_workers=1, learning_batch_size=1)
+    with pytest.raises(KeyboardInterrupt):
+        batch.run(items)
+    journal = batch.journal_for(items)
+    assert [material for material, _ in journal.entries()] == ['Iron']
+
+    resumed = FakePipeline(tmp_path / 'learning.db')
+    results = _batch(resumed, generation_workers=1, validation_workers=1).run(items)
+
+    assert [(r.material, r.status, r.resumed) for r in results] == [
+        ('Iron', PASSED, True), ('Steel', PASSED, False), ('Brass', PASSED, False),
+    ]
+    assert [material for material, _ in resumed.prompts] == ['Steel', 'Brass']
+    assert not journal.exists()
+
+
+def test_materials_are_journaled_after_their_learning_records(tmp_path):
+    items = _items(tmp_path, 'Iron', 'Steel', 'Brass')
+    pipeline = FakePipeline(tmp_path / 'learning.db')
+    batch = _batch(pipeline, learning_batch_size=10)
+    journal = batch.journal_for(items)
+    journaled_before_learning = []
+    record_learning = pipeline.record_learning
+
+    def record_and_check_journal(material, **record):
+        if journal.exists():
+            journaled_before_learning.extend(m for m, _ in journal.entries() if m == material)
+        return record_learning(material, **record)
+
+    pipeline.record_learning = record_and_check_journal
+    results = batch.run(items)
+
+    assert all(r.status == PASSED for r in results)
+    assert len(pipeline.learning) == 3
+    assert journaled_before_learning == []
+
+
+def test_dry_run_builds_prompts_only(tmp_path):
+    pipeline = FakePipeline(tmp_path / 'learning.db')
+    items = _items(tmp_path, 'Iron', 'Steel')
+    results = _batch(pipeline).run(items, dry_run=True)
+
+    assert [r.status for r in results] == [PASSED, PASSED]
+    assert pipeline.generations == [] and pipeline.learning == []
+    assert not list(tmp_path.glob('.image-batch-*'))
+
+
+def test_journal_scope_includes_image_settings(tmp_path):
+    items = _items(tmp_path, 'Iron')
+    batch = _batch(FakePipeline(tmp_path / 'learning.db'))
+    heavy = [
+        BatchItem(item.material, MaterialImageConfig(material=item.material, category='metals_ferrous',
+                                                     severity='heavy'), item.output_path)
+        for item in items
+    ]
+    assert batch.journal_for(items).journal_path == batch.journal_for(_items(tmp_path, 'Iron')).journal_path
+    assert batch.journal_for(items).journal_path != batch.journal_for(heavy).journal_path
+
+
+def test_exhausted_quota_is_not_retried(tmp_path):
+    quota = RuntimeError('429 RESOURCE_EXHAUSTED: daily quota exceeded')
+    pipeline = FakePipeline(tmp_path / 'learning.db', generation_errors={'Iron': [quota, None]})
+    results = _batch(pipeline, max_attempts=3).run(_items(tmp_path, 'Iron'))
+
+    assert (results[0].status, results[0].attempts) == (ERROR, 1)
+    assert pipeline.generations == ['Iron']
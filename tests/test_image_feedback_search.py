@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Test Image Feedback Search
+==========================
+Tests that ImageGenerationLogger.search_feedback uses the feedback_fts
+full-text index: the triggers keep it in sync with generation_attempts,
+results are ranked, prefix and category filters apply, and databases are
+indexed by the first search rather than when the logger opens them.
+"""
+
+import sqlite3
+
+import pytest
+
+from shared.image.learning.image_generation_logger import FEEDBACK_FTS_TABLE, ImageGenerationLogger
+
+
+def _log(image_logger, material, category, feedback, passed=False, feedback_category='contamination'):
+    return image_logger.log_attempt(
+        material=material,
+        category=category,
+        generation_params={'feedback_text': feedback, 'feedback_category': feedback_category},
+        validation_results={'realism_score': 90 if passed else 40, 'passed': passed},
+        outcome={},
+    )
+
+
+@pytest.fixture
+def image_logger(tmp_path):
+    image_logger = ImageGenerationLogger(db_path=tmp_path / 'history.db')
+    _log(image_logger, 'Steel', 'metal_ferrous', 'Rust not visible enough - needs higher contrast')
+    _log(image_logger, 'Birch', 'wood_hardwood', 'Clean side contaminated; rust rust rust on the edge')
+    _log(image_logger, 'Copper', 'metal_nonferrous', 'Contamination looks painted on', feedback_category='physics')
+    _log(image_logger, 'Oak', 'wood_hardwood', None)
+    return image_logger
+
+
+def test_search_is_ranked_with_prefix_and_filters(image_logger):
+    assert [r['material'] for r in image_logger.search_feedback('rust')] == ['Birch', 'Steel']
+    assert {r['material'] for r in image_logger.search_feedback('contam')} == {'Birch', 'Copper'}
+    assert image_logger.search_feedback('contam', prefix=False) == []
+    assert [r['material'] for r in image_logger.search_feedback('rust', category='metal_ferrous')] == ['Steel']
+    assert [r['material'] for r in image_logger.search_feedback('contam', feedback_category='physics')] == ['Copper']
+    assert len(image_logger.search_feedback('rust', limit=1)) == 1
+    # Words must all match; FTS syntax in user input is treated as text
+    assert [r['material'] for r in image_logger.search_feedback('rust contrast')] == ['Steel']
+    assert image_logger.search_feedback('"NEAR(') == []
+
+
+def test_triggers_follow_updates_and_deletes(image_logger):
+    conn = sqlite3.connect(image_logger.db_path)
+    conn.execute("UPDATE generation_attempts SET feedback_text = 'Too glossy' WHERE material = 'Steel'")
+    conn.execute("DELETE FROM generation_attempts WHERE material = 'Birch'")
+    conn.commit()
+    conn.close()
+
+    assert image_logger.search_feedback('rust') == []
+    assert [r['material'] for r in image_logger.search_feedback('gloss')] == ['Steel']
+    conn = sqlite3.connect(image_logger.db_path)
+    conn.execute(f"INSERT INTO {FEEDBACK_FTS_TABLE}({FEEDBACK_FTS_TABLE}) VALUES ('integrity-check')")
+    conn.close()
+
+
+def test_opening_leaves_database_unindexed_until_first_search(image_logger):
+    def schema_names():
+        conn = sqlite3.connect(image_logger.db_path)
+        names = {name for (name,) in conn.execute("SELECT name FROM sqlite_master")}
+        conn.close()
+        return names
+
+    assert FEEDBACK_FTS_TABLE not in schema_names()
+    assert 'idx_failed_feedback_category' not in schema_names()
+
+    assert [r['material'] for r in image_logger.search_feedback('rust')] == ['Birch', 'Steel']
+    assert image_logger.fts_enabled
+    assert {FEEDBACK_FTS_TABLE, 'idx_failed_feedback_category'} <= schema_names()
+
+
+def test_existing_database_is_indexed_on_first_search(image_logger):
+    image_logger.search_feedback('rust')
+    conn = sqlite3.connect(image_logger.db_path)
+    conn.execute(f"DROP TABLE {FEEDBACK_FTS_TABLE}")
+    for trigger in ('feedback_fts_insert', 'feedback_fts_delete', 'feedback_fts_update'):
+        conn.execute(f"DROP TRIGGER {trigger}")
+    conn.commit()
+    conn.close()
+
+    reopened = ImageGenerationLogger(db_path=image_logger.db_path)
+    assert [r['material'] for r in reopened.search_feedback('rust')] == ['Birch', 'Steel']
+
+
+def test_like_fallback_without_fts(image_logger):
+    image_logger.fts_enabled = False
+    assert {r['material'] for r in image_logger.search_feedback('contam')} == {'Birch', 'Copper'}
+    assert [r['material'] for r in image_logger.search_feedback('Rust', category='metal_ferrous')] == ['Steel']
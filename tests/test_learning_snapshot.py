@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Test Learning Snapshot
+======================
+Tests that HumannessOptimizer reads learned patterns from the versioned
+learning snapshot: repeated prompt builds do not re-run the analytics, new
+detection rows are merged incrementally, learned_patterns.yaml is re-read only
+when it changes, and sections survive a new process.
+"""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from learning.humanness_optimizer import HumannessOptimizer
+from learning.learning_snapshot import (
+    MISSING_TABLE,
+    LearningSnapshot,
+    get_learning_snapshot,
+    reset_learning_snapshots,
+)
+from postprocessing.detection.winston_feedback_db import WinstonFeedbackDatabase
+
+
+@pytest.fixture(autouse=True)
+def fresh_snapshots():
+    reset_learning_snapshots()
+    yield
+    reset_learning_snapshots()
+
+
+@pytest.fixture
+def winston_db(tmp_path):
+    return WinstonFeedbackDatabase(str(tmp_path / 'winston.db'))
+
+
+@pytest.fixture
+def patterns_file(tmp_path):
+    path = tmp_path / 'learned_patterns.yaml'
+    path.write_text(yaml.safe_dump({
+        'total_evaluations': 3,
+        'theatrical_phrases': {'high_penalty': ['zaps away'], 'medium_penalty': ['really']},
+        'ai_tendencies': {'common': {'formulaic_phrasing': 2}},
+        'scoring_adjustments': {'theatrical': 0.5},
+        'success_patterns': {'professional_verbs': ['removes'], 'sample_count': 1},
+    }))
+    return path
+
+
+def _log(db, text, ai_score, success=True):
+    winston_result = {'human_score': 1.0 - ai_score, 'ai_score': ai_score, 'sentences': []}
+    return db.log_detection('Steel', 'micro', text, winston_result, 0.7, 1, success)
+
+
+def _optimizer(winston_db, patterns_file, tmp_path):
+    # Bypass __init__ (prompt registry and generation config are not under test)
+    optimizer = HumannessOptimizer.__new__(HumannessOptimizer)
+    optimizer.winston_db_path = winston_db.db_path
+    optimizer.structural_db_path = str(tmp_path / 'structural.db')
+    optimizer.patterns_file = Path(patterns_file)
+    optimizer._winston_db = None
+    optimizer._pattern_learner = None
+    optimizer._learning_snapshot = None
+    optimizer._total_evaluations = None
+    return optimizer
+
+
+def test_repeated_builds_reuse_winston_section(winston_db, patterns_file, tmp_path):
+    _log(winston_db, 'We use around 100 W here.', 0.3)
+    _log(winston_db, 'It stays near 8.8 g/cm³ typically.', 0.1)
+    _log(winston_db, 'Rejected text.', 0.9, success=False)
+    optimizer = _optimizer(winston_db, patterns_file, tmp_path)
+
+    with patch.object(WinstonFeedbackDatabase, 'get_passing_samples',
+                      autospec=True, side_effect=WinstonFeedbackDatabase.get_passing_samples) as query:
+        first = optimizer._extract_winston_patterns()
+        for _ in range(3):
+            assert optimizer._extract_winston_patterns() == first
+        assert query.call_count == 1
+
+        # A new row is merged by reading only rows after the last build
+        _log(winston_db, 'Roughly 0.5% remains.', 0.05)
+        refreshed = optimizer._extract_winston_patterns()
+        assert query.call_count == 2
+        assert query.call_args.kwargs['after_id'] == 3
+
+    assert first.sample_count == 2
+    assert refreshed.sample_count == 3
+    assert refreshed.best_score == 0.05
+    # Same result as the uncached analysis
+    assert refreshed.sample_excerpts == winston_db.get_passing_sample_patterns()['sample_excerpts']
+
+
+def test_subjective_section_follows_file_changes(winston_db, patterns_file, tmp_path):
+    optimizer = _optimizer(winston_db, patterns_file, tmp_path)
+    optimizer._extract_subjective_patterns()
+
+    with patch('learning.subjective_pattern_learner.SubjectivePatternLearner._load_patterns',
+               autospec=True, side_effect=lambda learner: yaml.safe_load(learner.patterns_file.read_text())) as load:
+        patterns = optimizer._extract_subjective_patterns()
+        assert load.call_count == 0
+        assert patterns.theatrical_phrases == ['zaps away', 'really']
+        assert optimizer._get_total_evaluations() == 3
+
+        data = yaml.safe_load(patterns_file.read_text())
+        data['total_evaluations'] = 40
+        data['theatrical_phrases']['high_penalty'].append('game-changing')
+        patterns_file.write_text(yaml.safe_dump(data))
+        patterns = optimizer._extract_subjective_patterns()
+        assert load.call_count > 0
+
+    assert 'game-changing' in patterns.theatrical_phrases
+    assert optimizer._get_total_evaluations() == 40
+
+
+def test_sections_persist_across_processes(winston_db, patterns_file, tmp_path):
+    _log(winston_db, 'We use around 100 W here.', 0.2)
+    _optimizer(winston_db, patterns_file, tmp_path)._extract_winston_patterns()
+
+    reset_learning_snapshots()
+    optimizer = _optimizer(winston_db, patterns_file, tmp_path)
+    with patch.object(WinstonFeedbackDatabase, 'get_passing_samples') as query:
+        patterns = optimizer._extract_winston_patterns()
+    query.assert_not_called()
+    assert patterns.sample_count == 1
+    assert get_learning_snapshot(winston_db.db_path).get_stats()['hits'] == 1
+
+
+def test_missing_structural_table_is_cached_until_created(winston_db, patterns_file, tmp_path):
+    optimizer = _optimizer(winston_db, patterns_file, tmp_path)
+    snapshot = optimizer._get_learning_snapshot()
+    assert LearningSnapshot.table_version(optimizer.structural_db_path, 'structural_patterns') == MISSING_TABLE
+
+    with patch.object(HumannessOptimizer, '_query_structural_patterns',
+                      autospec=True, side_effect=HumannessOptimizer._query_structural_patterns) as query:
+        # No table yet: the error is reported as empty patterns and not cached
+        assert optimizer._extract_structural_patterns('micro').sample_count == 0
+        assert optimizer._extract_structural_patterns('micro').sample_count == 0
+        assert query.call_count == 2
+    assert snapshot.get_stats()['rebuilds'] == 0
+
+
+def test_get_rebuilds_on_version_change_and_age(tmp_path):
+    snapshot = LearningSnapshot(tmp_path / 'snapshot.db')
+    builds = []
+
+    def build(previous):
+        builds.append(previous.payload if previous else None)
+        return {'n': len(builds)}
+
+    assert snapshot.get('section', (1,), build) == {'n': 1}
+    assert snapshot.get('section', (1,), build) == {'n': 1}
+    assert snapshot.get('section', (2,), build) == {'n': 2}
+    assert builds == [None, {'n': 1}]
+
+    # Expired sections rebuild even at the same version; None versions never cache
+    assert snapshot.get('section', (2,), build, max_age=-1) == {'n': 3}
+    assert snapshot.get('section', (None,), build) == {'n': 4}
+    assert snapshot.get('section', (2,), build) == {'n': 3}
+
+    snapshot.invalidate('section')
+    assert snapshot.get('section', (2,), build) == {'n': 5}
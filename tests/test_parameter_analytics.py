@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Test Parameter Analytics (columnar sweet spots)
+===============================================
+Tests the columnar store's incremental refresh and that vectorized sweet
+spots and correlations match the row-by-row statistics they replace.
+"""
+
+import random
+import sqlite3
+import statistics
+
+import pytest
+from scipy.stats import pearsonr, spearmanr
+
+from learning.parameter_analytics import PARAMETER_COLUMNS, ParameterColumnStore
+from learning.sweet_spot_analyzer import SweetSpotAnalyzer
+from shared.utils.sqlite_pool import close_all_pools
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = tmp_path / "learning.db"
+    conn = sqlite3.connect(path)
+    conn.executescript(f"""
+        CREATE TABLE detection_results (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            human_score REAL,
+            composite_quality_score REAL,
+            success BOOLEAN
+        );
+        CREATE TABLE generation_parameters (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            detection_result_id INTEGER,
+            {', '.join(name + ' REAL' for name in PARAMETER_COLUMNS)}
+        );
+    """)
+    conn.close()
+    yield path
+    close_all_pools()
+
+
+def _insert(db_path, count, seed):
+    rng = random.Random(seed)
+    conn = sqlite3.connect(db_path)
+    for _ in range(count):
+        human = round(rng.uniform(0.5, 1.0), 3)
+        composite = round(rng.uniform(0.5, 1.0), 3) if rng.random() < 0.5 else None
+        cursor = conn.execute(
+            "INSERT INTO detection_results (human_score, composite_quality_score, success) VALUES (?, ?, ?)",
+            (human, composite, rng.random() < 0.8)
+        )
+        values = [round(rng.uniform(0, 1), 2) for _ in PARAMETER_COLUMNS]
+        # Nullable voice parameters
+        values[PARAMETER_COLUMNS.index('imperfection_tolerance')] = None if rng.random() < 0.3 else values[9]
+        conn.execute(
+            f"INSERT INTO generation_parameters (detection_result_id, {', '.join(PARAMETER_COLUMNS)}) "
+            f"VALUES (?, {', '.join('?' * len(PARAMETER_COLUMNS))})",
+            [cursor.lastrowid] + values
+        )
+    conn.commit()
+    conn.close()
+
+
+def _successful_rows(db_path):
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    rows = conn.execute("""
+        SELECT gp.*, dr.human_score, COALESCE(dr.composite_quality_score, dr.human_score) AS quality_score
+        FROM generation_parameters gp
+        JOIN detection_results dr ON gp.detection_result_id = dr.id
+        WHERE dr.success = 1
+        ORDER BY gp.id
+    """).fetchall()
+    conn.close()
+    return rows
+
+
+def test_refresh_appends_only_new_rows(db_path):
+    store = ParameterColumnStore(db_path)
+    _insert(db_path, 40, seed=1)
+    first = store.refresh()
+    assert first == len(_successful_rows(db_path))
+    assert store.refresh() == 0
+
+    _insert(db_path, 10, seed=2)
+    added = store.refresh()
+    assert len(store) == first + added == len(_successful_rows(db_path))
+    assert list(store.row_ids) == [row['id'] for row in _successful_rows(db_path)]
+
+
+def test_refresh_reloads_after_delete(db_path):
+    store = ParameterColumnStore(db_path)
+    _insert(db_path, 30, seed=3)
+    store.refresh()
+
+    conn = sqlite3.connect(db_path)
+    conn.execute("DELETE FROM generation_parameters WHERE id <= 5")
+    conn.commit()
+    conn.close()
+
+    store.refresh()
+    assert list(store.row_ids) == [row['id'] for row in _successful_rows(db_path)]
+
+
+def test_sweet_spots_match_row_statistics(db_path):
+    _insert(db_path, 300, seed=4)
+    analyzer = SweetSpotAnalyzer(str(db_path), min_samples=10, success_threshold=0.7)
+    sweet_spots = analyzer.find_sweet_spots(top_n_percent=25)
+
+    rows = [row for row in _successful_rows(db_path) if row['quality_score'] >= 0.7]
+    rows.sort(key=lambda row: row['quality_score'], reverse=True)
+    top = rows[:max(10, int(len(rows) * 0.25))]
+
+    assert set(sweet_spots) == set(PARAMETER_COLUMNS)
+    for name, spot in sweet_spots.items():
+        values = [row[name] for row in top if row[name] is not None]
+        scores = [row['human_score'] for row in top if row[name] is not None]
+        assert spot.sample_count == len(values)
+        assert spot.optimal_min == round(min(values), 3)
+        assert spot.optimal_max == round(max(values), 3)
+        assert spot.optimal_median == pytest.approx(round(statistics.median(values), 3))
+        assert spot.avg_human_score == pytest.approx(round(statistics.mean(scores), 2))
+
+
+def test_correlations_match_scipy(db_path):
+    _insert(db_path, 200, seed=5)
+    analyzer = SweetSpotAnalyzer(str(db_path), min_samples=10)
+    rows = _successful_rows(db_path)
+
+    for method, reference in (('pearson', pearsonr), ('spearman', spearmanr)):
+        correlations = dict(analyzer.analyze_parameter_correlation(method=method))
+        for name, correlation in correlations.items():
+            pairs = [(row[name], row['human_score']) for row in rows if row[name] is not None]
+            expected = reference([p[0] for p in pairs], [p[1] for p in pairs])[0]
+            assert correlation == pytest.approx(round(expected, 3), abs=1e-3)
+
+
+def test_insufficient_data_returns_empty(db_path):
+    _insert(db_path, 3, seed=6)
+    analyzer = SweetSpotAnalyzer(str(db_path), min_samples=10)
+    assert analyzer.find_sweet_spots() == {}
+    assert analyzer.analyze_parameter_correlation() == []
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Test AI Pattern Engine
+======================
+Tests that the compiled, literal-screened pattern scan reports exactly what
+per-pattern re.search / re.findall report, for both pattern files, and the
+AIDetectorEnsemble batch path.
+"""
+
+import random
+import re
+
+import pytest
+
+from postprocessing.detection import ai_detection as postprocessing_detection
+from postprocessing.detection.ensemble import AIDetectorEnsemble
+from shared.voice import ai_detection as voice_detection
+from shared.voice.pattern_engine import PatternEngine, get_pattern_engine, required_literals
+
+PHRASES = [
+    "data lead to improved results", "the process achieve", "achieves efficient removal",
+    "with process", "is achieved", "is removed by laser", "it is important to note",
+    "this method", "cleaning processing", "delve into", "testament to", "perhaps",
+    "utilize", "he said", "she noted", "they", "laser", "surface", "oxide", "rust",
+    "the coating", "gently", "in essence", "pivotal role", "is maintained", "might",
+]
+
+
+def _texts(count=200):
+    rng = random.Random(5)
+    return [" ".join(rng.choice(PHRASES) for _ in range(rng.randint(0, 25))) for _ in range(count)]
+
+
+def _reference(config, text):
+    """Per-pattern scan as the detectors did it before the engine."""
+    grammar = [d['name'] for d in config['grammar_patterns'] if re.search(d['pattern'], text)]
+    phrasing = [
+        (d['name'], re.findall(d['pattern'], text)[:3])
+        for d in config['phrasing_patterns'] if re.findall(d['pattern'], text)
+    ]
+    linguistic = [
+        (d['name'], len(re.findall(d['pattern'], text)))
+        for d in config['linguistic_patterns']
+        if ('formal_words' in d['name'] or 'pronoun' in d['name']) and re.findall(d['pattern'], text)
+    ]
+    return grammar, phrasing, linguistic
+
+
+@pytest.mark.parametrize("module", [postprocessing_detection, voice_detection])
+def test_scan_matches_per_pattern_regexes(module):
+    config = module.load_patterns()
+    engine = PatternEngine(config)
+    assert engine.patterns
+    for text in _texts():
+        scan = engine.scan(text)
+        assert (
+            [hit.definition['name'] for hit in scan['grammar']],
+            [(hit.definition['name'], hit.matches) for hit in scan['phrasing']],
+            [(hit.definition['name'], len(hit.matches)) for hit in scan['linguistic']],
+        ) == _reference(config, text)
+
+
+def test_literal_screen_skips_patterns_that_cannot_match():
+    config = {'grammar_patterns': [
+        {'name': 'data', 'pattern': r'\bdata\s+(lead|show)\b', 'example': '', 'severity': 'critical'},
+        {'name': 'any_word', 'pattern': r'\w+', 'example': '', 'severity': 'low'},
+    ]}
+    engine = PatternEngine(config, categories=('grammar',))
+    assert required_literals(r'\bdata\s+(lead|show)\b') == {'data'}
+    assert required_literals(r'\w+') is None
+    assert required_literals(r'(?i)data') is None
+    assert [p.definition['name'] for p in engine.candidates("no match here")] == ['any_word']
+    assert [hit.definition['name'] for hit in engine.scan("data show")['grammar']] == ['data', 'any_word']
+
+
+def test_invalid_patterns_are_skipped_and_engines_shared():
+    config = {'phrasing_patterns': [
+        {'name': 'broken', 'pattern': '(unclosed', 'example': '', 'reason': '', 'severity': 'low'},
+        {'name': 'ok', 'pattern': 'laser', 'example': '', 'reason': '', 'severity': 'low'},
+    ]}
+    engine = get_pattern_engine(config, categories=('phrasing',))
+    assert [p.definition['name'] for p in engine.patterns] == ['ok']
+    assert get_pattern_engine(dict(config), categories=('phrasing',)) is engine
+
+
+class _FakeWinston:
+    def __init__(self):
+        self.calls = []
+
+    def detect_ai_content(self, text):
+        self.calls.append(text)
+        return {'success': True, 'ai_score': len(text) / 100, 'human_score': 50.0, 'sentences': []}
+
+
+def test_batch_detect_deduplicates_and_keeps_order():
+    client = _FakeWinston()
+    ensemble = AIDetectorEnsemble(winston_client=client)
+    texts = ["a" * 10, "b" * 20, "a" * 10, "c" * 30]
+    results = ensemble.batch_detect(texts)
+    assert [r['ai_score'] for r in results] == [0.1, 0.2, 0.1, 0.3]
+    assert sorted(client.calls) == sorted(set(texts))
+    assert results[0] is not results[2]
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Test Concurrent Postprocess Pipeline
+====================================
+Tests ordered concurrent scheduling, per-provider rate-limited clients, and
+concurrent postprocess_all runs with serialized source writes.
+"""
+
+import random
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from generation.core.adapters.domain_adapter import DomainAdapter
+from shared.commands.postprocess_pipeline import (
+    RateLimitedClient,
+    get_provider_rate_limiter,
+    rate_limited,
+    reset_provider_rate_limiters,
+    run_ordered,
+)
+
+
+class _FakeClient:
+    base_url = "https://api.x.ai"
+
+    def __init__(self):
+        self.calls = 0
+
+    def generate(self, request):
+        self.calls += 1
+        return f"response to {request}"
+
+
+def test_run_ordered_keeps_input_order():
+    rng = random.Random(5)
+    delays = [rng.uniform(0, 0.02) for _ in range(12)]
+    completions = []
+
+    def worker(index):
+        time.sleep(delays[index])
+        return index * 10
+
+    results = run_ordered(
+        list(range(12)), worker, max_workers=4,
+        on_complete=lambda completed, index, result: completions.append((completed, index)),
+    )
+    assert results == [index * 10 for index in range(12)]
+    assert [completed for completed, _ in completions] == list(range(1, 13))
+    assert sorted(index for _, index in completions) == list(range(12))
+
+
+def test_run_ordered_bounds_workers_and_propagates_errors():
+    active = []
+    peak = []
+    lock = threading.Lock()
+
+    def worker(item):
+        with lock:
+            active.append(item)
+            peak.append(len(active))
+        time.sleep(0.01)
+        with lock:
+            active.remove(item)
+        if item == 'boom':
+            raise RuntimeError('worker failed')
+        return item
+
+    assert run_ordered(list('abcdefgh'), worker, max_workers=3) == list('abcdefgh')
+    assert max(peak) <= 3
+    with pytest.raises(RuntimeError, match='worker failed'):
+        run_ordered(['a', 'boom', 'c'], worker, max_workers=2)
+    with pytest.raises(ValueError):
+        run_ordered(['a'], worker, max_workers=0)
+
+
+def test_rate_limited_client_shares_provider_limiter():
+    reset_provider_rate_limiters()
+    try:
+        first = rate_limited(_FakeClient())
+        second = rate_limited(_FakeClient())
+        assert isinstance(first, RateLimitedClient)
+        assert first.limiter is second.limiter is get_provider_rate_limiter("https://api.x.ai")
+        # Grok is configured at 60 requests per minute
+        assert first.limiter.rate == pytest.approx(1.0)
+        assert rate_limited(first) is first
+        assert first.base_url == "https://api.x.ai"
+
+        with patch.object(first.limiter, 'acquire', return_value=0.0) as acquire:
+            assert first.generate('prompt') == 'response to prompt'
+        acquire.assert_called_once()
+        assert first.client.calls == 1
+        # Unknown endpoints are not limited
+        assert get_provider_rate_limiter("https://example.invalid").rate == 0
+    finally:
+        reset_provider_rate_limiters()
+
+
+@patch('generation.utils.frontmatter_sync.sync_field_to_frontmatter')
+def test_concurrent_postprocess_all(mock_sync, postprocess_command, monkeypatch):
+    """Workers overlap, results keep item order, and every buffered write lands."""
+    with open(postprocess_command._get_data_path(), 'r', encoding='utf-8') as f:
+        item_ids = list(yaml.safe_load(f)['settings'])[:8]
+    monkeypatch.setattr(postprocess_command, '_list_items_with_field', lambda: item_ids)
+    monkeypatch.setattr(postprocess_command, '_apply_provider_rate_limits', lambda: None)
+    generator_adapter = DomainAdapter('settings', config_override=postprocess_command.domain_adapter.config)
+    rng = random.Random(11)
+    delays = {item_id: rng.uniform(0, 0.02) for item_id in item_ids}
+
+    def fake_postprocess_item(item_id, dry_run=False):
+        postprocess_command._load_source_data(item_id)
+        time.sleep(delays[item_id])
+        if item_id == item_ids[3]:
+            raise RuntimeError('provider exploded')
+        if item_ids.index(item_id) % 2:
+            generator_adapter.write_component(item_id, 'pageDescription', f"Generated {item_id}.")
+        else:
+            postprocess_command._save_to_source_data(item_id, f"Rewritten {item_id}.")
+        return {'item': item_id, 'improved': True}
+
+    monkeypatch.setattr(postprocess_command, 'postprocess_item', fake_postprocess_item)
+    results = postprocess_command.postprocess_all(batch_size=3, concurrency=4)
+
+    assert [result['item'] for result in results] == item_ids
+    assert results[3]['action'] == 'ERROR'
+    with open(postprocess_command._get_data_path(), 'r', encoding='utf-8') as f:
+        items = yaml.safe_load(f)['settings']
+    for position, item_id in enumerate(item_ids):
+        if position == 3:
+            continue
+        expected = f"Generated {item_id}." if position % 2 else f"Rewritten {item_id}."
+        assert items[item_id]['pageDescription'] == expected
+    assert mock_sync.call_count == len(item_ids) - 1
+    assert postprocess_command.domain_adapter.get_active_session() is None
+
+
+def test_concurrency_requires_text_field(postprocess_command):
+    postprocess_command.field_type = 'data'
+    with pytest.raises(ValueError, match='text field'):
+        postprocess_command.postprocess_all(concurrency=2)
+    with pytest.raises(ValueError):
+        postprocess_command.postprocess_all(concurrency=0)
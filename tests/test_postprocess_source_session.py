@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Test PostprocessCommand Source Data Session
+===========================================
+Tests that postprocess_all parses the source YAML once, resolves items and
+peers from the session view, and persists buffered writes at checkpoints.
+"""
+
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from generation.core.adapters.domain_adapter import DomainAdapter
+
+
+def _read_items(cmd):
+    with open(cmd._get_data_path(), 'r', encoding='utf-8') as f:
+        return yaml.safe_load(f)['settings']
+
+
+@patch('generation.utils.frontmatter_sync.sync_field_to_frontmatter')
+def test_postprocess_all_parses_source_once(mock_sync, postprocess_command, monkeypatch):
+    """Lookups, peers and saves for every item reuse the session's single parse."""
+    item_ids = list(_read_items(postprocess_command))[:5]
+    monkeypatch.setattr(postprocess_command, '_list_items_with_field', lambda: item_ids)
+    parse_count = {'n': 0}
+    real_safe_load = yaml.safe_load
+
+    def counting_safe_load(stream):
+        parse_count['n'] += 1
+        return real_safe_load(stream)
+
+    def fake_postprocess_item(item_id, dry_run=False):
+        item_data = postprocess_command._load_source_data(item_id)
+        peers = postprocess_command._collect_same_field_peer_contents(item_id)
+        assert item_data['pageDescription'] not in peers
+        postprocess_command._save_to_source_data(item_id, f"Rewritten {item_id}.")
+        return {'item': item_id, 'improved': True}
+
+    monkeypatch.setattr(postprocess_command, 'postprocess_item', fake_postprocess_item)
+    with patch('yaml.safe_load', side_effect=counting_safe_load):
+        results = postprocess_command.postprocess_all(batch_size=10)
+
+    assert [r['item'] for r in results] == item_ids
+    assert parse_count['n'] == 1
+    items = _read_items(postprocess_command)
+    for item_id in item_ids:
+        assert items[item_id]['pageDescription'] == f"Rewritten {item_id}."
+    assert mock_sync.call_count == len(item_ids)
+    assert postprocess_command.domain_adapter.get_active_session() is None
+    assert not postprocess_command.domain_adapter.get_journal_path().exists()
+
+
+@patch('generation.utils.frontmatter_sync.sync_field_to_frontmatter')
+def test_writes_flush_at_batch_checkpoints(mock_sync, postprocess_command, monkeypatch):
+    """Buffered writes reach the file at every batch_size checkpoint."""
+    item_ids = list(_read_items(postprocess_command))[:3]
+    monkeypatch.setattr(postprocess_command, '_list_items_with_field', lambda: item_ids)
+    on_disk_at_start = {}
+
+    def fake_postprocess_item(item_id, dry_run=False):
+        on_disk_at_start[item_id] = {
+            key: value.get('pageDescription') for key, value in _read_items(postprocess_command).items()
+        }
+        postprocess_command._save_to_source_data(item_id, f"Rewritten {item_id}.")
+        return {'item': item_id, 'improved': True}
+
+    monkeypatch.setattr(postprocess_command, 'postprocess_item', fake_postprocess_item)
+    postprocess_command.postprocess_all(batch_size=2)
+
+    # Item 1 was still buffered while item 2 ran; the checkpoint flushed it before item 3
+    assert on_disk_at_start[item_ids[1]][item_ids[0]] != f"Rewritten {item_ids[0]}."
+    assert on_disk_at_start[item_ids[2]][item_ids[0]] == f"Rewritten {item_ids[0]}."
+    assert on_disk_at_start[item_ids[2]][item_ids[1]] == f"Rewritten {item_ids[1]}."
+    assert _read_items(postprocess_command)[item_ids[2]]['pageDescription'] == f"Rewritten {item_ids[2]}."
+
+
+@patch('generation.utils.frontmatter_sync.sync_field_to_frontmatter')
+def test_session_sees_generator_writes_and_names(mock_sync, postprocess_command, monkeypatch):
+    """Items resolve by display name, and other adapters' buffered writes are visible."""
+    item_id = list(_read_items(postprocess_command))[0]
+    name = _read_items(postprocess_command)[item_id]['name']
+    monkeypatch.setattr(postprocess_command, '_list_items_with_field', lambda: [name.upper()])
+    generator_adapter = DomainAdapter('settings', config_override=postprocess_command.domain_adapter.config)
+    seen = {}
+
+    def fake_postprocess_item(requested, dry_run=False):
+        generator_adapter.write_component(item_id, 'pageDescription', 'Generator output text.')
+        seen['data'] = postprocess_command._load_source_data(requested)
+        seen['peers'] = postprocess_command._collect_same_field_peer_contents('some-other-item')
+        return {'item': requested, 'improved': True}
+
+    monkeypatch.setattr(postprocess_command, 'postprocess_item', fake_postprocess_item)
+    postprocess_command.postprocess_all(batch_size=10)
+
+    assert seen['data']['pageDescription'] == 'Generator output text.'
+    assert 'Generator output text.' in seen['peers']
+    assert _read_items(postprocess_command)[item_id]['pageDescription'] == 'Generator output text.'
+
+
+def test_unknown_item_raises(postprocess_command):
+    owns_write_session = postprocess_command._begin_source_session()
+    try:
+        with pytest.raises(FileNotFoundError):
+            postprocess_command._load_source_data('no-such-item')
+    finally:
+        postprocess_command._end_source_session(owns_write_session)
+    assert owns_write_session
+    assert postprocess_command.domain_adapter.get_active_session() is None
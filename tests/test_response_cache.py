@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Test ResponseCache (SQLite store)
+=================================
+Tests hits/misses, TTL expiry, running size accounting, LRU eviction and
+compressed bodies.
+"""
+
+import time
+
+import pytest
+
+from shared.api.response_cache import ResponseCache
+
+
+def _config(tmp_path, **overrides):
+    config = {
+        'enabled': True,
+        'storage_location': str(tmp_path / 'cache'),
+        'ttl_seconds': 3600,
+        'max_size_mb': 1,
+        'key_strategy': 'full_request_hash',
+    }
+    config.update(overrides)
+    return config
+
+
+def _request(n):
+    return {'prompt': f"prompt {n}", 'model': 'deepseek-chat', 'temperature': 0.5, 'max_tokens': 100}
+
+
+def _response(n, size=10):
+    return {'success': True, 'content': f"content {n} " + 'x' * size}
+
+
+def test_set_then_get_round_trips(tmp_path):
+    cache = ResponseCache(_config(tmp_path))
+    assert cache.get(_request(1)) is None
+    assert cache.set(_request(1), _response(1))
+    assert cache.get(_request(1)) == _response(1)
+
+    stats = cache.get_stats()
+    assert stats['hits'] == 1 and stats['misses'] == 1
+    assert stats['entry_count'] == 1
+
+
+def test_overwrite_keeps_size_totals_exact(tmp_path):
+    cache = ResponseCache(_config(tmp_path))
+    cache.set(_request(1), _response(1, size=100))
+    cache.set(_request(1), _response(1, size=10))
+    total_bytes, entry_count = cache._totals()
+    stored = cache._connection().execute("SELECT SUM(size_bytes), COUNT(*) FROM responses").fetchone()
+    assert (total_bytes, entry_count) == stored
+    assert entry_count == 1
+
+
+def test_expired_entry_is_a_miss(tmp_path):
+    cache = ResponseCache(_config(tmp_path, ttl_seconds=1))
+    cache.set(_request(1), _response(1))
+    with cache._connection() as conn:
+        conn.execute("UPDATE responses SET cached_at = ?", (time.time() - 10,))
+    assert cache.get(_request(1)) is None
+    assert cache.get_stats()['entry_count'] == 0
+
+
+def test_size_limit_evicts_least_recently_used(tmp_path):
+    cache = ResponseCache(_config(tmp_path))
+    entry_size = 200 * 1024
+    for n in range(4):
+        cache.set(_request(n), _response(n, size=entry_size))
+        time.sleep(0.01)
+    # Touch entry 0 so entry 1 is now the least recently used
+    assert cache.get(_request(0)) is not None
+    time.sleep(0.01)
+
+    cache.set(_request(4), _response(4, size=entry_size))
+    cache.set(_request(5), _response(5, size=entry_size))
+
+    assert cache.stats['evictions'] > 0
+    assert cache.get(_request(1)) is None
+    assert cache.get(_request(5)) is not None
+    assert cache.get_stats()['cache_size_mb'] <= 1
+
+
+def test_compression_round_trips_and_shrinks(tmp_path):
+    plain = ResponseCache(_config(tmp_path / 'plain'))
+    packed = ResponseCache(_config(tmp_path / 'packed', compression=True))
+    for cache in (plain, packed):
+        cache.set(_request(1), _response(1, size=5000))
+        assert cache.get(_request(1)) == _response(1, size=5000)
+    assert packed._totals()[0] < plain._totals()[0]
+
+
+def test_clear_and_disabled(tmp_path):
+    cache = ResponseCache(_config(tmp_path))
+    cache.set(_request(1), _response(1))
+    cache.set(_request(2), _response(2))
+    assert cache.clear() == 2
+    assert cache.get_stats()['entry_count'] == 0
+
+    disabled = ResponseCache(_config(tmp_path / 'off', enabled=False))
+    assert disabled.set(_request(1), _response(1)) is False
+    assert not (tmp_path / 'off').exists()
+
+
+def test_invalid_compression_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        ResponseCache(_config(tmp_path, compression='yes'))
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Test CrossItemSimilarityIndex
+=============================
+Tests that indexed cross-item checks agree with the full peer scan, that
+LSH finds near-duplicates, and that the index persists and re-indexes only
+changed items.
+"""
+
+import random
+
+import pytest
+
+from shared.text.validation.similarity_index import CrossItemSimilarityIndex
+from shared.text.validation.structural_variation_checker import StructuralVariationChecker
+
+WORDS = (
+    "laser pulse surface oxide layer steel aluminum cleaning removes coating gently "
+    "fast heat zone substrate energy beam contaminant residue clean finish operators "
+    "prefer results stable adhesion weld prep paint rust mill scale"
+).split()
+
+
+def _text(rng, sentences=5):
+    return " ".join(
+        " ".join(rng.choice(WORDS) for _ in range(rng.randint(6, 14))).capitalize() + "."
+        for _ in range(sentences)
+    )
+
+
+@pytest.fixture(scope="module")
+def checker(tmp_path_factory):
+    return StructuralVariationChecker(db_path=str(tmp_path_factory.mktemp("db") / "patterns.db"))
+
+
+@pytest.fixture
+def corpus():
+    rng = random.Random(3)
+    items = {f"item-{n}": _text(rng) for n in range(60)}
+    # A near-duplicate pair
+    items["dup-b"] = items["item-7"].replace("laser", "beam", 1)
+    return items
+
+
+def _index(tmp_path, checker, items):
+    index = CrossItemSimilarityIndex("materials", "description", checker.similarity_features, index_dir=tmp_path)
+    index.sync(items)
+    return index
+
+
+def test_indexed_check_matches_full_scan(tmp_path, checker, corpus):
+    index = _index(tmp_path, checker, corpus)
+    for item_id in ["item-7", "item-3", "dup-b"]:
+        peers = [text for key, text in corpus.items() if key != item_id]
+        full = checker.check_cross_item_variation(corpus[item_id], peers)
+        indexed = checker.check_cross_item_variation(
+            corpus[item_id], similarity_index=index, exclude_item=item_id
+        )
+        assert indexed['status'] == full['status']
+        assert indexed['violations'] == full['violations']
+        for key in ('peer_count', 'near_duplicate_count'):
+            assert indexed['metrics'][key] == full['metrics'][key]
+        # Scores far below the threshold use MinHash estimates for the trigram part
+        for key in ('max_weighted_similarity', 'avg_weighted_similarity'):
+            assert indexed['metrics'][key] == pytest.approx(full['metrics'][key], abs=0.03)
+    # Near-duplicates are always scored exactly
+    peers = [text for key, text in corpus.items() if key != "dup-b"]
+    full = checker.check_cross_item_variation(corpus["dup-b"], peers)
+    indexed = checker.check_cross_item_variation(corpus["dup-b"], similarity_index=index, exclude_item="dup-b")
+    assert indexed['metrics']['max_weighted_similarity'] == full['metrics']['max_weighted_similarity']
+
+
+def test_lsh_candidates_include_near_duplicate(tmp_path, checker, corpus):
+    index = _index(tmp_path, checker, corpus)
+    features = checker.similarity_features(corpus["item-7"])
+    assert "dup-b" in index.candidates(features, exclude="item-7")
+    assert "item-7" not in index.candidates(features, exclude="ITEM-7")
+    # Unrelated texts mostly fall outside the candidate set
+    assert len(index.candidates(features, exclude="item-7")) < len(corpus) / 2
+
+
+def test_sync_reindexes_only_changed_items(tmp_path, checker, corpus):
+    index = _index(tmp_path, checker, corpus)
+    updated = dict(corpus)
+    updated["item-1"] = "Completely new text here. Another sentence follows."
+    del updated["item-2"]
+    assert index.sync(updated) == 2
+    assert len(index) == len(updated)
+    assert index.sync(updated) == 0
+
+
+def test_save_and_load_round_trip(tmp_path, checker, corpus):
+    source = tmp_path / "source.yaml"
+    source.write_text("placeholder")
+    index = _index(tmp_path, checker, corpus)
+    index.mark_synced(source)
+    index.save()
+
+    loaded = CrossItemSimilarityIndex.load("materials", "description", checker.similarity_features, index_dir=tmp_path)
+    assert len(loaded) == len(corpus)
+    assert not loaded.is_stale(source)
+    features = checker.similarity_features(corpus["item-7"])
+    assert loaded.candidates(features) == index.candidates(features)
+
+    source.write_text("changed source")
+    assert loaded.is_stale(source)
+
+
+def test_rejects_peer_list_and_index_together(tmp_path, checker, corpus):
+    index = _index(tmp_path, checker, corpus)
+    with pytest.raises(ValueError):
+        checker.check_cross_item_variation("text", ["peer"], similarity_index=index)
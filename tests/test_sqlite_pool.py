@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Test SQLite Connection Pool
+===========================
+Tests per-thread connection reuse, WAL mode, drop-in sqlite3.connect
+semantics and grouped transactions for the learning databases.
+"""
+
+import sqlite3
+import threading
+
+import pytest
+
+from postprocessing.detection.winston_feedback_db import WinstonFeedbackDatabase
+from shared.utils.sqlite_pool import close_all_pools, get_sqlite_pool, pooled_connect
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = tmp_path / "learning.db"
+    with pooled_connect(path) as conn:
+        conn.execute("CREATE TABLE events (id INTEGER PRIMARY KEY, name TEXT)")
+    yield path
+    close_all_pools()
+
+
+def _count(db_path):
+    conn = sqlite3.connect(db_path)
+    try:
+        return conn.execute("SELECT COUNT(*) FROM events").fetchone()[0]
+    finally:
+        conn.close()
+
+
+def test_connection_reused_per_thread_and_wal_enabled(db_path):
+    first = pooled_connect(db_path)
+    second = pooled_connect(db_path)
+    assert first._conn is second._conn
+    assert first.execute("PRAGMA journal_mode").fetchone()[0] == 'wal'
+
+    other = []
+    thread = threading.Thread(target=lambda: other.append(pooled_connect(db_path)._conn))
+    thread.start()
+    thread.join()
+    assert other[0] is not first._conn
+
+
+def test_context_manager_commits_and_rolls_back(db_path):
+    with pooled_connect(db_path) as conn:
+        conn.execute("INSERT INTO events (name) VALUES ('kept')")
+    with pytest.raises(RuntimeError):
+        with pooled_connect(db_path) as conn:
+            conn.execute("INSERT INTO events (name) VALUES ('dropped')")
+            raise RuntimeError("fail")
+    assert _count(db_path) == 1
+
+
+def test_row_factory_is_per_handle(db_path):
+    with pooled_connect(db_path) as conn:
+        conn.execute("INSERT INTO events (name) VALUES ('a')")
+    rows_conn = pooled_connect(db_path)
+    rows_conn.row_factory = sqlite3.Row
+    assert rows_conn.execute("SELECT name FROM events").fetchone()['name'] == 'a'
+    assert pooled_connect(db_path).execute("SELECT name FROM events").fetchone() == ('a',)
+
+
+def test_transaction_groups_inner_commits(db_path):
+    pool = get_sqlite_pool(db_path)
+    with pytest.raises(RuntimeError):
+        with pool.transaction():
+            with pooled_connect(db_path) as conn:
+                conn.execute("INSERT INTO events (name) VALUES ('one')")
+                conn.commit()  # joins the outer transaction
+            raise RuntimeError("fail after inner commit")
+    assert _count(db_path) == 0
+
+    with pool.transaction():
+        for name in ('one', 'two'):
+            with pooled_connect(db_path) as conn:
+                conn.execute("INSERT INTO events (name) VALUES (?)", (name,))
+    assert _count(db_path) == 2
+
+
+def test_executemany_batches_rows(db_path):
+    inserted = get_sqlite_pool(db_path).executemany(
+        "INSERT INTO events (name) VALUES (?)", [(f"e{n}",) for n in range(50)]
+    )
+    assert inserted == 50
+    assert _count(db_path) == 50
+
+
+def test_feedback_db_generation_sequence_is_one_transaction(tmp_path):
+    db = WinstonFeedbackDatabase(str(tmp_path / "winston.db"))
+    winston_result = {
+        'human_score': 0.8,
+        'ai_score': 0.2,
+        'sentences': [{'text': 'First.', 'score': 80}, {'text': 'Second.', 'score': 75}],
+    }
+    with pytest.raises(RuntimeError):
+        with db.transaction():
+            db.log_detection('Steel', 'micro', 'First. Second.', winston_result, 0.7, 1, True)
+            raise RuntimeError("evaluation failed")
+
+    with db.transaction():
+        detection_id = db.log_detection('Steel', 'micro', 'First. Second.', winston_result, 0.7, 1, True)
+
+    conn = sqlite3.connect(db.db_path)
+    try:
+        assert conn.execute("SELECT COUNT(*) FROM detection_results").fetchone()[0] == 1
+        assert conn.execute(
+            "SELECT COUNT(*) FROM sentence_analysis WHERE detection_result_id = ?", (detection_id,)
+        ).fetchone()[0] == 2
+    finally:
+        conn.close()
+    close_all_pools()
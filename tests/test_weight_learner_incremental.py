@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Test WeightLearner incremental mode
+===================================
+Tests that weights solved from persisted sufficient statistics match the
+full-table SLSQP refit, that only new rows are folded in, and that the
+periodic full refit repairs drift from deleted rows.
+"""
+
+import random
+import sqlite3
+
+import numpy as np
+import pytest
+
+from learning.weight_learner import SufficientStatistics, WeightLearner
+from shared.utils.sqlite_pool import close_all_pools
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = tmp_path / "learning.db"
+    conn = sqlite3.connect(path)
+    conn.execute("""
+        CREATE TABLE detection_results (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            human_score REAL,
+            composite_quality_score REAL,
+            readability_score REAL,
+            success BOOLEAN
+        )
+    """)
+    conn.close()
+    yield path
+    close_all_pools()
+
+
+def _insert(db_path, count, seed, with_readability=True):
+    rng = random.Random(seed)
+    conn = sqlite3.connect(db_path)
+    for _ in range(count):
+        winston = rng.uniform(0, 1)
+        subjective = rng.uniform(0, 1)
+        readability = rng.uniform(0, 1) if with_readability and rng.random() < 0.9 else None
+        success = (0.7 * winston + 0.3 * subjective + rng.gauss(0, 0.1)) > 0.5
+        conn.execute(
+            "INSERT INTO detection_results (human_score, composite_quality_score, readability_score, success) "
+            "VALUES (?, ?, ?, ?)",
+            (winston, subjective, readability, success)
+        )
+    conn.commit()
+    conn.close()
+
+
+def _weights(learner):
+    learner.invalidate_cache()
+    return np.array(learner.get_optimal_weights())
+
+
+@pytest.mark.parametrize("with_readability", [True, False])
+def test_incremental_matches_full_refit(db_path, with_readability):
+    _insert(db_path, 300, seed=1, with_readability=with_readability)
+    incremental = _weights(WeightLearner(db_path))
+    full = _weights(WeightLearner(db_path, incremental=False))
+
+    assert incremental.sum() == pytest.approx(1.0)
+    assert np.all(incremental >= 0)
+    np.testing.assert_allclose(incremental, full, atol=1e-3)
+    if not with_readability:
+        assert incremental[2] == 0.0
+
+
+def test_only_new_rows_are_folded_in(db_path):
+    _insert(db_path, 150, seed=2)
+    learner = WeightLearner(db_path)
+    _weights(learner)
+    assert learner._update_statistics()['last_row_id'] == 150
+
+    _insert(db_path, 50, seed=3)
+    # A fresh learner resumes from the persisted state
+    resumed = WeightLearner(db_path)
+    folded = []
+    original_fold = resumed._fold_rows
+    resumed._fold_rows = lambda conn, state: folded.append(original_fold(conn, state)) or folded[-1]
+
+    np.testing.assert_allclose(
+        _weights(resumed), _weights(WeightLearner(db_path, incremental=False)), atol=1e-3
+    )
+    assert folded == [50]
+
+
+def test_periodic_refit_repairs_deleted_rows(db_path):
+    _insert(db_path, 200, seed=4)
+    learner = WeightLearner(db_path)
+    learner.REFIT_INTERVAL = 10
+    _weights(learner)
+
+    conn = sqlite3.connect(db_path)
+    conn.execute("DELETE FROM detection_results WHERE id <= 40")
+    conn.commit()
+    conn.close()
+    _insert(db_path, 20, seed=5)
+
+    state = learner._update_statistics()
+    assert state['two_metric'].n == 180
+    assert state['samples_since_refit'] == 0
+
+
+def test_insufficient_data_raises(db_path):
+    _insert(db_path, 20, seed=6)
+    with pytest.raises(RuntimeError):
+        WeightLearner(db_path).get_optimal_weights()
+
+
+def test_solve_respects_simplex_constraints():
+    stats = SufficientStatistics(3)
+    rng = np.random.default_rng(7)
+    features = rng.uniform(size=(100, 3))
+    # Success driven negatively by the third metric -> its weight hits zero
+    success = features[:, 0] - features[:, 2]
+    stats.add(features, success)
+
+    weights, _ = stats.solve()
+    assert weights.sum() == pytest.approx(1.0)
+    assert weights[2] == pytest.approx(0.0)
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Test YAML Item Block Index
+==========================
+Tests single-item reads and spliced writes against domain-style YAML files.
+"""
+
+import yaml
+
+from shared.utils.yaml_block_index import YAMLItemBlockIndex
+
+
+SOURCE = """schemaVersion: 2.0.0
+materials:
+  aluminum:
+    name: Aluminum
+    tags:
+    - metal
+    - light
+  # Steel entries below
+  steel:
+    name: Steel
+    description: |
+      Multi-line
+      text
+  brass:
+    name: Brass
+metadata:
+  count: 3
+"""
+
+
+def _build(tmp_path, text=SOURCE):
+    source = tmp_path / "Materials.yaml"
+    source.write_text(text, encoding='utf-8')
+    return source, YAMLItemBlockIndex.build(source, 'materials')
+
+
+def test_index_lists_items_in_file_order(tmp_path):
+    """Every item under the root key gets a block, in order."""
+    _, index = _build(tmp_path)
+    assert index.item_ids() == ['aluminum', 'steel', 'brass']
+
+
+def test_read_item_matches_full_parse(tmp_path):
+    """Parsing one block yields the same data as parsing the whole file."""
+    source, index = _build(tmp_path)
+    full = yaml.safe_load(source.read_text())
+    for identifier in index.item_ids():
+        assert index.read_item(identifier) == full['materials'][identifier]
+
+
+def test_write_item_only_changes_target_block(tmp_path):
+    """Splicing one item leaves the rest of the file byte-identical."""
+    source, index = _build(tmp_path)
+    item = index.read_item('aluminum')
+    item['description'] = 'Updated'
+
+    assert index.write_item('aluminum', item) is True
+
+    text = source.read_text()
+    assert "  # Steel entries below\n  steel:" in text
+    assert text.endswith("  brass:\n    name: Brass\nmetadata:\n  count: 3\n")
+    full = yaml.safe_load(text)
+    assert full['materials']['aluminum']['description'] == 'Updated'
+    assert full['materials']['steel']['description'] == "Multi-line\ntext\n"
+    # Later blocks were shifted and are still readable
+    assert index.read_item('brass') == {'name': 'Brass'}
+
+
+def test_external_edit_triggers_rebuild(tmp_path):
+    """Edits made outside the index are picked up before the next read."""
+    source, index = _build(tmp_path)
+    source.write_text(SOURCE.replace("name: Brass", "name: Yellow Brass"), encoding='utf-8')
+    assert index.read_item('brass') == {'name': 'Yellow Brass'}
+
+
+def test_items_sharing_anchors_are_not_isolated(tmp_path):
+    """Items linked by YAML aliases must go through a full rewrite."""
+    text = """materials:
+  aluminum:
+    standards:
+    - &id001
+      name: ISO 1234
+  steel:
+    standards:
+    - *id001
+  brass:
+    name: Brass
+"""
+    _, index = _build(tmp_path, text)
+    assert not index.is_isolated('aluminum')
+    assert not index.is_isolated('steel')
+    assert index.is_isolated('brass')
+    assert index.write_item('steel', {'name': 'Steel'}) is False
+
+
+def test_unindexable_layout_returns_none(tmp_path):
+    """Flow-style root sections cannot be block-indexed."""
+    _, index = _build(tmp_path, "materials: {aluminum: {name: Aluminum}}\n")
+    assert index is None
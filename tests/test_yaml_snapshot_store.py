@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Test YAML Snapshot Store
+========================
+Tests that shared.cache.yaml_snapshot serves pickled parses only while the
+source YAML content is unchanged.
+"""
+
+import pytest
+import yaml
+
+from shared.cache.yaml_snapshot import YAMLSnapshotStore
+
+
+def _write(path, items):
+    path.write_text(yaml.safe_dump({'items': items}), encoding='utf-8')
+
+
+def test_snapshot_hit_returns_same_data(tmp_path):
+    """Second load of an unchanged file comes from the snapshot."""
+    source = tmp_path / "Items.yaml"
+    _write(source, {'a': {'value': 1}, 'b': {'value': 2}})
+    store = YAMLSnapshotStore(snapshot_dir=tmp_path / "snapshots", min_bytes=0, enabled=True)
+
+    first = store.load(source, 'safe', yaml.safe_load)
+    second = store.load(source, 'safe', yaml.safe_load)
+
+    assert first == second == {'items': {'a': {'value': 1}, 'b': {'value': 2}}}
+    assert store.get_stats()['misses'] == 1
+    assert store.get_stats()['hits'] == 1
+    assert store.snapshot_path(source, 'safe').exists()
+
+
+def test_snapshot_invalidated_when_content_changes(tmp_path):
+    """Editing the source produces a miss and the new content."""
+    source = tmp_path / "Items.yaml"
+    _write(source, {'a': {'value': 1}})
+    store = YAMLSnapshotStore(snapshot_dir=tmp_path / "snapshots", min_bytes=0, enabled=True)
+    store.load(source, 'safe', yaml.safe_load)
+
+    _write(source, {'a': {'value': 99}})
+    data = store.load(source, 'safe', yaml.safe_load)
+
+    assert data['items']['a']['value'] == 99
+    assert store.get_stats()['misses'] == 2
+
+
+def test_loaders_do_not_share_snapshots(tmp_path):
+    """Snapshots are keyed by loader name as well as content."""
+    source = tmp_path / "Items.yaml"
+    _write(source, {'a': 1})
+    store = YAMLSnapshotStore(snapshot_dir=tmp_path / "snapshots", min_bytes=0, enabled=True)
+
+    store.load(source, 'safe', yaml.safe_load)
+    store.load(source, 'other', yaml.safe_load)
+
+    assert store.get_stats()['misses'] == 2
+    assert store.invalidate(source) == 2
+
+
+@pytest.mark.parametrize('garbage', [
+    b"not a pickle",
+    b"I1\nI2\nR.",        # unpickling raises TypeError
+    b"(I1\nt\x85.",       # header is not a dict
+])
+def test_corrupt_snapshot_is_reparsed(tmp_path, garbage):
+    """A damaged snapshot file is discarded and rewritten."""
+    source = tmp_path / "Items.yaml"
+    _write(source, {'a': 1})
+    store = YAMLSnapshotStore(snapshot_dir=tmp_path / "snapshots", min_bytes=0, enabled=True)
+    store.load(source, 'safe', yaml.safe_load)
+
+    store.snapshot_path(source, 'safe').write_bytes(garbage)
+    assert store.load(source, 'safe', yaml.safe_load) == {'items': {'a': 1}}
+    assert store.load(source, 'safe', yaml.safe_load) == {'items': {'a': 1}}
+    assert store.get_stats()['hits'] == 1